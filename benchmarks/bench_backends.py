@@ -0,0 +1,97 @@
+"""So'rov backendlarini solishtirish: pandas (agregat kub) va DuckDB.
+
+Sintetik Parquet/CSV fayl yaratiladi, bo'limlar ishlatadigan har bir so'rov
+ikkala backendda bajariladi va vaqtlari chiqariladi (natijalar bir xilligi
+``tests/test_backends.py`` da tekshiriladi). Pandas uchun jadvalni yuklash
+va kubni qurish alohida ko'rsatiladi (so'rovlar tayyor kubdan o'qiydi),
+DuckDB uchun ulanish ochish (CSV bo'lsa - Parquet nusxaga bir martalik
+o'tkazish ham) alohida ko'rsatiladi, so'rovlar Parquet fayl ustida bajariladi.
+
+Ishga tushirish::
+
+    python benchmarks/bench_backends.py --rows 2000000 --format parquet
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from survey.backends import DuckDBBackend, PandasBackend  # noqa: E402
+from survey.ingest import load_local, prepare_dataset  # noqa: E402
+from survey.synthetic import write_survey  # noqa: E402
+
+QUERIES = [
+    ('counts:Role', lambda b: b.counts('Role')),
+    ('counts:Country', lambda b: b.counts('Country')),
+    ('group_mean:Role', lambda b: b.group_mean('Role', 'Salary')),
+    ('group_mean:Education', lambda b: b.group_mean('Education', 'Salary')),
+    ('group_mean:RemoteWork', lambda b: b.group_mean('RemoteWork', 'Salary')),
+    ('crosstab:Role x Education', lambda b: b.crosstab('Role', 'Education')),
+    ('rollup:Role', lambda b: b.rollup(['Role'], 'JobSatisfaction')),
+    ('summary:Salary', lambda b: b.summary('Salary')),
+    ('correlation', lambda b: b.correlation(['Salary', 'YearsExperience', 'JobSatisfaction',
+                                             'WorkLifeBalance', 'Age'])),
+]
+
+FILTERS = ({'Role': ['Data Scientist', 'Data Engineer']}, {'Salary': (60_000.0, 120_000.0)})
+
+
+def timed(func, repeat):
+    best, result = float('inf'), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return result, best
+
+
+def compare(pandas_backend, duckdb_backend, repeat, label):
+    print(f"\n{label}")
+    print("so'rov".ljust(28) + 'pandas, ms'.rjust(12) + 'duckdb, ms'.rjust(12))
+    for name, query in QUERIES:
+        _, pandas_time = timed(lambda: query(pandas_backend), repeat)
+        _, duckdb_time = timed(lambda: query(duckdb_backend), repeat)
+        print(f"{name:<28}{pandas_time * 1000:>12.2f}{duckdb_time * 1000:>12.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--format', choices=['parquet', 'csv'], default='parquet')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--threads', type=int, default=None, help="DuckDB oqimlari soni")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        path = os.path.join(workdir, f"survey.{args.format}")
+        write_survey(path, args.rows)
+        os.environ.setdefault('SURVEY_CACHE_DIR', os.path.join(workdir, 'cache'))
+
+        start = time.perf_counter()
+        df, _, version = load_local(path)
+        dataset, _ = prepare_dataset(df, version)
+        load_time = time.perf_counter() - start
+        start = time.perf_counter()
+        dataset.cube, dataset.comoments
+        build_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        duckdb_backend = DuckDBBackend.from_file(path, threads=args.threads)
+        open_time = time.perf_counter() - start
+
+        print(f"{args.rows:,} qator ({args.format})")
+        print(f"pandas: yuklash {load_time:.2f}s, kub va ko-momentlar {build_time:.2f}s; "
+              f"duckdb: ulanish va Parquet nusxa {open_time:.3f}s")
+        compare(PandasBackend(dataset), duckdb_backend, args.repeat, "Barcha qatorlar")
+
+        selections, ranges = FILTERS
+        subset = dataset.filtered(selections, ranges)
+        compare(PandasBackend(subset), duckdb_backend.filtered(selections, ranges), args.repeat,
+                f"Filtr: {selections}, {ranges} ({len(subset.df):,} qator)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,74 @@
+"""Guruh o'rtachalari bootstrap'i: vektorlashgan (``group_intervals``) va replikatsiyalar tsikli.
+
+Oddiy yo'l har bir replikatsiya uchun har bir guruhdan ``rng.choice`` bilan
+qayta tanlov oladi (Python tsikli). U ``--loop-replicates`` ta replikatsiya
+uchun o'lchanib, ``--replicates`` ga chiziqli ko'paytiriladi. Oraliqlar
+chegaralari bir-biridan standart xatolik ulushida farqlanishi tekshiriladi::
+
+    python benchmarks/bench_bootstrap.py --rows 1000000 --replicates 1000 --workers 4
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from survey.bootstrap import CONFIDENCE, group_intervals  # noqa: E402
+from survey.schema import compact_frame, standardize_columns  # noqa: E402
+from survey.synthetic import sample_survey  # noqa: E402
+
+CHARTS = [('Role', 'Salary'), ('Education', 'Salary'), ('RemoteWork', 'Salary'),
+          ('Role', 'JobSatisfaction')]
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def loop_intervals(groups, values, replicates, confidence=CONFIDENCE, seed=0):
+    """Replikatsiyalar bo'yicha Python tsikli bilan bootstrap"""
+    rng = np.random.default_rng(seed)
+    frame = pd.DataFrame({'group': groups.astype(object), 'value': values}).dropna()
+    alpha = (1 - confidence) / 2
+    rows = {}
+    for group, part in frame.groupby('group')['value']:
+        part = part.to_numpy(dtype='float64')
+        means = [rng.choice(part, size=len(part)).mean() for _ in range(replicates)]
+        rows[group] = np.quantile(means, [alpha, 1 - alpha])
+    return pd.DataFrame(rows, index=['low', 'high']).T
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--replicates', type=int, default=1000)
+    parser.add_argument('--loop-replicates', type=int, default=20,
+                        help="Tsikl yo'li shuncha replikatsiya uchun o'lchanadi")
+    parser.add_argument('--workers', type=int, default=None)
+    args = parser.parse_args()
+
+    df = compact_frame(standardize_columns(sample_survey(args.rows)))[0]
+    print(f"{args.rows:,} qator, {args.replicates} replikatsiya, {os.cpu_count()} yadro")
+    print(f"\n{'grafik':<28}{'vektorlashgan, s':>18}{'tsikl (taxmin), s':>20}{'chegaralar farqi, SE':>22}")
+    for dimension, measure in CHARTS:
+        intervals, fast = timed(lambda: group_intervals(df[dimension], df[measure], args.replicates,
+                                                         workers=args.workers))
+        loop, slow = timed(lambda: loop_intervals(df[dimension], df[measure], args.loop_replicates))
+        slow *= args.replicates / args.loop_replicates
+        # Farq guruh o'rtachasining standart xatoligiga nisbatan (kam replikatsiyali tsikl shovqinli)
+        grouped = df.groupby(df[dimension].astype(object))[measure]
+        se = grouped.std() / np.sqrt(grouped.count())
+        loop = loop.reindex(intervals.index.astype(object))
+        gap = max(np.abs((intervals[bound].to_numpy() - loop[bound].to_numpy()) / se.reindex(loop.index).to_numpy()).max()
+                  for bound in ('low', 'high'))
+        print(f"{dimension + ' -> ' + measure:<28}{fast:>18.2f}{slow:>20.1f}{gap:>22.2f}")
+
+
+if __name__ == '__main__':
+    main()
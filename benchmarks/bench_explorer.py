@@ -0,0 +1,78 @@
+"""Jadval ko'rgichi: indekslarni qurish va sahifalash/saralash/qidiruv kechikishi.
+
+Sintetik jadval yaratiladi (ilovadagidek ixchamlashtiriladi), so'ng har bir
+so'rov turi uchun birinchi (indeks qurilishi bilan) va takroriy (indeks
+tayyor, natija keshsiz) vaqt o'lchanadi. Takroriy so'rovlardan birortasi
+``--budget-ms`` dan oshsa, skript nol bo'lmagan kod bilan tugaydi::
+
+    python benchmarks/bench_explorer.py --rows 10000000 --budget-ms 100
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from survey.explorer import DEFAULT_MAX_BYTES, TableExplorer  # noqa: E402
+from survey.lru import LRUCache  # noqa: E402
+from survey.schema import compact_frame, standardize_columns  # noqa: E402
+from survey.synthetic import sample_survey  # noqa: E402
+
+PAGE_SIZE = 50
+
+QUERIES = [
+    ('sahifa 1', dict(number=0)),
+    ('sahifa 1000', dict(number=999)),
+    ('saralash Salary', dict(number=0, sort='Salary')),
+    ('saralash Salary (kamayish), sahifa 500', dict(number=499, sort='Salary', descending=True)),
+    ('saralash Country', dict(number=0, sort='Country')),
+    ("qidiruv 'julia'", dict(number=0, search='julia')),
+    ("qidiruv 'python'", dict(number=0, search='python')),
+    ('saralash Country, Salary (kamayish)', dict(number=0, sort=['Country', 'Salary'], descending=[False, True])),
+    ("qidiruv 'python' + saralash Role, Age", dict(number=3, search='python', sort=['Role', 'Age'])),
+    ("qidiruv 'engineer india' + saralash Age", dict(number=0, search='engineer india', sort='Age')),
+    ("filtr Country=USA,UK + qidiruv 'sql'", dict(number=0, search='sql', filters={'Country': ['USA', 'UK']})),
+    ("filtr Role + qidiruv 'r' + saralash Salary", dict(number=2, search='r', filters={'Role': ['BI Developer']},
+                                                        sort='Salary', descending=True)),
+]
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return result, (time.perf_counter() - start) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--budget-ms', type=float, default=100)
+    args = parser.parse_args()
+
+    df, build_ms = timed(lambda: compact_frame(standardize_columns(sample_survey(args.rows)))[0])
+    print(f"{args.rows:,} qator, jadval {build_ms / 1000:.1f}s da yaratildi")
+
+    explorer = TableExplorer(df, cache=LRUCache(DEFAULT_MAX_BYTES))
+    print(f"\n{'so`rov':<46}{'birinchi, ms':>14}{'takroriy, ms':>14}{'sahifa':>8}{'mos qatorlar':>14}")
+    failures = []
+    for name, query in QUERIES:
+        query = dict(query, size=PAGE_SIZE)
+        _, first = timed(lambda: explorer.page(**query))
+        # Takroriy o'lchov: indekslar tayyor, lekin mos qatorlar keshdan olinmaydi
+        explorer.cache = type(explorer.cache)(explorer.cache.max_bytes)
+        (page, total), repeat = timed(lambda: explorer.page(**query))
+        print(f"{name:<46}{first:>14.1f}{repeat:>14.1f}{len(page):>8}{total:>14,}")
+        if repeat > args.budget_ms:
+            failures.append(name)
+
+    explorer.page(number=0, size=PAGE_SIZE, search='python', sort='Salary')
+    _, cached = timed(lambda: explorer.page(number=10, size=PAGE_SIZE, search='python', sort='Salary'))
+    print(f"\nkeshdagi natija bo'yicha keyingi sahifa: {cached:.2f} ms")
+    print(f"indekslar hajmi: {explorer.nbytes / 2**20:.0f} MB, jadval: {df.memory_usage(deep=True).sum() / 2**20:.0f} MB")
+    if failures:
+        raise SystemExit(f"Byudjetdan ({args.budget_ms:.0f} ms) oshgan so'rovlar: {', '.join(failures)}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,120 @@
+"""Bir nechta to'lqinni parallel yuklash: mahalliy HTTP server o'rinbosari bilan.
+
+Server GitHub contents API ko'rinishidagi ro'yxatni va har bir faylni
+sun'iy kechikish bilan beradi (``--flaky`` bilan har bir faylga birinchi
+so'rov 503 qaytaradi - qayta urinishlar tekshiriladi). Ketma-ket (1 oqim)
+va parallel yuklash vaqtlari solishtiriladi.
+
+Ishga tushirish::
+
+    python benchmarks/bench_ingest.py --waves 4 --rows 200000 --latency 1.0 --flaky
+"""
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+WORKDIR = tempfile.mkdtemp(prefix='bench_ingest_')
+# Snapshot va disk keshi vaqtinchalik papkada (import'dan oldin o'rnatiladi)
+os.environ['SURVEY_CACHE_DIR'] = os.path.join(WORKDIR, 'cache')
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from survey.cache import DiskCache  # noqa: E402
+from survey.ingest import fetch_survey  # noqa: E402
+from survey.snapshot import SNAPSHOT_DIR  # noqa: E402
+from survey.synthetic import sample_survey  # noqa: E402
+
+# Keyingi to'lqinlarda ustun nomlari boshqacha - column_mapping bo'yicha tekislanishi kerak
+RENAMED_COLUMNS = {'Role': 'Job Title', 'Salary': 'Yearly Salary', 'YearsExperience': 'Years of Experience'}
+
+
+def make_waves(count, rows):
+    """To'lqin fayllari: {nom: baytlar}"""
+    files = {}
+    for wave in range(count):
+        df = sample_survey(rows, seed=wave)
+        if wave % 2:
+            df = df.rename(columns=RENAMED_COLUMNS)
+        files[f"survey_wave_{wave + 1}.csv"] = df.to_csv(index=False).encode('utf-8')
+    return files
+
+
+def make_handler(files, latency, flaky):
+    failed = set()
+    lock = threading.Lock()
+
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, *args):
+            pass
+
+        def do_GET(self):
+            host = f"http://{self.headers['Host']}"
+            if self.path == '/contents':
+                listing = [{'name': name, 'sha': hashlib.sha1(content).hexdigest(),
+                            'download_url': f"{host}/files/{name}"} for name, content in files.items()]
+                return self._send(200, json.dumps(listing).encode('utf-8'))
+
+            name = self.path.rsplit('/', 1)[-1]
+            if name not in files:
+                return self._send(404, b'')
+            with lock:
+                first = name not in failed
+                failed.add(name)
+            if flaky and first:
+                return self._send(503, b'')
+            time.sleep(latency)
+            self._send(200, files[name])
+
+        def _send(self, status, body):
+            self.send_response(status)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    return Handler
+
+
+def timed_fetch(api_url, max_workers, label):
+    cache = DiskCache(os.path.join(WORKDIR, f"downloads_{label}"))
+    # Har bir o'lchov sovuq holatdan: ustunli nusxalar ham qaytadan quriladi
+    shutil.rmtree(SNAPSHOT_DIR, ignore_errors=True)
+    start = time.perf_counter()
+    df, file_name, version = fetch_survey(cache=cache, api_url=api_url, max_workers=max_workers, on_warning=print)
+    return df, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--waves', type=int, default=4)
+    parser.add_argument('--rows', type=int, default=100_000)
+    parser.add_argument('--latency', type=float, default=1.0, help="Har bir fayl uchun sun'iy kechikish, soniya")
+    parser.add_argument('--flaky', action='store_true', help="Har bir faylga birinchi so'rov 503 qaytaradi")
+    args = parser.parse_args()
+
+    files = make_waves(args.waves, args.rows)
+    server = ThreadingHTTPServer(('127.0.0.1', 0), make_handler(files, args.latency, args.flaky))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    api_url = f"http://127.0.0.1:{server.server_address[1]}/contents"
+
+    try:
+        _, sequential = timed_fetch(api_url, 1, 'sequential')
+        df, parallel = timed_fetch(api_url, args.waves, 'parallel')
+    finally:
+        server.shutdown()
+        shutil.rmtree(WORKDIR, ignore_errors=True)
+
+    print(f"{args.waves} to'lqin x {args.rows:,} qator, kechikish {args.latency}s")
+    print(f"ketma-ket: {sequential:.2f}s  parallel: {parallel:.2f}s  tezlanish: {sequential / parallel:.1f}x")
+    print(f"natija: {len(df):,} qator, {df.shape[1]} ustun")
+    print(df.groupby('SurveyWave', observed=True).size().to_string())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,106 @@
+"""Yuklama testi: sessiyalar soni oshganda jarayon xotirasi.
+
+Ilova ``streamlit.testing`` orqali brauzersiz, bitta jarayonda bir nechta
+parallel sessiya sifatida ishga tushiriladi (barcha sessiyalar tirik
+saqlanadi). Ma'lumotlar jarayon bo'yicha bitta bo'lgani uchun har bir yangi
+sessiya xotirani deyarli oshirmasligi kerak: keyingi sessiyalar uchun o'rtacha
+o'sish ``--max-growth-mb`` dan oshsa, skript nol bo'lmagan kod bilan tugaydi
+(kichik hajmdagi xuddi shu tekshiruv - ``tests/test_sessions.py``)::
+
+    python benchmarks/bench_sessions.py --rows 1000000 --sessions 20 --max-growth-mb 5
+"""
+import argparse
+import gc
+import json
+import os
+import resource
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Repozitoriya oxiriga qo'shiladi: ildizdagi streamlit.py haqiqiy streamlit paketini yashirmasligi kerak
+sys.path.append(ROOT)
+
+from survey.synthetic import write_survey  # noqa: E402
+
+APP_PATH = os.path.join(ROOT, 'streamlit.py')
+
+
+def rss_bytes():
+    """Jarayonning joriy rezident xotirasi (Linux), bo'lmasa eng yuqori qiymat"""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError):
+        scale = 1 if sys.platform == 'darwin' else 1024
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale
+
+
+def open_session(sections):
+    """Yangi sessiya: ilovani ishga tushirish va bir nechta bo'limni ochish"""
+    from streamlit.testing.v1 import AppTest
+
+    session = AppTest.from_file(APP_PATH, default_timeout=600)
+    session.run()
+    if session.exception:
+        raise RuntimeError(session.exception[0].value)
+    for option in session.radio[0].options[:sections]:
+        session.radio[0].set_value(option).run()
+    return session
+
+
+def run(rows, sessions, sections, workdir):
+    path = os.path.join(workdir, f"survey_{rows}.csv")
+    write_survey(path, rows)
+    os.environ['SURVEY_DATA_PATH'] = path
+    os.environ.setdefault('SURVEY_CACHE_DIR', os.path.join(workdir, 'cache'))
+
+    gc.collect()
+    baseline = rss_bytes()
+    alive, results = [], []
+    for count in range(1, sessions + 1):
+        start = time.perf_counter()
+        alive.append(open_session(sections))
+        elapsed = time.perf_counter() - start
+        gc.collect()
+        rss = rss_bytes()
+        results.append({'sessions': count, 'rss_bytes': rss, 'seconds': elapsed})
+        print(f"{count:>4} sessiya  RSS: {rss / 2**20:9.1f} MB  "
+              f"(+{(rss - baseline) / 2**20:8.1f} MB)  {elapsed:6.2f}s")
+
+    return baseline, results
+
+
+def session_growth(results):
+    """Birinchi sessiya ma'lumotlarni yuklaydi; keyingilari uchun sessiyaga to'g'ri keladigan o'sish"""
+    if len(results) < 2:
+        return 0.0
+    return (results[-1]['rss_bytes'] - results[0]['rss_bytes']) / (len(results) - 1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--sessions', type=int, default=20)
+    parser.add_argument('--sections', type=int, default=3, help="Har bir sessiyada ochiladigan bo'limlar soni")
+    parser.add_argument('--max-growth-mb', type=float, default=5,
+                        help="Keyingi har bir sessiya uchun ruxsat etilgan o'rtacha o'sish")
+    parser.add_argument('--output', help="Natijalar JSON fayli")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        baseline, results = run(args.rows, args.sessions, args.sections, workdir)
+    growth = session_growth(results)
+    print(f"\nBirinchi sessiya: +{(results[0]['rss_bytes'] - baseline) / 2**20:.1f} MB, "
+          f"keyingi har bir sessiya: +{growth / 2**20:.2f} MB")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({'rows': args.rows, 'baseline_rss_bytes': baseline, 'results': results}, f, indent=1)
+    if growth > args.max_growth_mb * 2**20:
+        raise SystemExit(f"Sessiyaga to'g'ri keladigan o'sish {growth / 2**20:.2f} MB > {args.max_growth_mb:g} MB")
+
+
+if __name__ == '__main__':
+    main()
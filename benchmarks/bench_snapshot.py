@@ -0,0 +1,62 @@
+"""Sovuq yuklash vaqtini solishtirish: manba fayl (read_excel/read_csv) va Arrow nusxasi.
+
+Ishga tushirish:
+    python benchmarks/bench_snapshot.py --rows 10000 1000000 10000000
+
+Excel varag'i 1 048 576 qatordan oshmaydi, shuning uchun undan katta
+o'lchamlarda manba sifatida CSV ishlatiladi (``read_csv`` bilan solishtiriladi).
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from survey.snapshot import load_snapshot, read_source  # noqa: E402
+from survey.synthetic import sample_survey  # noqa: E402
+
+EXCEL_MAX_ROWS = 1_048_575
+
+
+def timed(func, *args, **kwargs):
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def run(rows, workdir):
+    results = []
+    for n in rows:
+        df = sample_survey(n)
+        name = f"survey_{n}.xlsx" if n <= EXCEL_MAX_ROWS else f"survey_{n}.csv"
+        path = os.path.join(workdir, name)
+        if name.endswith('.xlsx'):
+            df.to_excel(path, index=False)
+        else:
+            df.to_csv(path, index=False)
+
+        snapshot_dir = os.path.join(workdir, "snapshots")
+        _, source_time = timed(read_source, path, name)
+        # Birinchi chaqiruv nusxani quradi, ikkinchisi nusxadan o'qiydi
+        _, build_time = timed(load_snapshot, path, name, root=snapshot_dir)
+        _, snapshot_time = timed(load_snapshot, path, name, root=snapshot_dir)
+
+        results.append((n, name.rsplit('.', 1)[1], source_time, build_time, snapshot_time))
+        print(f"{n:>10,} qator  {results[-1][1]:>4}  manba: {source_time:8.3f}s  "
+              f"nusxa qurish: {build_time:8.3f}s  nusxadan: {snapshot_time:8.3f}s  "
+              f"tezlanish: {source_time / max(snapshot_time, 1e-9):6.1f}x")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, nargs='+', default=[10_000, 1_000_000, 10_000_000])
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory() as workdir:
+        run(args.rows, workdir)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,298 @@
+"""Ilova bosqichlari benchmarki: yuklash, normallashtirish, bo'limlar va grafiklar.
+
+Har bir bosqich brauzersiz, bir nechta o'lchamdagi ma'lumotlarda ishga
+tushiriladi; vaqt (bir necha takrorning eng yaxshisi) va eng yuqori xotira
+(``tracemalloc``) JSON faylga yoziladi. Ikki commit natijalarini solishtirish::
+
+    python benchmarks/bench_stages.py --rows 10000 100000 1000000 --output before.json
+    python benchmarks/bench_stages.py --rows 10000 100000 1000000 --output after.json --compare before.json
+
+Yuklash bosqichlari ilovaning o'z kirish nuqtasi - ``fetch_survey`` orqali
+o'lchanadi: fayl va GitHub contents ro'yxati mahalliy HTTP serverdan
+(ETag va 304 bilan) beriladi, shuning uchun tarmoq, disk keshi va ustunli
+nusxa bosqichlari ham natijaga kiradi. ``--latency-ms`` - har bir javobga
+qo'shiladigan tarmoq kechikishi.
+"""
+import argparse
+import hashlib
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Yuklash keshi va ustunli nusxalar foydalanuvchi keshiga emas, vaqtinchalik papkaga yoziladi
+# (survey modullari kesh joyini import paytida o'qiydi)
+CACHE_DIR = os.environ['SURVEY_CACHE_DIR'] = tempfile.mkdtemp(prefix='survey-bench-')
+
+from survey.cube import AggregateCube  # noqa: E402
+from survey.cache import DiskCache  # noqa: E402
+from survey.dataset import SurveyDataset  # noqa: E402
+from survey.diagnostics import Diagnostics  # noqa: E402
+from survey.figures import build_figures  # noqa: E402
+from survey.filters import BitmapIndex  # noqa: E402
+from survey.ingest import fetch_survey  # noqa: E402
+from survey.languages import LanguageMatrix  # noqa: E402
+from survey.schema import compact_frame, numeric_columns, standardize_columns  # noqa: E402
+from survey.sections import SECTION_TITLES, compute_section, detect_available  # noqa: E402
+from survey.snapshot import SNAPSHOT_DIR, file_fingerprint  # noqa: E402
+from survey.synthetic import sample_survey, write_survey  # noqa: E402
+
+
+class SurveyServer:
+    """Papkadagi fayllarni va ularning GitHub contents ro'yxatini beradigan mahalliy server.
+
+    Har bir javob ETag bilan beriladi, ``If-None-Match`` mos kelsa 304
+    qaytariladi - GitHub API va raw.githubusercontent.com kabi.
+    """
+
+    def __init__(self, directory, latency=0.0):
+        self.directory = directory
+        self.files = {}
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                time.sleep(latency)
+                name = self.path.lstrip('/')
+                if name == 'contents':
+                    body = json.dumps(server.listing()).encode('utf-8')
+                    etag, size = f'"{hashlib.sha1(body).hexdigest()}"', len(body)
+                elif name in server.files:
+                    body, path = None, os.path.join(server.directory, name)
+                    etag, size = f'"{server.files[name]}"', os.path.getsize(path)
+                else:
+                    self.send_error(404)
+                    return
+                if self.headers.get('If-None-Match') == etag:
+                    self.send_response(304)
+                    self.send_header('ETag', etag)
+                    self.end_headers()
+                    return
+                self.send_response(200)
+                self.send_header('ETag', etag)
+                self.send_header('Content-Length', str(size))
+                self.end_headers()
+                if body is not None:
+                    self.wfile.write(body)
+                else:
+                    with open(path, 'rb') as f:
+                        shutil.copyfileobj(f, self.wfile)
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+        self.api_url = f"{self.url}/contents"
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+
+    def publish(self, name):
+        """Ro'yxatda faqat shu fayl (SHA o'rniga mazmun xeshi)"""
+        self.files = {name: file_fingerprint(os.path.join(self.directory, name))}
+
+    def listing(self):
+        return [{'name': name, 'sha': sha, 'size': os.path.getsize(os.path.join(self.directory, name)),
+                 'download_url': f"{self.url}/{name}"} for name, sha in self.files.items()]
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+def measure(func, setup=None, repeat=3):
+    """Bosqichning eng yaxshi vaqti va eng yuqori xotirasi (xotira alohida o'lchanadi)"""
+    best = float('inf')
+    for _ in range(repeat):
+        args = setup() if setup else ()
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+
+    # tracemalloc kodni sekinlashtiradi, shuning uchun xotira vaqtdan alohida o'lchanadi
+    args = setup() if setup else ()
+    tracemalloc.start()
+    try:
+        func(*args)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return best, peak
+
+
+def fresh_dataset(df, available, cube, languages):
+    """Umumiy indekslari tayyor, lekin bo'lim keshlari bo'sh ma'lumotlar"""
+    dataset = SurveyDataset(df, 'bench', available)
+    dataset.__dict__.update(cube=cube, languages=languages)
+    return dataset
+
+
+def clear_snapshots():
+    """Ustunli nusxalarni o'chirish (yuklangan fayllar keshda qoladi)"""
+    shutil.rmtree(SNAPSHOT_DIR, ignore_errors=True)
+    return ()
+
+
+def clear_cache():
+    """Butun diskdagi keshni o'chirish: keyingi yuklash tarmoqdan boshlanadi"""
+    shutil.rmtree(CACHE_DIR, ignore_errors=True)
+    os.makedirs(CACHE_DIR)
+    return ()
+
+
+def ingest(server):
+    """Ilovadagi kabi yuklash: ro'yxat, fayllar (disk keshi orqali) va ustunli nusxa"""
+    return fetch_survey(cache=DiskCache(CACHE_DIR), api_url=server.api_url)
+
+
+def ingest_breakdown(server, setup):
+    """Yuklash ichki bosqichlari (ro'yxat, fayl, o'qish) - bitta ishga tushirish, diagnostika orqali"""
+    setup()
+    diagnostics = Diagnostics(enabled=True)
+    fetch_survey(cache=DiskCache(CACHE_DIR), api_url=server.api_url, diagnostics=diagnostics)
+    timings = diagnostics.frame('timing')
+    return timings.groupby('stage', sort=False)['ms'].sum() / 1000
+
+
+# Yuklash holatlari: (bosqich nomi, tayyorlovchi)
+INGEST_STAGES = [
+    # Kesh bo'sh: ro'yxat va fayl tarmoqdan, manba o'qiladi va ustunli nusxa yoziladi
+    ('ingest.network', clear_cache),
+    # Fayl keshda (SHA bo'yicha), nusxa yo'q: ro'yxat 304, manba diskdan o'qiladi
+    ('ingest.disk_cache', clear_snapshots),
+    # Qayta ishga tushish: ro'yxat 304, ma'lumotlar ustunli nusxadan
+    ('ingest.snapshot', None),
+]
+
+
+def stages(server, name):
+    """(bosqich nomi, funksiya, tayyorlovchi) ro'yxati"""
+    server.publish(name)
+    clear_cache()
+    raw, _, _ = ingest(server)
+    available = detect_available(raw.columns)
+    standardized = standardize_columns(raw)
+    df, _ = compact_frame(standardized)
+    cube = AggregateCube.build(df)
+    languages = LanguageMatrix.from_series(df['ProgrammingLanguages'])
+    numeric_cols = numeric_columns(df)
+
+    items = [(stage, lambda: ingest(server), setup) for stage, setup in INGEST_STAGES]
+    items += [
+        ('normalize.columns', lambda: standardize_columns(raw), None),
+        ('normalize.compact', lambda: compact_frame(standardized), None),
+        ('index.cube', lambda: AggregateCube.build(df), None),
+        ('index.languages', lambda: LanguageMatrix.from_series(df['ProgrammingLanguages']), None),
+        ('index.bitmaps', lambda: BitmapIndex(df), None),
+        ('stats.describe', lambda: df[numeric_cols].describe(), None),
+        ('stats.corr', lambda: df[numeric_cols].corr(), None),
+    ]
+    for section in SECTION_TITLES:
+        items.append((
+            f'section.{section}',
+            lambda dataset, section=section: compute_section(section, dataset),
+            lambda: (fresh_dataset(df, available, cube, languages),),
+        ))
+    for section in SECTION_TITLES:
+        data = compute_section(section, fresh_dataset(df, available, cube, languages))
+        items.append((f'figures.{section}', lambda section=section, data=data: build_figures(section, data), None))
+    return items
+
+
+def run(rows, file_format, repeat, workdir, latency=0.0):
+    results = []
+    server = SurveyServer(workdir, latency)
+    try:
+        for n in rows:
+            name = f"survey_{n}.{file_format}"
+            path = os.path.join(workdir, name)
+            if file_format == 'xlsx':
+                sample_survey(n).to_excel(path, index=False)
+            else:
+                write_survey(path, n)
+
+            for stage, func, setup in stages(server, name):
+                seconds, peak = measure(func, setup, repeat)
+                results.append({'rows': n, 'stage': stage, 'seconds': seconds, 'peak_bytes': peak})
+                print(f"{n:>10,} qator  {stage:<24} {seconds:9.4f}s  {peak / 2**20:9.1f} MB")
+            for stage, setup in INGEST_STAGES:
+                for part, seconds in ingest_breakdown(server, setup or (lambda: ())).items():
+                    results.append({'rows': n, 'stage': f"{stage}/{part}", 'seconds': seconds, 'peak_bytes': None})
+                    print(f"{n:>10,} qator  {stage + '/' + part:<24} {seconds:9.4f}s")
+    finally:
+        server.stop()
+    return results
+
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__)), check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results, baseline_path):
+    """Avvalgi natijalar bilan solishtirish (vaqt nisbati > 1 - sekinlashgan)"""
+    with open(baseline_path, encoding='utf-8') as f:
+        baseline = {(item['rows'], item['stage']): item for item in json.load(f)['results']}
+    print(f"\nSolishtirish: {baseline_path}")
+    for item in results:
+        old = baseline.get((item['rows'], item['stage']))
+        if old is None:
+            continue
+        ratio = item['seconds'] / max(old['seconds'], 1e-9)
+        flag = '  <-- sekinlashdi' if ratio > 1.2 else ''
+        print(f"{item['rows']:>10,} qator  {item['stage']:<24} {old['seconds']:9.4f}s -> "
+              f"{item['seconds']:9.4f}s  ({ratio:5.2f}x){flag}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, nargs='+', default=[10_000, 100_000, 1_000_000])
+    parser.add_argument('--format', choices=['csv', 'xlsx'], default='csv', help="Manba fayl formati")
+    parser.add_argument('--repeat', type=int, default=3, help="Vaqt o'lchash takrorlari soni")
+    parser.add_argument('--latency-ms', type=float, default=0, help="Har bir HTTP javobga qo'shiladigan kechikish, ms")
+    parser.add_argument('--output', default='benchmark_results.json', help="Natijalar JSON fayli")
+    parser.add_argument('--compare', help="Solishtirish uchun avvalgi natijalar fayli")
+    args = parser.parse_args()
+
+    try:
+        with tempfile.TemporaryDirectory() as workdir:
+            results = run(args.rows, args.format, args.repeat, workdir, args.latency_ms / 1000)
+    finally:
+        shutil.rmtree(CACHE_DIR, ignore_errors=True)
+
+    payload = {
+        'commit': git_commit(),
+        'created': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'pandas': pd.__version__,
+        'machine': platform.machine(),
+        'cpu_count': os.cpu_count(),
+        'format': args.format,
+        'repeat': args.repeat,
+        'latency_ms': args.latency_ms,
+        'results': results,
+    }
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(payload, f, indent=1)
+    print(f"\nNatijalar: {args.output}")
+
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,169 @@
+"""Ilova ishga tushish profili va import vaqti byudjeti.
+
+``streamlit.py`` ning modul darajasidagi importlari (``ast`` orqali
+o'qiladi, shuning uchun yangi importlar avtomatik hisobga olinadi) toza
+jarayonda ``python -X importtime`` bilan bajariladi. Hisobot: umumiy import
+vaqti, ilovaning o'z ulushi (bir necha takrorning eng yaxshisi) va eng
+qimmat modullar.
+
+Ilova ``streamlit``, ``pandas`` va ``pyarrow`` importlaridan qochib
+qutula olmaydi, ularning vaqti esa mashinaga bog'liq. Shuning uchun ular
+(``BASELINE_MODULES``) o'sha jarayonda oldindan import qilinadi va byudjet
+faqat undan keyingi importlarga - ``survey.*`` modullari va ular tortib
+keladigan qo'shimcha paketlarga qo'llanadi.
+
+Byudjet: ilova ulushi ``--budget-ms`` dan oshsa yoki ishga tushishda og'ir,
+faqat ba'zi bo'limlarga kerakli modullar (``LAZY_MODULES``) yuklangan
+bo'lsa, skript nol bo'lmagan kod bilan tugaydi. ``tests/test_startup.py``
+da ``LAZY_MODULES`` tekshiruvi har doim, vaqt byudjeti esa ``slow`` belgisi
+bilan (``-m slow``) bajariladi::
+
+    python benchmarks/bench_startup.py --budget-ms 300
+    python benchmarks/bench_startup.py --top 30 --output startup.json
+    python benchmarks/bench_startup.py --app   # birinchi to'liq chizish vaqti ham
+"""
+import argparse
+import ast
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP_PATH = os.path.join(ROOT, 'streamlit.py')
+
+# Ishga tushishda import qilinmasligi kerak bo'lgan modullar (kerak bo'lganda yuklanadi)
+LAZY_MODULES = ['matplotlib', 'seaborn', 'scipy', 'duckdb', 'plotly.express', 'survey.figures']
+
+# Ilova qochib qutula olmaydigan importlar - byudjetga kirmaydi
+BASELINE_MODULES = ['streamlit', 'pandas', 'pyarrow']
+
+# Ilovaning o'z importlari uchun chegara (asosiy modullardan keyin)
+DEFAULT_BUDGET_MS = 300
+
+# importtime chiqishida asosiy modullar va ilova importlarini ajratuvchi qator
+APP_MARKER = 'import time: --- app ---'
+
+
+def app_imports(path=APP_PATH):
+    """Ilova faylining modul darajasidagi import qatorlari"""
+    with open(path, encoding='utf-8') as f:
+        tree = ast.parse(f.read(), path)
+    return [ast.unparse(node) for node in tree.body if isinstance(node, (ast.Import, ast.ImportFrom))]
+
+
+def profile_imports(statements, baseline=BASELINE_MODULES):
+    """Importlarni toza jarayonda bajarish.
+
+    Avval ``baseline`` modullari import qilinadi, so'ng ``statements``.
+    Natija: (modullar ro'yxati, umumiy vaqt mks, ilova ulushi mks,
+    yuklangan modullar). Ro'yxatdagi har bir modulda ``app`` - u asosiy
+    modullardan keyin yuklanganmi.
+    """
+    # Repozitoriya oxiriga qo'shiladi va jarayon boshqa papkada ishga tushadi:
+    # ildizdagi streamlit.py haqiqiy streamlit paketini yashirmasligi kerak
+    code = '\n'.join([f"import sys; sys.path.append({ROOT!r})",
+                      *[f"try:\n    import {name}\nexcept ImportError:\n    pass" for name in baseline],
+                      f"sys.stderr.write({APP_MARKER!r} + '\\n'); sys.stderr.flush()",
+                      *statements,
+                      "import json; print(json.dumps(sorted(sys.modules)))"])
+    with tempfile.TemporaryDirectory() as workdir:
+        result = subprocess.run([sys.executable, '-X', 'importtime', '-c', code], cwd=workdir,
+                                capture_output=True, text=True, check=True)
+    rows, app = [], False
+    for line in result.stderr.splitlines():
+        if line == APP_MARKER:
+            app = True
+            continue
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        rows.append({'module': name.strip(), 'depth': (len(name) - len(name.lstrip()) - 1) // 2,
+                     'self_us': int(self_us), 'cumulative_us': int(cumulative_us), 'app': app})
+    loaded = json.loads(result.stdout.strip().splitlines()[-1])
+    return (rows, sum(row['self_us'] for row in rows), sum(row['self_us'] for row in rows if row['app']),
+            loaded)
+
+
+def eager_modules(loaded):
+    """Ishga tushishda yuklangan, lekin kechiktirilishi kerak bo'lgan modullar"""
+    return [module for module in LAZY_MODULES if module in loaded]
+
+
+def budget_failures(app_ms, loaded, budget_ms=DEFAULT_BUDGET_MS):
+    """Byudjet buzilishlari ro'yxati (bo'sh bo'lsa - byudjet bajarildi)"""
+    failures = []
+    if app_ms > budget_ms:
+        failures.append(f"ilova importlari {app_ms:.0f} ms byudjetdan ({budget_ms:.0f} ms) oshdi")
+    eager = eager_modules(loaded)
+    if eager:
+        failures.append(f"ishga tushishda yuklanmasligi kerak bo'lgan modullar: {', '.join(eager)}")
+    return failures
+
+
+def first_render_seconds():
+    """Ilovaning birinchi to'liq chizilishi (AppTest, namunaviy ma'lumotlar bilan)"""
+    code = '\n'.join([
+        f"import sys, time; sys.path.append({ROOT!r})",
+        "start = time.perf_counter()",
+        "from streamlit.testing.v1 import AppTest",
+        f"at = AppTest.from_file({APP_PATH!r}, default_timeout=600); at.run()",
+        "assert not at.exception, at.exception[0].value",
+        "print(time.perf_counter() - start)",
+    ])
+    with tempfile.TemporaryDirectory() as workdir:
+        env = dict(os.environ, SURVEY_CACHE_DIR=os.environ.get('SURVEY_CACHE_DIR', os.path.join(workdir, 'cache')))
+        result = subprocess.run([sys.executable, '-c', code], cwd=workdir, env=env,
+                                capture_output=True, text=True, check=True)
+    return float(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--budget-ms', type=float, default=DEFAULT_BUDGET_MS, help="Import vaqti chegarasi, ms")
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--top', type=int, default=15, help="Hisobotdagi eng qimmat modullar soni")
+    parser.add_argument('--app', action='store_true', help="Birinchi to'liq chizish vaqtini ham o'lchash")
+    parser.add_argument('--output', help="Natijalar JSON fayli")
+    args = parser.parse_args()
+
+    statements = app_imports()
+    best_rows, best_total, best_app, loaded = None, float('inf'), float('inf'), []
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        rows, total, app, loaded = profile_imports(statements)
+        if app < best_app:
+            best_rows, best_total, best_app = rows, total, app
+        wall = time.perf_counter() - start
+    eager = eager_modules(loaded)
+
+    print(f"Importlar ({len(statements)} qator): jami {best_total / 1000:.0f} ms, "
+          f"shundan ilova {best_app / 1000:.0f} ms (byudjet {args.budget_ms:.0f} ms, "
+          f"{', '.join(BASELINE_MODULES)} hisobga olinmaydi), jarayon {wall:.2f}s")
+    print(f"\n{'modul':<50}{'cumulative, ms':>16}{'self, ms':>10}")
+    for row in sorted(best_rows, key=lambda row: row['cumulative_us'], reverse=True)[:args.top]:
+        name = '  ' * row['depth'] + row['module']
+        print(f"{name[:50]:<50}{row['cumulative_us'] / 1000:>16.1f}{row['self_us'] / 1000:>10.1f}")
+
+    render = None
+    if args.app:
+        render = first_render_seconds()
+        print(f"\nBirinchi to'liq chizish (AppTest): {render:.2f}s")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({'total_ms': best_total / 1000, 'app_ms': best_app / 1000, 'budget_ms': args.budget_ms,
+                       'baseline_modules': BASELINE_MODULES, 'eager_lazy_modules': eager,
+                       'first_render_s': render, 'modules': best_rows}, f, indent=1)
+
+    failures = budget_failures(best_app / 1000, loaded, args.budget_ms)
+    if failures:
+        print('\nXATO: ' + '; '.join(failures))
+        sys.exit(1)
+    print("\nByudjet bajarildi.")
+
+
+if __name__ == '__main__':
+    main()
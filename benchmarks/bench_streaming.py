@@ -0,0 +1,88 @@
+"""Bo'laklab o'qish va to'liq yuklash: eng yuqori xotira, vaqt va natijalar farqi.
+
+Sintetik CSV yaratiladi va ikki usulda umumiy statistika olinadi:
+``read_csv`` + ``describe()`` (butun jadval xotirada) hamda
+``stream_csv`` (bir vaqtda faqat bitta bo'lak). Eng yuqori xotira
+``tracemalloc`` bilan o'lchanadi; count/mean/std/min/max aynan mos kelishi,
+kvartillarning rang xatosi esa eskiz xatoligi chegarasida bo'lishi
+tekshiriladi.
+
+Ishga tushirish::
+
+    python benchmarks/bench_streaming.py --rows 2000000 --chunk-rows 200000
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from survey.schema import standardize_columns  # noqa: E402
+from survey.streaming import stream_csv  # noqa: E402
+from survey.synthetic import write_survey  # noqa: E402
+
+EXACT_ROWS = ['count', 'mean', 'std', 'min', 'max']
+
+
+def measure(func):
+    tracemalloc.start()
+    start = time.perf_counter()
+    try:
+        result = func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, time.perf_counter() - start, peak
+
+
+def full_describe(path):
+    df = standardize_columns(pd.read_csv(path))
+    return df.select_dtypes(include='number').describe()
+
+
+def rank_error(values, value, q):
+    """``value`` ning ``values`` dagi rangi ``q`` dan qanchaga farq qiladi (takroriy qiymatlar hisobga olinadi)"""
+    values = values[~np.isnan(values)]
+    below, upto = np.mean(values < value), np.mean(values <= value)
+    return max(0.0, below - q, q - upto)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--chunk-rows', type=int, default=200_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        path = os.path.join(workdir, 'survey.csv')
+        write_survey(path, args.rows)
+        size = os.path.getsize(path)
+
+        expected, full_time, full_peak = measure(lambda: full_describe(path))
+        summary, stream_time, stream_peak = measure(lambda: stream_csv(path, chunksize=args.chunk_rows))
+        numeric = standardize_columns(pd.read_csv(path))[list(expected.columns)]
+
+    actual = summary.describe()[expected.columns]
+    exact_error = ((actual.loc[EXACT_ROWS] - expected.loc[EXACT_ROWS]).abs() / expected.loc[EXACT_ROWS].abs()).max().max()
+    quartile_error = max(
+        rank_error(numeric[col].to_numpy(dtype='float64'), actual.loc[f"{int(q * 100)}%", col], q)
+        for col in actual.columns for q in (0.25, 0.5, 0.75)
+    )
+
+    print(f"{args.rows:,} qator, CSV {size / 2**20:.1f} MB, bo'lak {args.chunk_rows:,} qator ({summary.chunks} ta)")
+    print(f"to'liq yuklash: {full_time:6.2f}s  eng yuqori xotira {full_peak / 2**20:8.1f} MB")
+    print(f"bo'laklab:      {stream_time:6.2f}s  eng yuqori xotira {stream_peak / 2**20:8.1f} MB")
+    print(f"count/mean/std/min/max nisbiy farqi: {exact_error:.2e}")
+    print(f"kvartillar rang xatosi: {quartile_error:.2%}")
+    if not np.isfinite(exact_error) or exact_error > 1e-9:
+        raise SystemExit("Welford statistikasi to'liq hisobdan farq qiladi")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,92 @@
+"""Umumiy statistika: bitta o'tish (``NumericSummary``) va alohida skanlar.
+
+Eski yo'l - umumiy ma'lumot bo'limidagi ``describe()``, maosh
+kartochkalari uchun ``mean()``/``median()``/``min()``/``max()`` va qo'shimcha
+analiz uchun ``select_dtypes`` - har biri jadvalni qayta ko'rib chiqadi.
+Yangi yo'l barcha raqamli ustunlar statistikasini bitta o'tishda yig'adi.
+Bo'laklar (``--parts``) uchun alohida qurilgan statistika birlashtirilib,
+butun jadval natijasi bilan solishtiriladi::
+
+    python benchmarks/bench_summary.py --rows 10000000 --parts 4
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from survey.schema import compact_frame, numeric_columns, standardize_columns  # noqa: E402
+from survey.summary import NumericSummary  # noqa: E402
+from survey.synthetic import sample_survey  # noqa: E402
+
+EXACT_ROWS = ['count', 'mean', 'std', 'min', 'max']
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def separate_scans(df):
+    """Bo'limlar avval qilgan hisoblar (har biri alohida o'tish)"""
+    describe = df[numeric_columns(df)].describe()
+    salary = df['Salary']
+    metrics = salary.mean(), salary.median(), salary.min(), salary.max()
+    numeric_columns(df)
+    return describe, metrics
+
+
+def rank_error(values, value, q):
+    """``value`` ning ``values`` dagi rangi ``q`` dan qanchaga farq qiladi (takroriy qiymatlar hisobga olinadi)"""
+    values = values[~np.isnan(values)]
+    below, upto = np.mean(values < value), np.mean(values <= value)
+    return max(0.0, below - q, q - upto)
+
+
+def relative_error(actual, expected):
+    return float(((actual - expected).abs() / expected.abs().replace(0, 1)).max().max())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=2_000_000)
+    parser.add_argument('--parts', type=int, default=4, help="Birlashtirish tekshiruvi uchun bo'laklar soni")
+    args = parser.parse_args()
+
+    df = compact_frame(standardize_columns(sample_survey(args.rows)))[0]
+    (expected, _), old_time = timed(lambda: separate_scans(df))
+    summary, new_time = timed(lambda: NumericSummary.from_frame(df))
+    actual = summary.describe()
+
+    bounds = np.linspace(0, len(df), args.parts + 1).astype(int)
+    parts = [NumericSummary.from_frame(df.iloc[start:end]) for start, end in zip(bounds[:-1], bounds[1:])]
+    merged, merge_time = timed(lambda: _merge_all(parts))
+    merged = merged.describe()
+
+    quartile_error = max(
+        rank_error(df[col].to_numpy(dtype='float64', na_value=np.nan), actual.loc[f"{q * 100:g}%", col], q)
+        for col in summary.columns for q in (0.25, 0.5, 0.75)
+    )
+    print(f"{args.rows:,} qator, {len(summary.columns)} ta raqamli ustun")
+    print(f"alohida skanlar (describe + maosh metrikalari): {old_time:6.2f}s")
+    print(f"bitta o'tish (NumericSummary):                  {new_time:6.2f}s")
+    print(f"{args.parts} bo'lakni birlashtirish:                      {merge_time * 1000:6.1f} ms")
+    print(f"count/mean/std/min/max nisbiy farqi: {relative_error(actual.loc[EXACT_ROWS], expected.loc[EXACT_ROWS]):.2e}"
+          f" (birlashtirilgan: {relative_error(merged.loc[EXACT_ROWS], expected.loc[EXACT_ROWS]):.2e})")
+    print(f"kvartillar rang xatosi: {quartile_error:.2%}"
+          f" (eskiz {'aniq' if summary.sketches[summary.columns[0]].exact else 'taqribiy'})")
+
+
+def _merge_all(parts):
+    merged = parts[0]
+    for part in parts[1:]:
+        merged = merged.merge(part)
+    return merged
+
+
+if __name__ == '__main__':
+    main()
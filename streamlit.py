@@ -1,15 +1,25 @@
 import streamlit as st
 import pandas as pd
-import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
-import requests
-from io import StringIO, BytesIO
-import zipfile
+from io import BytesIO
 import os
+import hashlib
+import time
+
+from survey.correlation import CORRELATIONS
+from survey.dataset import FILTERED, DatasetStore
+from survey.diagnostics import Diagnostics
+from survey.figure_cache import FIGURES
+from survey.explorer import PAGE_SIZES, SEARCHES
+from survey.ingest import (
+    FORCE_STREAMING, LOCAL_SOURCE, fetch_survey, load_local, prepare_dataset, should_stream, stream_local, stream_survey
+)
+from survey.schema import standardize_columns
+from survey.sql_dataset import open_sql_dataset, sql_source
+from survey.sections import (
+    INTERVAL_CHARTS, INTERVAL_FIGURES, SALARY_PERCENTILES, SCATTER_MAX_POINTS, SECTION_TITLES, attach_intervals,
+    compute_intervals, compute_section
+)
+from survey.synthetic import sample_survey
 
 # Sahifa sarlavhasi
 st.set_page_config(
@@ -24,12 +34,12 @@ st.title("📊 Data Professional Survey Dashboard")
 st.markdown("*Data sohasidagi mutaxassislar so'rovnomasi natijalari tahlili*")
 
 # Kerakli kutubxonalar haqida xabar berish
-required_packages = ['openpyxl', 'plotly', 'seaborn', 'matplotlib']
+required_packages = ['openpyxl', 'plotly', 'pyarrow', 'scipy']
 st.sidebar.header("Tavsiya etilgan kutubxonalar")
 st.sidebar.info("""
 Ushbu dasturni to'g'ri ishlashi uchun quyidagi kutubxonalar kerak:
 ```
-pip install streamlit pandas numpy matplotlib seaborn plotly requests openpyxl
+pip install streamlit pandas numpy plotly requests openpyxl pyarrow scipy
 ```
 """)
 
@@ -68,58 +78,26 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
+# Diagnostika (sessiya uchun): yon paneldagi belgi o'chiq bo'lsa hech narsa yozilmaydi
+diagnostics = st.session_state.setdefault('diagnostics', Diagnostics())
+diagnostics.start_run(st.session_state.get('diagnostics_enabled', False))
+
+# Ma'lumotlarni yuklab bo'lmaganda ishlatiladigan namunali ma'lumotlar o'lchami
+SAMPLE_SIZE = 500
+SAMPLE_SEED = 42
+
 # GitHub'dan ma'lumotlarni yuklab olish funksiyasi
-@st.cache_data
 def download_and_process_data():
-    """GitHub'dan ma'lumotlarni yuklab olish va qayta ishlash"""
+    """GitHub'dan (yoki SURVEY_DATA_PATH'dagi mahalliy fayldan) ma'lumotlarni yuklab olish"""
     try:
-        # 1. Avval GitHub API orqali fayllarni tekshiramiz
-        repo_owner = "UktambekA"
-        repo_name = "Data-Professional-Survey"
-        api_url = f"https://api.github.com/repos/{repo_owner}/{repo_name}/contents"
-        
-        response = requests.get(api_url)
-        response.raise_for_status()
-        
-        # CSV yoki Excel fayllarni qidirish
-        data_files = [item for item in response.json() if item['name'].endswith(('.csv', '.xlsx', '.xls'))]
-        
-        if data_files:
-            # Birinchi topilgan faylni yuklab olish
-            file_url = data_files[0]['download_url']
-            file_name = data_files[0]['name']
-            
-            file_response = requests.get(file_url)
-            file_response.raise_for_status()
-            
-            # Fayl kengaytmasiga qarab o'qish
-            if file_name.endswith('.csv'):
-                df = pd.read_csv(BytesIO(file_response.content))
-            else:  # Excel fayl
-                try:
-                    df = pd.read_excel(BytesIO(file_response.content))
-                except ImportError:
-                    st.error("Excel fayllarni o'qish uchun 'openpyxl' kutubxonasi kerak. Iltimos, 'pip install openpyxl' buyrug'i orqali o'rnating.")
-                    raise
-            
-            return df, file_name
-        
-        # Agar repozitoriyada to'g'ridan-to'g'ri fayl bo'lmasa, zaxira variantga o'tish
-        st.warning("GitHub repozitoriyasida to'g'ridan-to'g'ri CSV yoki Excel fayl topilmadi. Boshqa manbadan yuklab olishga harakat qilinmoqda...")
-        
-        # Zaxira variant - agar umumiy ma'lumotlar topilmasa
-        url = "https://raw.githubusercontent.com/AlexTheAnalyst/Power-BI/main/Power%20BI%20-%20Final%20Project.xlsx"
-        response = requests.get(url)
-        try:
-            df = pd.read_excel(BytesIO(response.content))
-            return df, "Power BI - Final Project.xlsx"
-        except ImportError:
-            st.error("Excel fayllarni o'qish uchun 'openpyxl' kutubxonasi kerak. Iltimos, 'pip install openpyxl' buyrug'i orqali o'rnating.")
-            # Import Error kelganda namunali ma'lumotlarni yaratish
-            raise
-        return df, "Power BI - Final Project.xlsx"
+        if LOCAL_SOURCE:
+            return load_local(LOCAL_SOURCE)
+        # GitHub'dan yuklash (diskdagi kesh va ustunli nusxa orqali)
+        return fetch_survey(on_warning=st.warning, diagnostics=diagnostics)
         
     except Exception as e:
+        if isinstance(e, ImportError):
+            st.error("Excel fayllarni o'qish uchun 'openpyxl' kutubxonasi kerak. Iltimos, 'pip install openpyxl' buyrug'i orqali o'rnating.")
         st.error(f"Ma'lumotlarni yuklab olishda xatolik: {e}")
         
         # Namunali ma'lumot (GitHub'dan ma'lumot olishning iloji bo'lmasa)
@@ -127,131 +105,293 @@ def download_and_process_data():
         st.warning("Ma'lumotlar yuklab olishda muammo yuzaga keldi. Namunali ma'lumotlar yaratilmoqda...")
         
         # Data professional survey uchun namunali ma'lumotlar yaratish
-        roles = ['Data Scientist', 'Data Analyst', 'Data Engineer', 'Machine Learning Engineer', 'BI Developer']
-        countries = ['USA', 'UK', 'Canada', 'Germany', 'France', 'Australia', 'India', 'Japan', 'China', 'Brazil']
-        education = ['Bachelor\'s', 'Master\'s', 'PhD', 'Self-taught', 'Bootcamp']
-        salaries = np.random.randint(40000, 150000, 500)
-        years_experience = np.random.randint(0, 20, 500)
-        work_life_balance = np.random.randint(1, 11, 500)  # 1-10 scale
-        job_satisfaction = np.random.randint(1, 11, 500)  # 1-10 scale
-        career_switch = np.random.choice(['Yes', 'No'], 500)
-        programming_languages = [', '.join(np.random.choice(['Python', 'R', 'SQL', 'Java', 'JavaScript', 'C++', 'Julia'], 
-                                                        size=np.random.randint(1, 5))) for _ in range(500)]
-        
-        df = pd.DataFrame({
-            'Role': np.random.choice(roles, 500),
-            'Country': np.random.choice(countries, 500),
-            'Education': np.random.choice(education, 500),
-            'YearsExperience': years_experience,
-            'Salary': salaries,
-            'WorkLifeBalance': work_life_balance,
-            'JobSatisfaction': job_satisfaction,
-            'CareerSwitch': career_switch,
-            'ProgrammingLanguages': programming_languages,
-            'Age': np.random.randint(22, 65, 500),
-            'Gender': np.random.choice(['Male', 'Female', 'Other', 'Prefer not to say'], 500),
-            'RemoteWork': np.random.choice(['Fully Remote', 'Hybrid', 'In Office'], 500)
-        })
+        df = sample_survey(SAMPLE_SIZE, seed=SAMPLE_SEED)
         
-        return df, "sample_data.csv"
+        return df, "sample_data.csv", f"sample_data.csv@{SAMPLE_SEED}"
 
-# Ma'lumotlarni yuklab olish
-with st.spinner("Ma'lumotlar yuklab olinmoqda..."):
+# Ma'lumotlar jarayon bo'yicha bitta: barcha sessiyalar bir xil o'zgarmas SurveyDataset'ni
+# nusxa olmasdan ishlatadi (st.cache_data kabi har bir sessiyaga alohida nusxa berilmaydi).
+# Asl jadval normallashtirilgach tashlab yuboriladi, indekslar oldindan quriladi.
+# SURVEY_QUERY_BACKEND=duckdb va mahalliy Parquet/CSV manba bo'lsa jadval umuman yuklanmaydi:
+# bo'limlar, filtrlar va jadval ko'rgichi so'rovlari fayl ustida DuckDB'da bajariladi.
+@st.cache_resource(show_spinner=False)
+def load_shared_dataset():
+    """Yuklash, ustunlarni standartlashtirish, ixcham turlarga o'tkazish va indekslarni qurish"""
+    diagnostics.miss('dataset')
+    if LOCAL_SOURCE:
+        with diagnostics.timer('backend'):
+            sql_dataset = open_sql_dataset(LOCAL_SOURCE)
+        if sql_dataset is not None:
+            with diagnostics.timer('precompute'):
+                sql_dataset.precompute()
+            return DatasetStore(sql_dataset), os.path.basename(LOCAL_SOURCE), None
     try:
-        df, file_name = download_and_process_data()
+        df, file_name, dataset_version = download_and_process_data()
     except Exception as e:
         st.error(f"Ma'lumotlarni yuklab olishda xatolik: {e}")
         st.info("Namunali ma'lumotlar yaratilmoqda...")
         
-        # Namunali ma'lumot yaratish
-        np.random.seed(42)  # Natijalar takrorlanishi uchun
-        sample_size = 500
-        
-        # Data professional survey uchun namunali ma'lumotlar yaratish
-        roles = ['Data Scientist', 'Data Analyst', 'Data Engineer', 'Machine Learning Engineer', 'BI Developer']
-        countries = ['USA', 'UK', 'Canada', 'Germany', 'France', 'Australia', 'India', 'Japan', 'China', 'Brazil']
-        education = ['Bachelor\'s', 'Master\'s', 'PhD', 'Self-taught', 'Bootcamp']
-        salaries = np.random.randint(40000, 150000, sample_size)
-        years_experience = np.random.randint(0, 20, sample_size)
-        work_life_balance = np.random.randint(1, 11, sample_size)  # 1-10 scale
-        job_satisfaction = np.random.randint(1, 11, sample_size)  # 1-10 scale
-        career_switch = np.random.choice(['Yes', 'No'], sample_size)
-        programming_languages = [', '.join(np.random.choice(['Python', 'R', 'SQL', 'Java', 'JavaScript', 'C++', 'Julia'], 
-                                                        size=np.random.randint(1, 5))) for _ in range(sample_size)]
-        
-        df = pd.DataFrame({
-            'Role': np.random.choice(roles, sample_size),
-            'Country': np.random.choice(countries, sample_size),
-            'Education': np.random.choice(education, sample_size),
-            'YearsExperience': years_experience,
-            'Salary': salaries,
-            'WorkLifeBalance': work_life_balance,
-            'JobSatisfaction': job_satisfaction,
-            'CareerSwitch': career_switch,
-            'ProgrammingLanguages': programming_languages,
-            'Age': np.random.randint(22, 65, sample_size),
-            'Gender': np.random.choice(['Male', 'Female', 'Other', 'Prefer not to say'], sample_size),
-            'RemoteWork': np.random.choice(['Fully Remote', 'Hybrid', 'In Office'], sample_size)
-        })
+        # Namunali ma'lumot yaratish (natijalar takrorlanishi uchun o'zgarmas seed bilan)
+        df = sample_survey(SAMPLE_SIZE, seed=SAMPLE_SEED)
         
         file_name = "namuna_malumotlar.csv"
+        dataset_version = f"namuna_malumotlar.csv@{SAMPLE_SEED}"
         st.success("Namunali ma'lumotlar muvaffaqiyatli yaratildi!")
 
+    dataset, memory_report = prepare_dataset(df, dataset_version, diagnostics=diagnostics)
+    with diagnostics.timer('precompute'):
+        dataset.precompute()
+    return DatasetStore(dataset), file_name, memory_report
+
+def show_salary_metrics(data):
+    """Maosh kartochkalari: o'rtacha, mediana, minimal, maksimal va persentillar"""
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        st.metric("O'rtacha maosh", f"${int(data['mean']):,}")
+    
+    with col2:
+        st.metric("Mediana maosh", f"${int(data['median']):,}")
+    
+    with col3:
+        st.metric("Minimal maosh", f"${int(data['min']):,}")
+    
+    with col4:
+        st.metric("Maksimal maosh", f"${int(data['max']):,}")
+    
+    percentiles = ", ".join(f"{int(q * 100)}%: ${int(v):,}" for q, v in data['percentiles'].items())
+    accuracy = "aniq" if data['exact_quantiles'] else "taxminiy, rang xatosi ~1.65%"
+    st.caption(f"Persentillar ({accuracy}): {percentiles}")
+
+# Juda katta manba (STREAM_THRESHOLD_BYTES dan katta yoki SURVEY_STREAMING=1): jadval xotiraga
+# yuklanmaydi, fayl diskka yuklanib bo'laklab o'qiladi va faqat yig'ilgan statistika ko'rsatiladi.
+# Jadvalsiz DuckDB rejimida katta mahalliy fayl ham (SURVEY_STREAMING=1 bo'lmasa) to'liq dashboard bilan ochiladi.
+@st.cache_resource(show_spinner=False)
+def streaming_mode():
+    return should_stream() and (FORCE_STREAMING or not sql_source(LOCAL_SOURCE))
+
+@st.cache_resource(show_spinner=False)
+def load_streaming_summary():
+    """Bo'laklab o'qish: Welford o'rtacha/dispersiya, min/max, kvantil eskizlari va ko-momentlar"""
+    diagnostics.miss('summary')
+    if LOCAL_SOURCE:
+        return stream_local(LOCAL_SOURCE, diagnostics=diagnostics)
+    return stream_survey(on_warning=st.warning, diagnostics=diagnostics)
+
+summary = None
+if streaming_mode():
+    try:
+        with st.spinner("Katta fayl bo'laklab o'qilmoqda..."):
+            summary, file_name, _ = diagnostics.cached_call('summary', load_streaming_summary)
+    except (RuntimeError, OSError, ValueError) as e:
+        # Fayllar topilmasa yoki yuklanmasa (requests xatolari ham OSError) - odatdagi yuklash yo'li,
+        # u o'z zaxira manbasiga va namunali ma'lumotlarga ega
+        st.error(f"Katta faylni bo'laklab o'qib bo'lmadi: {e}")
+        st.info("Ma'lumotlar odatdagi usulda yuklanmoqda...")
+
+if summary is not None:
+    st.subheader(f"📂 Yuklab olingan ma'lumotlar: {file_name}")
+    st.write(f"Ma'lumotlar o'lchami: {summary.rows} qator")
+    st.info(
+        f"Fayl xotiraga to'liq yuklanmadi: {summary.chunks} ta bo'lakda o'qildi. "
+        "Faqat umumiy statistika, maosh ko'rsatkichlari va korrelyatsiyalar mavjud."
+    )
+    
+    st.header("Umumiy ma'lumot")
+    st.subheader("Ma'lumotlar jadvali")
+    st.dataframe(summary.head)
+    
+    st.subheader("Umumiy statistika")
+    describe = summary.describe()
+    if describe is not None:
+        st.dataframe(describe)
+        st.caption("Kvartillar kvantil eskizidan olingan")
+    else:
+        st.info("Raqamli ma'lumotlar mavjud emas")
+    
+    salary_metrics = summary.salary_metrics(SALARY_PERCENTILES)
+    if salary_metrics is not None:
+        st.header("Maosh tahlili")
+        st.subheader("Maosh statistikasi")
+        show_salary_metrics(salary_metrics)
+        for column, label in [('YearsExperience', "Tajriba"), ('JobSatisfaction', "Ish qoniqish darajasi")]:
+            corr = summary.correlation_pair('Salary', column)
+            if corr is not None and pd.notna(corr):
+                st.write(f"{label} va maosh o'rtasidagi korrelyatsiya koeffitsienti: **{corr:.2f}**")
+    
+    # Korrelyatsiya matritsasi bo'laklar bo'yicha yig'ilgan ko-momentlardan (jadvalsiz)
+    st.header("Qo'shimcha statistik analiz")
+    st.subheader("Korrelyatsiya matritsasi")
+    corr_matrix = summary.correlation()
+    if corr_matrix is not None:
+        from survey.figures import extra_figures
+
+        st.plotly_chart(extra_figures({'corr_matrix': corr_matrix})['corr_heatmap'], use_container_width=True)
+    else:
+        st.info("Korrelyatsiya matritsasi uchun yetarli raqamli ustunlar mavjud emas")
+    st.stop()
+
+# Ma'lumotlarni yuklab olish
+with st.spinner("Ma'lumotlar yuklab olinmoqda..."):
+    store, file_name, memory_report = diagnostics.cached_call('dataset', load_shared_dataset)
+
+# Yangi javoblar: yuklangan CSV umumiy ma'lumotlarga qo'shiladi (barcha sessiyalar yangi versiyani ko'radi).
+# Agregatlar faqat yangi qatorlar bo'yicha yangilanadi, qayta hisoblanmaydi. Bu jarayon bo'yicha umumiy
+# holatni o'zgartiradi, shuning uchun yuklash oynasi faqat SURVEY_ALLOW_APPEND=1 bo'lganda ko'rsatiladi.
+ALLOW_APPEND = os.environ.get("SURVEY_ALLOW_APPEND") == "1" and store.current.df is not None
+new_responses = st.sidebar.file_uploader(
+    "Yangi javoblar qo'shish (CSV)", type=['csv'],
+    help="Ustunlar so'rovnoma ustunlari bilan bir xil bo'lishi kerak"
+) if ALLOW_APPEND else None
+if new_responses is not None:
+    content = new_responses.getvalue()
+    try:
+        with diagnostics.timer('append'):
+            store.append(standardize_columns(pd.read_csv(BytesIO(content))), key=hashlib.sha1(content).hexdigest())
+    except (ValueError, KeyError, pd.errors.ParserError) as e:
+        st.sidebar.error(f"Yangi javoblarni qo'shib bo'lmadi: {e}")
+
+dataset = store.current
+dataset_version = dataset.version
+
 # Ma'lumotlar haqida umumiy ma'lumot
 st.subheader(f"📂 Yuklab olingan ma'lumotlar: {file_name}")
-st.write(f"Ma'lumotlar o'lchami: {df.shape[0]} qator, {df.shape[1]} ustun")
-
-# Tab-lar yaratish
-tabs = st.tabs([
-    "📋 Umumiy ma'lumot", 
-    "👨‍💼 Demografik ma'lumotlar", 
-    "💰 Maosh tahlili", 
-    "📚 Ta'lim va tajriba", 
-    "💻 Texnologiyalar", 
-    "😊 Ish faoliyati"
-])
-
-# Ta'lim ustuni borligini tekshirish
-has_education = any(col.lower() in ['education', 'highest education', 'degree'] for col in df.columns)
-has_salary = any(col.lower() in ['salary', 'yearly salary', 'annual salary', 'income'] for col in df.columns)
-has_experience = any(col.lower() in ['years experience', 'yearsexperience', 'years of experience', 'experience'] for col in df.columns)
-has_role = any(col.lower() in ['role', 'job title', 'position', 'title'] for col in df.columns)
-has_country = any(col.lower() in ['country', 'location', 'region'] for col in df.columns)
-has_satisfaction = any(col.lower() in ['satisfaction', 'job satisfaction', 'jobsatisfaction'] for col in df.columns)
-has_wlb = any(col.lower() in ['work life balance', 'worklifebalance', 'work-life balance'] for col in df.columns)
-has_languages = any(col.lower() in ['programming languages', 'programminglanguages', 'languages', 'favorite programming language'] for col in df.columns)
-
-# Ustunlarni standartlashtirish
-column_mapping = {}
-for col in df.columns:
-    col_lower = col.lower()
-    if 'education' in col_lower or 'degree' in col_lower:
-        column_mapping[col] = 'Education'
-    elif 'salary' in col_lower or 'income' in col_lower:
-        column_mapping[col] = 'Salary'
-    elif 'experience' in col_lower:
-        column_mapping[col] = 'YearsExperience'
-    elif 'role' in col_lower or 'title' in col_lower or 'position' in col_lower:
-        column_mapping[col] = 'Role'
-    elif 'country' in col_lower or 'location' in col_lower:
-        column_mapping[col] = 'Country'
-    elif 'satisfaction' in col_lower:
-        column_mapping[col] = 'JobSatisfaction'
-    elif 'work' in col_lower and 'balance' in col_lower:
-        column_mapping[col] = 'WorkLifeBalance'
-    elif 'language' in col_lower or 'programming' in col_lower:
-        column_mapping[col] = 'ProgrammingLanguages'
-    elif 'gender' in col_lower or 'sex' in col_lower:
-        column_mapping[col] = 'Gender'
-    elif 'age' in col_lower:
-        column_mapping[col] = 'Age'
-
-# Ustunlar mavjud bo'lsa, nomlarini o'zgartirish
-if column_mapping:
-    df = df.rename(columns=column_mapping)
-
-# Umumiy ma'lumot tab
-with tabs[0]:
+st.write(f"Ma'lumotlar o'lchami: {dataset.rows} qator, {len(dataset.columns)} ustun")
+
+available = dataset.available
+if memory_report is not None:
+    st.caption(
+        f"Xotira: {memory_report['before'] / 1024 ** 2:.1f} MB → {memory_report['after'] / 1024 ** 2:.1f} MB "
+        "(ixcham turlarga o'tkazilgandan keyin)"
+    )
+else:
+    st.caption(
+        f"Jadval xotiraga yuklanmagan: so'rovlar fayl ustida bajariladi (so'rov backendi: {dataset.backend.name}). "
+        "Ishonch oraliqlari va yangi javoblar qo'shish bu rejimda mavjud emas."
+    )
+
+# Global filtrlar: barcha bo'limlarga qo'llanadi, bitmap indekslar orqali hisoblanadi
+st.sidebar.header("Filtrlar")
+selections = {}
+for dim, label in [('SurveyWave', "So'rovnoma to'lqini"), ('Role', 'Lavozim'), ('Country', 'Mamlakat'),
+                   ('Education', "Ta'lim darajasi"), ('Gender', 'Jins'), ('RemoteWork', 'Ish turi')]:
+    values = dataset.filter_values(dim)
+    if values is not None:
+        selections[dim] = st.sidebar.multiselect(label, values, placeholder="Barchasi")
+
+ranges = {}
+for col, label in [('Age', 'Yosh'), ('Salary', 'Maosh ($)')]:
+    bounds = dataset.filter_bounds(col)
+    if bounds is not None:
+        low, high = bounds
+        if low.is_integer() and high.is_integer():
+            low, high = int(low), int(high)
+        if low < high:
+            chosen = st.sidebar.slider(label, low, high, (low, high))
+            if tuple(chosen) != (low, high):
+                ranges[col] = tuple(chosen)
+
+# Filtrlangan ko'rinishlar jarayon bo'yicha baytlarda cheklangan LRU keshda (survey.dataset.FILTERED)
+active = dataset.filtered(selections, ranges, diagnostics=diagnostics)
+if active is not dataset:
+    st.write(f"Filtrlangan: {active.rows} qator")
+    if active.rows == 0:
+        st.warning("Tanlangan filtrlarga mos ma'lumot topilmadi")
+        st.stop()
+
+# Guruh o'rtachalari grafiklari uchun xato chiziqlari (bootstrap natijalari versiya bo'yicha keshlanadi;
+# qatorlar jadvali kerak, shuning uchun jadvalsiz rejimda ko'rsatilmaydi)
+show_intervals = dataset.df is not None and st.sidebar.toggle(
+    "Ishonch oraliqlari (bootstrap, 95%)", key='confidence_intervals',
+    help="O'rtacha qiymat grafiklarida guruh o'rtachalarining ishonch oraliqlarini ko'rsatadi"
+)
+
+# Har bir bo'lim natijalari alohida keshlanadi (bo'lim nomi, ma'lumotlar versiyasi va filtrlar bo'yicha)
+@st.cache_resource(max_entries=64, show_spinner=False)
+def section_data(section, dataset_version, _dataset):
+    """Bo'lim hisob-kitoblari; natija sessiyalar o'rtasida bo'lishiladi va o'zgartirilmaydi"""
+    diagnostics.miss(f'section.{section}')
+    with diagnostics.timer('compute', section=section):
+        return compute_section(section, _dataset)
+
+@st.cache_resource(max_entries=64, show_spinner=False)
+def section_intervals(section, dataset_version, _dataset):
+    """Bo'lim grafiklari uchun bootstrap ishonch oraliqlari (bo'lim va versiya bo'yicha keshlanadi)"""
+    diagnostics.miss(f'intervals.{section}')
+    with diagnostics.timer('bootstrap', section=section):
+        return compute_intervals(section, _dataset)
+
+def section_figures(section):
+    """Bo'lim natijalari va ulardan qurilgan grafiklar.
+
+    Grafiklar jarayon bo'yicha umumiy keshda (bo'lim, grafik va versiya bo'yicha);
+    plotly.express faqat grafik birinchi marta qurilganda yuklanadi. Ishonch
+    oraliqlari yoqilganda faqat xato chiziqli grafiklar alohida versiya sifatida
+    keshlanadi, bo'limning qolgan grafiklari o'sha yozuvlardan olinadi.
+    """
+    data = diagnostics.cached_call(f'section.{section}', section_data, section, active.version, active)
+    if not (show_intervals and section in INTERVAL_CHARTS):
+        return data, FIGURES.figures(section, active.version, data, diagnostics=diagnostics)
+    intervals = diagnostics.cached_call(
+        f'intervals.{section}', section_intervals, section, active.version, active
+    )
+    data = attach_intervals(data, intervals)
+    variants = {chart: (active.version, 'ci') for chart in INTERVAL_FIGURES[section]}
+    return data, FIGURES.figures(section, active.version, data, diagnostics=diagnostics, variants=variants)
+
+def show_chart(figs, chart):
+    """Grafikni chizish (diagnostika yoqilgan bo'lsa, hajmi va vaqti yoziladi)"""
+    diagnostics.payload(chart, None, figs.sizes[chart])
+    with diagnostics.timer('chart', chart=chart):
+        st.plotly_chart(figs.figure(chart), use_container_width=True)
+
+def render_table_explorer(dataset):
+    """Jadval ko'rgichi: qidiruv, ustun filtri va saralash serverda, brauzerga faqat joriy sahifa yuboriladi"""
+    explorer = dataset.explorer
+
+    col1, col2, col3 = st.columns([2, 1, 1])
+    with col1:
+        search = st.text_input(
+            "Qidirish", key='explorer_search', placeholder="Lavozim, davlat yoki dasturlash tili"
+        )
+    with col2:
+        sort = st.multiselect("Saralash", explorer.columns, key='explorer_sort')
+    with col3:
+        descending = st.toggle("Kamayish tartibida", key='explorer_descending', disabled=not sort)
+
+    filters = {}
+    col1, col2 = st.columns([1, 3])
+    with col1:
+        filter_column = st.selectbox("Ustun filtri", ['—', *explorer.filter_columns], key='explorer_filter_column')
+    if filter_column != '—':
+        with col2:
+            filters[filter_column] = st.multiselect(
+                "Qiymatlar", explorer.values(filter_column), key=f'explorer_filter_{filter_column}'
+            )
+
+    with diagnostics.timer('explorer', section='overview'):
+        total = explorer.count(search, filters)
+        col1, col2 = st.columns([1, 3])
+        with col1:
+            page_size = st.selectbox("Sahifa hajmi", PAGE_SIZES, key='explorer_page_size')
+        pages = max((total + page_size - 1) // page_size, 1)
+        with col2:
+            number = st.number_input(f"Sahifa (jami {pages:,})", 1, pages, 1, key='explorer_page')
+        page, total = explorer.page(
+            number - 1, page_size, search, filters,
+            sort=sort, descending=descending
+        )
+
+    st.dataframe(page)
+    if total:
+        start = (min(number, pages) - 1) * page_size
+        st.caption(f"{total:,} ta qatordan {start + 1:,}–{start + len(page):,} ko'rsatilmoqda")
+    else:
+        st.caption("Mos qatorlar topilmadi")
+
+# Umumiy ma'lumot bo'limi
+def render_overview():
+    data, figs = section_figures('overview')
     st.header("Umumiy ma'lumot")
     
     # Ma'lumotlar haqida qisqacha ma'lumot
@@ -267,15 +407,13 @@ with tabs[0]:
     
     # Ma'lumotlar jadvalini ko'rsatish
     st.subheader("Ma'lumotlar jadvali")
-    st.dataframe(df.head(10))
+    render_table_explorer(active)
     
     # Umumiy statistika
     st.subheader("Umumiy statistika")
     
-    # Ustunlar tanlash
-    numeric_cols = df.select_dtypes(include=['float64', 'int64']).columns.tolist()
-    if numeric_cols:
-        st.dataframe(df[numeric_cols].describe())
+    if data['describe'] is not None:
+        st.dataframe(data['describe'])
     else:
         st.info("Raqamli ma'lumotlar mavjud emas")
     
@@ -289,8 +427,9 @@ with tabs[0]:
     """
     st.markdown(analysis_text)
 
-# Demografik ma'lumotlar tab
-with tabs[1]:
+# Demografik ma'lumotlar bo'limi
+def render_demographics():
+    data, figs = section_figures('demographics')
     st.header("Demografik ma'lumotlar")
     
     col1, col2 = st.columns(2)
@@ -299,17 +438,9 @@ with tabs[1]:
         st.markdown('<div class="chart-container">', unsafe_allow_html=True)
         
         # Lavozimlar bo'yicha taqsimot
-        if has_role:
+        if 'role_pie' in figs:
             st.subheader("Lavozimlar taqsimoti")
-            role_counts = df['Role'].value_counts().reset_index()
-            role_counts.columns = ['Role', 'Count']
-            
-            fig = px.pie(role_counts, values='Count', names='Role', 
-                         title='Lavozimlar taqsimoti',
-                         hole=0.4, color_discrete_sequence=px.colors.qualitative.Pastel)
-            fig.update_traces(textposition='inside', textinfo='percent+label')
-            fig.update_layout(height=400)
-            st.plotly_chart(fig, use_container_width=True)
+            show_chart(figs, 'role_pie')
         else:
             st.info("Lavozimlar haqida ma'lumot mavjud emas")
         
@@ -318,20 +449,10 @@ with tabs[1]:
     with col2:
         st.markdown('<div class="chart-container">', unsafe_allow_html=True)
         
-        # Mamlakat bo'yicha taqsimot
-        if has_country:
+        # Mamlakat bo'yicha taqsimot (Top 10)
+        if 'country_bar' in figs:
             st.subheader("Mamlakat bo'yicha taqsimot")
-            country_counts = df['Country'].value_counts().reset_index()
-            country_counts.columns = ['Country', 'Count']
-            
-            # Top 10 mamlakatlar
-            top_countries = country_counts.head(10)
-            
-            fig = px.bar(top_countries, x='Country', y='Count', 
-                        title='Top 10 mamlakatlar',
-                        color='Count', color_continuous_scale='Viridis')
-            fig.update_layout(height=400)
-            st.plotly_chart(fig, use_container_width=True)
+            show_chart(figs, 'country_bar')
         else:
             st.info("Mamlakatlar haqida ma'lumot mavjud emas")
         
@@ -342,55 +463,33 @@ with tabs[1]:
     col3, col4 = st.columns(2)
     
     with col3:
-        if 'Gender' in df.columns:
+        if 'gender_bar' in figs:
             st.subheader("Jinsi bo'yicha taqsimot")
-            gender_counts = df['Gender'].value_counts().reset_index()
-            gender_counts.columns = ['Gender', 'Count']
-            
-            fig = px.bar(gender_counts, x='Gender', y='Count', 
-                        color='Gender', title="Jinsi bo'yicha taqsimot")
-            fig.update_layout(height=350)
-            st.plotly_chart(fig, use_container_width=True)
+            show_chart(figs, 'gender_bar')
         else:
             st.info("Jins haqida ma'lumot mavjud emas")
     
     with col4:
-        if 'Age' in df.columns:
+        if 'age_hist' in figs:
             st.subheader("Yosh bo'yicha taqsimot")
-            
-            fig = px.histogram(df, x='Age', nbins=20, 
-                            title="Yosh bo'yicha taqsimot",
-                            color_discrete_sequence=['#3366CC'])
-            fig.update_layout(height=350)
-            st.plotly_chart(fig, use_container_width=True)
+            show_chart(figs, 'age_hist')
         else:
             st.info("Yosh haqida ma'lumot mavjud emas")
     
     st.markdown('</div>', unsafe_allow_html=True)
 
-# Maosh tahlili tab
-with tabs[2]:
+# Maosh tahlili bo'limi
+def render_salary():
+    data, figs = section_figures('salary')
     st.header("Maosh tahlili")
     
-    if has_salary:
+    if 'salary' in available:
         # Maosh statistikasi
         st.markdown('<div class="chart-container">', unsafe_allow_html=True)
         st.subheader("Maosh statistikasi")
         
         # Asosiy statistikani ko'rsatish
-        col1, col2, col3, col4 = st.columns(4)
-        
-        with col1:
-            st.metric("O'rtacha maosh", f"${int(df['Salary'].mean()):,}")
-        
-        with col2:
-            st.metric("Mediana maosh", f"${int(df['Salary'].median()):,}")
-        
-        with col3:
-            st.metric("Minimal maosh", f"${int(df['Salary'].min()):,}")
-        
-        with col4:
-            st.metric("Maksimal maosh", f"${int(df['Salary'].max()):,}")
+        show_salary_metrics(data)
         
         st.markdown('</div>', unsafe_allow_html=True)
         
@@ -401,12 +500,7 @@ with tabs[2]:
             
             # Maosh taqsimoti
             st.subheader("Maosh taqsimoti")
-            
-            fig = px.histogram(df, x='Salary', nbins=30, 
-                              title='Maosh taqsimoti',
-                              color_discrete_sequence=['#22A7F0'])
-            fig.update_layout(xaxis_title='Maosh ($)', height=400)
-            st.plotly_chart(fig, use_container_width=True)
+            show_chart(figs, 'salary_hist')
             
             st.markdown('</div>', unsafe_allow_html=True)
         
@@ -414,189 +508,118 @@ with tabs[2]:
             st.markdown('<div class="chart-container">', unsafe_allow_html=True)
             
             # Lavozimlar bo'yicha o'rtacha maosh
-            if has_role:
+            if 'role_salary_bar' in figs:
                 st.subheader("Lavozimlar bo'yicha o'rtacha maosh")
-                
-                role_salary = df.groupby('Role')['Salary'].mean().sort_values(ascending=False).reset_index()
-                
-                fig = px.bar(role_salary, x='Role', y='Salary', 
-                            title="Lavozimlar bo'yicha o'rtacha maosh",
-                            color='Salary', color_continuous_scale='Viridis')
-                fig.update_layout(yaxis_title="O'rtacha maosh ($)", height=400)
-                st.plotly_chart(fig, use_container_width=True)
+                show_chart(figs, 'role_salary_bar')
             else:
                 st.info("Lavozimlar haqida ma'lumot mavjud emas")
             
             st.markdown('</div>', unsafe_allow_html=True)
         
         # Maosh va tajriba o'rtasidagi bog'liqlik
-        if has_experience:
+        if 'experience_salary_scatter' in figs:
             st.markdown('<div class="chart-container">', unsafe_allow_html=True)
             st.subheader("Maosh va tajriba o'rtasidagi bog'liqlik")
+            show_chart(figs, 'experience_salary_scatter')
+            if data['scatter_density']:
+                st.caption(f"{SCATTER_MAX_POINTS:,} qatordan ko'p ma'lumot uchun nuqtalar o'rniga zichlik xaritasi ko'rsatilmoqda")
             
-            fig = px.scatter(df, x='YearsExperience', y='Salary', 
-                            title="Maosh va tajriba o'rtasidagi bog'liqlik",
-                            color='Salary', size='Salary',
-                            color_continuous_scale='Viridis')
-            
-            # Regression line qo'shish
-            fig.update_layout(height=500)
-            st.plotly_chart(fig, use_container_width=True)
-            
-            # Korrelyatsiya koeffitsientini hisoblash
-            correlation = df['YearsExperience'].corr(df['Salary'])
-            st.write(f"Tajriba va maosh o'rtasidagi korrelyatsiya koeffitsienti: **{correlation:.2f}**")
+            # Korrelyatsiya koeffitsienti
+            st.write(f"Tajriba va maosh o'rtasidagi korrelyatsiya koeffitsienti: **{data['experience_corr']:.2f}**")
             
             st.markdown('</div>', unsafe_allow_html=True)
     else:
         st.info("Maosh haqida ma'lumot mavjud emas")
 
-# Ta'lim va tajriba tab
-with tabs[3]:
+# Ta'lim va tajriba bo'limi
+def render_education():
+    data, figs = section_figures('education')
     st.header("Ta'lim va tajriba")
     
     col1, col2 = st.columns(2)
     
     with col1:
         # Ta'lim darajasi
-        if has_education:
+        if 'edu_pie' in figs:
             st.markdown('<div class="chart-container">', unsafe_allow_html=True)
             st.subheader("Ta'lim darajasi taqsimoti")
-            
-            edu_counts = df['Education'].value_counts().reset_index()
-            edu_counts.columns = ['Education', 'Count']
-            
-            fig = px.pie(edu_counts, values='Count', names='Education', 
-                        title='Ta\'lim darajasi taqsimoti',
-                        color_discrete_sequence=px.colors.qualitative.Pastel)
-            fig.update_traces(textposition='inside', textinfo='percent+label')
-            fig.update_layout(height=400)
-            st.plotly_chart(fig, use_container_width=True)
+            show_chart(figs, 'edu_pie')
             st.markdown('</div>', unsafe_allow_html=True)
         else:
             st.info("Ta'lim darajasi haqida ma'lumot mavjud emas")
     
     with col2:
         # Tajriba yillari
-        if has_experience:
+        if 'experience_hist' in figs:
             st.markdown('<div class="chart-container">', unsafe_allow_html=True)
             st.subheader("Tajriba yillari taqsimoti")
-            
-            fig = px.histogram(df, x='YearsExperience', nbins=20, 
-                            title='Tajriba yillari taqsimoti',
-                            color_discrete_sequence=['#72B01D'])
-            fig.update_layout(xaxis_title='Tajriba (yil)', height=400)
-            st.plotly_chart(fig, use_container_width=True)
+            show_chart(figs, 'experience_hist')
             st.markdown('</div>', unsafe_allow_html=True)
         else:
             st.info("Tajriba yillari haqida ma'lumot mavjud emas")
     
     # Ta'lim darajasi va maosh o'rtasidagi bog'liqlik
-    if has_education and has_salary:
+    if 'edu_salary_bar' in figs:
         st.markdown('<div class="chart-container">', unsafe_allow_html=True)
         st.subheader("Ta'lim darajasi va o'rtacha maosh")
-        
-        edu_salary = df.groupby('Education')['Salary'].mean().sort_values(ascending=False).reset_index()
-        
-        fig = px.bar(edu_salary, x='Education', y='Salary', 
-                    title='Ta\'lim darajasi va o\'rtacha maosh',
-                    color='Salary', color_continuous_scale='Viridis')
-        fig.update_layout(yaxis_title='O\'rtacha maosh ($)', height=400)
-        st.plotly_chart(fig, use_container_width=True)
+        show_chart(figs, 'edu_salary_bar')
         st.markdown('</div>', unsafe_allow_html=True)
     
     # Lavozim va ta'lim o'rtasidagi bog'liqlik
-    if has_role and has_education:
+    if 'role_edu_heatmap' in figs:
         st.markdown('<div class="chart-container">', unsafe_allow_html=True)
         st.subheader("Lavozim va ta'lim darajasi o'rtasidagi bog'liqlik")
-        
-        # Crosstab yaratish
-        role_edu = pd.crosstab(df['Role'], df['Education'])
-        
-        # Plotly Heatmap
-        fig = px.imshow(role_edu, 
-                        title='Lavozim va ta\'lim darajasi o\'rtasidagi bog\'liqlik',
-                        color_continuous_scale='Viridis')
-        fig.update_layout(height=500)
-        st.plotly_chart(fig, use_container_width=True)
+        show_chart(figs, 'role_edu_heatmap')
         st.markdown('</div>', unsafe_allow_html=True)
 
-# Texnologiyalar tab
-with tabs[4]:
+# Texnologiyalar bo'limi
+def render_technology():
+    data, figs = section_figures('technology')
     st.header("Texnologiyalar va ko'nikmalar")
     
-    if has_languages:
-        # Programming languages (Split by comma)
-        if df['ProgrammingLanguages'].dtype == 'object':  # String values
+    if 'languages' in available:
+        if 'languages_bar' in figs:
             st.markdown('<div class="chart-container">', unsafe_allow_html=True)
             st.subheader("Dasturlash tillari")
-            
-            # Split languages and count
-            languages = []
-            for lang_list in df['ProgrammingLanguages'].dropna():
-                languages.extend([l.strip() for l in str(lang_list).split(',')])
-            
-            lang_count = pd.Series(languages).value_counts().reset_index()
-            lang_count.columns = ['Language', 'Count']
-            
-            # Show top 10 languages
-            top_langs = lang_count.head(10)
-            
-            fig = px.bar(top_langs, x='Language', y='Count', 
-                        title='Eng mashhur dasturlash tillari (Top 10)',
-                        color='Count', color_continuous_scale='Viridis')
-            fig.update_layout(height=400)
-            st.plotly_chart(fig, use_container_width=True)
+            show_chart(figs, 'languages_bar')
             st.markdown('</div>', unsafe_allow_html=True)
             
-            # Languages by role
-            if has_role:
+            # Lavozimlar bo'yicha tillar (lavozim x til jadvali)
+            if 'role_languages_heatmap' in figs:
                 st.markdown('<div class="chart-container">', unsafe_allow_html=True)
                 st.subheader("Lavozimlar bo'yicha mashhur dasturlash tillari")
-                
-                # Create a heatmap of roles vs languages
-                # (This is complex and requires data processing which we'll simplify here)
-                st.info("Bu seksiya uchun ma'lumotlar tahlil qilinmoqda...")
+                show_chart(figs, 'role_languages_heatmap')
                 st.markdown('</div>', unsafe_allow_html=True)
+            
+            # Tillarning birgalikda tanlanishi
+            st.markdown('<div class="chart-container">', unsafe_allow_html=True)
+            st.subheader("Dasturlash tillarining birgalikda tanlanishi")
+            show_chart(figs, 'languages_cooccurrence_heatmap')
+            st.markdown('</div>', unsafe_allow_html=True)
         else:
             st.info("Dasturlash tillari to'g'risida ma'lumot mavjud emas yoki to'g'ri formatda emas")
     else:
         st.info("Dasturlash tillari haqida ma'lumot mavjud emas")
     
     # Remote work distribution if available
-    if 'RemoteWork' in df.columns:
+    if 'remote_pie' in figs:
         st.markdown('<div class="chart-container">', unsafe_allow_html=True)
         col1, col2 = st.columns(2)
         
         with col1:
             st.subheader("Masofaviy ish taqsimoti")
-            
-            remote_counts = df['RemoteWork'].value_counts().reset_index()
-            remote_counts.columns = ['WorkType', 'Count']
-            
-            fig = px.pie(remote_counts, values='Count', names='WorkType', 
-                        title='Masofaviy ish taqsimoti',
-                        hole=0.4, color_discrete_sequence=px.colors.qualitative.Pastel)
-            fig.update_traces(textposition='inside', textinfo='percent+label')
-            fig.update_layout(height=350)
-            st.plotly_chart(fig, use_container_width=True)
+            show_chart(figs, 'remote_pie')
         
         with col2:
-            if has_salary:
+            if 'remote_salary_bar' in figs:
                 st.subheader("Ish turi bo'yicha o'rtacha maosh")
-                
-                remote_salary = df.groupby('RemoteWork')['Salary'].mean().reset_index()
-                
-                fig = px.bar(remote_salary, x='RemoteWork', y='Salary', 
-                            title='Ish turi bo\'yicha o\'rtacha maosh',
-                            color='RemoteWork')
-                fig.update_layout(yaxis_title='O\'rtacha maosh ($)', height=350)
-                st.plotly_chart(fig, use_container_width=True)
+                show_chart(figs, 'remote_salary_bar')
         
         st.markdown('</div>', unsafe_allow_html=True)
 
-# Ish faoliyati tab
-with tabs[5]:
+# Ish faoliyati bo'limi
+def render_performance():
+    data, figs = section_figures('performance')
     st.header("Ish faoliyati va qoniqish darajasi")
     
     # Ish qoniqish darajasi
@@ -604,120 +627,163 @@ with tabs[5]:
     
     with col1:
         # Job satisfaction
-        if has_satisfaction:
+        if 'satisfaction_hist' in figs:
             st.markdown('<div class="chart-container">', unsafe_allow_html=True)
             st.subheader("Ish faoliyatidan qoniqish darajasi")
-            
-            fig = px.histogram(df, x='JobSatisfaction', nbins=10, 
-                            title='Ish faoliyatidan qoniqish darajasi taqsimoti',
-                            color_discrete_sequence=['#FF6B6B'])
-            fig.update_layout(xaxis_title='Qoniqish darajasi (1-10)', height=400)
-            st.plotly_chart(fig, use_container_width=True)
+            show_chart(figs, 'satisfaction_hist')
             st.markdown('</div>', unsafe_allow_html=True)
         else:
             st.info("Ish faoliyatidan qoniqish darajasi haqida ma'lumot mavjud emas")
     
     with col2:
         # Work-life balance
-        if has_wlb:
+        if 'wlb_hist' in figs:
             st.markdown('<div class="chart-container">', unsafe_allow_html=True)
             st.subheader("Ish-hayot muvozanati")
-            
-            fig = px.histogram(df, x='WorkLifeBalance', nbins=10, 
-                            title='Ish-hayot muvozanati taqsimoti',
-                            color_discrete_sequence=['#4ECDC4'])
-            fig.update_layout(xaxis_title='Ish-hayot muvozanati (1-10)', height=400)
-            st.plotly_chart(fig, use_container_width=True)
+            show_chart(figs, 'wlb_hist')
             st.markdown('</div>', unsafe_allow_html=True)
         else:
             st.info("Ish-hayot muvozanati haqida ma'lumot mavjud emas")
     
     # Lavozim bo'yicha ish qoniqish darajasi
-    if has_role and has_satisfaction:
+    if 'role_satisfaction_bar' in figs:
         st.markdown('<div class="chart-container">', unsafe_allow_html=True)
         st.subheader("Lavozim bo'yicha ish qoniqish darajasi")
-        
-        role_satisfaction = df.groupby('Role', observed=True)['JobSatisfaction'].mean().sort_values(ascending=False).reset_index()
-        
-        fig = px.bar(role_satisfaction, x='Role', y='JobSatisfaction', 
-                    title='Lavozim bo\'yicha o\'rtacha ish qoniqish darajasi',
-                    color='JobSatisfaction', color_continuous_scale='RdYlGn')
-        fig.update_layout(yaxis_title='O\'rtacha qoniqish darajasi (1-10)', height=400)
-        st.plotly_chart(fig, use_container_width=True)
+        show_chart(figs, 'role_satisfaction_bar')
         st.markdown('</div>', unsafe_allow_html=True)
     
     # Maosh va ish qoniqish o'rtasidagi bog'liqlik
-    if has_salary and has_satisfaction:
+    if 'salary_satisfaction_scatter' in figs:
         st.markdown('<div class="chart-container">', unsafe_allow_html=True)
         st.subheader("Maosh va ish qoniqish darajasi o'rtasidagi bog'liqlik")
+        show_chart(figs, 'salary_satisfaction_scatter')
+        if data['scatter_density']:
+            st.caption(f"{SCATTER_MAX_POINTS:,} qatordan ko'p ma'lumot uchun nuqtalar o'rniga zichlik xaritasi ko'rsatilmoqda")
         
-        fig = px.scatter(df, x='Salary', y='JobSatisfaction', 
-                        title='Maosh va ish qoniqish darajasi o\'rtasidagi bog\'liqlik',
-                        color='JobSatisfaction', size='Salary',
-                        color_continuous_scale='RdYlGn')
-        fig.update_layout(height=500, 
-                          xaxis_title='Maosh ($)',
-                          yaxis_title='Ish qoniqish darajasi (1-10)')
-        st.plotly_chart(fig, use_container_width=True)
-        
-        # Korrelyatsiya koeffitsientini hisoblash
-        correlation = df['Salary'].corr(df['JobSatisfaction'])
-        st.write(f"Maosh va ish qoniqish darajasi o'rtasidagi korrelyatsiya koeffitsienti: **{correlation:.2f}**")
+        # Korrelyatsiya koeffitsienti
+        st.write(f"Maosh va ish qoniqish darajasi o'rtasidagi korrelyatsiya koeffitsienti: **{data['satisfaction_corr']:.2f}**")
         st.markdown('</div>', unsafe_allow_html=True)
     
     # Maosh va ish-hayot muvozanati o'rtasidagi bog'liqlik
-    if has_salary and has_wlb:
+    if 'salary_wlb_bar' in figs:
         st.markdown('<div class="chart-container">', unsafe_allow_html=True)
         st.subheader("Maosh va ish-hayot muvozanati o'rtasidagi bog'liqlik")
-        
-        # Maosh kategoriyalarga ajratish
-        df['SalaryBin'] = pd.qcut(df['Salary'], q=5, labels=['Eng past', 'Past', "O'rta", 'Yuqori', 'Eng yuqori'])
-        
-        salary_wlb = df.groupby('SalaryBin', observed=True)['WorkLifeBalance'].mean().reset_index()
-        
-        fig = px.bar(salary_wlb, x='SalaryBin', y='WorkLifeBalance', 
-                    title='Maosh kategoriyasi va o\'rtacha ish-hayot muvozanati',
-                    color='WorkLifeBalance', color_continuous_scale='RdYlGn')
-        fig.update_layout(height=400, 
-                          xaxis_title='Maosh kategoriyasi',
-                          yaxis_title='O\'rtacha ish-hayot muvozanati (1-10)')
-        st.plotly_chart(fig, use_container_width=True)
+        show_chart(figs, 'salary_wlb_bar')
         st.markdown('</div>', unsafe_allow_html=True)
 
-# Qo'shimcha statistik analiz
-if st.checkbox("Qo'shimcha statistik analiz ko'rsatish"):
+# Qo'shimcha statistik analiz bo'limi
+def render_extra():
+    data, figs = section_figures('extra')
     st.header("Qo'shimcha statistik analiz")
     
     # Korrelyatsiya matritsasi
     st.subheader("Korrelyatsiya matritsasi")
     
-    # Raqamli ustunlarni olish
-    numeric_cols = df.select_dtypes(include=['float64', 'int64']).columns.tolist()
-    
-    if len(numeric_cols) > 1:
-        corr_matrix = df[numeric_cols].corr()
-        
-        fig = px.imshow(corr_matrix, 
-                       title='Raqamli ma\'lumotlar o\'rtasidagi korrelyatsiya',
-                       color_continuous_scale='RdBu_r',
-                       text_auto='.2f')
-        fig.update_layout(height=600)
-        st.plotly_chart(fig, use_container_width=True)
+    if 'corr_heatmap' in figs:
+        method = st.radio("Usul", ['Pearson', 'Spearman'], horizontal=True,
+                          help="Spearman - qiymatlar ranglari bo'yicha (monoton bog'liqlik)")
+        show_chart(figs, 'corr_heatmap' if method == 'Pearson' else 'spearman_heatmap')
     else:
         st.info("Korrelyatsiya matritsasi uchun yetarli raqamli ustunlar mavjud emas")
     
     # Lavozimlar bo'yicha statistika
-    if has_role:
+    if 'role_stats' in data:
         st.subheader("Lavozimlar bo'yicha statistika")
-        
-        role_stats = df.groupby('Role', observed=True).agg({
-            'YearsExperience': 'mean' if has_experience else 'count',
-            'Salary': 'mean' if has_salary else 'count',
-            'JobSatisfaction': 'mean' if has_satisfaction else 'count',
-            'WorkLifeBalance': 'mean' if has_wlb else 'count'
-        }).reset_index()
-        
-        st.dataframe(role_stats)
+        st.dataframe(data['role_stats'])
+
+SECTIONS = {
+    SECTION_TITLES[section]: (section, render)
+    for section, render in [
+        ('overview', render_overview),
+        ('demographics', render_demographics),
+        ('salary', render_salary),
+        ('education', render_education),
+        ('technology', render_technology),
+        ('performance', render_performance),
+    ]
+}
+
+def run_section(section, render):
+    """Bo'limni chizish va unga ketgan vaqtni yozib qo'yish"""
+    start = time.perf_counter()
+    with diagnostics.timer('section', section=section):
+        render()
+    st.session_state.setdefault('section_timings', {})[section] = time.perf_counter() - start
+
+# Navigatsiya: faqat tanlangan bo'lim hisoblanadi yoki barcha tablar birdaniga
+lazy_navigation = st.sidebar.toggle(
+    "Faqat tanlangan bo'limni hisoblash", value=True,
+    help="O'chirilsa, barcha tablar har safar hisoblanadi"
+)
+
+if lazy_navigation:
+    selected = st.radio("Bo'lim", list(SECTIONS), horizontal=True, label_visibility='collapsed')
+    run_section(*SECTIONS[selected])
+else:
+    for tab, (section, render) in zip(st.tabs(list(SECTIONS)), SECTIONS.values()):
+        with tab:
+            run_section(section, render)
+
+# Qo'shimcha statistik analiz
+if st.checkbox("Qo'shimcha statistik analiz ko'rsatish"):
+    run_section('extra', render_extra)
+
+# Bo'limlarga ketgan vaqt (oxirgi ishga tushirishlar)
+timings = st.session_state.get('section_timings', {})
+if timings:
+    st.sidebar.subheader("Bo'limlar vaqti")
+    st.sidebar.dataframe(
+        pd.DataFrame({'Bo\'lim': list(timings), 'ms': [round(t * 1000, 1) for t in timings.values()]}),
+        hide_index=True
+    )
+
+# Diagnostika paneli: bosqichlar vaqti, grafiklar hajmi va kesh statistikasi
+st.sidebar.checkbox(
+    "Diagnostika paneli", key='diagnostics_enabled',
+    help="Har bir bosqich va grafik vaqtini, grafik hajmini va kesh natijalarini yozib boradi"
+)
+if diagnostics.enabled:
+    with st.sidebar.expander("Diagnostika", expanded=True):
+        st.caption("Bosqichlar (oxirgi ishga tushirish, ms)")
+        st.dataframe(diagnostics.timing_summary(run=diagnostics.run), hide_index=True)
+        payloads = diagnostics.frame('payload', run=diagnostics.run)
+        if not payloads.empty:
+            st.caption(f"Grafiklar hajmi: jami {payloads['bytes'].sum() / 1024:.1f} KB")
+            st.dataframe(
+                payloads.assign(KB=(payloads['bytes'] / 1024).round(1), serialize_ms=payloads['serialize_ms'].round(2))
+                [['chart', 'KB', 'serialize_ms']].sort_values('KB', ascending=False),
+                hide_index=True
+            )
+        st.caption("Kesh (sessiya davomida)")
+        st.dataframe(diagnostics.cache_summary(), hide_index=True)
+        correlation_cache = CORRELATIONS.cache.stats()
+        st.caption(
+            f"Korrelyatsiya keshi (jarayon): {correlation_cache['entries']} yozuv, "
+            f"{correlation_cache['bytes'] / 1024:.1f} / {correlation_cache['max_bytes'] / 1024 ** 2:.0f} MB, "
+            f"hit {correlation_cache['hits']}, miss {correlation_cache['misses']}"
+        )
+        filter_cache = FILTERED.stats()
+        st.caption(
+            f"Filtrlar keshi (jarayon): {filter_cache['entries']} yozuv, "
+            f"{filter_cache['bytes'] / 1024 ** 2:.1f} / {filter_cache['max_bytes'] / 1024 ** 2:.0f} MB, "
+            f"hit {filter_cache['hits']}, miss {filter_cache['misses']}"
+        )
+        search_cache = SEARCHES.stats()
+        st.caption(
+            f"Jadval qidiruvi keshi (jarayon): {search_cache['entries']} yozuv, "
+            f"{search_cache['bytes'] / 1024 ** 2:.1f} / {search_cache['max_bytes'] / 1024 ** 2:.0f} MB, "
+            f"hit {search_cache['hits']}, miss {search_cache['misses']}"
+        )
+        figure_cache = FIGURES.stats()
+        st.caption(
+            f"Grafiklar keshi (jarayon): {figure_cache['entries']} yozuv, "
+            f"{figure_cache['bytes'] / 1024:.1f} KB / {figure_cache['max_bytes'] / 1024 ** 2:.0f} MB, "
+            f"hit {figure_cache['hits']}, miss {figure_cache['misses']}"
+        )
+        st.download_button(
+            "Loglarni yuklab olish (JSONL)", diagnostics.to_jsonl(),
+            file_name="diagnostics.jsonl", mime="application/x-ndjson"
+        )
 
 # Footer
 st.markdown("---")
@@ -0,0 +1 @@
+"""Data Professional Survey dashboardi uchun yordamchi modullar"""
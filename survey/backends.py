@@ -0,0 +1,488 @@
+"""Bo'limlar agregatlari uchun so'rov backendlari.
+
+Bo'limlar guruhlar bo'yicha sonlar, o'rtachalar, kesishma jadvali,
+``role_stats`` va korrelyatsiyani ``dataset.backend`` orqali so'raydi:
+
+* ``PandasBackend`` - xotiradagi jadval: agregat kub va ko-momentlardan o'qiydi;
+* ``DuckDBBackend`` - DuckDB orqali Parquet fayl ustida SQL: backendning
+  o'zi faylni xotiraga yuklamaydi, so'rovlar ko'p oqimli va ``memory_limit``
+  dan oshsa diskka chiqib bajariladi.
+
+CSV manba bir marta (fayl mazmuni barmoq izi bo'yicha) Parquet nusxaga
+o'tkaziladi: ustunli fayldan har bir so'rov faqat kerakli ustunlarni
+o'qiydi, CSV har safar qayta tahlil qilinmaydi. Ulanish va ``survey``
+ko'rinishi (view) backend bilan birga yashaydi, filtrlangan nusxalar ham
+shu ulanishdan foydalanadi.
+
+Ilovada ``SURVEY_QUERY_BACKEND=duckdb`` bo'lsa jadval umuman yuklanmaydi:
+``survey.sql_dataset.SQLDataset`` bo'limlar, filtrlar va jadval ko'rgichi
+so'rovlarini shu backend orqali bajaradi. Hisobotlarda (``survey.report``)
+backend xotiradagi jadvalga ``attach_backend`` bilan o'rnatiladi - u yerda
+faqat agregatlar DuckDB'da hisoblanadi. DuckDB ning o'z buferlari
+``SURVEY_DUCKDB_MEMORY_LIMIT`` bilan cheklanadi.
+
+Ikkala backend bir xil ko'rinishdagi natija qaytaradi (indeks nomlari,
+tartib, ustunlar) - ``tests/test_backends.py`` buni tekshiradi,
+``benchmarks/bench_backends.py`` vaqtlarini solishtiradi.
+"""
+import os
+
+import numpy as np
+import pandas as pd
+
+from survey.cache import DEFAULT_CACHE_DIR, DiskCache
+from survey.correlation import CORRELATIONS, METHODS
+from survey.cube import CUBE_MEASURES
+from survey.histograms import Density, Histogram, bin_layout
+from survey.schema import build_column_mapping
+from survey.snapshot import file_fingerprint
+
+# SURVEY_QUERY_BACKEND=duckdb: mahalliy Parquet/CSV manba bo'lsa agregatlar DuckDB'da hisoblanadi
+QUERY_BACKEND = os.environ.get('SURVEY_QUERY_BACKEND', 'pandas')
+
+# DuckDB ishchi xotirasi chegarasi (undan oshgan oraliq natijalar diskka chiqariladi)
+DUCKDB_MEMORY_LIMIT = os.environ.get('SURVEY_DUCKDB_MEMORY_LIMIT', '1GB')
+
+# DuckDB backend qabul qiladigan formatlar (CSV Parquet nusxaga o'tkaziladi)
+DUCKDB_FORMATS = ('.parquet', '.csv')
+
+# CSV manbalarning Parquet nusxalari
+PARQUET_DIR = os.path.join(DEFAULT_CACHE_DIR, "parquet")
+
+# Ko'rinishdagi qator raqami (fayldagi tartib; jadval ko'rgichida teng kalitlar shu bo'yicha)
+ROW_COLUMN = '__row'
+
+# CSV ustunlari uchun DuckDB sinab ko'radigan turlar
+CSV_TYPES = "['BIGINT', 'DOUBLE', 'VARCHAR']"
+
+# Raqamli DuckDB turlari (pandas'dagi ``select_dtypes(include='number')`` kabi, BOOLEAN'siz)
+NUMERIC_TYPES = ('TINYINT', 'SMALLINT', 'INTEGER', 'BIGINT', 'HUGEINT', 'UTINYINT', 'USMALLINT', 'UINTEGER',
+                 'UBIGINT', 'UHUGEINT', 'FLOAT', 'DOUBLE', 'DECIMAL')
+
+# Natija ustunlari tartibi (AggregateCube.rollup bilan bir xil)
+ROLLUP_COLUMNS = ['n', 'count', 'sum', 'sumsq', 'min', 'max', 'mean', 'std']
+
+
+class PandasBackend:
+    """Xotiradagi SurveyDataset: agregat kub va ko-momentlar orqali"""
+
+    name = 'pandas'
+
+    def __init__(self, dataset):
+        self.dataset = dataset
+
+    def row_count(self):
+        return len(self.dataset.df)
+
+    def counts(self, dimension):
+        return self.dataset.cube.counts(dimension)
+
+    def group_mean(self, dimension, measure):
+        return self.dataset.cube.group_mean(dimension, measure)
+
+    def crosstab(self, row, column):
+        return self.dataset.cube.crosstab(row, column)
+
+    def rollup(self, dimensions, measure):
+        return self.dataset.cube.rollup(dimensions, measure)
+
+    def binned_mean(self, column, edges, measure):
+        return self.dataset.binned_mean(column, edges, measure)
+
+    def summary(self, measure):
+        # Kub o'rniga umumiy statistika: dispersiya Welford usulida, barcha ustunlar bitta o'tishda
+        return self.dataset.summary.column(measure)
+
+    def correlation(self, columns=None, method='pearson'):
+        return CORRELATIONS.matrix(self.dataset, method, columns)
+
+    def correlation_pair(self, x, y, method='pearson'):
+        return CORRELATIONS.pair(self.dataset, x, y, method)
+
+
+class DuckDBBackend:
+    """Fayl ustidagi DuckDB ko'rinishi (view); ustun nomlari ``column_mapping`` bo'yicha.
+
+    ``where``/``params`` - global filtrlar (``filtered`` orqali quriladi),
+    ``raw_columns`` - fayldagi asl ustun nomlari.
+    """
+
+    name = 'duckdb'
+
+    def __init__(self, connection, columns, where='', params=(), measures=CUBE_MEASURES, raw_columns=None):
+        self.connection = connection
+        self.columns = list(columns)
+        self.where = where
+        self.params = list(params)
+        self.measures = [m for m in measures if m in self.columns]
+        self.raw_columns = list(columns if raw_columns is None else raw_columns)
+
+    @classmethod
+    def from_file(cls, path, threads=None, memory_limit=None, temp_directory=None, fingerprint=None):
+        """Parquet yoki CSV fayl uchun backend (ma'lumotlar xotiraga yuklanmaydi).
+
+        CSV fayl ``parquet_copy`` orqali Parquet nusxaga o'tkaziladi
+        (``fingerprint`` berilmasa, fayl mazmunidan hisoblanadi).
+        """
+        import duckdb
+
+        extension = os.path.splitext(path)[1].lower()
+        if extension not in DUCKDB_FORMATS:
+            raise ValueError(f"DuckDB backend uchun qo'llab-quvvatlanmaydigan format: {extension}")
+
+        connection = duckdb.connect(database=':memory:')
+        if threads:
+            connection.execute(f"SET threads = {int(threads)}")
+        if memory_limit:
+            connection.execute(f"SET memory_limit = '{memory_limit}'")
+        if temp_directory:
+            connection.execute(f"SET temp_directory = '{temp_directory}'")
+
+        if extension == '.csv':
+            path = parquet_copy(path, connection, fingerprint)
+        source = f"read_parquet({_literal(path)}, file_row_number = true)"
+
+        # Asl ustun nomlari standart nomlarga o'tkaziladi (takrorlangan nomlardan birinchisi olinadi)
+        raw_columns = [row[0] for row in connection.execute(f"DESCRIBE SELECT * FROM {source}").fetchall()
+                       if row[0] != 'file_row_number']
+        mapping = build_column_mapping(raw_columns)
+        selected, names = [], []
+        for col in raw_columns:
+            name = mapping.get(col, col)
+            if name not in names:
+                selected.append(f"{_quote(col)} AS {_quote(name)}")
+                names.append(name)
+        selected.append(f"file_row_number AS {_quote(ROW_COLUMN)}")
+        connection.execute(f"CREATE VIEW survey AS SELECT {', '.join(selected)} FROM {source}")
+        return cls(connection, names, raw_columns=raw_columns)
+
+    def filtered(self, selections=None, ranges=None):
+        """Filtrlar qo'llangan backend (bitmap indeks o'rniga WHERE sharti)"""
+        clauses, params = [], []
+        for dim, values in (selections or {}).items():
+            if values and dim in self.columns:
+                clauses.append(f"{_quote(dim)} IN ({', '.join('?' * len(values))})")
+                params.extend(str(value) for value in values)
+        for col, (low, high) in (ranges or {}).items():
+            if col in self.columns:
+                clauses.append(f"{_quote(col)} BETWEEN ? AND ?")
+                params.extend([low, high])
+        if not clauses:
+            return self
+        where = ' AND '.join(([self.where] if self.where else []) + clauses)
+        return DuckDBBackend(self.connection, self.columns, where, self.params + params, self.measures,
+                             self.raw_columns)
+
+    def query(self, sql, params=()):
+        """So'rov natijasi DataFrame sifatida (har bir oqim o'z kursoridan foydalanadi)"""
+        return self.connection.cursor().execute(sql, list(params)).df()
+
+    def _where(self, *conditions):
+        conditions = ([self.where] if self.where else []) + list(conditions)
+        return f"WHERE {' AND '.join(conditions)}" if conditions else ''
+
+    def row_count(self):
+        return int(self.query(f"SELECT count(*) AS n FROM survey {self._where()}", self.params)['n'].iloc[0])
+
+    def counts(self, dimension):
+        d = _quote(dimension)
+        table = self.query(
+            f"SELECT {d} AS key, count(*) AS n FROM survey {self._where(f'{d} IS NOT NULL')} "
+            f"GROUP BY {d} ORDER BY n DESC, key", self.params)
+        return pd.Series(table['n'].to_numpy(dtype='int64'), index=pd.Index(table['key'], name=dimension), name='count')
+
+    def group_mean(self, dimension, measure):
+        means = self.rollup([dimension], measure)['mean'].dropna()
+        means.name = measure
+        return means
+
+    def crosstab(self, row, column):
+        r, c = _quote(row), _quote(column)
+        table = self.query(
+            f"SELECT {r} AS r, {c} AS c, count(*) AS n FROM survey "
+            f"{self._where(f'{r} IS NOT NULL', f'{c} IS NOT NULL')} GROUP BY ALL", self.params)
+        result = table.pivot(index='r', columns='c', values='n').fillna(0).astype('int64')
+        result = result.sort_index().sort_index(axis=1)
+        result.index.name, result.columns.name = row, column
+        return result
+
+    def rollup(self, dimensions, measure):
+        """``AggregateCube.rollup`` ekvivalenti: n, count, sum, sumsq, min, max, mean, std"""
+        keys = [_quote(d) for d in dimensions]
+        x = f"CAST({_quote(measure)} AS DOUBLE)"
+        select = ', '.join(keys + [
+            "count(*) AS n", f"count({x}) AS count", f"coalesce(sum({x}), 0) AS sum",
+            f"coalesce(sum({x} * {x}), 0) AS sumsq", f"min({x}) AS min", f"max({x}) AS max",
+            f"avg({x}) AS mean", f"stddev_samp({x}) AS std",
+        ])
+        not_null = [f"{k} IS NOT NULL" for k in keys]
+        group = f"GROUP BY {', '.join(keys)} ORDER BY {', '.join(keys)}" if keys else ''
+        table = self.query(f"SELECT {select} FROM survey {self._where(*not_null)} {group}", self.params)
+        table['n'] = table['n'].astype('int64')
+        table['count'] = table['count'].astype('float64')
+        if dimensions:
+            table = table.set_index(list(dimensions))
+        return table[ROLLUP_COLUMNS]
+
+    def summary(self, measure):
+        return self.rollup([], measure).iloc[0]
+
+    def binned_mean(self, column, edges, measure):
+        """``SurveyDataset.binned_mean`` ekvivalenti: oraliq raqami bo'yicha ``n`` va ``mean``"""
+        x, m = _quote(column), f"CAST({_quote(measure)} AS DOUBLE)"
+        # pd.cut(include_lowest=True): birinchi oraliq [e0, e1], qolganlari (e_i, e_i+1]
+        cases = ' '.join(f"WHEN {x} {'>=' if i == 0 else '>'} ? AND {x} <= ? THEN {i}" for i in range(len(edges) - 1))
+        bounds = [float(value) for pair in zip(edges[:-1], edges[1:]) for value in pair]
+        table = self.query(
+            f"SELECT bin, count(*) AS n, avg({m}) AS mean FROM "
+            f"(SELECT CASE {cases} END AS bin, {_quote(measure)} FROM survey {self._where()}) "
+            f"WHERE bin IS NOT NULL GROUP BY bin", bounds + self.params)
+        table = table.set_index('bin').reindex(range(len(edges) - 1))
+        return pd.DataFrame({'n': table['n'].fillna(0).astype('int64'), 'mean': table['mean'].astype('float64')})
+
+    def correlation(self, columns=None, method='pearson'):
+        """Juftlik bo'yicha Pearson yoki Spearman korrelyatsiyasi (NULL juftlar tashlab yuboriladi).
+
+        Spearman uchun har bir ustun NULL'siz qiymatlari bo'yicha o'rtacha
+        rangga o'tkaziladi (``CorrelationService`` bilan bir xil qoida).
+        """
+        if method not in METHODS:
+            raise ValueError(f"Noma'lum korrelyatsiya usuli: {method}")
+        columns = list(columns if columns is not None else self.measures)
+        pairs = [(i, j) for i in range(len(columns)) for j in range(i + 1, len(columns))]
+        if not pairs:
+            return pd.DataFrame(np.eye(len(columns)), index=columns, columns=columns)
+        select = ', '.join(
+            f"corr({_quote(columns[i])}, {_quote(columns[j])}) AS c{k}" for k, (i, j) in enumerate(pairs)
+        )
+        source = _ranked(columns, self._where()) if method == 'spearman' else (
+            f"(SELECT {', '.join(f'CAST({_quote(c)} AS DOUBLE) AS {_quote(c)}' for c in columns)} "
+            f"FROM survey {self._where()})"
+        )
+        row = self.query(f"SELECT {select} FROM {source}", self.params).iloc[0]
+        corr = np.eye(len(columns))
+        for k, (i, j) in enumerate(pairs):
+            corr[i, j] = corr[j, i] = np.nan if pd.isna(row[f'c{k}']) else row[f'c{k}']
+        return pd.DataFrame(corr, index=columns, columns=columns)
+
+    def correlation_pair(self, x, y, method='pearson'):
+        return self.correlation([x, y], method).loc[x, y]
+
+    # Jadvalsiz rejim (``SQLDataset``) so'rovlari: natijalar xotiradagi hisob-kitoblar bilan bir xil ko'rinishda
+
+    def column_types(self):
+        """Ustun -> DuckDB turi (qator raqami ustunisiz)"""
+        table = self.query("DESCRIBE survey")
+        return {name: kind for name, kind in zip(table['column_name'], table['column_type']) if name != ROW_COLUMN}
+
+    def numeric_columns(self):
+        return [name for name, kind in self.column_types().items() if kind.split('(')[0] in NUMERIC_TYPES]
+
+    def describe(self, columns, percentiles):
+        """``NumericSummary.describe`` ko'rinishidagi jadval (kvartillar aniq - ``quantile_cont``)"""
+        parts = []
+        for i, column in enumerate(columns):
+            x = f"CAST({_quote(column)} AS DOUBLE)"
+            parts += [f"count({x}) AS count{i}", f"avg({x}) AS mean{i}", f"stddev_samp({x}) AS std{i}",
+                      f"min({x}) AS min{i}", f"quantile_cont({x}, {_float_list(percentiles)}) AS q{i}",
+                      f"max({x}) AS max{i}"]
+        row = self.query(f"SELECT {', '.join(parts)} FROM survey {self._where()}", self.params).iloc[0]
+        table = {}
+        for i, column in enumerate(columns):
+            quantiles = row[f'q{i}'] if row[f'count{i}'] else [np.nan] * len(percentiles)
+            table[column] = [row[f'count{i}'], row[f'mean{i}'], row[f'std{i}'], row[f'min{i}'], *quantiles,
+                             row[f'max{i}']]
+        index = ['count', 'mean', 'std', 'min'] + [f"{q * 100:g}%" for q in percentiles] + ['max']
+        return pd.DataFrame(table, index=index, dtype='float64')
+
+    def quantiles(self, column, q):
+        """Aniq kvantillar (``np.quantile`` kabi chiziqli interpolyatsiya); qiymat bo'lmasa NaN"""
+        x = f"CAST({_quote(column)} AS DOUBLE)"
+        value = self.query(f"SELECT quantile_cont({x}, {_float_list(np.atleast_1d(q))}) AS q FROM survey "
+                           f"{self._where()}", self.params)['q'].iloc[0]
+        values = np.full(np.size(q), np.nan) if value is None or np.ndim(value) == 0 else np.asarray(value, dtype='float64')
+        return values if np.ndim(q) else float(values[0])
+
+    def histogram(self, column, nbins):
+        """``compute_histogram`` ekvivalenti: bin chegaralari min/max bo'yicha, sonlar SQL'da"""
+        x = f"CAST({_quote(column)} AS DOUBLE)"
+        layout = self._layout(x, nbins)
+        if layout is None:
+            return Histogram(column, 0.0, 1.0, np.zeros(0, dtype=np.int64))
+        start, size = layout
+        table = self.query(
+            f"SELECT CAST(floor(({x} - ?) / ?) AS BIGINT) AS bin, count(*) AS n FROM survey "
+            f"{self._where(f'{x} IS NOT NULL')} GROUP BY bin", [start, size] + self.params)
+        counts = np.zeros(int(table['bin'].max()) + 1, dtype=np.int64)
+        counts[table['bin'].to_numpy()] = table['n'].to_numpy()
+        return Histogram(column, start, size, counts)
+
+    def density(self, x_column, y_column, nbins=(50, 50)):
+        """``compute_density`` ekvivalenti (ikkala qiymati bor qatorlar)"""
+        x, y = (f"CAST({_quote(column)} AS DOUBLE)" for column in (x_column, y_column))
+        both = [f'{x} IS NOT NULL', f'{y} IS NOT NULL']
+        x_layout, y_layout = self._layout(x, nbins[0], *both), self._layout(y, nbins[1], *both)
+        if x_layout is None:
+            return Density(x_column, y_column, 0.0, 1.0, 0.0, 1.0, np.zeros((0, 0), dtype=np.int64))
+        table = self.query(
+            f"SELECT CAST(floor(({x} - ?) / ?) AS BIGINT) AS ix, CAST(floor(({y} - ?) / ?) AS BIGINT) AS iy, "
+            f"count(*) AS n FROM survey {self._where(*both)} GROUP BY ALL", [*x_layout, *y_layout] + self.params)
+        counts = np.zeros((int(table['ix'].max()) + 1, int(table['iy'].max()) + 1), dtype=np.int64)
+        counts[table['ix'].to_numpy(), table['iy'].to_numpy()] = table['n'].to_numpy()
+        return Density(x_column, y_column, *x_layout, *y_layout, counts)
+
+    def _layout(self, x, nbins, *conditions):
+        row = self.query(
+            f"SELECT min({x}) AS low, max({x}) AS high, bool_and({x} = round({x})) AS integral FROM survey "
+            f"{self._where(f'{x} IS NOT NULL', *conditions)}", self.params).iloc[0]
+        if pd.isna(row['low']):
+            return None
+        return bin_layout(float(row['low']), float(row['high']), bool(row['integral']), nbins)
+
+    def points(self, columns):
+        """Ustunlar qiymatlari fayldagi tartibda (kichik natijalar uchun)"""
+        select = ', '.join(_quote(column) for column in columns)
+        return self.query(f"SELECT {select} FROM survey {self._where()} ORDER BY {_quote(ROW_COLUMN)}", self.params)
+
+    def distinct(self, column):
+        """Ustunning bo'sh bo'lmagan noyob qiymatlari (matn sifatida, saralangan)"""
+        c = _quote(column)
+        table = self.query(f"SELECT DISTINCT CAST({c} AS VARCHAR) AS value FROM survey "
+                           f"{self._where(f'{c} IS NOT NULL')} ORDER BY value", self.params)
+        return table['value'].tolist()
+
+    def bounds(self, column):
+        """Ustun minimumi va maksimumi (qiymat bo'lmasa - (0, 0))"""
+        x = f"CAST({_quote(column)} AS DOUBLE)"
+        row = self.query(f"SELECT min({x}) AS low, max({x}) AS high FROM survey {self._where()}", self.params).iloc[0]
+        return (0.0, 0.0) if pd.isna(row['low']) else (float(row['low']), float(row['high']))
+
+    def language_counts(self, column):
+        """``LanguageMatrix.counts`` ekvivalenti (bir qatordagi takroriy til bir marta sanaladi)"""
+        table = self.query(f"SELECT lang AS Language, count(*) AS Count FROM {self._languages(column)} s, "
+                           f"unnest(s.langs) AS t(lang) GROUP BY lang ORDER BY Count DESC, lang", self.params)
+        return pd.Series(table['Count'].to_numpy(dtype='int64'), index=pd.Index(table['Language'], name='Language'),
+                         name='Count')
+
+    def language_pairs(self, column):
+        """``LanguageMatrix.cooccurrence`` ekvivalenti: til x til (diagonalda - tilning o'zi)"""
+        table = self.query(f"SELECT a, b, count(*) AS n FROM {self._languages(column)} s, "
+                           f"unnest(s.langs) AS t1(a), unnest(s.langs) AS t2(b) GROUP BY ALL", self.params)
+        vocabulary = pd.Index(sorted(set(table['a'])), name='Language')
+        pairs = table.pivot(index='a', columns='b', values='n')
+        return pd.DataFrame(pairs.reindex(index=vocabulary, columns=vocabulary).fillna(0).to_numpy(dtype='int64'),
+                            index=vocabulary, columns=vocabulary)
+
+    def languages_by(self, column, dimension):
+        """``LanguageMatrix.by_group`` ekvivalenti: guruh x til"""
+        d = _quote(dimension)
+        table = self.query(f"SELECT g, lang, count(*) AS n FROM {self._languages(column, f'{d} AS g')} s, "
+                           f"unnest(s.langs) AS t(lang) WHERE g IS NOT NULL GROUP BY ALL", self.params)
+        groups = pd.Index(self.distinct(dimension), name=dimension)
+        vocabulary = pd.Index(sorted(set(table['lang'])), name='Language')
+        table['g'] = table['g'].astype(str)
+        counts = table.pivot(index='g', columns='lang', values='n')
+        return pd.DataFrame(counts.reindex(index=groups, columns=vocabulary).fillna(0).to_numpy(dtype='int64'),
+                            index=groups, columns=vocabulary)
+
+    def _languages(self, column, *extra):
+        """Har bir qator tillari ro'yxati (vergul bo'yicha, bo'shliqlarsiz, takrorlarsiz) quyi so'rovi"""
+        c = _quote(column)
+        langs = (f"list_filter(list_distinct(list_transform(string_split(CAST({c} AS VARCHAR), ','), "
+                 f"x -> trim(x))), x -> x <> '') AS langs")
+        return f"(SELECT {', '.join([*extra, langs])} FROM survey {self._where(f'{c} IS NOT NULL')})"
+
+    def count_matching(self, search_columns, terms, filters):
+        """Jadval ko'rgichi: qidiruv so'zlari va ustun filtrlariga mos qatorlar soni"""
+        conditions, params = _search_conditions(search_columns, terms, filters)
+        return int(self.query(f"SELECT count(*) AS n FROM survey {self._where(*conditions)}",
+                              self.params + params)['n'].iloc[0])
+
+    def page(self, start, size, search_columns, terms, filters, sort=(), descending=(), columns=None):
+        """Jadval ko'rgichi sahifasi: saralash (bo'shlar oxirida, tenglar fayl tartibida), LIMIT/OFFSET"""
+        conditions, params = _search_conditions(search_columns, terms, filters)
+        select = ', '.join(_quote(column) for column in [*(columns or self.columns), ROW_COLUMN])
+        keys = [f"{_quote(column)} {'DESC' if desc else 'ASC'} NULLS LAST" for column, desc in zip(sort, descending)]
+        table = self.query(
+            f"SELECT {select} FROM survey {self._where(*conditions)} "
+            f"ORDER BY {', '.join([*keys, _quote(ROW_COLUMN)])} LIMIT ? OFFSET ?",
+            self.params + params + [int(size), int(start)])
+        return table.set_index(ROW_COLUMN).rename_axis(None)
+
+
+def attach_backend(dataset, source, name=QUERY_BACKEND, **options):
+    """``dataset`` ga ``source`` fayli ustidagi backendni o'rnatish.
+
+    DuckDB tanlanmagan, o'rnatilmagan yoki fayl formati mos kelmasa, xotiradagi
+    (pandas) backend qoladi. Natija - o'rnatilgan backend.
+    """
+    options.setdefault('memory_limit', DUCKDB_MEMORY_LIMIT)
+    if name == 'duckdb' and source and os.path.splitext(source)[1].lower() in DUCKDB_FORMATS:
+        try:
+            dataset.backend = DuckDBBackend.from_file(source, **options)
+        except ImportError:
+            pass
+    return dataset.backend
+
+
+def parquet_copy(path, connection, fingerprint=None, root=PARQUET_DIR):
+    """CSV faylning Parquet nusxasi yo'li (nusxa fayl mazmuni bo'yicha bir marta quriladi).
+
+    Nusxa nomida fayl nomi va barmoq izi bor: fayl o'zgarsa yangi nusxa
+    yoziladi, shu faylning eski nusxalari o'chiriladi.
+    """
+    fingerprint = fingerprint or file_fingerprint(path)
+    prefix = DiskCache.make_key(os.path.basename(path))
+    target = os.path.join(root, f"{prefix}-{fingerprint}.parquet")
+    if os.path.exists(target):
+        return target
+    os.makedirs(root, exist_ok=True)
+    tmp_path = f"{target}.{os.getpid()}.tmp"
+    # Turlar pandas.read_csv kabi aniqlanadi (Yes/No kabi qiymatlar mantiqiy emas, matn bo'lib qoladi)
+    connection.execute(f"COPY (SELECT * FROM read_csv_auto({_literal(path)}, "
+                       f"auto_type_candidates = {CSV_TYPES})) TO {_literal(tmp_path)} (FORMAT parquet)")
+    os.replace(tmp_path, target)
+    for name in os.listdir(root):
+        if name.startswith(f"{prefix}-") and name.endswith(".parquet") and os.path.join(root, name) != target:
+            try:
+                os.remove(os.path.join(root, name))
+            except OSError:
+                pass
+    return target
+
+
+def _search_conditions(search_columns, terms, filters):
+    """Qidiruv (har bir so'z istalgan qidiruv ustunida, katta-kichik harf farqisiz) va filtr shartlari"""
+    conditions, params = [], []
+    for column, values in filters:
+        conditions.append(f"CAST({_quote(column)} AS VARCHAR) IN ({', '.join('?' * len(values))})")
+        params.extend(values)
+    for term in terms:
+        pattern = '%' + term.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_') + '%'
+        conditions.append('(' + ' OR '.join(f"CAST({_quote(column)} AS VARCHAR) ILIKE ? ESCAPE '\\'"
+                                            for column in search_columns) + ')')
+        params.extend([pattern] * len(search_columns))
+    return conditions, params
+
+
+def _float_list(values):
+    return '[' + ', '.join(repr(float(value)) for value in values) + ']'
+
+
+def _ranked(columns, where):
+    """Har bir ustun o'rtacha rangga o'tkazilgan quyi so'rov (NULL'lar NULL qoladi)"""
+    ranks = ', '.join(
+        f"CASE WHEN {_quote(c)} IS NULL THEN NULL ELSE "
+        f"rank() OVER (PARTITION BY {_quote(c)} IS NULL ORDER BY {_quote(c)}) "
+        f"+ (count(*) OVER (PARTITION BY {_quote(c)}) - 1) / 2.0 END AS {_quote(c)}"
+        for c in columns
+    )
+    return f"(SELECT {ranks} FROM survey {where})"
+
+
+def _quote(name):
+    return '"' + str(name).replace('"', '""') + '"'
+
+
+def _literal(value):
+    return "'" + str(value).replace("'", "''") + "'"
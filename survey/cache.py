@@ -0,0 +1,336 @@
+"""GitHub'dan yuklangan fayllar uchun diskdagi doimiy kesh"""
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Kesh joylashuvi va cheklovlari (muhit o'zgaruvchilari orqali o'zgartirish mumkin)
+DEFAULT_CACHE_DIR = os.environ.get(
+    "SURVEY_CACHE_DIR",
+    os.path.join(os.path.expanduser("~"), ".cache", "data-professional-survey"),
+)
+DEFAULT_MAX_AGE = int(os.environ.get("SURVEY_CACHE_MAX_AGE", 7 * 24 * 3600))  # soniya
+DEFAULT_MAX_BYTES = int(os.environ.get("SURVEY_CACHE_MAX_BYTES", 512 * 1024 * 1024))
+
+# (ulanish, o'qish) uchun kutish vaqti, soniyada
+REQUEST_TIMEOUT = (5, 60)
+
+# Vaqtinchalik xatolarda qayta urinishlar soni va ular orasidagi kutish koeffitsienti
+REQUEST_RETRIES = 3
+RETRY_BACKOFF = 0.5
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# Fayllar diskka shu o'lchamdagi bo'laklar bilan yoziladi (butun fayl xotiraga olinmaydi)
+DOWNLOAD_CHUNK_BYTES = 1 << 20
+
+# Foydalanish vaqti shu aniqlikda yangilanadi (soniya): har bir o'qishda meta qayta yozilmaydi
+ACCESS_RESOLUTION = 60
+
+logger = logging.getLogger(__name__)
+
+
+class DiskCache:
+    """Fayl tizimidagi kesh: har bir yozuv ma'lumot fayli va JSON metadan iborat.
+
+    Yozuv yoshi u saqlangan (yoki server 304 bilan tasdiqlagan) vaqtdan
+    hisoblanadi - o'qish uni yoshartirmaydi. ``max_age`` soniyadan eski
+    yozuvlar ``get`` da berilmaydi, lekin diskda qoladi: ular ETag bilan qayta
+    tekshiriladi va tarmoq ishlamaganda zaxira nusxa bo'ladi. ``immutable``
+    metali yozuvlar (mazmuni SHA bilan aniqlangan fayllar) eskirmaydi.
+    Yozuvlar faqat hajm bo'yicha o'chiriladi: umumiy hajm ``max_bytes`` dan
+    oshsa, eng kam ishlatilganlaridan boshlab.
+
+    Bitta obyekt bir nechta oqimdan (parallel yuklash) ishlatiladi: metani
+    yozish va tozalash qulf ostida, vaqtinchalik fayllar har bir yozish uchun
+    alohida. ``pinned()`` bloki ichida o'qilgan yoki yozilgan yozuvlar
+    o'chirilmaydi - boshqa oqim o'z faylini o'qib ulgurmasdan uni
+    o'chirib yubormasligi uchun; tozalash blok tugagach bir marta bajariladi.
+    """
+
+    def __init__(self, root=DEFAULT_CACHE_DIR, max_age=DEFAULT_MAX_AGE, max_bytes=DEFAULT_MAX_BYTES):
+        self.root = root
+        self.max_age = max_age
+        self.max_bytes = max_bytes
+        self._lock = threading.RLock()
+        self._pin_depth = 0
+        self._pinned = set()
+        os.makedirs(self.root, exist_ok=True)
+
+    @staticmethod
+    def make_key(*parts):
+        """Kalit qismlaridan (masalan, fayl nomi va SHA) barqaror kalit yasash"""
+        return hashlib.sha1("\x00".join(str(p) for p in parts).encode("utf-8")).hexdigest()
+
+    def data_path(self, key):
+        return os.path.join(self.root, key + ".bin")
+
+    def _meta_path(self, key):
+        return os.path.join(self.root, key + ".json")
+
+    def get(self, key, stale=False):
+        """Yozuv metasini qaytarish va foydalanish vaqtini yangilash; yo'q yoki muddati o'tgan bo'lsa None.
+
+        ``stale=True`` - muddati o'tgan yozuv ham qaytariladi (ETag bilan
+        qayta tekshirish va tarmoq ishlamaganda zaxira nusxa uchun).
+        """
+        try:
+            with open(self._meta_path(key), encoding="utf-8") as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not os.path.exists(self.data_path(key)):
+            return None
+        if not stale and self.expired(meta):
+            return None
+        self._pin(key)
+        if time.time() - meta.get("accessed_at", 0) >= ACCESS_RESOLUTION:
+            self.touch(key, meta)
+        return meta
+
+    def expired(self, meta, now=None):
+        """Yozuv saqlangan (tasdiqlangan) vaqtidan ``max_age`` soniya o'tganmi"""
+        if meta.get("immutable"):
+            return False
+        stored_at = meta.get("stored_at", meta.get("accessed_at", 0))
+        return (now if now is not None else time.time()) - stored_at > self.max_age
+
+    def read(self, key):
+        with open(self.data_path(key), "rb") as f:
+            return f.read()
+
+    def put(self, key, content, **meta):
+        """Ma'lumotni atomar tarzda yozish va keshni tozalash"""
+        now = time.time()
+        meta = dict(meta, size=len(content), stored_at=now, accessed_at=now)
+        with self._lock:
+            self._pin(key)
+            self._atomic_write(self.data_path(key), content)
+            self._atomic_write(self._meta_path(key), json.dumps(meta).encode("utf-8"))
+            self.evict(keep=key)
+        return meta
+
+    def put_stream(self, key, chunks, **meta):
+        """Bo'laklar oqimini to'g'ridan-to'g'ri diskka yozish (katta fayllar uchun)"""
+        path = self.data_path(key)
+        fd, tmp_path = self._temp_file(path)
+        size = 0
+        try:
+            # Tarmoqdan o'qish qulfsiz (boshqa oqimlar o'z fayllarini parallel yozadi)
+            with os.fdopen(fd, "wb") as f:
+                for chunk in chunks:
+                    f.write(chunk)
+                    size += len(chunk)
+            now = time.time()
+            meta = dict(meta, size=size, stored_at=now, accessed_at=now)
+            with self._lock:
+                self._pin(key)
+                os.replace(tmp_path, path)
+                self._atomic_write(self._meta_path(key), json.dumps(meta).encode("utf-8"))
+                self.evict(keep=key)
+        except BaseException:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+        return meta
+
+    @contextmanager
+    def pinned(self):
+        """Blok ichida o'qilgan va yozilgan yozuvlarni o'chirishdan himoyalash (blokdan keyin bir marta tozalanadi)"""
+        with self._lock:
+            self._pin_depth += 1
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self._pin_depth -= 1
+                if not self._pin_depth:
+                    self._pinned.clear()
+                    self.evict()
+
+    def _pin(self, key):
+        with self._lock:
+            if self._pin_depth:
+                self._pinned.add(key)
+
+    def touch(self, key, meta=None, validated=False):
+        """Foydalanish vaqtini yangilash; ``validated=True`` - server tasdiqladi, yosh qaytadan hisoblanadi"""
+        meta = meta if meta is not None else self.get(key, stale=True)
+        if meta is None:
+            return
+        meta["accessed_at"] = time.time()
+        if validated:
+            meta["stored_at"] = meta["accessed_at"]
+        try:
+            with self._lock:
+                self._atomic_write(self._meta_path(key), json.dumps(meta).encode("utf-8"))
+        except OSError:
+            pass
+
+    def evict(self, keep=None):
+        """Hajm chegarasidan oshgan yozuvlarni o'chirish (eng kam ishlatilganlaridan boshlab).
+
+        Muddati o'tgan yozuvlar yoshi bo'yicha o'chirilmaydi - ular tarmoq
+        ishlamaganda zaxira nusxa. ``keep`` va ``pinned()`` bloki ichida
+        ishlatilgan yozuvlar o'chirilmaydi.
+        """
+        with self._lock:
+            entries = list(self._entries())
+            total = sum(meta.get("size", 0) for _, meta in entries)
+            for key, meta in sorted(entries, key=lambda e: e[1].get("accessed_at", 0)):
+                if total <= self.max_bytes:
+                    break
+                if key == keep or key in self._pinned:
+                    continue
+                self._remove(key)
+                total -= meta.get("size", 0)
+
+    def _entries(self):
+        for name in os.listdir(self.root):
+            if not name.endswith(".json"):
+                continue
+            key = name[:-len(".json")]
+            try:
+                with open(os.path.join(self.root, name), encoding="utf-8") as f:
+                    yield key, json.load(f)
+            except (OSError, ValueError):
+                self._remove(key)
+
+    def _remove(self, key):
+        for path in (self.data_path(key), self._meta_path(key)):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    @staticmethod
+    def _temp_file(path):
+        """Shu papkada noyob vaqtinchalik fayl (oqimlar va jarayonlar bir-birining faylini ishlatmaydi)"""
+        return tempfile.mkstemp(dir=os.path.dirname(path), prefix=os.path.basename(path) + ".", suffix=".tmp")
+
+    @classmethod
+    def _atomic_write(cls, path, content):
+        fd, tmp_path = cls._temp_file(path)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(content)
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+
+
+def make_session(retries=REQUEST_RETRIES, backoff=RETRY_BACKOFF, pool_size=8):
+    """Ulanishlar hovuzi va qayta urinishlarga ega HTTP sessiya.
+
+    Bitta sessiya bir nechta oqimdan (thread) parallel yuklash uchun
+    ishlatiladi; ``pool_size`` - bir xost uchun ochiq ulanishlar soni.
+    """
+    retry = Retry(
+        total=retries, connect=retries, read=retries, backoff_factor=backoff,
+        status_forcelist=RETRY_STATUSES, allowed_methods=frozenset(["GET", "HEAD"]),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(max_retries=retry, pool_connections=pool_size, pool_maxsize=pool_size)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def cached_get(url, cache, key=None, session=None, timeout=REQUEST_TIMEOUT, on_warning=None, **meta):
+    """URL'ni ETag/If-None-Match bilan qayta tekshirib yuklash.
+
+    Server 304 qaytarsa (yozuv yoshi yangilanadi) yoki tarmoq ishlamasa,
+    keshdagi nusxa qaytariladi - muddati o'tgan bo'lsa ham, chunki u
+    avval serverdan tekshiriladi (tarmoqsiz holatda ``on_warning`` ga yoki
+    log'ga ogohlantirish yoziladi). Natija: ``(content_bytes, from_cache)``.
+    """
+    key = key or cache.make_key(url)
+    cached = cache.get(key, stale=True)
+    headers = {}
+    if cached and cached.get("etag"):
+        headers["If-None-Match"] = cached["etag"]
+
+    http = session or requests
+    try:
+        response = http.get(url, headers=headers, timeout=timeout)
+        if response.status_code == 304 and cached is not None:
+            cache.touch(key, cached, validated=True)
+            return cache.read(key), True
+        response.raise_for_status()
+    except requests.RequestException as e:
+        # Tarmoq ishlamasa - keshdagi nusxadan foydalanish
+        if cached is None:
+            raise
+        _warn_stale(url, e, on_warning)
+        return cache.read(key), True
+
+    cache.put(key, response.content, url=url, etag=response.headers.get("ETag"), **meta)
+    return response.content, False
+
+
+def cached_get_file(item, cache, session=None, timeout=REQUEST_TIMEOUT, on_warning=None):
+    """GitHub contents ro'yxatidagi faylni nomi va SHA bo'yicha keshlab yuklash.
+
+    SHA fayl mazmunini aniqlaydi, shuning uchun bunday yozuv eskirmaydi va
+    mos yozuv bo'lsa tarmoqqa umuman murojaat qilinmaydi. SHA bo'lmasa,
+    muddati o'tgan yozuv ETag bilan qayta tekshiriladi. Natija: keshdagi
+    faylning yo'li.
+    """
+    sha = item.get("sha", "")
+    key = cache.make_key(item["name"], sha)
+    if cache.get(key) is None:
+        cached_download(item["download_url"], cache, key=key, session=session, timeout=timeout,
+                        on_warning=on_warning, name=item["name"], sha=sha, immutable=bool(sha))
+    return cache.data_path(key)
+
+
+def cached_download(url, cache, key=None, session=None, timeout=REQUEST_TIMEOUT, on_warning=None, **meta):
+    """URL'ni bo'laklab keshga yuklash; javob tanasi xotirada to'planmaydi.
+
+    Keshdagi (muddati o'tgan) yozuv ETag bilan qayta tekshiriladi; server 304
+    qaytarsa yoki tarmoq ishlamasa, shu nusxa ishlatiladi. Natija: keshdagi
+    faylning yo'li.
+    """
+    key = key or cache.make_key(url)
+    cached = cache.get(key, stale=True)
+    headers = {}
+    if cached and cached.get("etag"):
+        headers["If-None-Match"] = cached["etag"]
+
+    http = session or requests
+    try:
+        with http.get(url, headers=headers, stream=True, timeout=timeout) as response:
+            if response.status_code == 304 and cached is not None:
+                cache.touch(key, cached, validated=True)
+                return cache.data_path(key)
+            response.raise_for_status()
+            # Fayl to'liq yozilgandan keyingina eski nusxa almashtiriladi
+            cache.put_stream(key, response.iter_content(DOWNLOAD_CHUNK_BYTES), url=url,
+                             etag=response.headers.get("ETag"), **meta)
+    except requests.RequestException as e:
+        if cached is None:
+            raise
+        _warn_stale(url, e, on_warning)
+    return cache.data_path(key)
+
+
+def _warn_stale(url, error, on_warning):
+    message = f"{url} yangilab bo'lmadi ({error}), keshdagi nusxa ishlatilmoqda"
+    if on_warning is not None:
+        on_warning(message)
+    else:
+        logger.warning(message)
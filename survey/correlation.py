@@ -0,0 +1,75 @@
+"""Korrelyatsiya xizmati: ko-momentlar ma'lumotlar versiyasi va filtr bo'yicha keshlanadi.
+
+Har bir versiya (filtrlangan versiyalar kalitida filtr holati ham bor) uchun
+ko-moment matritsalari (soni, yig'indilar, kvadratlar va ko'paytmalar
+yig'indilari) bir marta quriladi. Butun matritsa ham, bitta juftlik ham shu
+yig'indilardan olinadi - ``df.corr()`` qayta ishga tushirilmaydi.
+
+Spearman korrelyatsiyasi - ranglar ustidagi Pearson: har bir ustunning
+ranglari (takroriy qiymatlarga o'rtacha rang) alohida keshlanadi va ular
+ustida ko-momentlar quriladi. Ranglar har bir ustun bo'yicha NaN'siz
+qiymatlardan olinadi, shuning uchun bo'sh qiymatlar bo'lmaganda natija
+``df.corr(method='spearman')`` bilan aynan bir xil.
+
+Pearson ko-momentlari ma'lumotlar obyektining o'zida saqlanadi (u bilan
+birga bo'shatiladi). Spearman ranglari va ko-momentlari faqat umumiy LRU
+keshda: hajmi baytlarda cheklanadi, eng kam ishlatilganlari birinchi
+chiqariladi.
+"""
+import os
+
+import numpy as np
+import pandas as pd
+
+from survey.lru import LRUCache
+from survey.moments import CoMoments
+from survey.schema import numeric_columns
+
+# Korrelyatsiya keshining chegarasi (baytlarda)
+DEFAULT_MAX_BYTES = int(os.environ.get("SURVEY_CORRELATION_CACHE_BYTES", 64 * 1024 * 1024))
+
+METHODS = ('pearson', 'spearman')
+
+
+class CorrelationService:
+    """Pearson va Spearman korrelyatsiyalari keshlangan ko-momentlardan"""
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+        self.cache = LRUCache(max_bytes)
+
+    def moments(self, dataset, method='pearson'):
+        """Versiya uchun barcha raqamli ustunlar ko-momentlari"""
+        if method not in METHODS:
+            raise ValueError(f"Noma'lum korrelyatsiya usuli: {method}")
+        if method == 'pearson':
+            # Pearson ko-momentlari SurveyDataset'ning o'zida (yangi qatorlar qo'shilganda yangilanadi) va
+            # u bilan birga yashaydi: LRU'da hisoblansa, chiqarib yuborish xotirani bo'shatmasdi
+            return dataset.comoments
+        return self.cache.get_or_build((dataset.version, method), lambda: self._rank_moments(dataset),
+                                       lambda m: m.nbytes)
+
+    def matrix(self, dataset, method='pearson', columns=None):
+        """Korrelyatsiya matritsasi (``columns`` berilsa - faqat shu ustunlar)"""
+        corr = self.moments(dataset, method).corr()
+        return corr if columns is None else corr.loc[columns, columns]
+
+    def pair(self, dataset, x, y, method='pearson'):
+        """Bitta juftlik korrelyatsiyasi"""
+        return self.moments(dataset, method).pair(x, y)
+
+    def ranks(self, dataset, column):
+        """Ustun ranglari (NaN'lar saqlanadi, takroriy qiymatlarga o'rtacha rang)"""
+        return self.cache.get_or_build(
+            (dataset.version, 'ranks', column),
+            lambda: dataset.df[column].rank(method='average').to_numpy(dtype='float64', na_value=np.nan),
+            lambda ranks: ranks.nbytes,
+        )
+
+    def _rank_moments(self, dataset):
+        columns = numeric_columns(dataset.df)
+        ranks = pd.DataFrame({column: self.ranks(dataset, column) for column in columns})
+        return CoMoments.from_frame(ranks, columns)
+
+
+# Jarayon bo'yicha umumiy xizmat (barcha sessiyalar va bo'limlar uchun)
+CORRELATIONS = CorrelationService()
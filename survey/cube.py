@@ -0,0 +1,134 @@
+"""Oldindan hisoblangan agregat kub: barcha tablar shu kubdan o'qiydi.
+
+Kub ma'lumotlar versiyasi uchun bir marta quriladi. Unda har bir
+Role x Country x Education x RemoteWork x Gender kombinatsiyasi uchun
+o'lchovlarning soni, yig'indisi, kvadratlar yig'indisi, minimumi va maksimumi
+saqlanadi. Grafiklar qatorlarni qayta ko'rib chiqmasdan, kubni kerakli
+o'lchamlarga yig'ish (roll-up) orqali hisoblanadi - qayta ishga tushirish
+narxi qatorlar soniga emas, guruhlar soniga bog'liq.
+"""
+import numpy as np
+import pandas as pd
+
+CUBE_DIMENSIONS = ['Role', 'Country', 'Education', 'RemoteWork', 'Gender']
+CUBE_MEASURES = ['Salary', 'YearsExperience', 'JobSatisfaction', 'WorkLifeBalance', 'Age']
+
+_STATS = ('count', 'sum', 'sumsq', 'min', 'max')
+
+
+class AggregateCube:
+    """O'lchamlar kombinatsiyalari bo'yicha yig'ilgan statistikalar jadvali"""
+
+    def __init__(self, table, dimensions, measures):
+        self.table = table
+        self.dimensions = list(dimensions)
+        self.measures = list(measures)
+
+    @classmethod
+    def build(cls, df, dimensions=CUBE_DIMENSIONS, measures=CUBE_MEASURES):
+        """DataFrame'dan kubni bir o'tishda qurish (faqat mavjud ustunlar ishlatiladi)"""
+        dimensions = [d for d in dimensions if d in df.columns]
+        measures = [m for m in measures if m in df.columns and pd.api.types.is_numeric_dtype(df[m])]
+
+        work = pd.DataFrame({d: df[d] for d in dimensions})
+        aggregations = {'n': (dimensions[0] if dimensions else '_one', 'size')}
+        if not dimensions:
+            work['_one'] = 0
+        for m in measures:
+            values = df[m].astype('float64')
+            work[m] = values
+            work[f'{m}__sq'] = values * values
+            aggregations[f'{m}_count'] = (m, 'count')
+            aggregations[f'{m}_sum'] = (m, 'sum')
+            aggregations[f'{m}_sumsq'] = (f'{m}__sq', 'sum')
+            aggregations[f'{m}_min'] = (m, 'min')
+            aggregations[f'{m}_max'] = (m, 'max')
+
+        if dimensions:
+            # Bo'sh (NaN) kalitlar ham saqlanadi, roll-up vaqtida tashlab yuboriladi
+            table = work.groupby(dimensions, observed=True, dropna=False, sort=False).agg(**aggregations)
+            table = table.reset_index()
+        else:
+            table = work.groupby('_one').agg(**aggregations).reset_index(drop=True)
+        return cls(table, dimensions, measures)
+
+    def merge(self, other):
+        """Ikki kubni birlashtirish (masalan, yangi qatorlar to'plami bilan)"""
+        combined = pd.concat([self.table, other.table], ignore_index=True)
+        for d in self.dimensions:
+            if isinstance(self.table[d].dtype, pd.CategoricalDtype) or isinstance(other.table[d].dtype, pd.CategoricalDtype):
+                combined[d] = combined[d].astype('category')
+        aggregations = {'n': ('n', 'sum')}
+        for m in self.measures:
+            for stat in _STATS:
+                col = f'{m}_{stat}'
+                aggregations[col] = (col, stat if stat in ('min', 'max') else 'sum')
+        if self.dimensions:
+            table = combined.groupby(self.dimensions, observed=True, dropna=False, sort=False).agg(**aggregations)
+            table = table.reset_index()
+        else:
+            table = combined.agg({col: func for col, (_, func) in aggregations.items()}).to_frame().T
+        return AggregateCube(table, self.dimensions, self.measures)
+
+    @property
+    def nbytes(self):
+        return int(self.table.memory_usage(deep=True).sum())
+
+    def has(self, *columns):
+        return all(c in self.dimensions or c in self.measures for c in columns)
+
+    def rollup(self, dimensions=(), measure=None):
+        """Kubni berilgan o'lchamlarga yig'ish.
+
+        Natijada ``n`` (qatorlar soni) va ``measure`` berilsa, uning
+        count/sum/sumsq/min/max hamda mean/std ustunlari bo'ladi.
+        """
+        dimensions = list(dimensions)
+        columns = ['n']
+        if measure is not None:
+            columns += [f'{measure}_{stat}' for stat in _STATS]
+
+        if dimensions:
+            grouped = self.table.groupby(dimensions, observed=True, dropna=True)
+            result = grouped[columns].agg({col: _rollup_func(col) for col in columns})
+        else:
+            result = self.table[columns].agg({col: _rollup_func(col) for col in columns}).to_frame().T
+
+        if measure is not None:
+            result.columns = ['n'] + list(_STATS)
+            count = result['count'].astype('float64')
+            result['mean'] = result['sum'] / count.where(count > 0)
+            variance = (result['sumsq'] - result['sum'] ** 2 / count.where(count > 0)) / (count - 1).where(count > 1)
+            result['std'] = np.sqrt(variance.clip(lower=0))
+        return result
+
+    def counts(self, dimension):
+        """``value_counts`` bilan bir xil: qiymat bo'yicha qatorlar soni, kamayish tartibida"""
+        counts = self.rollup([dimension])['n']
+        counts = counts[counts > 0].sort_values(ascending=False, kind='stable')
+        counts.name = 'count'
+        return counts
+
+    def group_mean(self, dimension, measure):
+        """``df.groupby(dimension)[measure].mean()`` ekvivalenti"""
+        means = self.rollup([dimension], measure)['mean'].dropna()
+        means.name = measure
+        return means
+
+    def crosstab(self, row, column):
+        """``pd.crosstab(df[row], df[column])`` ekvivalenti"""
+        table = self.rollup([row, column])['n'].unstack(fill_value=0)
+        table = table.loc[table.sum(axis=1) > 0, table.sum(axis=0) > 0]
+        return table.astype('int64')
+
+    def summary(self, measure):
+        """O'lchov bo'yicha umumiy count/mean/std/min/max"""
+        return self.rollup([], measure).iloc[0]
+
+
+def _rollup_func(col):
+    if col.endswith('_min'):
+        return 'min'
+    if col.endswith('_max'):
+        return 'max'
+    return 'sum'
@@ -0,0 +1,305 @@
+"""Bitta versiyadagi so'rovnoma ma'lumotlari va ulardan quriladigan indekslar"""
+import os
+import threading
+from functools import cached_property
+
+import numpy as np
+import pandas as pd
+
+from survey.backends import PandasBackend
+from survey.bootstrap import group_intervals
+from survey.cube import AggregateCube
+from survey.diagnostics import DISABLED
+from survey.explorer import TableExplorer
+from survey.filters import BitmapIndex, filter_key
+from survey.histograms import compute_density, compute_histogram
+from survey.languages import LanguageMatrix
+from survey.lru import LRUCache
+from survey.moments import CoMoments
+from survey.schema import append_rows, freeze_frame, is_text_column, numeric_columns
+from survey.summary import NumericSummary
+
+# Filtrlangan ko'rinishlar keshining chegarasi (baytlarda: jadval, qurilgan indekslar va natijalar)
+DEFAULT_FILTER_CACHE_BYTES = int(os.environ.get("SURVEY_FILTER_CACHE_BYTES", 512 * 1024 * 1024))
+
+
+class SurveyDataset:
+    """Normallashtirilgan DataFrame va undan olingan indekslar.
+
+    Indekslar (agregat kub, tillar matritsasi, gistogramma bin'lari, kvantil
+    eskizlari) birinchi kerak bo'lganda quriladi va shu versiya uchun qayta
+    ishlatiladi. Jadval sessiyalar o'rtasida bo'lishiladi, shuning uchun uning
+    massivlari faqat o'qish uchun (``freeze_frame``), eslab qolingan natijalar
+    lug'atlari esa qulf ostida to'ldiriladi.
+    """
+
+    # Kerak bo'lganda quriladigan indekslar (``nbytes`` ularni hisobga oladi)
+    INDEXES = ('cube', 'languages', 'bitmaps', 'summary', 'explorer', 'comoments')
+
+    def __init__(self, df, version, available):
+        self.df = freeze_frame(df)
+        self.version = version
+        self.available = available
+        self._histograms = {}
+        self._densities = {}
+        self._intervals = {}
+        self._prefix_sums = {}
+        self._lock = threading.Lock()
+
+    @cached_property
+    def cube(self):
+        return AggregateCube.build(self.df)
+
+    @cached_property
+    def languages(self):
+        if 'ProgrammingLanguages' not in self.df.columns or not is_text_column(self.df['ProgrammingLanguages']):
+            return None
+        return LanguageMatrix.from_series(self.df['ProgrammingLanguages'])
+
+    @cached_property
+    def bitmaps(self):
+        return BitmapIndex(self.df)
+
+    @cached_property
+    def summary(self):
+        """Raqamli ustunlar statistikasi va kvantil eskizlari (bitta o'tishda)"""
+        return NumericSummary.from_frame(self.df)
+
+    @cached_property
+    def explorer(self):
+        """Jadval ko'rgichi (saralash tartiblari va teskari indekslar ustunlar bo'yicha kerak bo'lganda quriladi)"""
+        return TableExplorer(self.df, self.version)
+
+    @cached_property
+    def comoments(self):
+        return CoMoments.from_frame(self.df, numeric_columns(self.df))
+
+    @cached_property
+    def backend(self):
+        """Bo'lim agregatlari uchun so'rov backendi (standart - kub va ko-momentlar).
+
+        Boshqa backend (masalan, ``DuckDBBackend``) shu atributga o'rnatiladi;
+        filtrlangan nusxalar uni filtr shartlari bilan oladi, yangi javoblar
+        qo'shilgan versiyalar esa yana xotiradagi backendga qaytadi.
+        """
+        return PandasBackend(self)
+
+    def precompute(self):
+        """Umumiy indekslarni oldindan qurish.
+
+        Jarayon bo'yicha bitta nusxa barcha sessiyalarga berilganda indekslar
+        birinchi so'rovda bir vaqtda bir necha marta qurilmasligi uchun.
+        """
+        self.languages, self.bitmaps, self.summary
+        if isinstance(self.backend, PandasBackend):
+            # Boshqa backendda agregatlar so'rov vaqtida hisoblanadi
+            self.cube, self.comoments
+        return self
+
+    def filtered(self, selections=None, ranges=None, cache=None, diagnostics=DISABLED):
+        """Global filtrlar qo'llangan ma'lumotlar (filtr bo'lmasa - o'zi).
+
+        Natija alohida versiya kalitiga ega, shuning uchun uning indekslari va
+        bo'lim keshlari filtr holati bo'yicha ajratiladi. Filtrlangan jadval
+        tanlangan qatorlar nusxasi, shuning uchun ko'rinishlar jarayon
+        bo'yicha baytlarda cheklangan LRU keshda (standart - ``FILTERED``)
+        saqlanadi: filtr holatlari ko'paysa ham xotira chegaradan oshmaydi.
+        """
+        mask = self.bitmaps.mask(selections, ranges)
+        if mask is None:
+            return self
+        cache = FILTERED if cache is None else cache
+        key = (self.version, filter_key(selections, ranges))
+        subset = cache.get(key)
+        diagnostics.cache('filter', subset is not None)
+        if subset is None:
+            with diagnostics.timer('filter'):
+                subset = self._subset(mask, selections, ranges)
+            cache.put(key, subset, subset.nbytes, sizeof=lambda view: view.nbytes)
+        else:
+            # Ko'rinishlar indekslarni keyinroq quradi: hajmlar qayta o'lchanadi
+            cache.refresh()
+        return subset
+
+    def _subset(self, mask, selections, ranges):
+        subset = SurveyDataset(self.df[mask], f"{self.version}|{filter_key(selections, ranges)}", self.available)
+        # Tillar matritsasi qayta ajratilmaydi - tayyor matritsadan qatorlar olinadi
+        if self.__dict__.get('languages') is not None:
+            subset.__dict__['languages'] = self.languages.subset(mask)
+        backend = self.__dict__.get('backend')
+        if backend is not None and not isinstance(backend, PandasBackend):
+            # Chegaralari to'liq oraliqqa teng diapazonlar bitmap'da ham e'tiborsiz qoldiriladi
+            active = {col: bounds for col, bounds in (ranges or {}).items()
+                      if col in self.bitmaps.sorted and tuple(bounds) != self.bitmaps.bounds(col)}
+            subset.backend = backend.filtered(selections, active)
+        return subset
+
+    @cached_property
+    def frame_bytes(self):
+        """Jadvalning o'zi hajmi (baytlarda; jadval o'zgarmas, bir marta o'lchanadi)"""
+        return int(self.df.memory_usage(deep=True).sum())
+
+    @property
+    def nbytes(self):
+        """Jadval, qurilgan indekslar va eslab qolingan natijalar hajmi (baytlarda).
+
+        Indekslar (bitmaplar, saralash tartiblari, tillar matritsasi, eskizlar,
+        jadval ko'rgichi indekslari) qatorlar soniga mutanosib va kerak
+        bo'lganda quriladi, shuning uchun hajm har safar qayta hisoblanadi.
+        """
+        with self._lock:
+            memos = [*self._histograms.values(), *self._densities.values(),
+                     *self._intervals.values(), *self._prefix_sums.values()]
+        indexes = [self.__dict__.get(name) for name in self.INDEXES]
+        return self.frame_bytes + sum(_sizeof(value) for value in indexes + memos)
+
+    def append(self, batch):
+        """Yangi javoblar qo'shilgan yangi versiya (joriy ma'lumotlar o'zgarmaydi).
+
+        ``batch`` - standart nomlangan ustunlardagi qatorlar. Qurilgan
+        agregatlar (kub, tillar soni va birgalikda uchrashi, ko-momentlar,
+        umumiy statistika va kvantil eskizlari, filtr bitmaplari) qayta
+        qurilmaydi - faqat yangi qatorlar bo'yicha yangilanadi.
+        Gistogrammalar kerak bo'lganda quriladi.
+        """
+        df = append_rows(self.df, batch)
+        batch = df.iloc[len(self.df):]
+        base_version = self.version.split('#', 1)[0]
+        appended = SurveyDataset(df, f"{base_version}#{len(df)}", self.available)
+
+        if 'cube' in self.__dict__:
+            appended.cube = self.cube.merge(AggregateCube.build(batch, self.cube.dimensions, self.cube.measures))
+        if self.__dict__.get('languages') is not None:
+            appended.languages = self.languages.append(LanguageMatrix.from_series(batch['ProgrammingLanguages']))
+        if 'bitmaps' in self.__dict__:
+            appended.bitmaps = self.bitmaps.append(batch)
+        if 'comoments' in self.__dict__:
+            appended.comoments = self.comoments.update(batch)
+        if 'summary' in self.__dict__:
+            appended.summary = self.summary.merge(NumericSummary.from_frame(batch, self.summary.columns))
+        return appended
+
+    def histogram(self, column, nbins):
+        """Ustun uchun bin'lar (ustun va bin soni bo'yicha keshlanadi)"""
+        return self._memo(self._histograms, (column, nbins),
+                          lambda: compute_histogram(self.df[column], nbins, column))
+
+    def density(self, x, y):
+        """Ikki ustun uchun 2D zichlik bin'lari (ustunlar juftligi bo'yicha keshlanadi)"""
+        return self._memo(self._densities, (x, y),
+                          lambda: compute_density(self.df[x], self.df[y], columns=(x, y)))
+
+    def binned_mean(self, column, edges, measure):
+        """``column`` oraliqlari bo'yicha ``measure`` o'rtachasi (``pd.cut(..., include_lowest=True)`` kabi).
+
+        ``column`` saralash tartibi (filtr indeksidagi) bo'yicha ``measure``
+        ning yig'ma yig'indilari bir marta quriladi, har bir so'rov -
+        chegaralar bo'yicha ``searchsorted``. Natija: oraliq raqami
+        bo'yicha ``n`` (qatorlar soni) va ``mean`` jadvali.
+        """
+        values, count, total = self._prefix_sum(column, measure)
+        edges = np.asarray(edges, dtype='float64')
+        bounds = np.r_[np.searchsorted(values, edges[0], side='left'),
+                       np.searchsorted(values, edges[1:], side='right')]
+        counts = np.diff(count[bounds])
+        with np.errstate(invalid='ignore', divide='ignore'):
+            means = np.where(counts > 0, np.diff(total[bounds]) / counts, np.nan)
+        return pd.DataFrame({'n': np.diff(bounds).astype('int64'), 'mean': means})
+
+    def _prefix_sum(self, column, measure):
+        return self._memo(self._prefix_sums, (column, measure), lambda: self._build_prefix_sum(column, measure))
+
+    def _build_prefix_sum(self, column, measure):
+        if column in self.bitmaps.sorted:
+            values, order = self.bitmaps.sorted[column]
+        else:
+            values = self.df[column].to_numpy(dtype='float64', na_value=np.nan)
+            order = np.argsort(values, kind='stable')
+            values = values[order]
+        measured = self.df[measure].to_numpy(dtype='float64', na_value=np.nan)[order]
+        valid = ~np.isnan(measured)
+        return values, np.r_[0, np.cumsum(valid)], np.r_[0.0, np.cumsum(np.where(valid, measured, 0.0))]
+
+    def intervals(self, dimension, measure, groups=None):
+        """Guruh o'rtachalari uchun bootstrap ishonch oraliqlari (guruh va o'lchov bo'yicha keshlanadi).
+
+        ``groups`` - jadvalda yo'q guruhlash (masalan, maosh kategoriyalari);
+        berilmasa ``dimension`` ustuni ishlatiladi.
+        """
+        groups = self.df[dimension] if groups is None else groups
+        return self._memo(self._intervals, (dimension, measure), lambda: group_intervals(groups, self.df[measure]))
+
+    def _memo(self, table, key, build):
+        """``table[key]`` ni bir marta hisoblash (qurish qulfdan tashqarida, natija birinchi yozilgani)"""
+        with self._lock:
+            if key in table:
+                return table[key]
+        value = build()
+        with self._lock:
+            return table.setdefault(key, value)
+
+    def sketch(self, column):
+        """Ustun uchun KLL kvantil eskizi (mediana, kvintillar, persentillar shundan olinadi)"""
+        return self.summary.sketches[column]
+
+    @property
+    def columns(self):
+        return list(self.df.columns)
+
+    @property
+    def rows(self):
+        return len(self.df)
+
+    def points(self, columns):
+        """Scatter grafik uchun ustunlar qiymatlari (qatorlar soni ``SCATTER_MAX_POINTS`` dan oshmaganda)"""
+        return self.df[columns]
+
+    def languages_by(self, dimension):
+        """Guruh x til jadvali (tillar matritsasi bo'lmasa None)"""
+        return None if self.languages is None else self.languages.by_group(self.df[dimension])
+
+    def filter_values(self, dim):
+        """Global filtr uchun qiymatlar; ustun bo'yicha filtr bo'lmasa None"""
+        return self.bitmaps.values(dim) if dim in self.bitmaps.bitmaps else None
+
+    def filter_bounds(self, col):
+        """Diapazon filtri chegaralari; ustun bo'yicha filtr bo'lmasa None"""
+        return self.bitmaps.bounds(col) if col in self.bitmaps.sorted else None
+
+
+# Jarayon bo'yicha filtrlangan ko'rinishlar (versiya va filtr kaliti bo'yicha)
+FILTERED = LRUCache(DEFAULT_FILTER_CACHE_BYTES)
+
+
+def _sizeof(value):
+    """Indeks yoki eslab qolingan natija hajmi (baytlarda)"""
+    if value is None:
+        return 0
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return int(value.memory_usage(deep=True).sum())
+    if isinstance(value, tuple):
+        return sum(_sizeof(item) for item in value)
+    return int(getattr(value, 'nbytes', 0))
+
+
+class DatasetStore:
+    """Jarayon bo'yicha joriy ma'lumotlar versiyasi.
+
+    Yangi javoblar ``append`` orqali qo'shiladi: joriy versiya o'zgartirilmaydi,
+    uning o'rniga yangilangan agregatlarga ega yangi versiya o'rnatiladi.
+    Bir xil to'plam (``key``) ikki marta qo'shilmaydi.
+    """
+
+    def __init__(self, dataset):
+        self.current = dataset
+        self._appended = set()
+        self._lock = threading.Lock()
+
+    def append(self, batch, key=None):
+        with self._lock:
+            if key is not None and key in self._appended:
+                return self.current
+            self.current = self.current.append(batch)
+            if key is not None:
+                self._appended.add(key)
+            return self.current
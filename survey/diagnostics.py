@@ -0,0 +1,137 @@
+"""Ilova ichidagi diagnostika: bosqichlar vaqti, grafik hajmi va kesh statistikasi.
+
+``Diagnostics`` yoqilmagan bo'lsa, ``timer`` tayyor bo'sh kontekstni qaytaradi
+va hech narsa yozilmaydi - o'chiq holatdagi qo'shimcha xarajat bitta
+atribut tekshiruvi. Yoqilganda har bir hodisa lug'at sifatida saqlanadi,
+``survey.diagnostics`` logger'iga JSON qator sifatida yoziladi va JSON Lines
+ko'rinishida eksport qilinadi.
+"""
+import json
+import logging
+import time
+from collections import Counter, deque
+from contextlib import contextmanager, nullcontext
+from datetime import datetime, timezone
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Sessiya davomida saqlanadigan hodisalar soni (eskilari tashlab yuboriladi)
+MAX_EVENTS = 5000
+
+_NULL_TIMER = nullcontext()
+
+
+class Diagnostics:
+    """Bitta sessiya uchun hodisalar jurnali"""
+
+    def __init__(self, enabled=False, max_events=MAX_EVENTS):
+        self.enabled = enabled
+        self.events = deque(maxlen=max_events)
+        self.cache_hits = Counter()
+        self.cache_misses = Counter()
+        self.run = 0
+
+    def start_run(self, enabled):
+        """Yangi ishga tushirish (Streamlit'da har bir qayta chizish)"""
+        self.enabled = enabled
+        self.run += 1
+
+    def record(self, event, **fields):
+        if not self.enabled:
+            return
+        entry = {'ts': datetime.now(timezone.utc).isoformat(timespec='milliseconds'),
+                 'run': self.run, 'event': event, **fields}
+        self.events.append(entry)
+        logger.debug(json.dumps(entry, ensure_ascii=False, default=str))
+
+    def timer(self, stage, **fields):
+        """Bosqich vaqtini o'lchaydigan kontekst (o'chiq holatda hech narsa qilmaydi)"""
+        if not self.enabled:
+            return _NULL_TIMER
+        return self._timer(stage, fields)
+
+    @contextmanager
+    def _timer(self, stage, fields):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record('timing', stage=stage, ms=(time.perf_counter() - start) * 1000, **fields)
+
+    def cache(self, name, hit):
+        """Kesh natijasini hisobga olish"""
+        if not self.enabled:
+            return
+        (self.cache_hits if hit else self.cache_misses)[name] += 1
+        self.record('cache', name=name, hit=hit)
+
+    def cached_call(self, name, func, *args, **kwargs):
+        """Streamlit keshlangan funksiyasini chaqirish va hit/miss'ni aniqlash.
+
+        Funksiya tanasi ichida ``miss(name)`` chaqiriladi - u faqat kesh
+        topilmaganda ishlaydi, shuning uchun chaqiruvdan keyin farq bo'yicha
+        natija aniqlanadi.
+        """
+        if not self.enabled:
+            return func(*args, **kwargs)
+        misses = self.cache_misses[name]
+        start = time.perf_counter()
+        result = func(*args, **kwargs)
+        hit = self.cache_misses[name] == misses
+        if hit:
+            self.cache_hits[name] += 1
+        self.record('cache', name=name, hit=hit, ms=(time.perf_counter() - start) * 1000)
+        return result
+
+    def miss(self, name):
+        if self.enabled:
+            self.cache_misses[name] += 1
+
+    def payload(self, chart, fig, size=None):
+        """Grafikning brauzerga yuboriladigan JSON hajmi va uni serializatsiya qilish vaqti.
+
+        ``size`` - oldindan o'lchangan ``(baytlar, ms)`` (grafiklar keshidan); berilmasa grafik serializatsiya qilinadi.
+        """
+        if not self.enabled:
+            return
+        if size is None:
+            start = time.perf_counter()
+            size = len(fig.to_json().encode('utf-8')), (time.perf_counter() - start) * 1000
+        self.record('payload', chart=chart, bytes=size[0], serialize_ms=size[1])
+
+    def frame(self, event=None, run=None):
+        """Hodisalar jadvali (tur va ishga tushirish bo'yicha tanlash mumkin)"""
+        events = [e for e in self.events
+                  if (event is None or e['event'] == event) and (run is None or e['run'] == run)]
+        return pd.DataFrame(events)
+
+    def timing_summary(self, run=None):
+        """Bosqichlar bo'yicha soni, umumiy va o'rtacha vaqt (eng sekinlari birinchi)"""
+        timings = self.frame('timing', run)
+        if timings.empty:
+            return timings
+        # Bo'lim, grafik yoki fayl nomi bosqich nomiga qo'shiladi: "compute:salary"
+        label = timings['stage']
+        for field in ('section', 'chart', 'file'):
+            if field in timings:
+                label = label.where(timings[field].isna(), label + ':' + timings[field].astype(str))
+        summary = timings.groupby(label.rename('stage'))['ms'].agg(['count', 'sum', 'mean', 'max'])
+        return summary.sort_values('sum', ascending=False).round(2).reset_index()
+
+    def cache_summary(self):
+        names = sorted(set(self.cache_hits) | set(self.cache_misses))
+        return pd.DataFrame({
+            'cache': names,
+            'hit': [self.cache_hits[name] for name in names],
+            'miss': [self.cache_misses[name] for name in names],
+        })
+
+    def to_jsonl(self):
+        """Barcha hodisalar JSON Lines ko'rinishida (tuzilgan log eksporti)"""
+        return '\n'.join(json.dumps(e, ensure_ascii=False, default=str) for e in self.events) + '\n'
+
+
+# Diagnostika uzatilmagan chaqiruvlar uchun (masalan, hisobotlar va benchmarklar)
+DISABLED = Diagnostics(enabled=False)
@@ -0,0 +1,376 @@
+"""Jadval ko'rgichi: server tomonida sahifalash, saralash, ustun filtri va matn qidiruvi.
+
+Brauzerga faqat ko'rinadigan sahifa yuboriladi. Har bir so'rov butun jadval
+bo'ylab qayta hisoblanmasligi uchun ustunlar bo'yicha indekslar bir marta
+(birinchi kerak bo'lganda) quriladi va shu versiya uchun qayta ishlatiladi:
+
+* saralash tartibi - ``argsort`` (barqaror, bo'sh qiymatlar oxirida) va
+  teskari almashtirish (har bir qatorning tartibdagi o'rni);
+* teskari indeks - matnli ustunning har bir noyob qiymati uchun qatorlar
+  ro'yxati (CSR ko'rinishida: qatorlar qiymat kodi bo'yicha guruhlangan).
+
+Qidiruv so'zlari ustunlarning noyob qiymatlari ichidan (katta-kichik harf
+farqisiz) qidiriladi, so'ng mos qiymatlar qatorlari olinadi: so'zlar
+orasida AND, ustunlar orasida OR. Shartlar kutilgan qatorlar soni bo'yicha
+tartiblanadi: eng kam qatorli shart indeksdan olinadi, qolganlari faqat
+shu qatorlar kodlari ustida tekshiriladi. Mos qatorlar (qidiruv va filtr bo'yicha)
+jarayon bo'yicha umumiy LRU keshda (``SEARCHES``) jadval versiyasi kaliti bilan
+saqlanadi - filtrlangan ko'rinishlar versiyasida filtr holati ham bor.
+Saralangan sahifa uchun tanlov to'liq saralanmaydi: qatorlarning tartibdagi
+o'rinlari ichidan ``np.partition`` bilan faqat sahifa oynasi ajratiladi va u
+saralanadi - har qanday sahifa uchun O(k). Bir nechta ustun bo'yicha
+saralashda ustunlar qiymatlari ranglari bitta butun kalitga birlashtiriladi
+va oyna shu kalit bo'yicha ajratiladi: filtrsiz jadvalda faqat birinchi
+ustunning sahifaga tushgan qiymat guruhlari, tanlovda - tanlangan qatorlar.
+"""
+import os
+
+import numpy as np
+import pandas as pd
+
+from survey.lru import LRUCache
+
+SEARCH_COLUMNS = ['Role', 'Country', 'ProgrammingLanguages']
+
+PAGE_SIZES = [25, 50, 100, 200]
+
+# Tanlangan qatorlar jami qatorlarning shu ulushidan kam bo'lsa, ro'yxatlar bilan ishlanadi
+SPARSE_FRACTION = 1 / 32
+
+# Qidiruv natijalari keshining chegarasi (baytlarda)
+DEFAULT_MAX_BYTES = int(os.environ.get("SURVEY_EXPLORER_CACHE_BYTES", 256 * 1024 * 1024))
+
+# Jarayon bo'yicha qidiruv natijalari (jadval versiyasi, so'zlar va filtrlar bo'yicha)
+SEARCHES = LRUCache(DEFAULT_MAX_BYTES)
+
+
+class SortOrder:
+    """Ustun bo'yicha o'sish tartibi, qatorlar o'rni va bo'sh bo'lmagan qiymatlar soni.
+
+    ``starts`` - tartibda har bir noyob qiymat guruhining boshlanish o'rni:
+    undan qiymat rangi va kamayish tartibidagi o'rin (teng qiymatlar
+    kamayishda ham qator tartibida) qiymatlarni saqlamasdan olinadi.
+    """
+
+    def __init__(self, series):
+        n = len(series)
+        dtype = _row_dtype(n)
+        if pd.api.types.is_numeric_dtype(series) and not isinstance(series.dtype, pd.CategoricalDtype):
+            # float argsort NaN'larni oxiriga qo'yadi
+            values = series.to_numpy(dtype='float64', na_value=np.nan)
+            self.order = np.argsort(values, kind='stable').astype(dtype)
+            self.valid = int(np.count_nonzero(~np.isnan(values)))
+        else:
+            values, _ = pd.factorize(series, sort=True)
+            self.valid = int(np.count_nonzero(values >= 0))
+            values = np.where(values < 0, values.max(initial=0) + 1, values)
+            self.order = np.argsort(values, kind='stable').astype(dtype)
+        self.position = np.empty(n, dtype=dtype)
+        self.position[self.order] = np.arange(n, dtype=dtype)
+        ordered = values[self.order[:self.valid]]
+        self.starts = np.flatnonzero(np.r_[True, ordered[1:] != ordered[:-1]]) if self.valid else \
+            np.zeros(0, dtype=np.int64)
+        self._ends = np.append(self.starts[1:], self.valid)
+        self._ranks = None
+
+    @property
+    def distinct(self):
+        """Bo'sh bo'lmagan noyob qiymatlar soni"""
+        return len(self.starts)
+
+    @property
+    def ranks(self):
+        """Har bir qator qiymatining rangi (bo'shlari - ``distinct``); bir nechta ustun bo'yicha saralashda quriladi"""
+        if self._ranks is None:
+            ranks = np.full(len(self.order), self.distinct, dtype=self.order.dtype)
+            ranks[self.order[:self.valid]] = np.repeat(np.arange(self.distinct, dtype=self.order.dtype),
+                                                       self._ends - self.starts)
+            self._ranks = ranks
+        return self._ranks
+
+    def keys(self, rows, descending=False):
+        """Tanlangan qatorlar qiymatlari ranglari (bo'shlari - eng katta, kamayish tartibida ham)"""
+        ranks = self.ranks[rows].astype(np.int64)
+        if descending:
+            ranks = np.where(ranks < self.distinct, self.distinct - 1 - ranks, ranks)
+        return ranks
+
+    def _flip(self, positions, descending):
+        # O'sish tartibidagi o'rin -> kamayish tartibidagi o'rin (guruhlar teskari, guruh ichida
+        # qator tartibi saqlanadi); bo'sh qiymatlar baribir oxirida
+        if not descending or not self.distinct:
+            return positions
+        groups = np.searchsorted(self.starts, positions, side='right') - 1
+        flipped = self.valid - self._ends[groups] + (positions - self.starts[groups])
+        return np.where(positions < self.valid, flipped, positions)
+
+    def unflip(self, positions, descending):
+        """Kamayish tartibidagi o'rin -> o'sish tartibidagi o'rin"""
+        if not descending or not self.distinct:
+            return positions
+        tops = (self.valid - self._ends)[::-1]
+        groups = self.distinct - np.searchsorted(tops, positions, side='right')
+        unflipped = self.starts[groups] + (positions - (self.valid - self._ends[groups]))
+        return np.where(positions < self.valid, unflipped, positions)
+
+    def span(self, position, descending=False):
+        """Tartibdagi ``position`` qiymat guruhining o'rinlar oralig'i [lo, hi)"""
+        if position >= self.valid:
+            return self.valid, len(self.order)
+        if not descending:
+            group = np.searchsorted(self.starts, position, side='right') - 1
+            return int(self.starts[group]), int(self._ends[group])
+        group = self.distinct - np.searchsorted((self.valid - self._ends)[::-1], position, side='right')
+        return int(self.valid - self._ends[group]), int(self.valid - self.starts[group])
+
+    def page(self, start, size, descending=False):
+        """Barcha qatorlar bo'yicha tartiblangan sahifa"""
+        positions = np.arange(start, min(start + size, len(self.order)))
+        return self.order[self.unflip(positions, descending)]
+
+    def page_of(self, rows, start, size, descending=False):
+        """Tanlangan qatorlar ichidan tartiblangan sahifa (tanlov to'liq saralanmaydi)"""
+        end = min(start + size, len(rows))
+        if start >= end:
+            return rows[:0]
+        positions = self._flip(self.position[rows], descending)
+        window = np.partition(positions, sorted({start, end - 1}))[start:end]
+        return self.order[self.unflip(np.sort(window), descending)]
+
+    @property
+    def nbytes(self):
+        return sum(array.nbytes for array in (self.order, self.position, self.starts, self._ends, self._ranks)
+                   if array is not None)
+
+
+class InvertedIndex:
+    """Ustun qiymati -> qatorlar ro'yxati (qatorlar o'sish tartibida)"""
+
+    def __init__(self, series):
+        codes, uniques = pd.factorize(series)
+        self.values = pd.Index(np.asarray(uniques, dtype=object).astype(str))
+        # Bo'sh qiymatlar oxirgi, hech bir so'zga mos kelmaydigan kodga yig'iladi
+        self.codes = np.where(codes < 0, len(uniques), codes).astype(np.min_scalar_type(len(uniques)))
+        counts = np.bincount(self.codes, minlength=len(uniques) + 1)
+        self.indptr = np.concatenate([[0], np.cumsum(counts)])
+        self.rows = np.argsort(self.codes, kind='stable').astype(_row_dtype(len(series)))
+        self._lowered = self.values.str.lower()
+
+    def match(self, term):
+        """So'z qatnashgan qiymatlar (katta-kichik harf farqisiz) - noyob qiymatlar bo'yicha niqob"""
+        return np.append(self._lowered.str.contains(term.lower(), regex=False), False)
+
+    def lookup(self, values):
+        """Aynan shu qiymatlar - noyob qiymatlar bo'yicha niqob"""
+        return np.append(self.values.isin([str(value) for value in values]), False)
+
+    def count(self, flags):
+        """Belgilangan qiymatlar qatorlari soni"""
+        codes = np.flatnonzero(flags)
+        return int((self.indptr[codes + 1] - self.indptr[codes]).sum())
+
+    def selection(self, flags):
+        """Belgilangan qiymatlar qatorlari: kam bo'lsa - ro'yxat, ko'p bo'lsa - niqob"""
+        if self.count(flags) <= SPARSE_FRACTION * len(self.codes):
+            codes = np.flatnonzero(flags)
+            parts = [self.rows[self.indptr[code]:self.indptr[code + 1]] for code in codes]
+            # Ro'yxatlarning har biri saralangan - barqaror saralash ularni birlashtiradi
+            return np.sort(np.concatenate(parts), kind='stable') if parts else self.rows[:0]
+        return np.take(flags, self.codes)
+
+    @property
+    def nbytes(self):
+        return self.codes.nbytes + self.indptr.nbytes + self.rows.nbytes
+
+
+class TableExplorer:
+    """Jadval bo'yicha sahifalangan so'rovlar (indekslar ustunlar bo'yicha birinchi kerak bo'lganda quriladi).
+
+    ``key`` - jadval versiyasi: umumiy qidiruv keshida (standart - ``SEARCHES``)
+    natijalar shu kalit bilan saqlanadi.
+    """
+
+    def __init__(self, df, key=None, search_columns=SEARCH_COLUMNS, cache=None):
+        self.df = df
+        self.key = key
+        self.search_columns = [col for col in search_columns if col in df.columns]
+        self._orders = {}
+        self._indexes = {}
+        self.cache = SEARCHES if cache is None else cache
+
+    def __len__(self):
+        return len(self.df)
+
+    @property
+    def columns(self):
+        return list(self.df.columns)
+
+    @property
+    def filter_columns(self):
+        """Ustun filtri uchun ustunlar (kategoriyali)"""
+        return [col for col in self.df.columns if isinstance(self.df[col].dtype, pd.CategoricalDtype)]
+
+    @property
+    def nbytes(self):
+        """Qurilgan indekslar hajmi (baytlarda; qidiruv natijalari umumiy keshda hisoblanadi)"""
+        return sum(order.nbytes for order in self._orders.values()) \
+            + sum(index.nbytes for index in self._indexes.values())
+
+    def sort_order(self, column):
+        if column not in self._orders:
+            self._orders[column] = SortOrder(self.df[column])
+        return self._orders[column]
+
+    def inverted_index(self, column):
+        if column not in self._indexes:
+            self._indexes[column] = InvertedIndex(self.df[column])
+        return self._indexes[column]
+
+    def values(self, column):
+        """Ustun filtri uchun tanlash mumkin bo'lgan qiymatlar"""
+        return sorted(self.inverted_index(column).values)
+
+    def rows(self, search='', filters=None):
+        """Qidiruv va filtrlarga mos qatorlar (o'sish tartibida); shart bo'lmasa None - barcha qatorlar"""
+        terms, filters = search_key(search, filters)
+        if not terms and not filters:
+            return None
+        return self.cache.get_or_build((self.key, terms, filters), lambda: self._select(terms, filters),
+                                       lambda rows: rows.nbytes)
+
+    def count(self, search='', filters=None):
+        """Qidiruv va filtrlarga mos qatorlar soni"""
+        rows = self.rows(search, filters)
+        return len(self.df) if rows is None else len(rows)
+
+    def page(self, number, size, search='', filters=None, sort=None, descending=False, columns=None):
+        """``number``-sahifa (0 dan) jadvali va mos qatorlar soni; faqat shu sahifa qatorlari olinadi.
+
+        ``sort`` - ustun yoki ustunlar ro'yxati; ``descending`` - hammasi uchun
+        bitta qiymat yoki har bir ustun uchun alohida.
+        """
+        rows = self.rows(search, filters)
+        total = len(self.df) if rows is None else len(rows)
+        start = min(max(number, 0), max(total - 1, 0) // size) * size
+        frame = self.df if columns is None else self.df[columns]
+        sort = (sort,) if isinstance(sort, str) else tuple(sort or ())
+        descending = tuple(descending) if isinstance(descending, (list, tuple)) else (descending,) * len(sort)
+        if len(sort) == 1:
+            order = self.sort_order(sort[0])
+            page = order.page(start, size, descending[0]) if rows is None else \
+                order.page_of(rows, start, size, descending[0])
+        elif sort:
+            page = self._multi_page(rows, start, size, sort, descending)
+        elif rows is None:
+            return frame.iloc[start:start + size], total
+        else:
+            page = rows[start:start + size]
+        return take_rows(frame, page), total
+
+    def _multi_page(self, rows, start, size, sort, descending):
+        """Bir nechta ustun bo'yicha tartiblangan sahifa (teng kalitlar qator tartibida)"""
+        n = len(self.df)
+        orders = [self.sort_order(column) for column in sort]
+        if rows is None:
+            # Sahifa birinchi ustunning shu oynaga tushgan qiymat guruhlari ichida - faqat ular saralanadi
+            first = orders[0]
+            end = min(start + size, n)
+            if start >= end:
+                return np.zeros(0, dtype=_row_dtype(n))
+            lo, hi = first.span(start, descending[0])[0], first.span(end - 1, descending[0])[1]
+            rows = first.order[first.unflip(np.arange(lo, hi), descending[0])]
+            start -= lo
+        end = min(start + size, len(rows))
+        if start >= end:
+            return rows[:0]
+        # Ranglar va qator raqami bitta butun kalitga; sahifa oynasi np.partition bilan ajratiladi
+        widths = [order.distinct + 1 for order in orders] + [n]
+        if np.prod(np.array(widths, dtype='float64')) >= 2 ** 63:
+            keys = [order.keys(rows, desc) for order, desc in zip(orders, descending)]
+            return rows[np.lexsort([rows, *keys[::-1]])[start:end]]
+        key = np.zeros(len(rows), dtype=np.int64)
+        for order, desc, width in zip(orders, descending, widths):
+            key = key * width + order.keys(rows, desc)
+        key = key * n + rows
+        window = np.partition(key, sorted({start, end - 1}))[start:end]
+        return (np.sort(window) % n).astype(rows.dtype)
+
+    def _select(self, terms, filters):
+        # Har bir shart - (indeks, qiymatlar niqobi) juftlari, ular orasida OR
+        conditions = [[(self.inverted_index(column), self.inverted_index(column).lookup(values))]
+                      for column, values in filters]
+        for term in terms:
+            # So'z istalgan qidiruv ustunida bo'lishi yetarli
+            conditions.append([(index, index.match(term))
+                               for index in map(self.inverted_index, self.search_columns)])
+        # Eng kam qatorli shart birinchi: qolganlari faqat uning qatorlari ustida tekshiriladi
+        conditions.sort(key=lambda pairs: sum(index.count(flags) for index, flags in pairs))
+
+        selected = None
+        for pairs in conditions:
+            pairs = [(index, flags) for index, flags in pairs if flags.any()]
+            if not pairs:
+                return np.zeros(0, dtype=_row_dtype(len(self.df)))
+            if selected is None:
+                matched = None
+                for index, flags in pairs:
+                    matched = _union(matched, index.selection(flags), len(self.df))
+                selected = np.flatnonzero(matched) if matched.dtype == bool else matched
+            else:
+                keep = np.zeros(len(selected), dtype=bool)
+                for index, flags in pairs:
+                    keep |= np.take(flags, index.codes[selected])
+                selected = selected[keep]
+        return selected.astype(_row_dtype(len(self.df)), copy=False)
+
+
+def search_key(search, filters):
+    """Qidiruv so'zlari va filtrlar kesh kaliti uchun (tartiblangan)"""
+    terms = tuple(search.lower().split())
+    filters = tuple(sorted((col, tuple(sorted(map(str, values)))) for col, values in (filters or {}).items()
+                           if values))
+    return terms, filters
+
+
+def take_rows(frame, rows):
+    """Qatorlarni o'rni bo'yicha olish.
+
+    Arrow ustunlari bir nechta bo'lakdan iborat bo'lsa, ``iloc`` har safar
+    butun ustun bo'ylab bo'laklar xaritasini quradi - qatorlar bo'laklar
+    bo'yicha alohida olinadi.
+    """
+    return pd.DataFrame({col: _take_column(frame[col], rows) for col in frame.columns},
+                        index=frame.index[rows])
+
+
+def _take_column(series, rows):
+    if not isinstance(series.array, pd.arrays.ArrowExtensionArray) \
+            or series.array.__arrow_array__().num_chunks <= 1:
+        return series.array.take(rows)
+    chunked = series.array.__arrow_array__()
+    offsets = np.cumsum([0] + [len(chunk) for chunk in chunked.chunks])
+    chunk_ids = np.searchsorted(offsets, rows, side='right') - 1
+    values = np.empty(len(rows), dtype=object)
+    for chunk_id in np.unique(chunk_ids):
+        at = chunk_ids == chunk_id
+        values[at] = chunked.chunk(chunk_id).take(rows[at] - offsets[chunk_id]).to_numpy(zero_copy_only=False)
+    return pd.array(values, dtype=series.dtype)
+
+
+def _row_dtype(n):
+    return np.int32 if n < 2 ** 31 else np.int64
+
+
+def _union(a, b, n):
+    """Ikki tanlov birlashmasi (har biri qatorlar ro'yxati yoki niqob)"""
+    if a is None:
+        return b
+    if a.dtype != bool and b.dtype != bool:
+        return np.union1d(a, b)
+    mask = np.zeros(n, dtype=bool)
+    for part in (a, b):
+        if part.dtype == bool:
+            mask |= part
+        else:
+            mask[part] = True
+    return mask
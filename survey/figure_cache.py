@@ -0,0 +1,124 @@
+"""Grafiklar keshi: bo'lim, grafik nomi va ma'lumotlar versiyasi bo'yicha.
+
+Versiya kalitida fayl izi (``file@sha``), filtr holati (``|filtr_kaliti``) va
+qo'shilgan qatorlar soni bor, shuning uchun filtr o'zgarmasa yoki boshqa
+bo'limga o'tib qaytilganda grafiklar ``plotly.express`` bilan qayta
+qurilmaydi. Har bir grafik qurilganda bir marta JSON'ga serializatsiya
+qilinadi va faqat shu satr (brauzerga yuboriladigan spetsifikatsiya)
+saqlanadi: yozuv hajmi - satrlar hajmi, ya'ni kesh chegarasi haqiqiy
+xotiraga mos.
+
+Har bir grafik alohida yozuv - ``(bo'lim, grafik, versiya)``; bo'limning
+grafiklar ro'yxati ham alohida yoziladi. Ba'zi grafiklar boshqa versiyada
+bo'lishi mumkin (``variants``): masalan, ishonch oraliqlari yoqilganda faqat
+xato chiziqli grafiklar ``(versiya, 'ci')`` bilan qayta quriladi, qolganlari
+o'sha yozuvlardan olinadi. Kesh umumiy baytlar chegarasidan oshganda eng kam
+ishlatilgan grafiklar chiqariladi.
+
+Keshdan olish bepul emas: chizishda ``go.Figure`` JSON'dan tekshiruvsiz
+tiklanadi (``json.loads`` va obyektlar, grafik uchun ~1-2 ms), so'ng
+``st.plotly_chart`` uni yana JSON'ga aylantiradi. Bu ``plotly.express``
+bilan qurish va tekshirishdan ancha arzon, lekin shunchaki lug'atdan olish emas.
+"""
+import json
+import os
+import time
+
+from survey.diagnostics import DISABLED
+from survey.lru import LRUCache
+
+# Grafiklar keshining chegarasi (baytlarda)
+DEFAULT_MAX_BYTES = int(os.environ.get("SURVEY_FIGURE_CACHE_BYTES", 128 * 1024 * 1024))
+
+
+class SectionFigures(dict):
+    """Bo'lim grafiklari ``{grafik: JSON}`` va ularning ``sizes`` - ``{grafik: (baytlar, serializatsiya ms)}``"""
+
+    def __init__(self, specs, sizes):
+        super().__init__(specs)
+        self.sizes = sizes
+
+    @classmethod
+    def serialize(cls, figs):
+        """Qurilgan grafiklarni bir marta JSON'ga aylantirish (hajmi shu satrdan)"""
+        specs, sizes = {}, {}
+        for chart, fig in figs.items():
+            start = time.perf_counter()
+            specs[chart] = fig.to_json()
+            sizes[chart] = len(specs[chart].encode('utf-8')), (time.perf_counter() - start) * 1000
+        return cls(specs, sizes)
+
+    def figure(self, chart):
+        """Chizish uchun ``go.Figure`` (JSON'dan tekshiruvsiz tiklanadi)"""
+        import plotly.graph_objects as go
+
+        return go.Figure(json.loads(self[chart]), skip_invalid=True, _validate=False)
+
+    @property
+    def nbytes(self):
+        return sum(size for size, _ in self.sizes.values())
+
+
+class FigureCache:
+    """Grafiklar uchun baytlarda cheklangan LRU kesh (hit/miss - grafiklar soni, kesh qulfi ostida)"""
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+        self.cache = LRUCache(max_bytes)
+        self.hits = 0
+        self.misses = 0
+
+    def figures(self, section, version, data, build=None, diagnostics=DISABLED, variants=None):
+        """Bo'lim grafiklari (``SectionFigures``); yetishmagan grafik bo'lsa, bo'lim qayta quriladi.
+
+        ``build(section, data)`` - grafiklarni qurish funksiyasi (standart: ``build_figures``).
+        ``variants`` - ``{grafik: versiya}``: shu grafiklar ``version`` o'rniga boshqa
+        versiya bilan keshlanadi. Qayta qurilganda faqat keshda yo'q grafiklar
+        serializatsiya qilinadi va yoziladi.
+        """
+        variants = variants or {}
+        charts = self.cache.get(('charts', section, version))
+        cached = {}
+        if charts is not None:
+            for chart in charts:
+                entry = self.cache.get((section, chart, variants.get(chart, version)))
+                if entry is not None:
+                    cached[chart] = entry
+            if len(cached) == len(charts):
+                self._count(hits=len(charts))
+                diagnostics.cache('figures', True)
+                return SectionFigures({chart: spec for chart, (spec, _) in cached.items()},
+                                      {chart: size for chart, (_, size) in cached.items()})
+
+        if build is None:
+            # plotly.express faqat grafiklar haqiqatan qurilganda yuklanadi
+            from survey.figures import build_figures as build
+        with diagnostics.timer('figures', section=section):
+            built = build(section, data)
+        missing = SectionFigures.serialize({chart: fig for chart, fig in built.items() if chart not in cached})
+        self._count(hits=len(cached), misses=len(missing))
+        diagnostics.cache('figures', False)
+        for chart, spec in missing.items():
+            self.cache.put((section, chart, variants.get(chart, version)), (spec, missing.sizes[chart]),
+                           missing.sizes[chart][0])
+        charts = tuple(built)
+        self.cache.put(('charts', section, version), charts, sum(len(chart) for chart in charts))
+        return SectionFigures(
+            {chart: missing[chart] if chart in missing else cached[chart][0] for chart in charts},
+            {chart: missing.sizes[chart] if chart in missing else cached[chart][1] for chart in charts},
+        )
+
+    def _count(self, hits=0, misses=0):
+        # Kesh sessiyalar (oqimlar) o'rtasida umumiy - hisoblagichlar ham kesh qulfi ostida
+        with self.cache.lock:
+            self.hits += hits
+            self.misses += misses
+
+    def stats(self):
+        """Grafiklar bo'yicha hit/miss (yozuvlar - grafiklar va bo'limlar ro'yxatlari)"""
+        with self.cache.lock:
+            hits, misses = self.hits, self.misses
+        return {**self.cache.stats(), 'hits': hits, 'misses': misses}
+
+
+# Jarayon bo'yicha umumiy kesh (barcha sessiyalar uchun)
+FIGURES = FigureCache()
@@ -0,0 +1,249 @@
+"""Bo'lim natijalaridan Plotly grafiklarini qurish (Streamlit'ga bog'liq emas).
+
+Har bir funksiya ``survey.sections`` natijasini oladi va grafik
+identifikatori bo'yicha lug'at qaytaradi.
+"""
+import numpy as np
+import plotly.express as px
+import plotly.graph_objects as go
+
+from survey.histograms import Density, histogram_frame
+
+
+def overview_figures(data):
+    return {}
+
+
+def demographics_figures(data):
+    figs = {}
+    if 'role_counts' in data:
+        fig = px.pie(data['role_counts'], values='Count', names='Role',
+                     title='Lavozimlar taqsimoti',
+                     hole=0.4, color_discrete_sequence=px.colors.qualitative.Pastel)
+        fig.update_traces(textposition='inside', textinfo='percent+label')
+        fig.update_layout(height=400)
+        figs['role_pie'] = fig
+    if 'top_countries' in data:
+        fig = px.bar(data['top_countries'], x='Country', y='Count',
+                     title='Top 10 mamlakatlar',
+                     color='Count', color_continuous_scale='Viridis')
+        fig.update_layout(height=400)
+        figs['country_bar'] = fig
+    if 'gender_counts' in data:
+        fig = px.bar(data['gender_counts'], x='Gender', y='Count',
+                     color='Gender', title="Jinsi bo'yicha taqsimot")
+        fig.update_layout(height=350)
+        figs['gender_bar'] = fig
+    if 'age' in data:
+        fig = binned_histogram(data['age'], title="Yosh bo'yicha taqsimot",
+                               color='#3366CC')
+        fig.update_layout(height=350)
+        figs['age_hist'] = fig
+    return figs
+
+
+def salary_figures(data):
+    figs = {}
+    if 'salary' in data:
+        fig = binned_histogram(data['salary'], title='Maosh taqsimoti',
+                               color='#22A7F0')
+        fig.update_layout(xaxis_title='Maosh ($)', height=400)
+        figs['salary_hist'] = fig
+    if 'role_salary' in data:
+        fig = px.bar(data['role_salary'], x='Role', y='Salary',
+                     title="Lavozimlar bo'yicha o'rtacha maosh",
+                     color='Salary', color_continuous_scale='Viridis',
+                     **error_bars(data['role_salary']))
+        fig.update_layout(yaxis_title="O'rtacha maosh ($)", height=400)
+        figs['role_salary_bar'] = fig
+    if 'experience_salary' in data:
+        fig = adaptive_scatter(data['experience_salary'], x='YearsExperience', y='Salary',
+                               title="Maosh va tajriba o'rtasidagi bog'liqlik",
+                               color='Salary', size='Salary',
+                               color_continuous_scale='Viridis')
+        fig.update_layout(height=500)
+        figs['experience_salary_scatter'] = fig
+    return figs
+
+
+def education_figures(data):
+    figs = {}
+    if 'edu_counts' in data:
+        fig = px.pie(data['edu_counts'], values='Count', names='Education',
+                     title='Ta\'lim darajasi taqsimoti',
+                     color_discrete_sequence=px.colors.qualitative.Pastel)
+        fig.update_traces(textposition='inside', textinfo='percent+label')
+        fig.update_layout(height=400)
+        figs['edu_pie'] = fig
+    if 'experience' in data:
+        fig = binned_histogram(data['experience'], title='Tajriba yillari taqsimoti',
+                               color='#72B01D')
+        fig.update_layout(xaxis_title='Tajriba (yil)', height=400)
+        figs['experience_hist'] = fig
+    if 'edu_salary' in data:
+        fig = px.bar(data['edu_salary'], x='Education', y='Salary',
+                     title='Ta\'lim darajasi va o\'rtacha maosh',
+                     color='Salary', color_continuous_scale='Viridis',
+                     **error_bars(data['edu_salary']))
+        fig.update_layout(yaxis_title='O\'rtacha maosh ($)', height=400)
+        figs['edu_salary_bar'] = fig
+    if 'role_edu' in data:
+        fig = px.imshow(data['role_edu'],
+                        title='Lavozim va ta\'lim darajasi o\'rtasidagi bog\'liqlik',
+                        color_continuous_scale='Viridis')
+        fig.update_layout(height=500)
+        figs['role_edu_heatmap'] = fig
+    return figs
+
+
+def technology_figures(data):
+    figs = {}
+    if 'top_langs' in data:
+        fig = px.bar(data['top_langs'], x='Language', y='Count',
+                     title='Eng mashhur dasturlash tillari (Top 10)',
+                     color='Count', color_continuous_scale='Viridis')
+        fig.update_layout(height=400)
+        figs['languages_bar'] = fig
+    if 'role_languages' in data:
+        fig = px.imshow(data['role_languages'],
+                        title='Lavozimlar bo\'yicha dasturlash tillari (respondentlar ulushi, %)',
+                        color_continuous_scale='Viridis', text_auto=True, aspect='auto')
+        fig.update_layout(height=450)
+        figs['role_languages_heatmap'] = fig
+    if 'lang_cooccurrence' in data:
+        fig = px.imshow(data['lang_cooccurrence'],
+                        title='Dasturlash tillarining birgalikda tanlanishi',
+                        color_continuous_scale='Viridis', text_auto=True, aspect='auto')
+        fig.update_layout(height=450)
+        figs['languages_cooccurrence_heatmap'] = fig
+    if 'remote_counts' in data:
+        fig = px.pie(data['remote_counts'], values='Count', names='WorkType',
+                     title='Masofaviy ish taqsimoti',
+                     hole=0.4, color_discrete_sequence=px.colors.qualitative.Pastel)
+        fig.update_traces(textposition='inside', textinfo='percent+label')
+        fig.update_layout(height=350)
+        figs['remote_pie'] = fig
+    if 'remote_salary' in data:
+        fig = px.bar(data['remote_salary'], x='RemoteWork', y='Salary',
+                     title='Ish turi bo\'yicha o\'rtacha maosh',
+                     color='RemoteWork',
+                     **error_bars(data['remote_salary']))
+        fig.update_layout(yaxis_title='O\'rtacha maosh ($)', height=350)
+        figs['remote_salary_bar'] = fig
+    return figs
+
+
+def performance_figures(data):
+    figs = {}
+    if 'satisfaction' in data:
+        fig = binned_histogram(data['satisfaction'], title='Ish faoliyatidan qoniqish darajasi taqsimoti',
+                               color='#FF6B6B')
+        fig.update_layout(xaxis_title='Qoniqish darajasi (1-10)', height=400)
+        figs['satisfaction_hist'] = fig
+    if 'wlb' in data:
+        fig = binned_histogram(data['wlb'], title='Ish-hayot muvozanati taqsimoti',
+                               color='#4ECDC4')
+        fig.update_layout(xaxis_title='Ish-hayot muvozanati (1-10)', height=400)
+        figs['wlb_hist'] = fig
+    if 'role_satisfaction' in data:
+        fig = px.bar(data['role_satisfaction'], x='Role', y='JobSatisfaction',
+                     title='Lavozim bo\'yicha o\'rtacha ish qoniqish darajasi',
+                     color='JobSatisfaction', color_continuous_scale='RdYlGn',
+                     **error_bars(data['role_satisfaction']))
+        fig.update_layout(yaxis_title='O\'rtacha qoniqish darajasi (1-10)', height=400)
+        figs['role_satisfaction_bar'] = fig
+    if 'salary_satisfaction' in data:
+        fig = adaptive_scatter(data['salary_satisfaction'], x='Salary', y='JobSatisfaction',
+                               title='Maosh va ish qoniqish darajasi o\'rtasidagi bog\'liqlik',
+                               color='JobSatisfaction', size='Salary',
+                               color_continuous_scale='RdYlGn')
+        fig.update_layout(height=500,
+                          xaxis_title='Maosh ($)',
+                          yaxis_title='Ish qoniqish darajasi (1-10)')
+        figs['salary_satisfaction_scatter'] = fig
+    if 'salary_wlb' in data:
+        fig = px.bar(data['salary_wlb'], x='SalaryBin', y='WorkLifeBalance',
+                     title='Maosh kategoriyasi va o\'rtacha ish-hayot muvozanati',
+                     color='WorkLifeBalance', color_continuous_scale='RdYlGn',
+                     **error_bars(data['salary_wlb']))
+        fig.update_layout(height=400,
+                          xaxis_title='Maosh kategoriyasi',
+                          yaxis_title='O\'rtacha ish-hayot muvozanati (1-10)')
+        figs['salary_wlb_bar'] = fig
+    return figs
+
+
+def extra_figures(data):
+    figs = {}
+    if data.get('corr_matrix') is not None:
+        fig = px.imshow(data['corr_matrix'],
+                        title='Raqamli ma\'lumotlar o\'rtasidagi korrelyatsiya',
+                        color_continuous_scale='RdBu_r',
+                        text_auto='.2f')
+        fig.update_layout(height=600)
+        figs['corr_heatmap'] = fig
+    if data.get('spearman_matrix') is not None:
+        fig = px.imshow(data['spearman_matrix'],
+                        title='Raqamli ma\'lumotlar o\'rtasidagi rang korrelyatsiyasi (Spearman)',
+                        color_continuous_scale='RdBu_r',
+                        text_auto='.2f')
+        fig.update_layout(height=600)
+        figs['spearman_heatmap'] = fig
+    return figs
+
+
+def error_bars(frame):
+    """Ishonch oraliqlari qo'shilgan bo'lsa (``sections.attach_intervals``), xato chiziqlari parametrlari"""
+    if 'ci_plus' not in frame.columns:
+        return {}
+    return dict(error_y='ci_plus', error_y_minus='ci_minus')
+
+
+def binned_histogram(histogram, title, color):
+    """Serverda hisoblangan bin'lardan gistogramma (faqat bin'lar brauzerga yuboriladi)"""
+    column = histogram.column
+    fig = px.histogram(histogram_frame(histogram), x=column, y='count', title=title,
+                       color_discrete_sequence=[color])
+    fig.update_traces(
+        xbins=dict(start=histogram.start, end=histogram.start + histogram.size * len(histogram.counts),
+                   size=histogram.size),
+        hovertemplate=f'{column}=%{{x}}<br>count=%{{y}}<extra></extra>',
+    )
+    fig.update_layout(yaxis_title='count')
+    return fig
+
+
+def adaptive_scatter(data, x, y, title, color, size, color_continuous_scale):
+    """Kichik ma'lumotlar uchun WebGL nuqtalar, katta ma'lumotlar uchun 2D zichlik xaritasi"""
+    if not isinstance(data, Density):
+        return px.scatter(data, x=x, y=y, title=title, color=color, size=size,
+                          color_continuous_scale=color_continuous_scale, render_mode='webgl')
+
+    counts = data.counts.T.astype('float64')
+    counts[counts == 0] = np.nan  # bo'sh katakchalar ko'rsatilmaydi
+    fig = go.Figure(go.Heatmap(
+        x=data.x_start + data.x_size * (np.arange(counts.shape[1]) + 0.5),
+        y=data.y_start + data.y_size * (np.arange(counts.shape[0]) + 0.5),
+        z=counts,
+        colorscale=color_continuous_scale,
+        colorbar=dict(title='Soni'),
+        hovertemplate=f'{x}=%{{x}}<br>{y}=%{{y}}<br>Soni=%{{z}}<extra></extra>',
+    ))
+    fig.update_layout(title=title, xaxis_title=x, yaxis_title=y)
+    return fig
+
+
+SECTION_FIGURES = {
+    'overview': overview_figures,
+    'demographics': demographics_figures,
+    'salary': salary_figures,
+    'education': education_figures,
+    'technology': technology_figures,
+    'performance': performance_figures,
+    'extra': extra_figures,
+}
+
+
+def build_figures(section, data):
+    """Bitta bo'lim uchun barcha grafiklarni qurish"""
+    return SECTION_FIGURES[section](data)
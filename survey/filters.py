@@ -0,0 +1,125 @@
+"""Global filtrlar uchun bitmap indekslar.
+
+Yuklashda har bir kategoriya qiymati uchun qadoqlangan (``np.packbits``)
+bitmap va diapazon ustunlari uchun saralash tartibi bir marta quriladi.
+Filtrlarni birlashtirish - butun DataFrame bo'ylab niqoblar o'rniga
+bitmaplar ustida arzon bitli OR/AND amallari.
+"""
+import numpy as np
+import pandas as pd
+
+FILTER_DIMENSIONS = ['SurveyWave', 'Role', 'Country', 'Education', 'Gender', 'RemoteWork']
+RANGE_COLUMNS = ['Age', 'Salary']
+
+
+class BitmapIndex:
+    """Kategoriya qiymatlari bitmaplari va diapazon ustunlari tartibi"""
+
+    def __init__(self, df, dimensions=FILTER_DIMENSIONS, range_columns=RANGE_COLUMNS):
+        self.n = len(df)
+        self.bitmaps = {}
+        for dim in dimensions:
+            if dim not in df.columns:
+                continue
+            codes, values = pd.factorize(df[dim], sort=True)
+            self.bitmaps[dim] = {
+                value: np.packbits(codes == code) for code, value in enumerate(values)
+            }
+
+        # Diapazon so'rovlari: saralangan qiymatlar ustida searchsorted (NaN'lar oxirida)
+        self.sorted = {}
+        for col in range_columns:
+            if col in df.columns and pd.api.types.is_numeric_dtype(df[col]):
+                values = df[col].to_numpy(dtype='float64')
+                order = np.argsort(values, kind='stable')
+                self.sorted[col] = (values[order], order)
+
+    def append(self, batch):
+        """Yangi qatorlar qo'shilgan indeks (mavjud bitmaplar qayta qurilmaydi)"""
+        index = BitmapIndex.__new__(BitmapIndex)
+        index.n = self.n + len(batch)
+        index.bitmaps = {}
+        for dim, bitmaps in self.bitmaps.items():
+            codes, values = pd.factorize(batch[dim], sort=True)
+            known = {value: code for code, value in enumerate(values)}
+            index.bitmaps[dim] = {
+                value: _append_bits(bitmap, self.n, codes == known.get(value, -2))
+                for value, bitmap in bitmaps.items()
+            }
+            for value, code in known.items():
+                if value not in bitmaps:
+                    index.bitmaps[dim][value] = _append_bits(np.zeros(0, dtype=np.uint8), 0,
+                                                             np.r_[np.zeros(self.n, dtype=bool), codes == code])
+        # Saralangan qiymatlarga yangilari birlashtirish (merge) orqali qo'shiladi, qayta saralanmaydi
+        index.sorted = {}
+        for col, (values, order) in self.sorted.items():
+            new_values = batch[col].to_numpy(dtype='float64')
+            new_order = np.argsort(new_values, kind='stable')
+            positions = np.searchsorted(values, new_values[new_order], side='right')
+            index.sorted[col] = (np.insert(values, positions, new_values[new_order]),
+                                 np.insert(order, positions, new_order + self.n))
+        return index
+
+    @property
+    def nbytes(self):
+        """Bitmaplar va saralash tartiblari hajmi (baytlarda)"""
+        return sum(bitmap.nbytes for bitmaps in self.bitmaps.values() for bitmap in bitmaps.values()) \
+            + sum(values.nbytes + order.nbytes for values, order in self.sorted.values())
+
+    def values(self, dim):
+        """Filtr uchun tanlash mumkin bo'lgan qiymatlar"""
+        return list(self.bitmaps.get(dim, {}))
+
+    def bounds(self, col):
+        """Diapazon ustunining minimum va maksimumi (NaN'siz)"""
+        values = self.sorted[col][0]
+        values = values[~np.isnan(values)]
+        return (float(values[0]), float(values[-1])) if len(values) else (0.0, 0.0)
+
+    def mask(self, selections=None, ranges=None):
+        """Filtrlar bo'yicha mantiqiy niqob; hech qanday filtr faol bo'lmasa None.
+
+        ``selections`` - {ustun: [qiymatlar]} (ustun ichida OR, ustunlar orasida AND),
+        ``ranges`` - {ustun: (quyi, yuqori)} (chegaralar kiradi).
+        """
+        packed = None
+        for dim, values in (selections or {}).items():
+            if not values or dim not in self.bitmaps:
+                continue
+            union = np.zeros((self.n + 7) // 8, dtype=np.uint8)
+            for value in values:
+                bitmap = self.bitmaps[dim].get(value)
+                if bitmap is not None:
+                    union |= bitmap
+            packed = union if packed is None else packed & union
+
+        for col, (low, high) in (ranges or {}).items():
+            if col not in self.sorted or (low, high) == self.bounds(col):
+                continue
+            values, order = self.sorted[col]
+            rows = order[np.searchsorted(values, low, side='left'):np.searchsorted(values, high, side='right')]
+            in_range = np.zeros(self.n, dtype=bool)
+            in_range[rows] = True
+            bitmap = np.packbits(in_range)
+            packed = bitmap if packed is None else packed & bitmap
+
+        if packed is None:
+            return None
+        return np.unpackbits(packed, count=self.n).astype(bool)
+
+
+def _append_bits(packed, n, bits):
+    """``n`` bitli qadoqlangan bitmap oxiriga yangi bitlarni qo'shish"""
+    full, partial = divmod(n, 8)
+    if partial == 0:
+        return np.concatenate([packed[:full], np.packbits(bits)])
+    tail = np.unpackbits(packed[full:full + 1], count=partial).astype(bool)
+    return np.concatenate([packed[:full], np.packbits(np.r_[tail, bits])])
+
+
+def filter_key(selections=None, ranges=None):
+    """Filtr holatining barqaror kaliti (keshlar uchun); filtr bo'lmasa bo'sh satr"""
+    parts = [f"{dim}={'|'.join(sorted(map(str, values)))}"
+             for dim, values in sorted((selections or {}).items()) if values]
+    parts += [f"{col}={low:g}..{high:g}" for col, (low, high) in sorted((ranges or {}).items())]
+    return ';'.join(parts)
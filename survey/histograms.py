@@ -0,0 +1,82 @@
+"""Gistogramma va 2D zichlik bin'larini serverda hisoblash.
+
+Brauzerga har bir qator emas, faqat bin chegaralari va sonlari yuboriladi.
+Bin kengligi Plotly'ning ``nbins`` bo'yicha avtomatik tanlashiga yaqin
+("chiroyli" 1/2/5 x 10^k qadamlar, butun sonlar uchun yarim birlikka
+surilgan chegaralar), shuning uchun grafiklar avvalgidek ko'rinadi.
+"""
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+Histogram = namedtuple('Histogram', ['column', 'start', 'size', 'counts'])
+Density = namedtuple('Density', ['x_column', 'y_column', 'x_start', 'x_size', 'y_start', 'y_size', 'counts'])
+
+
+def nice_bin_size(raw_size):
+    """Bin kengligini 1, 2, 5 x 10^k ko'rinishidagi eng yaqin yuqori qiymatga yaxlitlash"""
+    if raw_size <= 0 or not np.isfinite(raw_size):
+        return 1.0
+    base = 10 ** np.floor(np.log10(raw_size))
+    for step in (1, 2, 5, 10):
+        if raw_size <= step * base * (1 + 1e-9):
+            return float(step * base)
+    return float(10 * base)
+
+
+def axis_bins(values, nbins):
+    """Bir o'q uchun bin boshlanishi va kengligi (``values`` - NaN'siz massiv)"""
+    return bin_layout(values.min(), values.max(), np.array_equal(values, np.round(values)), nbins)
+
+
+def bin_layout(low, high, all_integer, nbins):
+    """Bin boshlanishi va kengligi qiymatlarning o'zisiz: minimum, maksimum va hammasi butunmi.
+
+    SQL backend shu uch qiymatni so'rov bilan oladi va bin'larni bir xil chegaralarda sanaydi.
+    """
+    size = nice_bin_size((high - low) / max(nbins, 1))
+    if all_integer:
+        size = max(size, 1.0)
+
+    start = np.floor(low / size) * size
+    if all_integer and size == np.round(size):
+        # Butun sonlar bin markaziga tushishi uchun chegaralar yarim birlikka suriladi
+        start = low - 0.5 if size == 1 else start - 0.5
+    return float(start), float(size)
+
+
+def compute_histogram(values, nbins, column=None):
+    """Qiymatlar uchun bin'larni bir vektorlashtirilgan o'tishda hisoblash"""
+    values = np.asarray(values, dtype='float64')
+    values = values[~np.isnan(values)]
+    if len(values) == 0:
+        return Histogram(column, 0.0, 1.0, np.zeros(0, dtype=np.int64))
+
+    start, size = axis_bins(values, nbins)
+    counts = np.bincount(((values - start) // size).astype(np.int64))
+    return Histogram(column, start, size, counts)
+
+
+def compute_density(x, y, nbins=(50, 50), columns=(None, None)):
+    """Ikki o'lchovli zichlik: har bir (x, y) katakchadagi qatorlar soni"""
+    x = np.asarray(x, dtype='float64')
+    y = np.asarray(y, dtype='float64')
+    valid = ~(np.isnan(x) | np.isnan(y))
+    x, y = x[valid], y[valid]
+    if len(x) == 0:
+        return Density(*columns, 0.0, 1.0, 0.0, 1.0, np.zeros((0, 0), dtype=np.int64))
+
+    x_start, x_size = axis_bins(x, nbins[0])
+    y_start, y_size = axis_bins(y, nbins[1])
+    ix = ((x - x_start) // x_size).astype(np.int64)
+    iy = ((y - y_start) // y_size).astype(np.int64)
+    shape = (ix.max() + 1, iy.max() + 1)
+    counts = np.bincount(ix * shape[1] + iy, minlength=shape[0] * shape[1]).reshape(shape)
+    return Density(*columns, x_start, x_size, y_start, y_size, counts)
+
+
+def histogram_frame(histogram):
+    """Bin markazlari va sonlari jadvali (grafik uchun)"""
+    centers = histogram.start + histogram.size * (np.arange(len(histogram.counts)) + 0.5)
+    return pd.DataFrame({histogram.column: centers, 'count': histogram.counts})
@@ -0,0 +1,227 @@
+"""So'rovnoma ma'lumotlarini yuklash yo'li (Streamlit ilovasi va hisobotlar uchun umumiy)"""
+import hashlib
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+
+import pandas as pd
+import requests
+
+from survey.cache import DiskCache, cached_get, cached_get_file, make_session
+from survey.dataset import SurveyDataset
+from survey.diagnostics import DISABLED
+from survey.schema import compact_frame, standardize_columns
+from survey.sections import detect_available
+from survey.snapshot import file_fingerprint, load_snapshot
+from survey.streaming import CHUNK_ROWS, StreamingSummary, stream_file
+
+REPO_OWNER = "UktambekA"
+REPO_NAME = "Data-Professional-Survey"
+API_URL = f"https://api.github.com/repos/{REPO_OWNER}/{REPO_NAME}/contents"
+DATA_EXTENSIONS = ('.csv', '.xlsx', '.xls')
+
+# Bir vaqtda yuklanadigan fayllar soni (HTTP ulanishlar hovuzi ham shu o'lchamda)
+MAX_WORKERS = 8
+
+# Berilsa, ilova GitHub o'rniga shu mahalliy fayldan o'qiydi (yuklama testlari, oflayn ish)
+LOCAL_SOURCE = os.environ.get("SURVEY_DATA_PATH")
+
+# Manba hajmi shundan katta bo'lsa (baytlarda), jadval to'liq yuklanmaydi - bo'laklab o'qiladi;
+# SURVEY_STREAMING=1 bo'lsa hajmdan qat'i nazar
+STREAM_THRESHOLD_BYTES = int(os.environ.get("SURVEY_STREAM_THRESHOLD_BYTES", 2 * 1024 ** 3))
+FORCE_STREAMING = os.environ.get("SURVEY_STREAMING") == "1"
+
+# Zaxira variant - agar repozitoriyada ma'lumotlar fayli topilmasa
+FALLBACK_NAME = "Power BI - Final Project.xlsx"
+FALLBACK_URL = "https://raw.githubusercontent.com/AlexTheAnalyst/Power-BI/main/Power%20BI%20-%20Final%20Project.xlsx"
+
+
+def fetch_survey(cache=None, on_warning=None, diagnostics=DISABLED, session=None,
+                 api_url=API_URL, max_workers=MAX_WORKERS):
+    """GitHub'dan ma'lumotlarni yuklab olish.
+
+    Ro'yxatdagi barcha CSV/Excel fayllar (so'rovnoma to'lqinlari) bitta HTTP
+    sessiya orqali parallel yuklanadi va o'qiladi, ustunlari ``column_mapping``
+    qoidalari bo'yicha moslashtirilib ``SurveyWave`` ustuni bilan birlashtiriladi
+    (bitta fayl bo'lsa, jadval avvalgidek o'zgarishsiz qaytariladi).
+
+    Natija: ``(df, file_name, version)``; ``version`` - fayllar nomi va SHA
+    (yoki mazmun xeshi), barcha keshlar shu kalit bo'yicha ishlaydi.
+    ``diagnostics`` - bosqichlar vaqti va disk keshi natijalarini yozish uchun.
+    """
+    # Diskdagi kesh: qayta ishga tushganda fayl qaytadan yuklab olinmaydi
+    cache = cache or DiskCache()
+    session = session or make_session(pool_size=max_workers)
+    data_files = list_data_files(cache, session, api_url, diagnostics, on_warning)
+
+    if data_files:
+        loaded = []
+        # Oqimlardagi ogohlantirishlar yig'iladi va asosiy oqimda uzatiladi (st.warning faqat shu yerda ishlaydi)
+        stale = []
+        # Yuklash va o'qish bir oqimda: tarmoqni kutish va read_csv/Arrow o'qish GIL'ni qo'yib yuboradi,
+        # shuning uchun umumiy vaqt eng sekin fayl vaqtiga yaqin. Hovuz ishlayotganda yuklangan fayllar
+        # keshdan o'chirilmaydi (boshqa oqim ularni hali o'qiyotgan bo'lishi mumkin), tozalash - oxirida
+        with cache.pinned(), ThreadPoolExecutor(max_workers=min(max_workers, len(data_files))) as pool:
+            futures = [pool.submit(_fetch_file, item, cache, session, diagnostics, stale.append)
+                       for item in data_files]
+            for item, future in zip(data_files, futures):
+                try:
+                    loaded.append((item, future.result()))
+                except (requests.RequestException, OSError, ValueError, ImportError) as e:
+                    # Bitta fayl bo'lsa xato avvalgidek yuqoriga uzatiladi, aks holda qolganlari bilan davom etiladi
+                    if len(data_files) == 1:
+                        raise
+                    if on_warning is not None:
+                        on_warning(f"{item['name']} faylini yuklab bo'lmadi: {e}")
+        if on_warning is not None:
+            for message in stale:
+                on_warning(message)
+        if not loaded:
+            raise RuntimeError("Ma'lumotlar fayllarining birortasini ham yuklab bo'lmadi")
+
+        df = combine_waves([frame for _, frame in loaded],
+                           [os.path.splitext(item['name'])[0] for item, _ in loaded])
+        file_name = ', '.join(item['name'] for item, _ in loaded)
+        version = '+'.join(f"{item['name']}@{item.get('sha', '')}" for item, _ in loaded)
+        return df, file_name, version
+
+    if on_warning is not None:
+        on_warning("GitHub repozitoriyasida to'g'ridan-to'g'ri CSV yoki Excel fayl topilmadi. Boshqa manbadan yuklab olishga harakat qilinmoqda...")
+
+    with diagnostics.timer('download.file', file=FALLBACK_NAME):
+        content, from_cache = cached_get(FALLBACK_URL, cache, session=session, on_warning=on_warning)
+    diagnostics.cache('disk.file', from_cache)
+    with diagnostics.timer('read', file=FALLBACK_NAME):
+        df = pd.read_excel(BytesIO(content))
+    return df, FALLBACK_NAME, f"{FALLBACK_NAME}@{hashlib.sha1(content).hexdigest()}"
+
+
+def list_data_files(cache, session=None, api_url=API_URL, diagnostics=DISABLED, on_warning=None):
+    """Repozitoriyadagi CSV/Excel fayllar ro'yxati (nomi bo'yicha tartib - to'lqinlar tartibi)"""
+    # Ro'yxat ETag orqali qayta tekshiriladi, tarmoq bo'lmasa keshdagi nusxa ishlatiladi
+    with diagnostics.timer('download.listing'):
+        listing, from_cache = cached_get(api_url, cache, session=session, on_warning=on_warning)
+    diagnostics.cache('disk.listing', from_cache)
+    return sorted(
+        (item for item in json.loads(listing) if item['name'].endswith(DATA_EXTENSIONS)),
+        key=lambda item: item['name'],
+    )
+
+
+def should_stream(local_source=LOCAL_SOURCE, cache=None, session=None, api_url=API_URL):
+    """Manba xotiraga to'liq yuklash uchun juda kattami (``STREAM_THRESHOLD_BYTES``)"""
+    if FORCE_STREAMING:
+        return True
+    if local_source:
+        return os.path.getsize(local_source) > STREAM_THRESHOLD_BYTES
+    try:
+        data_files = list_data_files(cache or DiskCache(), session, api_url)
+    except (requests.RequestException, OSError, ValueError):
+        return False
+    return sum(item.get('size', 0) for item in data_files) > STREAM_THRESHOLD_BYTES
+
+
+def stream_survey(cache=None, on_warning=None, diagnostics=DISABLED, session=None,
+                  api_url=API_URL, chunksize=CHUNK_ROWS):
+    """GitHub'dagi fayllarni diskka yuklab, bo'laklab o'qish (jadval xotirada yig'ilmaydi).
+
+    Natija: ``(summary, file_name, version)``, bu yerda ``summary`` -
+    ``StreamingSummary``. Bir nechta fayl bo'lsa, har bir bo'lakka
+    ``SurveyWave`` ustuni qo'shiladi.
+    """
+    cache = cache or DiskCache()
+    session = session or make_session()
+    data_files = list_data_files(cache, session, api_url, diagnostics, on_warning)
+    if not data_files:
+        raise RuntimeError("GitHub repozitoriyasida CSV yoki Excel fayl topilmadi")
+
+    summary = StreamingSummary()
+    streamed = []
+    for item in data_files:
+        try:
+            with diagnostics.timer('download.file', file=item['name']):
+                path = cached_get_file(item, cache, session=session, on_warning=on_warning)
+        except (requests.RequestException, OSError) as e:
+            if len(data_files) == 1:
+                raise
+            if on_warning is not None:
+                on_warning(f"{item['name']} faylini yuklab bo'lmadi: {e}")
+            continue
+        wave = os.path.splitext(item['name'])[0] if len(data_files) > 1 else None
+        with diagnostics.timer('stream', file=item['name']):
+            stream_file(path, item['name'], summary, chunksize, wave)
+        streamed.append(item)
+    if not streamed:
+        raise RuntimeError("Ma'lumotlar fayllarining birortasini ham yuklab bo'lmadi")
+
+    file_name = ', '.join(item['name'] for item in streamed)
+    version = '+'.join(f"{item['name']}@{item.get('sha', '')}" for item in streamed)
+    return summary, file_name, version
+
+
+def stream_local(path, chunksize=CHUNK_ROWS, diagnostics=DISABLED):
+    """Mahalliy faylni bo'laklab o'qish (``stream_survey`` ning mahalliy ko'rinishi)"""
+    file_name = os.path.basename(path)
+    with diagnostics.timer('stream', file=file_name):
+        summary = stream_file(path, file_name, chunksize=chunksize)
+    return summary, file_name, f"{file_name}@{file_fingerprint(path)}"
+
+
+def _fetch_file(item, cache, session, diagnostics, on_warning=None):
+    """Bitta faylni yuklash (nomi va SHA bo'yicha keshlanadi) va o'qish"""
+    file_name = item['name']
+    with diagnostics.timer('download.file', file=file_name):
+        file_path = cached_get_file(item, cache, session=session, on_warning=on_warning)
+
+    # Fayl birinchi marta o'qilganda ustunli nusxa yaratiladi, keyin nusxadan o'qiladi
+    with diagnostics.timer('read', file=file_name):
+        return load_snapshot(file_path, file_name, fingerprint=item.get('sha'))
+
+
+def combine_waves(frames, waves):
+    """To'lqinlarni bitta jadvalga birlashtirish va ``SurveyWave`` ustunini qo'shish.
+
+    Bitta fayl bo'lsa, jadval o'zgartirilmaydi; bir nechta fayl ustunlari
+    ``column_mapping`` qoidalari bo'yicha standart nomlarga keltirilib
+    tekislanadi (faylda yo'q ustunlar NaN bo'ladi). ``SurveyWave`` -
+    to'lqinlar tartibidagi category; biror faylda category bo'lgan ustun
+    birlashtirilgandan keyin ham category qoladi (toifalar birlashmasi bilan,
+    aks holda ``pd.concat`` uni object'ga aylantiradi).
+    """
+    if len(frames) == 1:
+        return frames[0]
+    wave_type = pd.CategoricalDtype(list(dict.fromkeys(waves)))
+    frames = [standardize_columns(frame).assign(SurveyWave=pd.Categorical([wave] * len(frame), dtype=wave_type))
+              for frame, wave in zip(frames, waves)]
+    categorical = {col for frame in frames for col in frame.columns
+                   if isinstance(frame[col].dtype, pd.CategoricalDtype)} - {'SurveyWave'}
+    for col in categorical:
+        dtype = pd.CategoricalDtype(pd.api.types.union_categoricals(
+            [frame[col].astype('category') for frame in frames if col in frame.columns]
+        ).categories)
+        # Faylda yo'q ustun ham shu turdagi bo'sh qiymatlar bilan (aks holda natija object bo'ladi)
+        frames = [frame.assign(**{col: frame[col].astype(dtype) if col in frame.columns
+                                  else pd.Categorical([None] * len(frame), dtype=dtype)})
+                  for frame in frames]
+    return pd.concat(frames, ignore_index=True, sort=False)
+
+
+def load_local(path):
+    """Mahalliy CSV/Excel faylni shu yo'l bilan o'qish (hisobotlar va benchmarklar uchun)"""
+    file_name = os.path.basename(path)
+    fingerprint = file_fingerprint(path)
+    return load_snapshot(path, file_name, fingerprint=fingerprint), file_name, f"{file_name}@{fingerprint}"
+
+
+def prepare_dataset(df, version, diagnostics=DISABLED):
+    """Asl jadvaldan SurveyDataset: mavjud ustunlarni aniqlash, nomlash va ixchamlashtirish.
+
+    Natija: ``(dataset, memory_report)``.
+    """
+    available = detect_available(df.columns)
+    with diagnostics.timer('normalize.columns'):
+        df = standardize_columns(df)
+    with diagnostics.timer('normalize.compact'):
+        df, memory_report = compact_frame(df)
+    return SurveyDataset(df, version, available), memory_report
@@ -0,0 +1,142 @@
+"""Dasturlash tillari uchun siyrak multi-hot matritsa.
+
+``ProgrammingLanguages`` ustuni (vergul bilan ajratilgan ro'yxatlar) bir marta
+respondent x til siyrak matritsasiga aylantiriladi. Tillar soni, lavozim x til
+jadvali va tillarning birgalikda uchrashi Python tsikllari o'rniga matritsa
+ko'paytmalari bilan hisoblanadi.
+
+Ustunda noyob qatorlar (tillar kombinatsiyalari) odatda juda kam, shuning
+uchun faqat noyob qiymatlar ajratiladi va matritsa ular kodlari bo'yicha
+yig'iladi.
+
+``scipy`` matritsa birinchi marta qurilganda import qilinadi - modulni
+import qilish ilova ishga tushishini sekinlashtirmaydi.
+"""
+import numpy as np
+import pandas as pd
+
+
+class LanguageMatrix:
+    """Respondent x til multi-hot matritsasi (CSR) va tillar lug'ati"""
+
+    def __init__(self, matrix, vocabulary, totals=None, pair_counts=None):
+        self.matrix = matrix
+        self.vocabulary = pd.Index(vocabulary, name='Language')
+        # Ustunlar yig'indisi va M.T @ M birinchi so'rovda hisoblanadi, append'da yangilanadi
+        self._totals = totals
+        self._pair_counts = pair_counts
+
+    @classmethod
+    def from_series(cls, series, sep=','):
+        """Vergul bilan ajratilgan ro'yxatlar ustunidan matritsa qurish"""
+        from scipy import sparse
+
+        codes, uniques = pd.factorize(series)
+        uniques = pd.Series(np.asarray(uniques, dtype=object)).astype(str)
+
+        # Faqat noyob qatorlarni ajratish: har bir noyob qator -> tillar
+        tokens = uniques.str.split(sep).explode().str.strip()
+        tokens = tokens[tokens.notna() & (tokens != '')]
+        token_codes, vocabulary = pd.factorize(tokens, sort=True)
+
+        # Oxirgi qo'shimcha qator - bo'sh (NaN) qiymatlar uchun
+        unique_rows = tokens.index.to_numpy()
+        unique_matrix = sparse.csr_matrix(
+            (np.ones(len(token_codes), dtype=np.int32), (unique_rows, token_codes)),
+            shape=(len(uniques) + 1, len(vocabulary)),
+        )
+        unique_matrix.sum_duplicates()
+        unique_matrix.data[:] = 1  # bir qatordagi takroriy til bir marta sanaladi
+
+        codes = np.where(codes < 0, len(uniques), codes)
+        return cls(unique_matrix[codes], vocabulary)
+
+    def __len__(self):
+        return self.matrix.shape[0]
+
+    def subset(self, rows):
+        """Qatorlar (mantiqiy niqob yoki indekslar) bo'yicha qism-matritsa"""
+        return LanguageMatrix(self.matrix[rows], self.vocabulary)
+
+    def append(self, other):
+        """Yangi qatorlar matritsasini qo'shish.
+
+        Lug'at birlashtiriladi; tillar soni va birgalikda uchrash jadvali
+        hisoblangan bo'lsa, faqat yangi qatorlar bo'yicha yangilanadi.
+        """
+        from scipy import sparse
+
+        vocabulary = self.vocabulary.union(other.vocabulary)
+        matrix = sparse.vstack([_reindex_columns(self.matrix, self.vocabulary, vocabulary),
+                                _reindex_columns(other.matrix, other.vocabulary, vocabulary)], format='csr')
+        totals = pair_counts = None
+        if self._totals is not None:
+            totals = _reindex_vector(self._totals, self.vocabulary, vocabulary) \
+                + _reindex_vector(other._column_totals(), other.vocabulary, vocabulary)
+        if self._pair_counts is not None:
+            pair_counts = _reindex_square(self._pair_counts, self.vocabulary, vocabulary) \
+                + _reindex_square(other._pair_table(), other.vocabulary, vocabulary)
+        return LanguageMatrix(matrix, vocabulary, totals, pair_counts)
+
+    def _column_totals(self):
+        if self._totals is None:
+            self._totals = np.asarray(self.matrix.sum(axis=0)).ravel()
+        return self._totals
+
+    def _pair_table(self):
+        if self._pair_counts is None:
+            self._pair_counts = (self.matrix.T @ self.matrix).toarray()
+        return self._pair_counts
+
+    @property
+    def nbytes(self):
+        """Matritsa va hisoblangan jadvallar hajmi (baytlarda)"""
+        matrix = self.matrix.data.nbytes + self.matrix.indices.nbytes + self.matrix.indptr.nbytes
+        return matrix + sum(table.nbytes for table in (self._totals, self._pair_counts) if table is not None)
+
+    def counts(self):
+        """Har bir tilni tanlagan respondentlar soni, kamayish tartibida"""
+        counts = pd.Series(self._column_totals(), index=self.vocabulary, name='Count')
+        return counts.sort_values(ascending=False, kind='stable')
+
+    def by_group(self, groups):
+        """Guruh x til jadvali: ``G.T @ M``, bu yerda G - guruh indikator matritsasi"""
+        from scipy import sparse
+
+        codes, categories = pd.factorize(groups, sort=True)
+        valid = codes >= 0
+        indicator = sparse.csr_matrix(
+            (np.ones(valid.sum(), dtype=np.int32), (np.flatnonzero(valid), codes[valid])),
+            shape=(len(self), len(categories)),
+        )
+        table = (indicator.T @ self.matrix).toarray()
+        return pd.DataFrame(table, index=pd.Index(categories, name=getattr(groups, 'name', None)),
+                            columns=self.vocabulary)
+
+    def cooccurrence(self):
+        """Til x til jadvali: ``M.T @ M`` (diagonalda - tilning o'zi tanlangan soni)"""
+        return pd.DataFrame(self._pair_table(), index=self.vocabulary, columns=self.vocabulary)
+
+
+def _reindex_columns(matrix, vocabulary, target):
+    """Matritsa ustunlarini kengroq lug'at tartibiga o'tkazish"""
+    from scipy import sparse
+
+    if vocabulary.equals(target):
+        return matrix
+    matrix = matrix.tocsr()
+    return sparse.csr_matrix((matrix.data, target.get_indexer(vocabulary)[matrix.indices], matrix.indptr),
+                             shape=(matrix.shape[0], len(target)))
+
+
+def _reindex_vector(values, vocabulary, target):
+    result = np.zeros(len(target), dtype=values.dtype)
+    result[target.get_indexer(vocabulary)] = values
+    return result
+
+
+def _reindex_square(table, vocabulary, target):
+    result = np.zeros((len(target), len(target)), dtype=table.dtype)
+    positions = target.get_indexer(vocabulary)
+    result[np.ix_(positions, positions)] = table
+    return result
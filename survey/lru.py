@@ -0,0 +1,80 @@
+"""Baytlarda cheklangan LRU kesh (korrelyatsiya va grafik keshlari uchun umumiy)"""
+import threading
+from collections import OrderedDict
+
+
+class LRUCache:
+    """Baytlarda cheklangan, oqimlar uchun xavfsiz LRU kesh.
+
+    Chegaradan katta yozuv saqlanmaydi (natija baribir qaytariladi).
+    Saqlangandan keyin o'sadigan qiymatlar (masalan, indekslarini kerak
+    bo'lganda quradigan filtrlangan ko'rinishlar) ``sizeof`` bilan yoziladi:
+    ularning hajmi har bir yozishda va ``refresh`` da qayta o'lchanadi.
+    """
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key, value, size, sizeof=None):
+        with self._lock:
+            if key in self._entries:
+                self.bytes -= self._entries.pop(key)[1]
+            self._remeasure()
+            if size > self.max_bytes:
+                return value
+            self._entries[key] = (value, size, sizeof)
+            self.bytes += size
+            self._evict()
+            return value
+
+    def refresh(self):
+        """O'sadigan yozuvlar hajmini qayta o'lchash va chegaradan oshganlarini chiqarish"""
+        with self._lock:
+            self._remeasure()
+            self._evict()
+
+    def _remeasure(self):
+        for key, (value, size, sizeof) in self._entries.items():
+            if sizeof is not None:
+                current = sizeof(value)
+                self._entries[key] = (value, current, sizeof)
+                self.bytes += current - size
+
+    def _evict(self):
+        while self.bytes > self.max_bytes:
+            _, (_, evicted, _) = self._entries.popitem(last=False)
+            self.bytes -= evicted
+
+    def get_or_build(self, key, build, sizeof):
+        value = self.get(key)
+        if value is None:
+            value = build()
+            self.put(key, value, sizeof(value))
+        return value
+
+    @property
+    def lock(self):
+        """Kesh qulfi (kesh ustidagi qo'shimcha hisoblagichlarni shu qulf bilan yangilash uchun)"""
+        return self._lock
+
+    def __len__(self):
+        return len(self._entries)
+
+    def stats(self):
+        return {'entries': len(self._entries), 'bytes': self.bytes, 'max_bytes': self.max_bytes,
+                'hits': self.hits, 'misses': self.misses}
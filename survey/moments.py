@@ -0,0 +1,99 @@
+"""Raqamli ustunlar uchun birlashtiriladigan ko-momentlar (korrelyatsiya yig'indilari).
+
+Har bir ustunlar juftligi (i, j) uchun ikkalasi ham NaN bo'lmagan qatorlar
+bo'yicha soni, yig'indilari, kvadratlar va ko'paytmalar yig'indisi
+saqlanadi - bu ``DataFrame.corr()`` ning juftlik bo'yicha (pairwise)
+hisobiga aynan mos keladi. Yig'indilar ``shift`` (birinchi to'plam
+o'rtachasi) atrofida olinadi, shuning uchun katta qiymatlarda (maosh)
+ayirishdagi aniqlik yo'qolmaydi.
+
+Yangi qatorlar qo'shilganda faqat ularning yig'indilari hisoblanadi va
+qo'shiladi: narx ``O(batch * p^2)``, jami qatorlar soniga bog'liq emas.
+"""
+import numpy as np
+import pandas as pd
+
+
+class CoMoments:
+    """Juftlik bo'yicha soni va siljitilgan yig'indilar (p x p matritsalar)"""
+
+    def __init__(self, columns, shift, n, sx, sxx, sxy):
+        self.columns = list(columns)
+        self.shift = shift
+        self.n = n      # n[i, j]: i va j ikkalasi ham mavjud qatorlar soni
+        self.sx = sx    # sx[i, j]: shu qatorlarda (x_i - shift_i) yig'indisi
+        self.sxx = sxx  # sxx[i, j]: shu qatorlarda (x_i - shift_i)^2 yig'indisi
+        self.sxy = sxy  # sxy[i, j]: (x_i - shift_i) * (x_j - shift_j) yig'indisi
+
+    @classmethod
+    def from_frame(cls, df, columns=None, shift=None):
+        """DataFrame ustunlaridan ko-momentlarni bir o'tishda hisoblash"""
+        columns = list(columns if columns is not None else df.select_dtypes(include='number').columns)
+        values = df[columns].to_numpy(dtype='float64', na_value=np.nan)
+        if shift is None:
+            with np.errstate(invalid='ignore'):
+                shift = np.nan_to_num(np.nanmean(values, axis=0)) if len(values) else np.zeros(len(columns))
+        return cls(columns, np.asarray(shift, dtype='float64'), *_sums(values, shift))
+
+    def update(self, df):
+        """Yangi qatorlarni qo'shish (o'sha ustunlar, o'sha siljish bilan)"""
+        values = df[self.columns].to_numpy(dtype='float64', na_value=np.nan)
+        n, sx, sxx, sxy = _sums(values, self.shift)
+        return CoMoments(self.columns, self.shift, self.n + n, self.sx + sx, self.sxx + sxx, self.sxy + sxy)
+
+    def merge(self, other):
+        """Ikki to'plam ko-momentlarini birlashtirish (boshqa siljish bilan olingan bo'lsa ham)"""
+        if other.columns != self.columns:
+            raise ValueError("Ko-momentlar ustunlari mos emas")
+        n, sx, sxx, sxy = other._reshifted(self.shift)
+        return CoMoments(self.columns, self.shift, self.n + n, self.sx + sx, self.sxx + sxx, self.sxy + sxy)
+
+    def _reshifted(self, shift):
+        """Yig'indilarni boshqa siljishga o'tkazish: x - a = (x - b) + (b - a)"""
+        d = self.shift - shift
+        di, dj = d[:, None], d[None, :]
+        sx = self.sx + self.n * di
+        sxx = self.sxx + 2 * di * self.sx + self.n * di ** 2
+        sxy = self.sxy + dj * self.sx + di * self.sx.T + self.n * di * dj
+        return self.n, sx, sxx, sxy
+
+    def corr(self, min_periods=1):
+        """Pearson korrelyatsiya matritsasi (``DataFrame.corr()`` ekvivalenti)"""
+        n = self.n
+        with np.errstate(invalid='ignore', divide='ignore'):
+            cov = self.sxy - self.sx * self.sx.T / n
+            var = self.sxx - self.sx ** 2 / n
+            corr = cov / np.sqrt(var * var.T)
+        corr = np.clip(corr, -1, 1)
+        corr[(n < max(min_periods, 2)) | ~np.isfinite(corr)] = np.nan
+        np.fill_diagonal(corr, np.where(np.diag(var) > 0, 1.0, np.nan))
+        return pd.DataFrame(corr, index=self.columns, columns=self.columns)
+
+    def pair(self, x, y, min_periods=1):
+        """Bitta juftlik korrelyatsiyasi (butun matritsani hisoblamasdan)"""
+        i, j = self.columns.index(x), self.columns.index(y)
+        n = self.n[i, j]
+        if i == j:
+            return 1.0 if n > 1 and self.sxx[i, j] - self.sx[i, j] ** 2 / n > 0 else np.nan
+        if n < max(min_periods, 2):
+            return np.nan
+        cov = self.sxy[i, j] - self.sx[i, j] * self.sx[j, i] / n
+        var_x = self.sxx[i, j] - self.sx[i, j] ** 2 / n
+        var_y = self.sxx[j, i] - self.sx[j, i] ** 2 / n
+        if var_x <= 0 or var_y <= 0:
+            return np.nan
+        return float(np.clip(cov / np.sqrt(var_x * var_y), -1, 1))
+
+    @property
+    def nbytes(self):
+        return self.n.nbytes + self.sx.nbytes + self.sxx.nbytes + self.sxy.nbytes
+
+    def count(self):
+        return pd.DataFrame(self.n.astype('int64'), index=self.columns, columns=self.columns)
+
+
+def _sums(values, shift):
+    valid = ~np.isnan(values)
+    centered = np.where(valid, values - shift, 0.0)
+    mask = valid.astype('float64')
+    return mask.T @ mask, centered.T @ mask, (centered ** 2).T @ mask, centered.T @ centered
@@ -0,0 +1,138 @@
+"""Birlashtiriladigan (mergeable) kvantil eskizi - KLL algoritmi.
+
+Eskiz ma'lumotlar yuklanganda bir marta quriladi; mediana, kvintil
+chegaralari va persentillar ustunni har safar saralash o'rniga eskizdan
+o'qiladi. Alohida bo'laklar (partition) uchun qurilgan eskizlarni
+``merge`` orqali birlashtirish mumkin.
+
+Xatolik chegarasi: ``k`` parametri bilan eskiz qaytargan qiymatning rangi
+so'ralgan kvantildan taxminan ``1.65 * 200 / k`` foizdan ko'p farq qilmaydi
+(99% ehtimol bilan); standart ``k=200`` uchun bu ~1.65% rang xatosi.
+Qatorlar soni ``exact_limit`` dan oshmaguncha eskiz barcha qiymatlarni
+saqlaydi va natija ``np.quantile`` bilan aynan bir xil bo'ladi.
+"""
+import copy
+
+import numpy as np
+
+DEFAULT_K = 200
+DEFAULT_EXACT_LIMIT = 100_000
+
+# Quyi darajalar sig'imining kamayish koeffitsienti (KLL maqolasidagi c)
+_CAPACITY_RATIO = 2 / 3
+# Katta massivlar bo'laklab qo'shiladi, shunda saralash xotirasi cheklangan bo'ladi
+_UPDATE_CHUNK = 1 << 16
+
+
+class QuantileSketch:
+    """KLL kvantil eskizi: ``h``-darajadagi har bir element ``2**h`` og'irlikka ega"""
+
+    def __init__(self, k=DEFAULT_K, exact_limit=DEFAULT_EXACT_LIMIT, seed=None):
+        self.k = k
+        self.exact_limit = exact_limit
+        self.n = 0
+        self.min = np.inf
+        self.max = -np.inf
+        self.levels = [np.empty(0)]
+        self._rng = np.random.default_rng(seed)
+
+    @classmethod
+    def from_values(cls, values, **kwargs):
+        sketch = cls(**kwargs)
+        sketch.update(values)
+        return sketch
+
+    @property
+    def exact(self):
+        """Eskiz hali barcha qiymatlarni saqlayaptimi"""
+        return len(self.levels) == 1 and self.n <= self.exact_limit
+
+    @property
+    def nbytes(self):
+        return sum(level.nbytes for level in self.levels)
+
+    def update(self, values):
+        """Yangi qiymatlarni qo'shish (NaN'lar e'tiborga olinmaydi)"""
+        values = np.asarray(values, dtype='float64').ravel()
+        values = values[~np.isnan(values)]
+        if len(values) == 0:
+            return self
+        self.n += len(values)
+        self.min = min(self.min, values.min())
+        self.max = max(self.max, values.max())
+        for start in range(0, len(values), _UPDATE_CHUNK):
+            self.levels[0] = np.concatenate([self.levels[0], values[start:start + _UPDATE_CHUNK]])
+            self._compress()
+        return self
+
+    def copy(self):
+        """Mustaqil nusxa (umumiy eskizni o'zgartirmasdan yangilash uchun)"""
+        sketch = QuantileSketch(k=self.k, exact_limit=self.exact_limit)
+        sketch.n, sketch.min, sketch.max = self.n, self.min, self.max
+        # Darajalar massivlari joyida o'zgartirilmaydi, faqat ro'yxat nusxalanadi
+        sketch.levels = list(self.levels)
+        sketch._rng = copy.deepcopy(self._rng)
+        return sketch
+
+    def merge(self, other):
+        """Ikki eskizni birlashtirish; natija ikkala to'plam uchun eskiz bo'ladi"""
+        merged = QuantileSketch(k=min(self.k, other.k), exact_limit=min(self.exact_limit, other.exact_limit))
+        merged.n = self.n + other.n
+        merged.min = min(self.min, other.min)
+        merged.max = max(self.max, other.max)
+        depth = max(len(self.levels), len(other.levels))
+        merged.levels = [
+            np.concatenate([
+                self.levels[h] if h < len(self.levels) else np.empty(0),
+                other.levels[h] if h < len(other.levels) else np.empty(0),
+            ])
+            for h in range(depth)
+        ]
+        merged._compress()
+        return merged
+
+    def quantile(self, q):
+        """Bitta yoki bir nechta kvantil (``q`` 0 va 1 oralig'ida)"""
+        q = np.asarray(q, dtype='float64')
+        if self.n == 0:
+            return np.full(q.shape, np.nan) if q.ndim else np.nan
+        if self.exact:
+            return np.quantile(self.levels[0], q)
+
+        items = np.concatenate(self.levels)
+        weights = np.concatenate([np.full(len(level), 2.0 ** h) for h, level in enumerate(self.levels)])
+        order = np.argsort(items, kind='stable')
+        items, cumulative = items[order], np.cumsum(weights[order])
+        index = np.searchsorted(cumulative, q * cumulative[-1], side='left')
+        result = items[np.clip(index, 0, len(items) - 1)]
+        # Chetki kvantillar aniq saqlangan minimum/maksimumdan olinadi
+        result = np.where(q <= 0, self.min, np.where(q >= 1, self.max, result))
+        return result if q.ndim else float(result)
+
+    def median(self):
+        return self.quantile(0.5)
+
+    def _capacity(self, level):
+        depth = len(self.levels) - level - 1
+        return max(int(np.ceil(self.k * _CAPACITY_RATIO ** depth)), 2)
+
+    def _compress(self):
+        """Sig'imidan oshgan darajalarni siqish: saralab, har ikkinchi elementni yuqoriga o'tkazish"""
+        if self.exact:
+            return
+        compacted = True
+        while compacted:
+            compacted = False
+            for level in range(len(self.levels)):
+                items = self.levels[level]
+                if len(items) <= self._capacity(level):
+                    continue
+                if level + 1 == len(self.levels):
+                    self.levels.append(np.empty(0))
+                items = np.sort(items)
+                # Toq element darajada qoladi, qolganlarining yarmi tasodifiy siljish bilan yuqoriga
+                leftover, items = items[len(items) - len(items) % 2:], items[:len(items) - len(items) % 2]
+                offset = self._rng.integers(2)
+                self.levels[level + 1] = np.concatenate([self.levels[level + 1], items[offset::2]])
+                self.levels[level] = leftover
+                compacted = True
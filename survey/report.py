@@ -0,0 +1,204 @@
+"""Statik hisobot: barcha bo'limlar grafiklarini Streamlit'siz qurish.
+
+Ma'lumotlar ilova bilan bir xil yo'l orqali yuklanadi (``survey.ingest``),
+har bir bo'lim agregatlari va Plotly grafiklari jarayonlar hovuzida
+(process pool) parallel quriladi. Natija - plotly.js bir marta ichiga
+joylangan mustaqil HTML fayl va agregatlarning JSON nusxasi.
+
+``fork`` mavjud bo'lsa (Linux, macOS), jadval va indekslar jarayonlarga
+nusxalanmasdan meros qilib beriladi va har bir jarayon bo'limni to'liq
+quradi. ``fork`` bo'lmasa (Windows) yoki so'rovlar DuckDB orqali bo'lsa
+(ulanish fork'dan keyin ishlatilmaydi), agregatlar asosiy jarayonda
+hisoblanadi - indekslar tufayli bu arzon - va jarayonlarga faqat bo'lim
+natijalari yuboriladi: eng qimmat qism, Plotly grafiklari va HTML, baribir
+parallel quriladi.
+
+Ishga tushirish::
+
+    python -m survey.report --output report.html --json aggregates.json
+    python -m survey.report --source data.csv --workers 4
+"""
+import argparse
+import html
+import json
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from survey.backends import QUERY_BACKEND, attach_backend
+from survey.figures import build_figures
+from survey.histograms import Density, Histogram
+from survey.ingest import fetch_survey, load_local, prepare_dataset
+from survey.sections import SECTION_TITLES, compute_section
+
+# Jarayon ichidagi ma'lumotlar (hovuz initializer'i orqali bir marta o'rnatiladi)
+_worker_dataset = None
+
+
+def _init_worker(dataset):
+    global _worker_dataset
+    _worker_dataset = dataset
+
+
+def render_section(section, dataset=None):
+    """Bitta bo'lim: agregatlar (JSON ko'rinishida), grafiklar HTML'i va jadvallar"""
+    dataset = dataset if dataset is not None else _worker_dataset
+    return render_payload(section, compute_section(section, dataset))
+
+
+def render_payload(section, data):
+    """Hisoblangan bo'lim natijalaridan grafiklar va jadvallar (jadvalning o'zi kerak emas)"""
+    figures = {
+        chart_id: fig.to_html(full_html=False, include_plotlyjs=False, div_id=f"{section}-{chart_id}")
+        for chart_id, fig in build_figures(section, data).items()
+    }
+    # Grafigi bo'lmagan jadvallar (masalan, umumiy ma'lumot) hisobotga jadval sifatida kiradi
+    tables = {
+        name: value.to_html(classes='table', float_format=lambda x: f"{x:,.2f}")
+        for name, value in data.items() if isinstance(value, pd.DataFrame) and section in ('overview', 'extra')
+    }
+    return section, to_jsonable(data), figures, tables
+
+
+def to_jsonable(value):
+    """Bo'lim natijalarini JSON'ga yoziladigan ko'rinishga keltirish"""
+    if isinstance(value, (Histogram, Density)):
+        return {field: to_jsonable(item) for field, item in value._asdict().items()}
+    if isinstance(value, dict):
+        return {str(key): to_jsonable(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [to_jsonable(item) for item in value]
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return json.loads(value.to_json(orient='split', date_format='iso'))
+    if isinstance(value, np.ndarray):
+        return to_jsonable(value.tolist())
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float) and not np.isfinite(value):
+        return None
+    return value
+
+
+def build_report(dataset, sections=None, workers=None):
+    """Barcha bo'limlarni hovuzda qurish; natija bo'limlar tartibida qaytariladi"""
+    sections = list(sections or SECTION_TITLES)
+    workers = min(workers or os.cpu_count() or 1, len(sections))
+    if workers <= 1:
+        return [render_section(section, dataset) for section in sections]
+
+    # Umumiy indekslar (kub, tillar, bitmaplar, xulosa eskizlari, momentlar) hovuzdan
+    # oldin quriladi - har bir jarayon (yoki har bir bo'lim) ularni qayta qurmaydi
+    dataset.precompute()
+    method = pool_method(dataset)
+    context = multiprocessing.get_context(method)
+    if method == 'fork':
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context,
+                                 initializer=_init_worker, initargs=(dataset,)) as pool:
+            return list(pool.map(render_section, sections))
+
+    # spawn/forkserver: jadval pickle qilinib har bir jarayonga yuborilmaydi - faqat bo'lim natijalari
+    payloads = [compute_section(section, dataset) for section in sections]
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+        return list(pool.map(render_payload, sections, payloads))
+
+
+def pool_method(dataset):
+    """Hovuz ishga tushirish usuli: ``fork`` - jadval meros qilinadi, aks holda bo'lim natijalari yuboriladi.
+
+    Python 3.14 da Linux standarti ``forkserver``, lekin ``fork`` so'rab olinadi.
+    DuckDB ulanishi fork'dan keyin ishlatilmaydi, shuning uchun u bilan ``fork`` tanlanmaydi.
+    """
+    methods = multiprocessing.get_all_start_methods()
+    if 'fork' in methods and dataset.backend.name != 'duckdb':
+        return 'fork'
+    return 'forkserver' if 'forkserver' in methods else 'spawn'
+
+
+def write_html(path, results, dataset, elapsed):
+    """Mustaqil HTML hisobot (plotly.js bir marta ichiga joylanadi)"""
+    from plotly.offline import get_plotlyjs
+
+    parts = []
+    for section, _, figures, tables in results:
+        if not figures and not tables:
+            continue
+        parts.append(f"<section><h2>{html.escape(SECTION_TITLES[section])}</h2>")
+        parts.extend(f'<div class="table-wrap">{table}</div>' for table in tables.values())
+        parts.extend(f'<div class="chart">{figure}</div>' for figure in figures.values())
+        parts.append("</section>")
+
+    generated = datetime.now().strftime('%Y-%m-%d %H:%M')
+    document = f"""<!DOCTYPE html>
+<html lang="uz">
+<head>
+<meta charset="utf-8">
+<title>Data Professional Survey - Hisobot</title>
+<script type="text/javascript">{get_plotlyjs()}</script>
+<style>
+body {{ font-family: sans-serif; margin: 2rem auto; max-width: 1200px; color: #222; }}
+h1 {{ color: #1f77b4; text-align: center; }}
+.meta {{ color: #666; text-align: center; }}
+section {{ margin-top: 2.5rem; }}
+.table-wrap {{ overflow-x: auto; margin-bottom: 1rem; }}
+.table {{ border-collapse: collapse; font-size: 0.85rem; }}
+.table td, .table th {{ border: 1px solid #ddd; padding: 4px 8px; }}
+</style>
+</head>
+<body>
+<h1>📊 Data Professional Survey - Hisobot</h1>
+<p class="meta">Ma'lumotlar: {html.escape(dataset.version)} · {len(dataset.df):,} qator ·
+Yaratilgan: {generated} · Qurish vaqti: {elapsed:.1f} s</p>
+{''.join(parts)}
+</body>
+</html>
+"""
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(document)
+
+
+def write_json(path, results, dataset):
+    payload = {
+        'version': dataset.version,
+        'rows': len(dataset.df),
+        'sections': {section: aggregates for section, aggregates, _, _ in results},
+    }
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(payload, f, ensure_ascii=False, indent=1)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Dashboard grafiklaridan statik HTML hisobot yaratish")
+    parser.add_argument('--source', help="Mahalliy CSV/Excel fayl (berilmasa GitHub'dan yuklanadi)")
+    parser.add_argument('--output', default='report.html', help="HTML hisobot fayli")
+    parser.add_argument('--json', default='aggregates.json', help="Agregatlar JSON fayli")
+    parser.add_argument('--workers', type=int, default=None, help="Jarayonlar soni (standart: barcha yadrolar)")
+    parser.add_argument('--sections', nargs='+', choices=list(SECTION_TITLES), help="Faqat shu bo'limlar")
+    parser.add_argument('--backend', choices=['pandas', 'duckdb'], default=QUERY_BACKEND,
+                        help="Agregatlar uchun so'rov backendi (duckdb - faqat --source Parquet/CSV bilan)")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    if args.source:
+        df, _, version = load_local(args.source)
+    else:
+        df, _, version = fetch_survey(on_warning=print)
+    dataset, _ = prepare_dataset(df, version)
+    attach_backend(dataset, args.source, args.backend)
+    loaded = time.perf_counter()
+
+    results = build_report(dataset, args.sections, args.workers)
+    elapsed = time.perf_counter() - start
+    write_html(args.output, results, dataset, elapsed)
+    write_json(args.json, results, dataset)
+    print(f"Yuklash: {loaded - start:.2f} s, grafiklar: {elapsed - (loaded - start):.2f} s "
+          f"({args.workers or os.cpu_count()} jarayon, {pool_method(dataset)})")
+    print(f"Hisobot: {args.output}, agregatlar: {args.json}")
+
+
+if __name__ == '__main__':
+    main()
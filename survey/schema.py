@@ -0,0 +1,200 @@
+"""Ustun nomlarini standartlashtirish va ixcham ma'lumot turlariga o'tkazish"""
+import numpy as np
+import pandas as pd
+
+# Kam sonli qiymatlarga ega matnli ustunlar - category turiga o'tkaziladi
+CATEGORY_COLUMNS = ['Role', 'Country', 'Education', 'Gender', 'RemoteWork', 'CareerSwitch', 'SurveyWave']
+
+# Butun sonli ballar va yosh - eng kichik mos butun turga o'tkaziladi
+INTEGER_COLUMNS = ['Age', 'YearsExperience', 'JobSatisfaction', 'WorkLifeBalance']
+
+# Boshqa matnli ustunlar uchun: noyob qiymatlar ulushi shundan kam bo'lsa category
+CATEGORY_MAX_UNIQUE_RATIO = 0.5
+
+# Ixchamlashtirishdan oldingi xotira hajmi (Arrow nusxasi uni asl fayldan saqlaydi)
+SOURCE_BYTES_ATTR = 'source_bytes'
+
+INTEGER_TYPES = (np.int8, np.int16, np.int32, np.int64)
+
+
+def build_column_mapping(columns):
+    """Asl ustun nomlarini standart nomlarga moslashtirish lug'ati"""
+    column_mapping = {}
+    for col in columns:
+        col_lower = str(col).lower()
+        if 'education' in col_lower or 'degree' in col_lower:
+            column_mapping[col] = 'Education'
+        elif 'salary' in col_lower or 'income' in col_lower:
+            column_mapping[col] = 'Salary'
+        elif 'experience' in col_lower:
+            column_mapping[col] = 'YearsExperience'
+        elif 'role' in col_lower or 'title' in col_lower or 'position' in col_lower:
+            column_mapping[col] = 'Role'
+        elif 'country' in col_lower or 'location' in col_lower:
+            column_mapping[col] = 'Country'
+        elif 'satisfaction' in col_lower:
+            column_mapping[col] = 'JobSatisfaction'
+        elif 'work' in col_lower and 'balance' in col_lower:
+            column_mapping[col] = 'WorkLifeBalance'
+        elif 'language' in col_lower or 'programming' in col_lower:
+            column_mapping[col] = 'ProgrammingLanguages'
+        elif 'gender' in col_lower or 'sex' in col_lower:
+            column_mapping[col] = 'Gender'
+        elif 'age' in col_lower:
+            column_mapping[col] = 'Age'
+    return column_mapping
+
+
+def standardize_columns(df):
+    """Ustunlar mavjud bo'lsa, nomlarini standart nomlarga o'zgartirish"""
+    column_mapping = build_column_mapping(df.columns)
+    if column_mapping:
+        df = df.rename(columns=column_mapping)
+    return df
+
+
+def compact_frame(df):
+    """Matnli ustunlarni category, butun sonlarni eng kichik turga o'tkazish.
+
+    Natija: ``(df, report)``, bu yerda ``report`` - o'zgartirishdan oldingi va
+    keyingi xotira hajmi (baytlarda). Jadval nusxalanmaydi: faqat turi
+    o'zgargan ustunlar almashtiriladi, allaqachon ixcham jadval (masalan,
+    Arrow nusxasidan o'qilgan) o'zi qaytariladi. Asl hajm ``df.attrs`` da
+    (``SOURCE_BYTES_ATTR``) bo'lsa, hisobot undan boshlanadi.
+    """
+    before = int(df.attrs.get(SOURCE_BYTES_ATTR) or df.memory_usage(deep=True).sum())
+
+    changed = {}
+    for col in df.columns:
+        series = df[col]
+        if col in INTEGER_COLUMNS or pd.api.types.is_integer_dtype(series):
+            compact = _downcast_integer(series)
+        elif is_text_column(series) and not isinstance(series.dtype, pd.CategoricalDtype) \
+                and col != 'ProgrammingLanguages' \
+                and (col in CATEGORY_COLUMNS or series.nunique() <= CATEGORY_MAX_UNIQUE_RATIO * len(series)):
+            compact = series.astype('category')
+        else:
+            continue
+        if compact.dtype != series.dtype:
+            changed[col] = compact
+    if changed:
+        df = df.copy(deep=False)
+        for col, compact in changed.items():
+            df[col] = compact
+
+    after = int(df.memory_usage(deep=True).sum())
+    return df, {'before': before, 'after': after}
+
+
+def validate_batch(df, batch):
+    """Yangi qatorlar jadvalga mosligini tekshirish; mos kelmasa ValueError.
+
+    Ustunlar jadval ustunlari bilan aynan bir xil bo'lishi kerak (ortiqcha
+    yoki yetishmaydigan ustun - xato), raqamli ustunlardagi qiymatlar son,
+    category ustunlardagi qiymatlar matn bo'lishi kerak. Natija - raqamli
+    ustunlari songa o'tkazilgan ``batch``.
+    """
+    if len(batch) == 0:
+        raise ValueError("Yangi javoblar bo'sh")
+    extra = [str(col) for col in batch.columns if col not in df.columns]
+    if extra:
+        raise ValueError(f"Noma'lum ustunlar: {', '.join(extra)}")
+    missing = [str(col) for col in df.columns if col not in batch.columns]
+    if missing:
+        raise ValueError(f"Yetishmaydigan ustunlar: {', '.join(missing)}")
+    if batch.columns.duplicated().any():
+        raise ValueError("Ustun nomlari takrorlangan")
+
+    batch = batch[list(df.columns)].copy()
+    for col in df.columns:
+        old, new = df[col], batch[col]
+        if pd.api.types.is_numeric_dtype(old.dtype) and not pd.api.types.is_bool_dtype(old.dtype):
+            converted = pd.to_numeric(new, errors='coerce')
+            if (converted.isna() & new.notna()).any():
+                raise ValueError(f"'{col}' ustunida son bo'lmagan qiymatlar bor")
+            batch[col] = converted
+        elif isinstance(old.dtype, pd.CategoricalDtype) and not is_text_column(old.cat.categories.to_series()):
+            continue
+        elif isinstance(old.dtype, pd.CategoricalDtype) or is_text_column(old):
+            values = new.dropna()
+            if len(values) and not values.map(lambda value: isinstance(value, str)).all():
+                raise ValueError(f"'{col}' ustunida matn bo'lmagan qiymatlar bor")
+    return batch
+
+
+def append_rows(df, batch):
+    """Ixcham jadvalga yangi qatorlarni qo'shish, ustun turlarini saqlagan holda.
+
+    ``batch`` - standart nomlangan ustunlar (``standardize_columns`` dan keyin),
+    avval ``validate_batch`` bilan tekshiriladi. Category ustunlarga yangi
+    qiymatlar kategoriya sifatida qo'shiladi (mavjud kodlar qayta
+    hisoblanmaydi), butun sonlar sig'sa o'sha turga keltiriladi.
+    """
+    batch = validate_batch(df, batch)
+    columns = {}
+    for col in df.columns:
+        old, new = df[col], batch[col]
+        if isinstance(old.dtype, pd.CategoricalDtype):
+            added = pd.Index(new.dropna().unique()).difference(old.cat.categories)
+            if len(added):
+                old = old.cat.add_categories(added)
+            new = pd.Categorical(new, categories=old.cat.categories)
+        elif pd.api.types.is_integer_dtype(old.dtype) and pd.api.types.is_numeric_dtype(new.dtype):
+            info = np.iinfo(old.dtype)
+            fits = len(new) == 0 or (new.min() >= info.min and new.max() <= info.max and (new % 1 == 0).all())
+            if new.notna().all() and fits:
+                new = new.astype(old.dtype)
+        columns[col] = (old, new)
+    old_part = pd.DataFrame({col: old for col, (old, _) in columns.items()}, index=df.index)
+    new_part = pd.DataFrame({col: new for col, (_, new) in columns.items()})
+    return pd.concat([old_part, new_part], ignore_index=True)
+
+
+def freeze_frame(df):
+    """Ustunlari faqat o'qiladigan massivlarga tayangan jadval (ma'lumotlar nusxalanmaydi).
+
+    Numpy ustunlar va category kodlari ``writeable=False`` ko'rinishlar
+    orqali olinadi, shuning uchun jarayon bo'yicha umumiy jadvalning
+    raqamli va category ustunlariga joyida yozish (``df.loc[...] = ...``)
+    xato beradi. Arrow (matnli) ustunlar buferlari o'zi o'zgarmas.
+    """
+    columns = {}
+    for col in df.columns:
+        series = df[col]
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            # Kodlar tayyor va to'g'ri - qayta tekshirilmaydi
+            values = pd.Categorical.from_codes(series.array.codes, dtype=series.dtype, validate=False)
+        elif isinstance(series.dtype, np.dtype):
+            values = series.to_numpy()
+            values.flags.writeable = False
+        else:
+            values = series.array
+        columns[col] = pd.Series(values, index=df.index, name=col, copy=False)
+    return pd.DataFrame(columns, index=df.index, copy=False)
+
+
+def numeric_columns(df):
+    """Barcha raqamli ustunlar (kichraytirilgan int8/int16/float32 ham)"""
+    return df.select_dtypes(include='number').columns.tolist()
+
+
+def is_text_column(series):
+    """Ustun matnli (object yoki string) ekanligini tekshirish"""
+    return pd.api.types.is_object_dtype(series) or pd.api.types.is_string_dtype(series)
+
+
+def _downcast_integer(series):
+    """Butun qiymatli ustunni eng kichik butun turga o'tkazish (bo'sh qiymat bo'lmasa)"""
+    if pd.api.types.is_bool_dtype(series) or not pd.api.types.is_numeric_dtype(series):
+        return series
+    if series.isna().any():
+        return series
+    if pd.api.types.is_integer_dtype(series) and len(series):
+        # Faqat min/max bo'yicha: tur allaqachon eng kichik bo'lsa ustun nusxalanmaydi
+        low, high = series.min(), series.max()
+        target = next((t for t in INTEGER_TYPES if np.iinfo(t).min <= low and high <= np.iinfo(t).max), None)
+        return series if target is None or series.dtype == target else series.astype(target)
+    values = series.to_numpy()
+    if pd.api.types.is_float_dtype(series) and not np.array_equal(values, np.round(values)):
+        return series
+    return pd.to_numeric(series.astype(np.int64), downcast='integer')
@@ -0,0 +1,279 @@
+"""Dashboard bo'limlari uchun hisob-kitoblar (Streamlit'ga bog'liq emas).
+
+Har bir bo'lim alohida chaqiriladigan funksiya: u ``SurveyDataset`` (yoki
+jadvalsiz ``SQLDataset``) oladi va grafiklar uchun tayyor natijalarni lug'at
+ko'rinishida qaytaradi. Bo'limlar jadvalga to'g'ridan-to'g'ri murojaat
+qilmaydi: guruhlar bo'yicha agregatlar va korrelyatsiya ``dataset.backend``
+orqali, gistogrammalar, kvantillar, tillar va nuqtalar ma'lumotlar
+obyektining metodlari orqali so'raladi. Ilova bu funksiyalarni bo'lim nomi
+va ma'lumotlar versiyasi bo'yicha alohida keshlaydi.
+"""
+import numpy as np
+import pandas as pd
+
+
+# Bo'limlar sarlavhalari (ilova tablari va hisobotlar uchun)
+SECTION_TITLES = {
+    'overview': "📋 Umumiy ma'lumot",
+    'demographics': "👨‍💼 Demografik ma'lumotlar",
+    'salary': "💰 Maosh tahlili",
+    'education': "📚 Ta'lim va tajriba",
+    'technology': "💻 Texnologiyalar",
+    'performance': "😊 Ish faoliyati",
+    'extra': "📈 Qo'shimcha statistik analiz",
+}
+
+SALARY_BIN_LABELS = ['Eng past', 'Past', "O'rta", 'Yuqori', 'Eng yuqori']
+SALARY_PERCENTILES = [0.25, 0.75, 0.9]
+
+# Guruh o'rtachalari grafiklari: bo'lim -> (natija kaliti, guruh ustuni, o'lchov)
+INTERVAL_CHARTS = {
+    'salary': [('role_salary', 'Role', 'Salary')],
+    'education': [('edu_salary', 'Education', 'Salary')],
+    'technology': [('remote_salary', 'RemoteWork', 'Salary')],
+    'performance': [('role_satisfaction', 'Role', 'JobSatisfaction'),
+                    ('salary_wlb', 'SalaryBin', 'WorkLifeBalance')],
+}
+
+# Xato chiziqlari chiziladigan grafiklar (``survey.figures``: ``{kalit}_bar``) - faqat ular
+# ishonch oraliqlari bilan alohida keshlanadi, bo'limning qolgan grafiklari o'zgarmaydi
+INTERVAL_FIGURES = {section: [f"{key}_bar" for key, _, _ in charts] for section, charts in INTERVAL_CHARTS.items()}
+
+# Scatter grafiklarda shundan ko'p qator bo'lsa, nuqtalar o'rniga 2D zichlik ko'rsatiladi
+SCATTER_MAX_POINTS = 20_000
+
+
+def detect_available(columns):
+    """Asl ustun nomlariga qarab qaysi ma'lumotlar mavjudligini aniqlash"""
+    checks = {
+        'education': ['education', 'highest education', 'degree'],
+        'salary': ['salary', 'yearly salary', 'annual salary', 'income'],
+        'experience': ['years experience', 'yearsexperience', 'years of experience', 'experience'],
+        'role': ['role', 'job title', 'position', 'title'],
+        'country': ['country', 'location', 'region'],
+        'satisfaction': ['satisfaction', 'job satisfaction', 'jobsatisfaction'],
+        'wlb': ['work life balance', 'worklifebalance', 'work-life balance'],
+        'languages': ['programming languages', 'programminglanguages', 'languages', 'favorite programming language'],
+    }
+    return tuple(
+        name for name, aliases in checks.items()
+        if any(str(col).lower() in aliases for col in columns)
+    )
+
+
+def compute_overview(dataset):
+    return {
+        'describe': dataset.summary.describe(),
+    }
+
+
+def compute_demographics(dataset):
+    columns, available = dataset.columns, dataset.available
+    data = {}
+    if 'role' in available:
+        data['role_counts'] = _counts_frame(dataset.backend.counts('Role'), 'Role')
+    if 'country' in available:
+        data['top_countries'] = _counts_frame(dataset.backend.counts('Country'), 'Country').head(10)
+    if 'Gender' in columns:
+        data['gender_counts'] = _counts_frame(dataset.backend.counts('Gender'), 'Gender')
+    if 'Age' in columns:
+        data['age'] = dataset.histogram('Age', 20)
+    return data
+
+
+def compute_salary(dataset):
+    available = dataset.available
+    if 'salary' not in available:
+        return {}
+    summary = dataset.backend.summary('Salary')
+    salary_sketch = dataset.sketch('Salary')
+    data = {
+        'mean': summary['mean'],
+        'median': salary_sketch.median(),
+        'percentiles': dict(zip(SALARY_PERCENTILES, salary_sketch.quantile(SALARY_PERCENTILES))),
+        'exact_quantiles': salary_sketch.exact,
+        'min': summary['min'],
+        'max': summary['max'],
+        'salary': dataset.histogram('Salary', 30),
+    }
+    if 'role' in available:
+        data['role_salary'] = dataset.backend.group_mean('Role', 'Salary').sort_values(ascending=False).reset_index()
+    if 'experience' in available:
+        data['experience_salary'] = _scatter_data(dataset, 'YearsExperience', 'Salary')
+        data['scatter_density'] = dataset.rows > SCATTER_MAX_POINTS
+        data['experience_corr'] = dataset.backend.correlation_pair('YearsExperience', 'Salary')
+    return data
+
+
+def compute_education(dataset):
+    available = dataset.available
+    data = {}
+    if 'education' in available:
+        data['edu_counts'] = _counts_frame(dataset.backend.counts('Education'), 'Education')
+    if 'experience' in available:
+        data['experience'] = dataset.histogram('YearsExperience', 20)
+    if 'education' in available and 'salary' in available:
+        data['edu_salary'] = dataset.backend.group_mean('Education', 'Salary').sort_values(ascending=False).reset_index()
+    if 'role' in available and 'education' in available:
+        data['role_edu'] = dataset.backend.crosstab('Role', 'Education')
+    return data
+
+
+def compute_technology(dataset):
+    available = dataset.available
+    data = {}
+    languages = dataset.languages if 'languages' in available else None
+    if languages is not None:
+        # Tillar soni va lavozim x til jadvali multi-hot matritsa ko'paytmalaridan olinadi
+        lang_count = languages.counts()
+        data['top_langs'] = lang_count.head(10).rename_axis('Language').reset_index()
+        top = lang_count.index[:10]
+        data['lang_cooccurrence'] = languages.cooccurrence().loc[top, top]
+        if 'role' in available:
+            role_langs = dataset.languages_by('Role')[top]
+            role_sizes = dataset.backend.counts('Role').reindex(role_langs.index)
+            # Lavozimdagi respondentlarning necha foizi shu tilni tanlagan
+            data['role_languages'] = role_langs.div(role_sizes, axis=0).mul(100).round(1)
+    if 'RemoteWork' in dataset.columns:
+        remote_counts = dataset.backend.counts('RemoteWork').reset_index()
+        remote_counts.columns = ['WorkType', 'Count']
+        data['remote_counts'] = remote_counts
+        if 'salary' in available:
+            data['remote_salary'] = dataset.backend.group_mean('RemoteWork', 'Salary').reset_index()
+    return data
+
+
+def compute_performance(dataset):
+    available = dataset.available
+    data = {}
+    if 'satisfaction' in available:
+        data['satisfaction'] = dataset.histogram('JobSatisfaction', 10)
+    if 'wlb' in available:
+        data['wlb'] = dataset.histogram('WorkLifeBalance', 10)
+    if 'role' in available and 'satisfaction' in available:
+        data['role_satisfaction'] = (
+            dataset.backend.group_mean('Role', 'JobSatisfaction').sort_values(ascending=False).reset_index()
+        )
+    if 'salary' in available and 'satisfaction' in available:
+        data['salary_satisfaction'] = _scatter_data(dataset, 'Salary', 'JobSatisfaction')
+        data['scatter_density'] = dataset.rows > SCATTER_MAX_POINTS
+        data['satisfaction_corr'] = dataset.backend.correlation_pair('Salary', 'JobSatisfaction')
+    if 'salary' in available and 'wlb' in available:
+        edges = _salary_edges(dataset)
+        if edges is not None:
+            # Kvintillar bo'yicha o'rtacha - backend'dan (qatorlar qayta guruhlanmaydi)
+            binned = dataset.backend.binned_mean('Salary', edges, 'WorkLifeBalance')
+            binned = binned[binned['n'] > 0]
+            data['salary_wlb'] = pd.DataFrame({
+                'SalaryBin': pd.Categorical.from_codes(binned.index, categories=SALARY_BIN_LABELS, ordered=True),
+                'WorkLifeBalance': binned['mean'].to_numpy(),
+            })
+    return data
+
+
+def compute_extra(dataset):
+    available = dataset.available
+    numeric_cols = dataset.summary.columns
+    data = {'corr_matrix': None, 'spearman_matrix': None}
+    if len(numeric_cols) > 1:
+        data['corr_matrix'] = dataset.backend.correlation(numeric_cols)
+        data['spearman_matrix'] = dataset.backend.correlation(numeric_cols, method='spearman')
+    if 'role' in available:
+        data['role_stats'] = pd.DataFrame({
+            'YearsExperience': dataset.backend.rollup(['Role'], 'YearsExperience')['mean' if 'experience' in available else 'count'],
+            'Salary': dataset.backend.rollup(['Role'], 'Salary')['mean' if 'salary' in available else 'count'],
+            'JobSatisfaction': dataset.backend.rollup(['Role'], 'JobSatisfaction')['mean' if 'satisfaction' in available else 'count'],
+            'WorkLifeBalance': dataset.backend.rollup(['Role'], 'WorkLifeBalance')['mean' if 'wlb' in available else 'count']
+        }).reset_index()
+    return data
+
+
+SECTION_COMPUTE = {
+    'overview': compute_overview,
+    'demographics': compute_demographics,
+    'salary': compute_salary,
+    'education': compute_education,
+    'technology': compute_technology,
+    'performance': compute_performance,
+    'extra': compute_extra,
+}
+
+
+def compute_section(section, dataset):
+    """Bitta bo'lim natijalarini hisoblash"""
+    return SECTION_COMPUTE[section](dataset)
+
+
+def compute_intervals(section, dataset):
+    """Bo'limning guruh o'rtachalari grafiklari uchun bootstrap ishonch oraliqlari.
+
+    Natija: natija kaliti -> ``mean``/``low``/``high``/``n`` jadvali (guruhlar
+    indeksida); bo'limda bunday grafik yoki qatorlar jadvali (``SQLDataset``)
+    bo'lmasa - bo'sh lug'at.
+    """
+    df = dataset.df
+    intervals = {}
+    if df is None:
+        return intervals
+    for key, dimension, measure in INTERVAL_CHARTS.get(section, []):
+        if measure not in df.columns:
+            continue
+        if dimension == 'SalaryBin':
+            groups = _salary_bins(dataset) if 'Salary' in df.columns else None
+        else:
+            groups = df[dimension] if dimension in df.columns else None
+        if groups is not None:
+            intervals[key] = dataset.intervals(dimension, measure, groups)
+    return intervals
+
+
+def attach_intervals(data, intervals):
+    """Bo'lim natijasining nusxasi: guruh o'rtachalari jadvallariga xato chiziqlari ustunlari qo'shiladi.
+
+    ``ci_plus``/``ci_minus`` - ustun balandligidan oraliqning yuqori va quyi
+    chegarasigacha masofa. Keshlangan asl natija o'zgartirilmaydi.
+    """
+    data = dict(data)
+    for key, interval in intervals.items():
+        if key not in data:
+            continue
+        frame = data[key]
+        dimension, measure = frame.columns[0], frame.columns[1]
+        groups = frame[dimension].astype(object)
+        bound = {name: groups.map(dict(zip(interval.index, interval[name]))).astype('float64')
+                 for name in ('low', 'high')}
+        data[key] = frame.assign(ci_plus=bound['high'] - frame[measure], ci_minus=frame[measure] - bound['low'])
+    return data
+
+
+def _salary_edges(dataset):
+    """Maosh kvintillari chegaralari (kvantil eskizidan); chegaralar takrorlansa None"""
+    edges = dataset.sketch('Salary').quantile(np.linspace(0, 1, 6))
+    # Kichik filtrlangan to'plamlarda chegaralar takrorlanishi mumkin - unda grafik ko'rsatilmaydi
+    if len(np.unique(edges)) != len(edges):
+        return None
+    return edges
+
+
+def _salary_bins(dataset):
+    """Maosh kategoriyalari (kvintillar) - bootstrap uchun qatorlar bo'yicha; chegaralar takrorlansa None.
+
+    Asl DataFrame o'zgartirilmaydi.
+    """
+    edges = _salary_edges(dataset)
+    if edges is None:
+        return None
+    return pd.cut(dataset.df['Salary'], bins=edges, labels=SALARY_BIN_LABELS, include_lowest=True).rename('SalaryBin')
+
+
+def _scatter_data(dataset, x, y):
+    """Kichik ma'lumotlar uchun nuqtalarning o'zi, katta ma'lumotlar uchun 2D zichlik bin'lari"""
+    if dataset.rows <= SCATTER_MAX_POINTS:
+        return dataset.points([x, y])
+    return dataset.density(x, y)
+
+
+def _counts_frame(counts, name):
+    frame = counts.reset_index()
+    frame.columns = [name, 'Count']
+    return frame
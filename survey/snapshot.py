@@ -0,0 +1,182 @@
+"""Yuklangan CSV/Excel fayllarning ustunli (Arrow IPC) nusxasi.
+
+Fayl birinchi marta ko'rilganda o'qiladi, ixcham turlarga o'tkaziladi
+(``compact_frame``: category - Arrow lug'at massivlari, kichraytirilgan
+butun sonlar) va Arrow IPC formatiga yoziladi. Ustun nomlari asl holida
+qoladi (mavjud bo'limlar asl nomlardan aniqlanadi). Keyingi ishga
+tushishlarda nusxa xotiraga akslantirib (memory-map) o'qiladi,
+``read_excel`` va turlarni o'zgartirish qayta bajarilmaydi. Ustunlar
+nusxadan nusxa ko'chirmasdan olinadi: raqamli ustunlar, category kodlari va
+Arrow asosidagi matnli ustunlar akslantirilgan fayl ustida turadi.
+
+Nusxa nomida fayl nomi va barmoq izi (GitHub SHA yoki mazmun xeshi) bor:
+manba o'zgarsa yangi nusxa yoziladi, shu nomning eski nusxalari o'chiriladi.
+Papka hajmi ``SNAPSHOT_MAX_BYTES`` bilan cheklanadi - eng uzoq vaqt
+o'qilmagan nusxalar birinchi o'chiriladi.
+"""
+import hashlib
+import os
+
+import pandas as pd
+
+from survey.cache import DEFAULT_CACHE_DIR, DiskCache
+from survey.schema import SOURCE_BYTES_ATTR, compact_frame, standardize_columns
+
+SNAPSHOT_DIR = os.path.join(DEFAULT_CACHE_DIR, "snapshots")
+FINGERPRINT_KEY = b"survey.fingerprint"
+SOURCE_BYTES_KEY = b"survey.source_bytes"
+
+# Nusxalar papkasining chegarasi (baytlarda)
+SNAPSHOT_MAX_BYTES = int(os.environ.get("SURVEY_SNAPSHOT_MAX_BYTES", 2 * 1024 ** 3))
+
+# Aralash turdagi ustunlar (masalan, sonlar va matn): Arrow ularni yoza olmaydi, matnga aylantiriladi
+MIXED_TYPES = ('mixed', 'mixed-integer')
+
+
+def file_fingerprint(path, chunk_size=1 << 20):
+    """Fayl mazmunidan SHA-1 barmoq izini hisoblash"""
+    digest = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def read_source(path, name):
+    """Manba faylni kengaytmasiga qarab o'qish"""
+    if name.endswith('.csv'):
+        return pd.read_csv(path)
+    if name.endswith('.parquet'):
+        return pd.read_parquet(path)
+    if name.endswith(('.arrow', '.feather')):
+        return pd.read_feather(path)
+    return pd.read_excel(path)
+
+
+def load_snapshot(path, name, fingerprint=None, root=SNAPSHOT_DIR, max_bytes=SNAPSHOT_MAX_BYTES):
+    """Faylni ustunli nusxa orqali o'qish; nusxa bo'lmasa yoki eskirgan bo'lsa qayta qurish.
+
+    ``fingerprint`` berilmasa (masalan, GitHub SHA), fayl mazmunidan
+    hisoblanadi. Natija turlari nusxa birinchi qurilganda ham, nusxadan
+    o'qilganda ham bir xil (aralash ustunlar ikkalasida ham matn, ixcham
+    turlar). ``pyarrow`` o'rnatilmagan bo'lsa, fayl odatdagidek o'qiladi.
+    """
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return read_compact(path, name)
+
+    fingerprint = fingerprint or file_fingerprint(path)
+    snapshot_path = snapshot_file(name, fingerprint, root)
+
+    df = read_snapshot(snapshot_path, fingerprint)
+    if df is not None:
+        return df
+
+    df = read_compact(path, name)
+    try:
+        write_snapshot(df, snapshot_path, fingerprint)
+        prune_snapshots(root, snapshot_path, max_bytes)
+    except (OSError, ValueError, TypeError):
+        # Nusxani yozib bo'lmasa ham ma'lumotlar bilan ishlash davom etadi
+        pass
+    return df
+
+
+def snapshot_file(name, fingerprint, root=SNAPSHOT_DIR):
+    """Fayl nomi va barmoq izi bo'yicha nusxa yo'li"""
+    return os.path.join(root, f"{DiskCache.make_key(name)}-{fingerprint}.arrow")
+
+
+def read_compact(path, name):
+    """Manba faylni o'qib ixcham turlarga o'tkazish (asl ustun nomlari va asl hajm ``attrs`` da saqlanadi)"""
+    df = normalize_mixed(read_source(path, name))
+    # Turlar standart nomlar bo'yicha tanlanadi (``prepare_dataset`` dagi kabi), nomlar esa asl holiga qaytadi
+    compact, report = compact_frame(standardize_columns(df))
+    compact.columns = df.columns
+    compact.attrs[SOURCE_BYTES_ATTR] = report['before']
+    return compact
+
+
+def normalize_mixed(df):
+    """Aralash turdagi object ustunlarni matnga aylantirish (bo'sh qiymatlar saqlanadi)"""
+    mixed = [col for col in df.columns if df[col].dtype == object
+             and pd.api.types.infer_dtype(df[col], skipna=True) in MIXED_TYPES]
+    if not mixed:
+        return df
+    df = df.copy()
+    for col in mixed:
+        df[col] = df[col].where(df[col].isna(), df[col].astype(str))
+    return df
+
+
+def read_snapshot(snapshot_path, fingerprint):
+    """Nusxani memory-map orqali o'qish; barmoq izi mos kelmasa None qaytarish.
+
+    ``split_blocks`` bilan ustunlar bitta 2D blokka yig'ilmaydi, shuning uchun
+    ular akslantirilgan buferlardan nusxa olinmasdan quriladi. O'qish vaqti
+    nusxaning ``mtime`` ga yoziladi (papkani tozalashda LRU tartibi uchun).
+    """
+    import pyarrow as pa
+
+    if not os.path.exists(snapshot_path):
+        return None
+    try:
+        with pa.memory_map(snapshot_path, "r") as source:
+            reader = pa.ipc.open_file(source)
+            metadata = reader.schema.metadata or {}
+            if metadata.get(FINGERPRINT_KEY) != fingerprint.encode("utf-8"):
+                return None
+            df = reader.read_all().to_pandas(split_blocks=True)
+        if SOURCE_BYTES_KEY in metadata:
+            df.attrs[SOURCE_BYTES_ATTR] = int(metadata[SOURCE_BYTES_KEY])
+        os.utime(snapshot_path)
+        return df
+    except (OSError, pa.ArrowException):
+        return None
+
+
+def write_snapshot(df, snapshot_path, fingerprint):
+    """DataFrame'ni siqilmagan Arrow IPC fayliga atomar yozish (category ustunlar - lug'at massivlari)"""
+    import pyarrow as pa
+
+    table = pa.Table.from_pandas(normalize_mixed(df), preserve_index=False)
+    metadata = dict(table.schema.metadata or {})
+    metadata[FINGERPRINT_KEY] = fingerprint.encode("utf-8")
+    if SOURCE_BYTES_ATTR in df.attrs:
+        metadata[SOURCE_BYTES_KEY] = str(df.attrs[SOURCE_BYTES_ATTR]).encode("utf-8")
+    table = table.replace_schema_metadata(metadata)
+
+    os.makedirs(os.path.dirname(snapshot_path), exist_ok=True)
+    tmp_path = f"{snapshot_path}.{os.getpid()}.tmp"
+    with pa.OSFile(tmp_path, "wb") as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+    os.replace(tmp_path, snapshot_path)
+
+
+def prune_snapshots(root, keep, max_bytes=SNAPSHOT_MAX_BYTES):
+    """Shu nomning eski nusxalarini va chegaradan oshgan eng eski nusxalarni o'chirish (``keep`` qoladi)"""
+    prefix = os.path.basename(keep).rsplit("-", 1)[0] + "-"
+    entries = []
+    for entry in os.scandir(root):
+        if not entry.name.endswith(".arrow") or entry.path == keep:
+            continue
+        if entry.name.startswith(prefix):
+            _remove(entry.path)
+        else:
+            stat = entry.stat()
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+    total = os.path.getsize(keep) + sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        _remove(path)
+        total -= size
+
+
+def _remove(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
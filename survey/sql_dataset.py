@@ -0,0 +1,240 @@
+"""Jadvalni xotiraga yuklamasdan ishlash: barcha so'rovlar DuckDB'da, Parquet fayl ustida.
+
+``SQLDataset`` - ``SurveyDataset`` bilan bir xil interfeys (bo'limlar, global
+filtrlar va jadval ko'rgichi uchun), lekin ``df`` yo'q: guruh agregatlari,
+umumiy statistika va aniq kvantillar, gistogramma va 2D zichlik bin'lari,
+tillar soni va birgalikda uchrashi, filtr qiymatlari va jadval sahifalari
+``DuckDBBackend`` so'rovlari bilan hisoblanadi. Xotirada faqat so'rov
+natijalari (bin'lar, kichik jadvallar, joriy sahifa) turadi, shuning uchun
+jadvalning o'zi konteyner xotirasiga sig'masa ham ilova ishlaydi.
+
+Bootstrap ishonch oraliqlari va yangi javoblarni qo'shish qatorlar
+darajasidagi jadvalni talab qiladi - bu rejimda ular mavjud emas.
+"""
+import importlib.util
+import os
+import threading
+from functools import cached_property
+
+from survey.backends import DUCKDB_FORMATS, DUCKDB_MEMORY_LIMIT, QUERY_BACKEND, DuckDBBackend
+from survey.dataset import FILTERED, SurveyDataset, _sizeof
+from survey.diagnostics import DISABLED
+from survey.explorer import SEARCH_COLUMNS, SEARCHES, search_key
+from survey.filters import FILTER_DIMENSIONS, RANGE_COLUMNS, filter_key
+from survey.sections import detect_available
+from survey.snapshot import file_fingerprint
+from survey.summary import DESCRIBE_PERCENTILES
+
+
+class SQLDataset:
+    """Fayl ustidagi so'rovlar (``SurveyDataset`` interfeysi, jadvalsiz).
+
+    ``df`` har doim None: ilova va bo'limlar qatorlar darajasidagi amallarni
+    (bootstrap, yangi javoblar qo'shish) shu belgi bo'yicha o'chiradi.
+    """
+
+    df = None
+
+    def __init__(self, backend, version, available):
+        self.backend = backend
+        self.version = version
+        self.available = available
+        self._histograms = {}
+        self._densities = {}
+        self._filters = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_file(cls, path, **options):
+        """Parquet yoki CSV fayl uchun (CSV bir marta Parquet nusxaga o'tkaziladi)"""
+        options.setdefault('memory_limit', DUCKDB_MEMORY_LIMIT)
+        fingerprint = file_fingerprint(path)
+        backend = DuckDBBackend.from_file(path, fingerprint=fingerprint, **options)
+        return cls(backend, f"{os.path.basename(path)}@{fingerprint}", detect_available(backend.raw_columns))
+
+    @property
+    def columns(self):
+        return self.backend.columns
+
+    @cached_property
+    def rows(self):
+        return self.backend.row_count()
+
+    @cached_property
+    def summary(self):
+        return SQLSummary(self.backend)
+
+    @cached_property
+    def languages(self):
+        if self.backend.column_types().get('ProgrammingLanguages') != 'VARCHAR':
+            return None
+        return SQLLanguages(self.backend)
+
+    @cached_property
+    def explorer(self):
+        return SQLExplorer(self.backend, self.version)
+
+    def precompute(self):
+        """Qatorlar soni va raqamli ustunlar (qolgan hammasi so'rov vaqtida)"""
+        self.rows, self.summary
+        return self
+
+    def sketch(self, column):
+        """Ustun kvantillari (``QuantileSketch`` interfeysi, lekin aniq)"""
+        return SQLQuantiles(self.backend, column)
+
+    def histogram(self, column, nbins):
+        return self._memo(self._histograms, (column, nbins), lambda: self.backend.histogram(column, nbins))
+
+    def density(self, x, y):
+        return self._memo(self._densities, (x, y), lambda: self.backend.density(x, y))
+
+    def points(self, columns):
+        return self.backend.points(columns)
+
+    def languages_by(self, dimension):
+        return None if self.languages is None else self.languages.by_group(dimension)
+
+    def filter_values(self, dim):
+        """Global filtr uchun qiymatlar; ustun bo'yicha filtr bo'lmasa None"""
+        if dim not in FILTER_DIMENSIONS or dim not in self.columns:
+            return None
+        return self._memo(self._filters, ('values', dim), lambda: self.backend.distinct(dim))
+
+    def filter_bounds(self, col):
+        """Diapazon filtri chegaralari; ustun bo'yicha filtr bo'lmasa None"""
+        if col not in RANGE_COLUMNS or col not in self.summary.columns:
+            return None
+        return self._memo(self._filters, ('bounds', col), lambda: self.backend.bounds(col))
+
+    def filtered(self, selections=None, ranges=None, cache=None, diagnostics=DISABLED):
+        """Filtrlar qo'llangan ko'rinish (WHERE sharti bilan; filtr bo'lmasa - o'zi)"""
+        selections = {dim: values for dim, values in (selections or {}).items() if values}
+        ranges = dict(ranges or {})
+        if not selections and not ranges:
+            return self
+        cache = FILTERED if cache is None else cache
+        key = (self.version, filter_key(selections, ranges))
+        subset = cache.get(key)
+        diagnostics.cache('filter', subset is not None)
+        if subset is None:
+            subset = SQLDataset(self.backend.filtered(selections, ranges), f"{self.version}|{key[1]}", self.available)
+            cache.put(key, subset, subset.nbytes, sizeof=lambda view: view.nbytes)
+        else:
+            cache.refresh()
+        return subset
+
+    def append(self, batch):
+        raise ValueError("Jadval xotiraga yuklanmagan (DuckDB rejimi): yangi javoblarni qo'shib bo'lmaydi")
+
+    @property
+    def nbytes(self):
+        """Eslab qolingan so'rov natijalari hajmi (baytlarda; jadvalning o'zi xotirada emas)"""
+        with self._lock:
+            memos = [*self._histograms.values(), *self._densities.values(), *self._filters.values()]
+        return sum(_sizeof(value) for value in memos)
+
+    _memo = SurveyDataset._memo
+
+
+class SQLSummary:
+    """Raqamli ustunlar statistikasi (``NumericSummary.describe`` ko'rinishida)"""
+
+    def __init__(self, backend):
+        self.backend = backend
+        self.columns = backend.numeric_columns()
+
+    def describe(self, percentiles=DESCRIBE_PERCENTILES):
+        if not self.columns:
+            return None
+        return self.backend.describe(self.columns, percentiles)
+
+
+class SQLQuantiles:
+    """Bitta ustun kvantillari SQL orqali (``QuantileSketch`` o'rnida)"""
+
+    exact = True
+
+    def __init__(self, backend, column):
+        self.backend = backend
+        self.column = column
+
+    def quantile(self, q):
+        return self.backend.quantiles(self.column, q)
+
+    def median(self):
+        return self.quantile(0.5)
+
+
+class SQLLanguages:
+    """Tillar soni, birgalikda uchrashi va guruh x til jadvali (``LanguageMatrix`` o'rnida)"""
+
+    def __init__(self, backend, column='ProgrammingLanguages'):
+        self.backend = backend
+        self.column = column
+
+    def counts(self):
+        return self.backend.language_counts(self.column)
+
+    def cooccurrence(self):
+        return self.backend.language_pairs(self.column)
+
+    def by_group(self, dimension):
+        return self.backend.languages_by(self.column, dimension)
+
+
+class SQLExplorer:
+    """``TableExplorer`` interfeysi: qidiruv ILIKE, saralash ORDER BY, sahifa LIMIT/OFFSET bilan.
+
+    Qatorlar soni va ustun qiymatlari jarayon bo'yicha qidiruv keshida (``SEARCHES``) saqlanadi.
+    """
+
+    def __init__(self, backend, key, search_columns=SEARCH_COLUMNS, cache=None):
+        self.backend = backend
+        self.key = key
+        self.search_columns = [col for col in search_columns if col in backend.columns]
+        self.cache = SEARCHES if cache is None else cache
+
+    @property
+    def columns(self):
+        return self.backend.columns
+
+    @cached_property
+    def filter_columns(self):
+        return [col for col, kind in self.backend.column_types().items()
+                if kind == 'VARCHAR' and col != 'ProgrammingLanguages']
+
+    def values(self, column):
+        return self.cache.get_or_build((self.key, 'values', column), lambda: self.backend.distinct(column),
+                                       lambda values: sum(len(value) for value in values))
+
+    def count(self, search='', filters=None):
+        terms, filters = search_key(search, filters)
+        return self.cache.get_or_build(
+            (self.key, 'count', terms, filters),
+            lambda: self.backend.count_matching(self.search_columns, terms, filters), lambda n: 8
+        )
+
+    def page(self, number, size, search='', filters=None, sort=None, descending=False, columns=None):
+        total = self.count(search, filters)
+        start = min(max(number, 0), max(total - 1, 0) // size) * size
+        sort = (sort,) if isinstance(sort, str) else tuple(sort or ())
+        descending = tuple(descending) if isinstance(descending, (list, tuple)) else (descending,) * len(sort)
+        terms, filters = search_key(search, filters)
+        page = self.backend.page(start, size, self.search_columns, terms, filters, sort, descending, columns)
+        return page, total
+
+
+def sql_source(path, name=None):
+    """Manba jadvalsiz rejimda ochiladimi: DuckDB tanlangan va o'rnatilgan, format Parquet/CSV.
+
+    ``name`` berilmasa ``QUERY_BACKEND`` (chaqiruv paytidagi qiymati) olinadi.
+    """
+    name = QUERY_BACKEND if name is None else name
+    return name == 'duckdb' and bool(path) and os.path.splitext(path)[1].lower() in DUCKDB_FORMATS \
+        and importlib.util.find_spec('duckdb') is not None
+
+
+def open_sql_dataset(path, name=None, **options):
+    """``SURVEY_QUERY_BACKEND=duckdb`` va mos format bo'lsa jadvalsiz ``SQLDataset``, aks holda None"""
+    return SQLDataset.from_file(path, **options) if sql_source(path, name) else None
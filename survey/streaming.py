@@ -0,0 +1,115 @@
+"""Xotiraga sig'maydigan CSV fayllar uchun bo'laklab o'qish va bir o'tishli statistika.
+
+Fayl ``read_csv(chunksize=...)`` bilan bo'laklab o'qiladi, har bir bo'lak
+ustunlari ``column_mapping`` qoidalari bo'yicha nomlanadi va statistikaga
+qo'shiladi, so'ng tashlab yuboriladi - xotirada faqat bitta bo'lak va
+yig'indilar turadi:
+
+* har bir raqamli ustun uchun soni, Welford o'rtachasi va dispersiyasi, min, max;
+* kvartillar va maosh persentillari uchun KLL kvantil eskizlari;
+* korrelyatsiya uchun juftlik ko-momentlari (``CoMoments``).
+
+Natija umumiy ma'lumot bo'limidagi ``describe()`` jadvali, maosh
+kartochkalari va korrelyatsiya matritsasini jadvalni to'liq yuklamasdan
+beradi.
+"""
+import numpy as np
+import pandas as pd
+
+from survey.moments import CoMoments
+from survey.schema import standardize_columns
+from survey.snapshot import read_source
+from survey.summary import NumericSummary
+
+# Bir bo'lakdagi qatorlar soni
+CHUNK_ROWS = 200_000
+
+
+class StreamingSummary:
+    """Bo'laklab to'planadigan umumiy statistika (ustunlar birinchi bo'lakdan aniqlanadi)"""
+
+    def __init__(self, head_rows=10, seed=0):
+        self.head_rows = head_rows
+        self.seed = seed
+        self.rows = 0
+        self.chunks = 0
+        self.head = None
+        self.columns = None
+        self.numeric = None
+        self.comoments = None
+
+    def update(self, chunk):
+        """Standart nomlangan bo'lakni qo'shish"""
+        if self.columns is None:
+            self.head = chunk.head(self.head_rows).copy()
+            self.columns = chunk.select_dtypes(include='number').columns.tolist()
+            self.numeric = NumericSummary(self.columns, seed=self.seed)
+        elif len(self.head) < self.head_rows:
+            self.head = pd.concat([self.head, chunk.head(self.head_rows - len(self.head))], ignore_index=True)
+
+        # Keyingi bo'laklarda ustun matn bo'lib o'qilgan bo'lsa ham raqamga keltiriladi
+        numeric = pd.DataFrame({
+            col: pd.to_numeric(chunk[col], errors='coerce') if col in chunk.columns else np.nan
+            for col in self.columns
+        }, index=chunk.index)
+        self.numeric.update(numeric.to_numpy(dtype='float64', na_value=np.nan))
+        if self.comoments is None:
+            self.comoments = CoMoments.from_frame(numeric, self.columns)
+        else:
+            self.comoments = self.comoments.update(numeric)
+        self.rows += len(chunk)
+        self.chunks += 1
+        return self
+
+    def describe(self):
+        """``df[numeric_cols].describe()`` ko'rinishidagi jadval (kvartillar eskizdan)"""
+        return self.numeric.describe() if self.numeric is not None else None
+
+    def correlation(self):
+        """Pearson korrelyatsiya matritsasi (``df[numeric_cols].corr()`` bilan bir xil, ko-momentlardan)"""
+        if self.comoments is None or len(self.columns) < 2:
+            return None
+        return self.comoments.corr()
+
+    def correlation_pair(self, x, y):
+        """Bitta juftlik korrelyatsiyasi; ustunlardan biri bo'lmasa ``None``"""
+        if self.comoments is None or x not in self.columns or y not in self.columns:
+            return None
+        return self.comoments.pair(x, y)
+
+    def salary_metrics(self, percentiles):
+        """Maosh kartochkalari uchun qiymatlar (``compute_salary`` bilan bir xil kalitlar)"""
+        return self.numeric.metrics('Salary', percentiles) if self.numeric is not None else None
+
+
+def iter_csv_chunks(path, chunksize=CHUNK_ROWS, wave=None, **read_options):
+    """CSV faylni standart nomlangan bo'laklar ketma-ketligi sifatida o'qish.
+
+    ``wave`` berilsa, har bir bo'lakka ``SurveyWave`` ustuni qo'shiladi.
+    """
+    with pd.read_csv(path, chunksize=chunksize, **read_options) as reader:
+        for chunk in reader:
+            chunk = standardize_columns(chunk)
+            yield chunk if wave is None else chunk.assign(SurveyWave=wave)
+
+
+def stream_csv(path, summary=None, chunksize=CHUNK_ROWS, wave=None, on_chunk=None, **read_options):
+    """Faylni bo'laklab o'qib ``StreamingSummary`` ga qo'shish.
+
+    ``on_chunk(summary)`` - har bir bo'lakdan keyin chaqiriladi (masalan, jarayon ko'rsatkichi uchun).
+    """
+    summary = summary or StreamingSummary()
+    for chunk in iter_csv_chunks(path, chunksize, wave, **read_options):
+        summary.update(chunk)
+        if on_chunk is not None:
+            on_chunk(summary)
+    return summary
+
+
+def stream_file(path, name, summary=None, chunksize=CHUNK_ROWS, wave=None):
+    """CSV bo'laklab o'qiladi; boshqa formatlar (Excel) to'liq o'qilib bitta bo'lak sifatida qo'shiladi"""
+    summary = summary or StreamingSummary()
+    if name.endswith('.csv'):
+        return stream_csv(path, summary, chunksize, wave)
+    chunk = standardize_columns(read_source(path, name))
+    return summary.update(chunk if wave is None else chunk.assign(SurveyWave=wave))
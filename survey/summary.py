@@ -0,0 +1,167 @@
+"""Raqamli ustunlar umumiy statistikasi - bitta o'tishda va birlashtiriladigan.
+
+Jadval ``BLOCK_ROWS`` qatorli bloklar bo'yicha bir marta o'qiladi: har bir
+blok barcha raqamli ustunlar uchun bitta float massivga aylantiriladi va shu
+massivdan soni, o'rtacha, dispersiya (Welford/Chan), min, max hamda KLL
+kvantil eskizlari bir vaqtda yangilanadi. Blok protsessor keshiga sig'adi,
+shuning uchun ``describe()``, ``mean()``, ``median()``, ``min()`` va
+``max()`` larning har biri uchun jadval qayta ko'rib chiqilmaydi.
+
+Bo'laklar (to'lqinlar, yangi qo'shilgan javoblar, fayl bo'laklari) uchun
+alohida qurilgan natijalar ``merge`` bilan birlashtiriladi. Qatorlar soni
+eskiz chegarasidan (``DEFAULT_EXACT_LIMIT``) oshmaguncha kvartillar
+``describe()`` bilan aynan bir xil, undan katta jadvallarda - eskiz
+xatoligi chegarasida.
+"""
+import numpy as np
+import pandas as pd
+
+from survey.quantiles import QuantileSketch
+from survey.schema import numeric_columns
+
+# Bir blokdagi qatorlar soni
+BLOCK_ROWS = 1 << 16
+
+DESCRIBE_PERCENTILES = [0.25, 0.5, 0.75]
+
+
+class RunningStats:
+    """Ustunlar bo'yicha soni, o'rtacha, kvadrat og'ishlar yig'indisi (M2), min va max.
+
+    Bo'lak statistikasi alohida hisoblanib, Chan formulasi bilan qo'shiladi -
+    bu Welford usulining bo'laklar uchun ko'rinishi, katta qiymatlarda ham
+    ``sum(x^2) - sum(x)^2/n`` kabi aniqlik yo'qotmaydi.
+    """
+
+    def __init__(self, columns):
+        self.columns = list(columns)
+        size = len(self.columns)
+        self.count = np.zeros(size)
+        self.mean = np.zeros(size)
+        self.m2 = np.zeros(size)
+        self.min = np.full(size, np.inf)
+        self.max = np.full(size, -np.inf)
+
+    def update(self, values):
+        """``values`` - (qatorlar, ustunlar) float massivi, NaN'lar hisobga olinmaydi"""
+        count = np.sum(~np.isnan(values), axis=0).astype('float64')
+        seen = count > 0
+        if not seen.any():
+            return self
+        with np.errstate(invalid='ignore', divide='ignore'):
+            mean = np.where(seen, np.nansum(values, axis=0) / count, 0.0)
+            m2 = np.nansum((values - mean) ** 2, axis=0)
+        missing = np.isnan(values)
+        self.merge_arrays(count, mean, m2,
+                          np.where(missing, np.inf, values).min(axis=0),
+                          np.where(missing, -np.inf, values).max(axis=0))
+        return self
+
+    def merge_arrays(self, count, mean, m2, minimum, maximum):
+        total = self.count + count
+        with np.errstate(invalid='ignore', divide='ignore'):
+            delta = mean - self.mean
+            self.mean = np.where(total > 0, self.mean + delta * count / total, 0.0)
+            self.m2 = np.where(total > 0, self.m2 + m2 + delta ** 2 * self.count * count / total, 0.0)
+        self.count = total
+        self.min = np.minimum(self.min, minimum)
+        self.max = np.maximum(self.max, maximum)
+
+    def merge(self, other):
+        """Boshqa to'plam statistikasini qo'shish (ustunlar bir xil bo'lishi kerak)"""
+        if other.columns != self.columns:
+            raise ValueError("Statistika ustunlari mos emas")
+        self.merge_arrays(other.count, other.mean, other.m2, other.min, other.max)
+        return self
+
+    def std(self):
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return np.where(self.count > 1, np.sqrt(self.m2 / (self.count - 1)), np.nan)
+
+
+class NumericSummary:
+    """Raqamli ustunlar statistikasi va kvantil eskizlari"""
+
+    def __init__(self, columns, seed=0):
+        self.columns = list(columns)
+        self.seed = seed
+        self.rows = 0
+        self.stats = RunningStats(self.columns)
+        self.sketches = {col: QuantileSketch(seed=seed) for col in self.columns}
+
+    @classmethod
+    def from_frame(cls, df, columns=None, seed=0, block_rows=BLOCK_ROWS):
+        """Jadvaldan bitta o'tishda qurish (standart - barcha raqamli ustunlar)"""
+        summary = cls(numeric_columns(df) if columns is None else columns, seed)
+        if not summary.columns:
+            return summary
+        frame = df[summary.columns]
+        for start in range(0, len(frame), block_rows):
+            summary.update(frame.iloc[start:start + block_rows].to_numpy(dtype='float64', na_value=np.nan))
+        return summary
+
+    def update(self, values):
+        """(qatorlar, ustunlar) float massivini qo'shish"""
+        self.stats.update(values)
+        for i, col in enumerate(self.columns):
+            self.sketches[col].update(values[:, i])
+        self.rows += len(values)
+        return self
+
+    def merge(self, other):
+        """Ikki bo'lak statistikasini birlashtirish (ikkalasi o'zgarmaydi)"""
+        merged = NumericSummary(self.columns, self.seed)
+        merged.rows = self.rows + other.rows
+        merged.stats.merge(self.stats).merge(other.stats)
+        merged.sketches = {col: self.sketches[col].merge(other.sketches[col]) for col in self.columns}
+        return merged
+
+    @property
+    def nbytes(self):
+        """Eskizlar hajmi (baytlarda); ustunlar statistikasi ustunlar soniga bog'liq, hisobga olinmaydi"""
+        return sum(sketch.nbytes for sketch in self.sketches.values())
+
+    def describe(self, percentiles=DESCRIBE_PERCENTILES):
+        """``df[numeric_cols].describe()`` ko'rinishidagi jadval; ustunlar bo'lmasa None"""
+        if not self.columns:
+            return None
+        stats = self.stats
+        quantiles = np.array([self.sketches[col].quantile(percentiles) if self.sketches[col].n
+                              else [np.nan] * len(percentiles) for col in self.columns]).T
+        seen = stats.count > 0
+        # Qiymatsiz ustunda (bo'sh yoki faqat NaN) count'dan boshqa maydonlar NaN - describe() kabi
+        rows = [stats.count, np.where(seen, stats.mean, np.nan), stats.std(), np.where(seen, stats.min, np.nan),
+                *quantiles, np.where(seen, stats.max, np.nan)]
+        index = ['count', 'mean', 'std', 'min'] + [f"{q * 100:g}%" for q in percentiles] + ['max']
+        return pd.DataFrame(np.vstack(rows), index=index, columns=self.columns)
+
+    def column(self, column):
+        """Bitta ustun statistikasi (``AggregateCube.rollup`` qatori bilan bir xil maydonlar)"""
+        i = self.columns.index(column)
+        count, mean = self.stats.count[i], self.stats.mean[i]
+        seen = count > 0
+        return pd.Series({
+            'n': self.rows,
+            'count': count,
+            'sum': mean * count,
+            'sumsq': self.stats.m2[i] + count * mean ** 2,
+            'min': self.stats.min[i] if seen else np.nan,
+            'max': self.stats.max[i] if seen else np.nan,
+            'mean': mean if seen else np.nan,
+            'std': self.stats.std()[i],
+        })
+
+    def metrics(self, column, percentiles):
+        """Metrika kartochkalari uchun: o'rtacha, mediana, persentillar, min va max; qiymat bo'lmasa None"""
+        if column not in self.sketches or self.sketches[column].n == 0:
+            return None
+        i = self.columns.index(column)
+        sketch = self.sketches[column]
+        return {
+            'mean': self.stats.mean[i],
+            'median': sketch.median(),
+            'percentiles': dict(zip(percentiles, sketch.quantile(percentiles))),
+            'exact_quantiles': sketch.exact,
+            'min': self.stats.min[i],
+            'max': self.stats.max[i],
+        }
@@ -0,0 +1,195 @@
+"""Namunali (sintetik) so'rovnoma ma'lumotlari generatori.
+
+Ma'lumotlarni yuklab bo'lmaganda ilova shu generatordan foydalanadi, yuklama
+testlari va benchmarklar uchun ham shu generator ishlatiladi. Qatorlar
+``np.random.Generator`` bilan o'zgarmas o'lchamdagi bo'laklarda, to'liq
+vektorlashtirilgan holda yaratiladi - 10M qator ham xotiraga sig'adi.
+
+Bog'liqliklar: maosh lavozim, mamlakat, ta'lim va tajribaga bog'liq; yosh
+tajribaga bog'liq; ish-hayot muvozanati ish turiga, qoniqish esa maoshga
+bog'liq. Dasturlash tillari lavozimga qarab tanlanadigan multi-hot to'plam.
+
+Ishga tushirish::
+
+    python -m survey.synthetic --rows 10000000 --output survey.csv
+    python -m survey.synthetic --rows 10000000 --output survey.parquet --seed 7
+"""
+import argparse
+import os
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_SEED = 42
+DEFAULT_CHUNK_SIZE = 1_000_000
+
+ROLES = ['Data Scientist', 'Data Analyst', 'Data Engineer', 'Machine Learning Engineer', 'BI Developer']
+COUNTRIES = ['USA', 'UK', 'Canada', 'Germany', 'France', 'Australia', 'India', 'Japan', 'China', 'Brazil']
+EDUCATION = ["Bachelor's", "Master's", 'PhD', 'Self-taught', 'Bootcamp']
+LANGUAGES = ['Python', 'R', 'SQL', 'Java', 'JavaScript', 'C++', 'Julia']
+GENDERS = ['Male', 'Female', 'Other', 'Prefer not to say']
+REMOTE_WORK = ['Fully Remote', 'Hybrid', 'In Office']
+
+ROLE_WEIGHTS = [0.25, 0.35, 0.2, 0.1, 0.1]
+COUNTRY_WEIGHTS = [0.3, 0.1, 0.08, 0.08, 0.06, 0.05, 0.15, 0.05, 0.08, 0.05]
+EDUCATION_WEIGHTS = [0.4, 0.3, 0.08, 0.14, 0.08]
+GENDER_WEIGHTS = [0.62, 0.33, 0.02, 0.03]
+REMOTE_WEIGHTS = [0.3, 0.45, 0.25]
+
+# Lavozim bo'yicha boshlang'ich yillik maosh (USD)
+ROLE_BASE_SALARY = [75_000, 55_000, 72_000, 85_000, 58_000]
+# Mamlakat va ta'lim bo'yicha maosh koeffitsientlari
+COUNTRY_SALARY_FACTOR = [1.3, 1.0, 1.05, 1.0, 0.9, 1.05, 0.45, 0.85, 0.6, 0.5]
+EDUCATION_SALARY_FACTOR = [1.0, 1.1, 1.25, 0.95, 0.92]
+# Har bir yil tajriba uchun maosh o'sishi
+EXPERIENCE_GROWTH = 0.045
+SALARY_RANGE = (20_000, 300_000)
+
+# Lavozim x til: shu lavozimdagi respondent tilni tanlash ehtimoli
+ROLE_LANGUAGE_PROBABILITY = np.array([
+    # Python R    SQL   Java  JS    C++   Julia
+    [0.90, 0.45, 0.70, 0.10, 0.10, 0.10, 0.08],  # Data Scientist
+    [0.55, 0.30, 0.90, 0.05, 0.10, 0.02, 0.02],  # Data Analyst
+    [0.80, 0.05, 0.90, 0.35, 0.15, 0.10, 0.02],  # Data Engineer
+    [0.95, 0.15, 0.45, 0.15, 0.10, 0.35, 0.10],  # Machine Learning Engineer
+    [0.25, 0.10, 0.95, 0.05, 0.15, 0.02, 0.01],  # BI Developer
+])
+
+# Matnli ustunlar turi (pandas 2 da object, pandas 3 da str) va jadval sxemasi
+TEXT_DTYPE = pd.Series([], dtype=str).dtype
+SCHEMA = {
+    'Role': TEXT_DTYPE, 'Country': TEXT_DTYPE, 'Education': TEXT_DTYPE, 'YearsExperience': np.dtype('int64'),
+    'Salary': np.dtype('int64'), 'WorkLifeBalance': np.dtype('int64'), 'JobSatisfaction': np.dtype('int64'),
+    'CareerSwitch': TEXT_DTYPE, 'ProgrammingLanguages': TEXT_DTYPE, 'Age': np.dtype('int64'),
+    'Gender': TEXT_DTYPE, 'RemoteWork': TEXT_DTYPE,
+}
+
+# Bitlar niqobi (0..127) bo'yicha tillar satri: 1-bit - Python, 2-bit - R va h.k.
+_LANGUAGE_STRINGS = np.array([
+    ', '.join(language for bit, language in enumerate(LANGUAGES) if mask >> bit & 1)
+    for mask in range(1 << len(LANGUAGES))
+], dtype=object)
+
+
+def _choice(rng, values, weights, n):
+    """Kategoriya qiymatlarini og'irliklar bo'yicha tanlash (kodlar va qiymatlar)"""
+    codes = rng.choice(len(values), size=n, p=np.asarray(weights) / np.sum(weights))
+    return codes, np.asarray(values, dtype=object)[codes]
+
+
+def generate_chunk(rng, n):
+    """Bitta bo'lak: ``n`` qatorli so'rovnoma jadvali"""
+    role, roles = _choice(rng, ROLES, ROLE_WEIGHTS, n)
+    country, countries = _choice(rng, COUNTRIES, COUNTRY_WEIGHTS, n)
+    education, educations = _choice(rng, EDUCATION, EDUCATION_WEIGHTS, n)
+    remote, remotes = _choice(rng, REMOTE_WORK, REMOTE_WEIGHTS, n)
+    _, genders = _choice(rng, GENDERS, GENDER_WEIGHTS, n)
+
+    # Tajriba geometrik taqsimotga yaqin (ko'pchilik yosh mutaxassislar), yosh tajribaga bog'liq
+    experience = np.minimum(rng.geometric(0.12, n) - 1, 40)
+    age = np.clip(22 + experience + rng.normal(3, 3, n).round(), 20, 70).astype(np.int64)
+
+    salary = (
+        np.take(ROLE_BASE_SALARY, role)
+        * np.take(COUNTRY_SALARY_FACTOR, country)
+        * np.take(EDUCATION_SALARY_FACTOR, education)
+        * (1 + EXPERIENCE_GROWTH) ** np.minimum(experience, 25)
+        * rng.lognormal(0, 0.18, n)
+    )
+    salary = (np.clip(salary, *SALARY_RANGE) // 500 * 500).astype(np.int64)
+
+    # Qoniqish maosh (mamlakat ichidagi nisbiy) bilan, ish-hayot muvozanati ish turi bilan bog'liq
+    relative_salary = np.log(salary / (np.take(ROLE_BASE_SALARY, role) * np.take(COUNTRY_SALARY_FACTOR, country)))
+    satisfaction = np.clip(np.rint(6 + 2.5 * relative_salary + rng.normal(0, 1.8, n)), 1, 10).astype(np.int64)
+    wlb = np.clip(np.rint(np.take([7.0, 6.5, 5.5], remote) + rng.normal(0, 1.8, n)), 1, 10).astype(np.int64)
+
+    # Tillar: har bir til uchun lavozimga bog'liq Bernulli bitlari, kamida bitta til tanlanadi
+    chosen = rng.random((n, len(LANGUAGES))) < ROLE_LANGUAGE_PROBABILITY[role]
+    masks = chosen @ (1 << np.arange(len(LANGUAGES)))
+    top_language = ROLE_LANGUAGE_PROBABILITY.argmax(axis=1)[role]
+    masks = np.where(masks == 0, 1 << top_language, masks)
+
+    frame = pd.DataFrame({
+        'Role': roles,
+        'Country': countries,
+        'Education': educations,
+        'YearsExperience': experience,
+        'Salary': salary,
+        'WorkLifeBalance': wlb,
+        'JobSatisfaction': satisfaction,
+        'CareerSwitch': np.where(rng.random(n) < 0.35, 'Yes', 'No').astype(object),
+        'ProgrammingLanguages': _LANGUAGE_STRINGS[masks],
+        'Age': age,
+        'Gender': genders,
+        'RemoteWork': remotes,
+    })
+    # Bo'sh bo'lakda matnli ustunlar turi aniqlanmaydi - sxemadagi turga keltiriladi
+    return frame.astype({col: dtype for col, dtype in SCHEMA.items() if frame[col].dtype != dtype})
+
+
+def generate_survey(n, seed=DEFAULT_SEED, chunk_size=DEFAULT_CHUNK_SIZE):
+    """``n`` qatorni ``chunk_size`` dan oshmaydigan bo'laklarda yaratish (generator).
+
+    Bir xil ``seed`` va ``chunk_size`` uchun natija har doim bir xil. ``n=0``
+    bo'lsa ustunlari va turlari o'sha, bitta bo'sh bo'lak qaytariladi.
+    """
+    rng = np.random.default_rng(seed)
+    for start in range(0, max(n, 1), chunk_size):
+        yield generate_chunk(rng, min(chunk_size, n - start))
+
+
+def sample_survey(n=500, seed=DEFAULT_SEED, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Butun namunali jadval bitta DataFrame sifatida"""
+    chunks = list(generate_survey(n, seed, chunk_size))
+    if len(chunks) == 1:
+        return chunks[0]
+    return pd.concat(chunks, ignore_index=True)
+
+
+def write_survey(path, n, seed=DEFAULT_SEED, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Namunali ma'lumotlarni bo'laklab faylga yozish (butun jadval xotirada to'planmaydi).
+
+    Format kengaytmadan aniqlanadi: ``.csv``, ``.parquet`` yoki ``.arrow``/``.feather``
+    (Arrow IPC; ustunli formatlar uchun ``pyarrow`` kerak).
+    """
+    extension = os.path.splitext(path)[1].lower()
+    chunks = generate_survey(n, seed, chunk_size)
+    if extension == '.csv':
+        for index, chunk in enumerate(chunks):
+            chunk.to_csv(path, mode='w' if index == 0 else 'a', header=index == 0, index=False)
+        return path
+
+    if extension not in ('.parquet', '.arrow', '.feather'):
+        raise ValueError(f"Qo'llab-quvvatlanmaydigan format: {extension}")
+
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    writer = None
+    try:
+        for chunk in chunks:
+            table = pa.Table.from_pandas(chunk, preserve_index=False)
+            if writer is None:
+                schema = table.schema.remove_metadata()
+                writer = (pq.ParquetWriter(path, schema) if extension == '.parquet'
+                          else pa.ipc.new_file(path, schema))
+            writer.write_table(table.cast(schema))
+    finally:
+        if writer is not None:
+            writer.close()
+    return path
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Namunali so'rovnoma ma'lumotlarini faylga yozish")
+    parser.add_argument('--rows', type=int, default=500)
+    parser.add_argument('--output', default='sample_survey.csv', help=".csv, .parquet yoki .arrow fayl")
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED)
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE)
+    args = parser.parse_args(argv)
+    write_survey(args.output, args.rows, args.seed, args.chunk_size)
+    print(f"{args.rows:,} qator: {args.output}")
+
+
+if __name__ == '__main__':
+    main()
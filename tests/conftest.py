@@ -0,0 +1,20 @@
+import os
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Repozitoriya oxiriga qo'shiladi: ildizdagi streamlit.py haqiqiy streamlit paketini yashirmasligi kerak
+sys.path[:] = [path for path in sys.path if os.path.abspath(path or '.') != ROOT]
+sys.path.append(ROOT)
+
+# Yuklash keshi va ustunli nusxalar foydalanuvchi keshiga emas, vaqtinchalik papkaga yoziladi
+# (survey modullari kesh joyini import paytida o'qiydi)
+os.environ.setdefault('SURVEY_CACHE_DIR', tempfile.mkdtemp(prefix='survey-tests-'))
+
+
+def pytest_configure(config):
+    config.addinivalue_line('markers', "slow: mashinaga bog'liq vaqt o'lchovlari (faqat -m slow bilan bajariladi)")
+    # Standart ishga tushirishda sekin testlar tanlanmaydi (``addopts = -m "not slow"`` bilan bir xil);
+    # -m berilsa, o'sha ifoda ishlatiladi
+    if not config.option.markexpr:
+        config.option.markexpr = 'not slow'
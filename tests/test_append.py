@@ -0,0 +1,43 @@
+"""Yangi javoblarni qo'shish: noto'g'ri to'plamlar umumiy ma'lumotlarni o'zgartirmaydi"""
+import io
+
+import pandas as pd
+import pytest
+
+from survey.dataset import DatasetStore
+from survey.ingest import prepare_dataset
+from survey.schema import standardize_columns
+from survey.synthetic import sample_survey
+
+
+@pytest.fixture
+def store():
+    dataset, _ = prepare_dataset(sample_survey(500), 'v1')
+    return DatasetStore(dataset)
+
+
+@pytest.mark.parametrize('batch, message', [
+    (pd.DataFrame({'foo': [1], 'bar': [2]}), "Noma'lum ustunlar"),
+    (sample_survey(5, seed=3).assign(Extra=1), "Noma'lum ustunlar: Extra"),
+    (sample_survey(5, seed=3).drop(columns=['Gender']), "Yetishmaydigan ustunlar: Gender"),
+    (sample_survey(5, seed=3).assign(Salary='abc'), "'Salary'"),
+    (sample_survey(5, seed=3).assign(Role=5), "'Role'"),
+    (sample_survey(5, seed=3).iloc[:0], "bo'sh"),
+])
+def test_invalid_batch_is_rejected(store, batch, message):
+    before = store.current
+    with pytest.raises(ValueError, match=message):
+        store.append(standardize_columns(batch))
+    assert store.current is before
+    assert store.current.version == 'v1'
+
+
+def test_csv_batch_keeps_dtypes(store):
+    dtypes = store.current.df.dtypes
+    buffer = io.StringIO()
+    sample_survey(50, seed=4).to_csv(buffer, index=False)
+    buffer.seek(0)
+    appended = store.append(standardize_columns(pd.read_csv(buffer)), key='batch')
+    assert appended.version == 'v1#550'
+    assert appended.df.dtypes.equals(dtypes)
+    assert len(appended.df) == 550
@@ -0,0 +1,82 @@
+"""Pandas (agregat kub) va DuckDB backendlari bir xil natija qaytaradi"""
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip('duckdb')
+
+from survey.backends import DuckDBBackend, PandasBackend, attach_backend  # noqa: E402
+from survey.ingest import load_local, prepare_dataset  # noqa: E402
+from survey.synthetic import write_survey  # noqa: E402
+
+ROWS = 20_000
+
+QUERIES = {
+    'counts:Role': lambda b: b.counts('Role'),
+    'counts:Country': lambda b: b.counts('Country'),
+    'group_mean:Role': lambda b: b.group_mean('Role', 'Salary'),
+    'group_mean:Education': lambda b: b.group_mean('Education', 'Salary'),
+    'group_mean:RemoteWork': lambda b: b.group_mean('RemoteWork', 'Salary'),
+    'crosstab:Role x Education': lambda b: b.crosstab('Role', 'Education'),
+    'rollup:Role': lambda b: b.rollup(['Role'], 'JobSatisfaction'),
+    'summary:Salary': lambda b: b.summary('Salary'),
+    'correlation': lambda b: b.correlation(['Salary', 'YearsExperience', 'JobSatisfaction',
+                                            'WorkLifeBalance', 'Age']),
+    'spearman': lambda b: b.correlation(['Salary', 'YearsExperience', 'Age'], method='spearman'),
+    'binned_mean:Salary': lambda b: b.binned_mean('Salary', [20_000.0, 50_000.0, 80_000.0, 110_000.0, 200_000.0],
+                                                  'WorkLifeBalance'),
+}
+
+FILTERS = {
+    'barcha qatorlar': (None, None),
+    'lavozim va maosh': ({'Role': ['Data Scientist', 'Data Engineer']}, {'Salary': (60_000.0, 120_000.0)}),
+    'mamlakat': ({'Country': ['USA']}, None),
+}
+
+
+def assert_same(expected, actual):
+    """Natijalar bir xilligi (indeks turlari - category yoki matn - hisobga olinmaydi)"""
+    if isinstance(expected, pd.Series):
+        expected, actual = expected.to_frame(), actual.to_frame()
+    expected = expected.rename(index=str, columns=str)
+    actual = actual.rename(index=str, columns=str)
+    assert list(expected.index) == list(actual.index)
+    assert list(expected.columns) == list(actual.columns)
+    np.testing.assert_allclose(actual.to_numpy(dtype='float64'), expected.to_numpy(dtype='float64'),
+                               rtol=1e-9, atol=1e-9, equal_nan=True)
+
+
+@pytest.fixture(scope='module', params=['parquet', 'csv'])
+def backends(request, tmp_path_factory):
+    workdir = tmp_path_factory.mktemp(request.param)
+    path = str(workdir / f"survey.{request.param}")
+    write_survey(path, ROWS)
+    df, _, version = load_local(path)
+    dataset, _ = prepare_dataset(df, version)
+    return dataset, DuckDBBackend.from_file(path)
+
+
+@pytest.mark.parametrize('label', FILTERS)
+@pytest.mark.parametrize('query', QUERIES)
+def test_backends_agree(backends, query, label):
+    dataset, duckdb_backend = backends
+    selections, ranges = FILTERS[label]
+    subset = dataset.filtered(selections, ranges)
+    assert_same(QUERIES[query](PandasBackend(subset)), QUERIES[query](duckdb_backend.filtered(selections, ranges)))
+
+
+def test_row_count_after_filter(backends):
+    dataset, duckdb_backend = backends
+    selections, ranges = FILTERS['lavozim va maosh']
+    assert duckdb_backend.filtered(selections, ranges).row_count() == len(dataset.filtered(selections, ranges).df)
+
+
+def test_attach_backend_limits_duckdb_memory(tmp_path):
+    path = str(tmp_path / 'survey.parquet')
+    write_survey(path, 100)
+    df, _, version = load_local(path)
+    dataset, _ = prepare_dataset(df, version)
+    backend = attach_backend(dataset, path, 'duckdb', memory_limit='256MB')
+    assert dataset.backend is backend and backend.name == 'duckdb'
+    limit = backend.query("SELECT current_setting('memory_limit') AS value")['value'].iloc[0]
+    assert limit.replace(' ', '').upper() in {'256MB', '244.1MIB'}
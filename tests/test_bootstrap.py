@@ -0,0 +1,74 @@
+"""Bootstrap oraliqlari: oddiy qayta tanlov tsikli bilan mos, qamrovi to'g'ri, oqimlar sonidan qat'i nazar bir xil"""
+import numpy as np
+import pandas as pd
+import pytest
+
+import survey.bootstrap
+from survey.bootstrap import bootstrap_means, group_intervals
+
+
+def naive_interval(values, replicates, confidence=0.95, seed=0):
+    """Har bir replikatsiya uchun alohida qaytariladigan tanlov (vektorlashmagan tekshiruv nusxasi)"""
+    rng = np.random.default_rng(seed)
+    means = [rng.choice(values, size=len(values), replace=True).mean() for _ in range(replicates)]
+    alpha = (1 - confidence) / 2
+    return np.quantile(means, [alpha, 1 - alpha])
+
+
+@pytest.mark.parametrize('kind', ['continuous', 'scores'])
+def test_matches_naive_resampling(kind):
+    # Uzluksiz qiymatlar - indekslar matritsasi, 1-10 baholar - multinomial yo'li
+    rng = np.random.default_rng(1)
+    values = rng.lognormal(11, 0.5, 400) if kind == 'continuous' else rng.integers(1, 11, 3000).astype(float)
+    result = group_intervals(pd.Series(['A'] * len(values)), values, replicates=4000, seed=3)
+    low, high = naive_interval(values, 4000, seed=7)
+    width = high - low
+    assert result.loc['A', 'mean'] == pytest.approx(values.mean())
+    assert result.loc['A', 'n'] == len(values)
+    assert abs(result.loc['A', 'low'] - low) < 0.1 * width
+    assert abs(result.loc['A', 'high'] - high) < 0.1 * width
+    # Kenglik normal yaqinlashishdagi 2 * 1.96 * SE ga yaqin
+    se = values.std(ddof=1) / np.sqrt(len(values))
+    assert (result.loc['A', 'high'] - result.loc['A', 'low']) == pytest.approx(2 * 1.96 * se, rel=0.1)
+
+
+def test_coverage_is_close_to_confidence():
+    rng = np.random.default_rng(2)
+    trials, size = 300, 60
+    values = rng.normal(50, 10, (trials, size)).ravel()
+    groups = np.repeat(np.arange(trials), size)
+    result = group_intervals(pd.Series(groups), values, replicates=500, seed=4)
+    covered = ((result['low'] <= 50) & (50 <= result['high'])).mean()
+    # Percentil bootstrap kichik tanlovlarda biroz tor: 0.95 atrofida
+    assert 0.89 <= covered <= 0.99
+
+
+def test_deterministic_for_fixed_seed_across_workers(monkeypatch):
+    # Kichik bloklar: har bir guruh replikatsiyalari bir nechta oqim vazifasiga bo'linadi
+    monkeypatch.setattr(survey.bootstrap, 'MAX_BLOCK_CELLS', 4096)
+    rng = np.random.default_rng(3)
+    values = np.concatenate([rng.normal(size=2000), rng.integers(0, 5, 2000)])
+    codes = np.concatenate([rng.integers(0, 7, 2000), rng.integers(-1, 7, 2000)])
+    serial = bootstrap_means(values, codes, 7, replicates=500, seed=9, workers=1)
+    for workers in [2, 8]:
+        np.testing.assert_array_equal(bootstrap_means(values, codes, 7, replicates=500, seed=9, workers=workers),
+                                      serial)
+    assert not np.array_equal(bootstrap_means(values, codes, 7, replicates=500, seed=10, workers=1), serial)
+
+
+def test_empty_input():
+    result = group_intervals(pd.Series([], dtype=object, name='Role'), [], replicates=100)
+    assert result.empty and list(result.columns) == ['mean', 'low', 'high', 'n']
+    means = bootstrap_means([], [], 3, replicates=50)
+    assert means.shape == (3, 50) and np.isnan(means).all()
+
+
+def test_single_value_and_missing_groups():
+    groups = pd.Series(['A', 'B', 'B', 'C', None], name='Role')
+    values = [5.0, 1.0, 3.0, np.nan, 7.0]
+    result = group_intervals(groups, values, replicates=200)
+    # C'da faqat NaN, oxirgi qator guruhsiz - ikkalasi ham tashlab yuboriladi
+    assert result.index.tolist() == ['A', 'B'] and result.index.name == 'Role'
+    assert result.loc['A'].tolist() == [5.0, 5.0, 5.0, 1]
+    assert result.loc['B', 'mean'] == 2.0 and result.loc['B', 'n'] == 2
+    assert 1.0 <= result.loc['B', 'low'] <= result.loc['B', 'high'] <= 3.0
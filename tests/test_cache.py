@@ -0,0 +1,232 @@
+"""Diskdagi yuklash keshi: ETag bilan qayta tekshirish, tarmoqsiz zaxira va tozalash (mahalliy HTTP server)"""
+import hashlib
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+import survey.cache
+from survey.cache import ACCESS_RESOLUTION, DiskCache, cached_download, cached_get, cached_get_file
+
+
+class SurveyServer:
+    """Bitta faylni ETag bilan beradigan mahalliy server; so'rov sarlavhalarini yozib boradi"""
+
+    def __init__(self, body=b"Role,Salary\nData Analyst,70000\n"):
+        self.body = body
+        self.requests = []
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                server.requests.append(dict(self.headers))
+                etag = f'"{hashlib.sha1(server.body).hexdigest()}"'
+                if self.headers.get('If-None-Match') == etag:
+                    self.send_response(304)
+                    self.send_header('ETag', etag)
+                    self.end_headers()
+                    return
+                self.send_response(200)
+                self.send_header('ETag', etag)
+                self.send_header('Content-Length', str(len(server.body)))
+                self.end_headers()
+                self.wfile.write(server.body)
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}/survey.csv"
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+class Clock:
+    def __init__(self, now=1_000_000.0):
+        self.now = now
+
+    def time(self):
+        return self.now
+
+
+@pytest.fixture
+def server():
+    server = SurveyServer()
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(survey.cache, 'time', clock)
+    return clock
+
+
+def test_revalidates_with_if_none_match(server, tmp_path):
+    cache = DiskCache(str(tmp_path))
+    content, from_cache = cached_get(server.url, cache)
+    assert (content, from_cache) == (server.body, False)
+    assert 'If-None-Match' not in server.requests[0]
+
+    content, from_cache = cached_get(server.url, cache)
+    assert (content, from_cache) == (server.body, True)
+    assert server.requests[1]['If-None-Match'] == f'"{hashlib.sha1(server.body).hexdigest()}"'
+
+    server.body = b"Role,Salary\nData Engineer,90000\n"
+    content, from_cache = cached_get(server.url, cache)
+    assert (content, from_cache) == (server.body, False)
+
+
+def test_falls_back_to_cache_when_network_is_down(server, tmp_path):
+    cache = DiskCache(str(tmp_path))
+    body, url = server.body, server.url
+    cached_get(url, cache)
+    server.stop()
+    assert cached_get(url, cache, timeout=2) == (body, True)
+    with pytest.raises(requests.RequestException):
+        cached_get(url, DiskCache(str(tmp_path / 'empty')), timeout=2)
+
+
+def test_expired_entry_is_revalidated_and_refreshed(server, tmp_path, clock):
+    cache = DiskCache(str(tmp_path), max_age=60)
+    cached_get(server.url, cache)
+    key = cache.make_key(server.url)
+    clock.now += 61
+    assert cache.get(key, stale=True) is not None
+    # Muddati o'tgan yozuv ham ETag bilan tekshiriladi; 304 uning yoshini yangilaydi
+    assert cached_get(server.url, cache) == (server.body, True)
+    assert 'If-None-Match' in server.requests[-1]
+    assert cache.get(key) is not None
+
+
+def test_frequent_reads_do_not_extend_max_age(tmp_path, clock):
+    cache = DiskCache(str(tmp_path), max_age=60)
+    cache.put('a', b'x' * 10)
+    for _ in range(6):
+        clock.now += 10
+        assert cache.get('a') is not None
+    clock.now += 10
+    assert cache.get('a') is None
+    # Muddati o'tgan yozuv o'chirilmaydi - u qayta tekshirish va tarmoqsiz holat uchun zaxira
+    assert cache.get('a', stale=True) is not None
+    assert os.path.exists(cache.data_path('a'))
+
+
+def test_expired_entries_are_not_evicted_by_age(tmp_path, clock):
+    cache = DiskCache(str(tmp_path), max_age=60)
+    cache.put('old', b'x' * 10)
+    clock.now += 61
+    cache.put('new', b'y' * 10)
+    assert cache.get('old', stale=True) is not None
+    assert cache.get('new') is not None
+
+
+def test_expired_entry_is_served_when_network_is_down(server, tmp_path, clock):
+    cache = DiskCache(str(tmp_path), max_age=1)
+    item = {'name': 'survey.csv', 'download_url': server.url, 'sha': ''}
+    path = cached_get_file(item, cache)
+    listing, _ = cached_get(server.url + '?listing', cache)
+    clock.now += 2
+    server.stop()
+
+    warnings = []
+    assert cached_get_file(item, cache, timeout=2, on_warning=warnings.append) == path
+    with open(path, 'rb') as f:
+        assert f.read() == server.body
+    assert cached_get(server.url + '?listing', cache, timeout=2, on_warning=warnings.append) == (listing, True)
+    assert len(warnings) == 2 and all("keshdagi nusxa" in message for message in warnings)
+
+
+def test_expired_download_is_revalidated_with_etag(server, tmp_path, clock):
+    cache = DiskCache(str(tmp_path), max_age=60)
+    item = {'name': 'survey.csv', 'download_url': server.url}
+    cached_get_file(item, cache)
+    cached_get_file(item, cache)
+    assert len(server.requests) == 1
+    clock.now += 61
+    cached_get_file(item, cache)
+    assert server.requests[-1]['If-None-Match'] == f'"{hashlib.sha1(server.body).hexdigest()}"'
+    assert cache.get(cache.make_key('survey.csv', '')) is not None
+
+
+def test_content_addressed_entries_never_expire(server, tmp_path, clock):
+    cache = DiskCache(str(tmp_path), max_age=60)
+    item = {'name': 'survey.csv', 'download_url': server.url, 'sha': 'abc123'}
+    path = cached_get_file(item, cache)
+    clock.now += 10 * 365 * 24 * 3600
+    assert cached_get_file(item, cache) == path
+    assert len(server.requests) == 1
+
+
+def test_evicts_least_recently_used_by_size(tmp_path, clock):
+    cache = DiskCache(str(tmp_path), max_bytes=250)
+    for key in ['a', 'b']:
+        cache.put(key, b'x' * 100)
+        clock.now += ACCESS_RESOLUTION
+    cache.get('a')
+    clock.now += 1
+    cache.put('c', b'z' * 100)
+    assert cache.get('b') is None
+    assert cache.get('a') is not None and cache.get('c') is not None
+    assert sum(os.path.getsize(cache.data_path(key)) for key in ['a', 'c']) <= cache.max_bytes
+
+
+def test_cached_download_streams_to_disk(server, tmp_path):
+    cache = DiskCache(str(tmp_path))
+    server.body = os.urandom(3 * 1024 * 1024)
+    path = cached_download(server.url, cache, key='big')
+    with open(path, 'rb') as f:
+        assert f.read() == server.body
+    assert cache.get('big')['etag'] == f'"{hashlib.sha1(server.body).hexdigest()}"'
+
+
+def test_reads_do_not_rewrite_meta_within_resolution(tmp_path, clock, monkeypatch):
+    cache = DiskCache(str(tmp_path))
+    cache.put('a', b'x' * 10)
+    writes = []
+    original = DiskCache._atomic_write
+    monkeypatch.setattr(DiskCache, '_atomic_write', classmethod(lambda cls, *args: writes.append(args[0])
+                                                                 or original(*args)))
+    for _ in range(5):
+        clock.now += 1
+        assert cache.get('a') is not None
+    assert writes == []
+    clock.now += ACCESS_RESOLUTION
+    assert cache.get('a')['accessed_at'] == clock.now and len(writes) == 1
+
+
+def test_pinned_entries_survive_concurrent_writes(tmp_path):
+    cache = DiskCache(str(tmp_path), max_bytes=250)
+    cache.put('old', b'o' * 100)
+
+    def write(key):
+        cache.put_stream(key, [key.encode() * 50, key.encode() * 50])
+        return cache.read(key)
+
+    # Hovuz ishlayotganda chegaradan oshsa ham, shu blokda yozilgan yozuvlar o'chirilmaydi
+    with cache.pinned():
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            contents = list(pool.map(write, 'abcdef'))
+        assert contents == [key.encode() * 100 for key in 'abcdef']
+        assert cache.get('old', stale=True) is None
+    # Blokdan keyin bir marta tozalanadi; vaqtinchalik fayllar qolmaydi
+    assert sum(cache.get(key, stale=True) is not None for key in 'abcdef') == 2
+    assert not [name for name in os.listdir(tmp_path) if name.endswith('.tmp')]
+
+
+def test_same_key_written_from_threads(tmp_path):
+    cache = DiskCache(str(tmp_path))
+    bodies = [bytes([i]) * 4096 for i in range(8)]
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(lambda body: cache.put('same', body), bodies * 4))
+    # Oqimlar bir vaqtinchalik faylni baham ko'rmaydi: natija yozuvlardan biri, buzilmagan
+    assert cache.read('same') in bodies and cache.get('same')['size'] == 4096
+    assert not [name for name in os.listdir(tmp_path) if name.endswith('.tmp')]
@@ -0,0 +1,89 @@
+"""Agregat kub: roll-up natijalari groupby, value_counts va crosstab bilan bir xil"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from survey.cube import CUBE_DIMENSIONS, AggregateCube
+from survey.schema import compact_frame, standardize_columns
+from survey.synthetic import sample_survey
+
+
+@pytest.fixture(scope='module')
+def frame():
+    df = compact_frame(standardize_columns(sample_survey(20_000, seed=21)))[0]
+    rng = np.random.default_rng(21)
+    # O'lchamlarda ham, o'lchovlarda ham bo'sh qiymatlar
+    df['Salary'] = df['Salary'].astype('float64').where(rng.random(len(df)) > 0.1)
+    df['Country'] = df['Country'].where(rng.random(len(df)) > 0.05)
+    return df
+
+
+@pytest.fixture(scope='module')
+def cube(frame):
+    return AggregateCube.build(frame)
+
+
+def by_index(series):
+    return series.sort_index().astype('float64')
+
+
+@pytest.mark.parametrize('dimension', CUBE_DIMENSIONS)
+def test_counts_match_value_counts(cube, frame, dimension):
+    counts = cube.counts(dimension)
+    expected = frame[dimension].value_counts()
+    pd.testing.assert_series_equal(by_index(counts), by_index(expected), check_names=False,
+                                   check_index_type=False, check_categorical=False)
+    assert counts.is_monotonic_decreasing
+
+
+@pytest.mark.parametrize('dimension', ['Role', 'Country', 'Education'])
+@pytest.mark.parametrize('measure', ['Salary', 'YearsExperience', 'JobSatisfaction'])
+def test_rollup_matches_groupby(cube, frame, dimension, measure):
+    result = cube.rollup([dimension], measure)
+    grouped = frame.groupby(dimension, observed=True)[measure]
+    expected = grouped.agg(['size', 'count', 'sum', 'min', 'max', 'mean', 'std'])
+    for ours, theirs in [('n', 'size'), ('count', 'count'), ('sum', 'sum'), ('min', 'min'), ('max', 'max'),
+                         ('mean', 'mean'), ('std', 'std')]:
+        pd.testing.assert_series_equal(by_index(result[ours]), by_index(expected[theirs]), check_names=False,
+                                       check_index_type=False, check_categorical=False, rtol=1e-9)
+    pd.testing.assert_series_equal(by_index(cube.group_mean(dimension, measure)), by_index(grouped.mean()),
+                                   check_names=False, check_index_type=False, check_categorical=False, rtol=1e-9)
+
+
+def test_two_dimension_rollup_matches_groupby(cube, frame):
+    result = cube.rollup(['Role', 'RemoteWork'], 'Salary')
+    expected = frame.groupby(['Role', 'RemoteWork'], observed=True)['Salary'].agg(['size', 'mean'])
+    pd.testing.assert_series_equal(result['n'].sort_index().astype('float64'),
+                                   expected['size'].sort_index().astype('float64'), check_names=False)
+    pd.testing.assert_series_equal(result['mean'].sort_index(), expected['mean'].sort_index(),
+                                   check_names=False, rtol=1e-9)
+
+
+@pytest.mark.parametrize('row, column', [('Role', 'Education'), ('Country', 'Gender'), ('RemoteWork', 'Role')])
+def test_crosstab_matches_pandas(cube, frame, row, column):
+    expected = pd.crosstab(frame[row], frame[column])
+    result = cube.crosstab(row, column)
+    pd.testing.assert_frame_equal(result.sort_index().sort_index(axis=1), expected.sort_index().sort_index(axis=1),
+                                  check_names=False, check_index_type=False, check_column_type=False,
+                                  check_categorical=False, check_dtype=False)
+
+
+@pytest.mark.parametrize('measure', ['Salary', 'Age'])
+def test_summary_matches_series(cube, frame, measure):
+    summary = cube.summary(measure)
+    values = frame[measure]
+    assert summary['n'] == len(frame) and summary['count'] == values.count()
+    np.testing.assert_allclose(summary[['mean', 'std', 'min', 'max']].astype('float64'),
+                               [values.mean(), values.std(), values.min(), values.max()], rtol=1e-9)
+
+
+def test_merged_cube_matches_whole(cube, frame):
+    merged = AggregateCube.build(frame.iloc[:7_000]).merge(AggregateCube.build(frame.iloc[7_000:]))
+    for dimension in ['Role', 'Country']:
+        pd.testing.assert_series_equal(by_index(merged.counts(dimension)), by_index(cube.counts(dimension)),
+                                       check_index_type=False, check_categorical=False)
+        pd.testing.assert_frame_equal(merged.rollup([dimension], 'Salary').sort_index(),
+                                      cube.rollup([dimension], 'Salary').sort_index(),
+                                      check_dtype=False, check_index_type=False, check_categorical=False, rtol=1e-9)
+    pd.testing.assert_frame_equal(merged.crosstab('Role', 'Education'), cube.crosstab('Role', 'Education'),
+                                  check_index_type=False, check_column_type=False, check_categorical=False)
@@ -0,0 +1,115 @@
+"""Diagnostika paneli namunali jadvalda: bosqichlar, grafik hajmi va kesh hodisalari to'g'ri maydonlar bilan yoziladi"""
+import json
+import os
+
+import pytest
+
+st = pytest.importorskip('streamlit')
+from streamlit.testing.v1 import AppTest  # noqa: E402
+
+import survey.ingest  # noqa: E402
+from survey.diagnostics import Diagnostics  # noqa: E402
+from survey.figure_cache import FIGURES  # noqa: E402
+from survey.sections import INTERVAL_FIGURES, SECTION_TITLES  # noqa: E402
+
+APP_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'streamlit.py')
+
+
+@pytest.fixture
+def sample_app(monkeypatch):
+    """Manba yo'q va GitHub'dan yuklab bo'lmaydi - ilova namunali jadval bilan ishlaydi"""
+    def offline(*args, **kwargs):
+        raise RuntimeError("tarmoq yo'q")
+
+    monkeypatch.setattr(survey.ingest, 'LOCAL_SOURCE', None)
+    monkeypatch.setattr(survey.ingest, 'fetch_survey', offline)
+    monkeypatch.setattr(survey.ingest, 'should_stream', lambda *args, **kwargs: False)
+    st.cache_resource.clear()
+    at = AppTest.from_file(APP_PATH, default_timeout=600)
+    at.session_state['diagnostics_enabled'] = True
+    at.run()
+    assert not at.exception, at.exception[0].value
+    yield at
+    st.cache_resource.clear()
+
+
+def show(at, section):
+    at.radio[0].set_value(SECTION_TITLES[section]).run()
+    assert not at.exception, at.exception[0].value
+
+
+def test_events_have_reported_fields(sample_app):
+    show(sample_app, 'salary')
+    diagnostics = sample_app.session_state['diagnostics']
+    assert diagnostics.enabled and diagnostics.run == 2
+    events = list(diagnostics.events)
+    assert {event['event'] for event in events} == {'timing', 'cache', 'payload'}
+    for event in events:
+        assert {'ts', 'run', 'event'} <= set(event) and event['run'] in (1, 2)
+
+    timings = diagnostics.frame('timing')
+    assert (timings['ms'] >= 0).all()
+    stages = set(timings['stage'])
+    assert {'normalize.columns', 'normalize.compact', 'precompute', 'compute', 'figures', 'chart', 'section'} <= stages
+    assert set(timings.loc[timings['stage'] == 'compute', 'section']) == {'overview', 'salary'}
+
+    # Umumiy ma'lumot bo'limida grafik yo'q - hajmlar maosh bo'limi grafiklari uchun
+    payloads = diagnostics.frame('payload')
+    assert set(payloads['run']) == {2} and 'salary_hist' in set(payloads['chart'])
+    assert list(payloads.columns[-3:]) == ['chart', 'bytes', 'serialize_ms']
+    assert (payloads['bytes'] > 0).all() and (payloads['serialize_ms'] >= 0).all()
+
+    caches = diagnostics.cache_summary()
+    assert list(caches.columns) == ['cache', 'hit', 'miss']
+    assert caches.set_index('cache').loc['dataset'].tolist() == [1, 1]
+
+    summary = diagnostics.timing_summary(run=2)
+    assert list(summary.columns) == ['stage', 'count', 'sum', 'mean', 'max']
+    assert summary['sum'].is_monotonic_decreasing
+    assert {'compute:salary', 'chart:salary_hist'} <= set(summary['stage'])
+
+
+def test_rerun_hits_caches_and_panel_is_rendered(sample_app):
+    for section in ['salary', 'demographics', 'salary']:
+        show(sample_app, section)
+    diagnostics = sample_app.session_state['diagnostics']
+    assert diagnostics.run == 4
+
+    caches = diagnostics.cache_summary().set_index('cache')
+    assert caches.loc['dataset'].tolist() == [3, 1]
+    assert caches.loc['section.salary'].tolist() == [1, 1]
+    # Oxirgi ishga tushirishda bo'lim qayta hisoblanmaydi, grafiklar keshdan olinadi
+    last = diagnostics.frame('timing', run=4)
+    assert 'compute' not in set(last['stage']) and 'figures' not in set(last['stage'])
+    assert diagnostics.frame('payload', run=4)['chart'].tolist() \
+        == diagnostics.frame('payload', run=2)['chart'].tolist()
+
+    captions = [caption.value for caption in sample_app.sidebar.caption]
+    assert any(caption.startswith("Grafiklar hajmi: jami") for caption in captions)
+    assert any(caption.startswith("Grafiklar keshi (jarayon)") for caption in captions)
+    lines = diagnostics.to_jsonl().splitlines()
+    assert len(lines) == len(diagnostics.events)
+    assert [json.loads(line)['event'] for line in lines] == [event['event'] for event in diagnostics.events]
+
+
+def test_intervals_rebuild_only_error_bar_charts(sample_app):
+    show(sample_app, 'salary')
+    before = FIGURES.stats()
+    toggle = next(toggle for toggle in sample_app.sidebar.toggle if toggle.key == 'confidence_intervals')
+    toggle.set_value(True).run()
+    assert not sample_app.exception, sample_app.exception[0].value
+    after = FIGURES.stats()
+    # Faqat xato chiziqli grafik yangi versiyada quriladi, maosh bo'limining qolganlari keshdan
+    assert after['misses'] - before['misses'] == len(INTERVAL_FIGURES['salary'])
+    payloads = sample_app.session_state['diagnostics'].frame('payload', run=3)
+    assert set(INTERVAL_FIGURES['salary']) <= set(payloads['chart'])
+
+
+def test_disabled_diagnostics_records_nothing():
+    diagnostics = Diagnostics(enabled=False)
+    with diagnostics.timer('compute', section='overview'):
+        pass
+    diagnostics.cache('figures', True)
+    diagnostics.payload('chart', None, (10, 1.0))
+    assert not diagnostics.events and diagnostics.cache_summary().empty
+    assert diagnostics.timer('compute') is diagnostics.timer('figures')
@@ -0,0 +1,95 @@
+"""Jadval ko'rgichi sahifalari, saralash va qidiruvi pandas'dagi oddiy amallar bilan bir xil"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from survey.explorer import SEARCH_COLUMNS, TableExplorer
+from survey.lru import LRUCache
+from survey.schema import compact_frame, standardize_columns
+from survey.synthetic import sample_survey
+
+
+@pytest.fixture(scope='module')
+def frame():
+    df = compact_frame(standardize_columns(sample_survey(2000, seed=3)))[0]
+    rng = np.random.default_rng(3)
+    # Saralash ustunlarida bo'sh qiymatlar (ular har doim oxirida)
+    df['Salary'] = df['Salary'].astype('float64').where(rng.random(len(df)) > 0.05)
+    df['Country'] = df['Country'].where(rng.random(len(df)) > 0.05)
+    return df
+
+
+@pytest.fixture
+def explorer(frame):
+    return TableExplorer(frame, 'explorer-test', cache=LRUCache(64 * 1024 * 1024))
+
+
+def expected_rows(df, search='', filters=None):
+    mask = pd.Series(True, index=df.index)
+    for column, values in (filters or {}).items():
+        mask &= df[column].astype(str).isin(values)
+    for term in search.lower().split():
+        hit = pd.Series(False, index=df.index)
+        for column in SEARCH_COLUMNS:
+            hit |= df[column].astype(str).str.lower().str.contains(term, regex=False) & df[column].notna()
+        mask &= hit
+    return df[mask]
+
+
+def expected_page(df, number, size, sort=(), descending=False):
+    if sort:
+        ascending = [not d for d in descending] if isinstance(descending, list) else not descending
+        df = df.sort_values(list(sort), ascending=ascending, kind='stable', na_position='last')
+    return df.iloc[number * size:(number + 1) * size]
+
+
+@pytest.mark.parametrize('number', [0, 7, 39])
+def test_pages_match_slicing(explorer, frame, number):
+    page, total = explorer.page(number, 50)
+    assert total == len(frame)
+    pd.testing.assert_frame_equal(page, expected_page(frame, number, 50))
+
+
+@pytest.mark.parametrize('sort, descending', [
+    ('Salary', False),
+    ('Salary', True),
+    ('Country', True),
+    (['Country', 'Salary'], False),
+    (['Country', 'Salary'], [False, True]),
+    (['Role', 'Age', 'Salary'], [True, False, True]),
+])
+@pytest.mark.parametrize('number', [0, 13, 79])
+def test_sorted_pages_match_sort_values(explorer, frame, sort, descending, number):
+    page, _ = explorer.page(number, 25, sort=sort, descending=descending)
+    expected = expected_page(frame, number, 25, [sort] if isinstance(sort, str) else sort, descending)
+    pd.testing.assert_frame_equal(page, expected, check_index_type=False)
+
+
+@pytest.mark.parametrize('search, filters', [
+    ('python', None),
+    ('engineer india', None),
+    ('sql', {'Country': ['USA', 'UK']}),
+    ('', {'Role': ['BI Developer']}),
+    ('nothing-matches-this', None),
+])
+def test_search_and_filters_match_pandas(explorer, frame, search, filters):
+    expected = expected_rows(frame, search, filters)
+    assert explorer.count(search, filters) == len(expected)
+    page, total = explorer.page(1, 20, search, filters, sort=['Country', 'Salary'], descending=[False, True])
+    assert total == len(expected)
+    number = min(1, max(total - 1, 0) // 20)
+    pd.testing.assert_frame_equal(
+        page, expected_page(expected, number, 20, ['Country', 'Salary'], [False, True]), check_index_type=False
+    )
+
+
+def test_search_results_are_shared_per_version(frame):
+    cache = LRUCache(64 * 1024 * 1024)
+    first = TableExplorer(frame, 'v1', cache=cache)
+    other = TableExplorer(frame.iloc[:100], 'v1|filtered', cache=cache)
+    rows = first.rows('python')
+    # Xuddi shu versiya uchun yangi ko'rgich natijani keshdan oladi
+    assert TableExplorer(frame, 'v1', cache=cache).rows('python') is rows
+    # Boshqa versiya (filtrlangan ko'rinish) alohida kalitga ega
+    assert len(other.rows('python')) == len(expected_rows(frame.iloc[:100], 'python'))
+    assert cache.stats()['entries'] == 2
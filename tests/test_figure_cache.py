@@ -0,0 +1,132 @@
+"""Grafiklar keshi: har bir grafik alohida yozuv (JSON hajmi bilan), bir marta serializatsiya qilinadi"""
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from survey.diagnostics import Diagnostics
+from survey.figure_cache import FigureCache
+
+
+class FakeFigure:
+    """``to_json`` chaqiruvlarini sanaydigan grafik"""
+
+    def __init__(self, size):
+        self.size = size
+        self.serialized = 0
+
+    def to_json(self):
+        self.serialized += 1
+        return 'x' * self.size
+
+
+class Builder:
+    def __init__(self, sizes):
+        self.sizes = sizes
+        self.calls = 0
+        self.built = {}
+
+    def __call__(self, section, data):
+        self.calls += 1
+        self.built = {chart: FakeFigure(size) for chart, size in self.sizes.items()}
+        return self.built
+
+
+def test_chart_entries_are_charged_with_figure_sizes():
+    cache = FigureCache(max_bytes=10_000)
+    build = Builder({'a': 1000, 'b': 2500})
+    figs = cache.figures('salary', 'v1', {}, build=build)
+    # Grafiklar JSON hajmi va bo'lim grafiklari ro'yxati (nomlar)
+    assert cache.cache.bytes == figs.nbytes + len('a') + len('b') and figs.nbytes == 3500
+    assert {chart: size for chart, (size, _) in figs.sizes.items()} == {'a': 1000, 'b': 2500}
+    again = cache.figures('salary', 'v1', {}, build=build)
+    assert again == figs and again.sizes == figs.sizes
+    assert build.calls == 1
+    assert cache.stats()['hits'] == 2 and cache.stats()['misses'] == 2
+
+
+def test_evicted_chart_is_rebuilt_alone():
+    cache = FigureCache(max_bytes=10_000)
+    build = Builder({'a': 3000, 'b': 1000})
+    for version in ['v1', 'v2']:
+        cache.figures('salary', version, {}, build=build)
+    cache.figures('salary', 'v1', {}, build=build)
+    # Chegaradan oshganda eng kam ishlatilgan grafik (v2 'a') chiqariladi, v1 qoladi
+    cache.figures('salary', 'v3', {}, build=build)
+    assert cache.cache.bytes <= cache.cache.max_bytes
+    cache.figures('salary', 'v1', {}, build=build)
+    assert build.calls == 3
+    figs = cache.figures('salary', 'v2', {}, build=build)
+    assert build.calls == 4 and figs['b'] == 'x' * 1000
+    # Keshda qolgan grafik qayta serializatsiya qilinmaydi
+    assert build.built['a'].serialized == 1 and build.built['b'].serialized == 0
+
+
+def test_chart_larger_than_bound_is_not_stored():
+    cache = FigureCache(max_bytes=1000)
+    build = Builder({'a': 1200, 'b': 100})
+    cache.figures('salary', 'v1', {}, build=build)
+    figs = cache.figures('salary', 'v1', {}, build=build)
+    assert build.calls == 2 and cache.cache.bytes == 100 + len('a') + len('b')
+    assert figs['a'] == 'x' * 1200 and build.built['b'].serialized == 0
+
+
+def test_variant_charts_are_cached_separately():
+    cache = FigureCache()
+    build = Builder({'hist': 100, 'role_bar': 200})
+    plain = cache.figures('salary', 'v1', {}, build=build)
+    variants = {'role_bar': ('v1', 'ci')}
+    # Ishonch oraliqlari yoqilganda faqat xato chiziqli grafik yangi yozuv; qolganlari o'sha yozuvlardan
+    with_ci = cache.figures('salary', 'v1', {}, build=build, variants=variants)
+    assert build.calls == 2 and build.built['hist'].serialized == 0 and build.built['role_bar'].serialized == 1
+    assert with_ci['hist'] is plain['hist']
+    assert cache.figures('salary', 'v1', {}, build=build, variants=variants) == with_ci
+    assert cache.figures('salary', 'v1', {}, build=build) == plain
+    assert build.calls == 2
+
+
+def test_counters_are_consistent_across_threads():
+    cache = FigureCache()
+    build = Builder({'a': 10, 'b': 10, 'c': 10})
+    cache.figures('salary', 'v1', {}, build=build)
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(lambda _: cache.figures('salary', 'v1', {}, build=build), range(400)))
+    assert cache.stats()['hits'] == 400 * 3 and cache.stats()['misses'] == 3
+
+
+@pytest.mark.parametrize('enabled', [False, True])
+def test_each_figure_is_serialized_once(enabled):
+    cache = FigureCache()
+    diagnostics = Diagnostics(enabled=enabled)
+    build = Builder({'a': 100})
+    figs = cache.figures('salary', 'v1', {}, build=build, diagnostics=diagnostics)
+    for _ in range(3):
+        figs = cache.figures('salary', 'v1', {}, diagnostics=diagnostics)
+        diagnostics.payload('a', None, figs.sizes['a'])
+    assert build.built['a'].serialized == 1
+    # Yozuvda grafik obyekti emas, faqat uning JSON satri saqlanadi
+    assert figs['a'] == 'x' * 100
+    payloads = diagnostics.frame('payload')
+    assert payloads.empty if not enabled else payloads['bytes'].tolist() == [100] * 3
+
+
+def test_figures_are_restored_from_json():
+    pytest.importorskip('plotly')
+    from survey.figures import build_figures
+    from survey.ingest import prepare_dataset
+    from survey.sections import INTERVAL_FIGURES, SECTION_COMPUTE
+    from survey.synthetic import sample_survey
+
+    dataset, _ = prepare_dataset(sample_survey(2000, seed=5), 'figures')
+    cache = FigureCache()
+    for section, compute in SECTION_COMPUTE.items():
+        data = compute(dataset)
+        built = build_figures(section, data)
+        figs = cache.figures(section, 'v1', data)
+        assert cache.cache.get(('charts', section, 'v1')) == tuple(built)
+        # Xato chiziqli grafiklar nomlari (alohida keshlanadi) bo'lim grafiklari orasida
+        assert set(INTERVAL_FIGURES.get(section, [])) <= set(built)
+        for chart, fig in built.items():
+            assert isinstance(figs[chart], str)
+            assert figs.sizes[chart][0] == len(figs[chart].encode('utf-8'))
+            assert json.loads(figs.figure(chart).to_json()) == json.loads(fig.to_json())
@@ -0,0 +1,164 @@
+"""Bitmap filtrlar oddiy pandas filtrlari (``isin``/``between``) bilan bir xil qatorlarni tanlaydi"""
+import itertools
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from survey.filters import BitmapIndex, filter_key
+from survey.ingest import prepare_dataset
+from survey.lru import LRUCache
+from survey.synthetic import sample_survey
+
+_versions = itertools.count()
+
+
+def survey_frame(n=3000, seed=0):
+    """Sintetik javoblar: kategoriyalarda va diapazon ustunlarida bo'sh qiymatlar bilan"""
+    df = sample_survey(n, seed=seed)
+    rng = np.random.default_rng(seed)
+    for col in ['Role', 'Country', 'Gender']:
+        df[col] = df[col].where(rng.random(n) > 0.05)
+    df['Age'] = df['Age'].astype('float64').where(rng.random(n) > 0.03)
+    df['Salary'] = df['Salary'].astype('float64').where(rng.random(n) > 0.03)
+    return df
+
+
+def make_dataset(df):
+    # Filtrlangan ko'rinishlar keshi versiya bo'yicha - har bir jadval o'z versiyasiga ega
+    dataset, _ = prepare_dataset(df, f"filters-test-{next(_versions)}")
+    return dataset
+
+
+def expected_mask(df, selections=None, ranges=None, bounds=None):
+    """Oddiy pandas: ustun ichida ``isin`` (OR), ustunlar orasida AND, diapazonlar ``between``.
+
+    Bo'sh tanlov va to'liq oraliqqa teng diapazon (slayder tegilmagan) filtr emas.
+    """
+    mask = pd.Series(True, index=df.index)
+    for dim, values in (selections or {}).items():
+        if values:
+            mask &= df[dim].astype(object).isin(values)
+    for col, (low, high) in (ranges or {}).items():
+        if bounds is None or (low, high) != bounds[col]:
+            mask &= df[col].between(low, high)
+    return mask.to_numpy()
+
+
+CASES = {
+    'bitta qiymat': ({'Role': ['Data Analyst']}, None),
+    'ustun ichida OR': ({'Country': ['USA', 'UK', 'India']}, None),
+    "bir nechta ustun AND": ({'Role': ['Data Scientist', 'Data Engineer'], 'Gender': ['Female'],
+                              'Education': ["Master's", 'PhD']}, None),
+    "bo'sh tanlov e'tiborsiz": ({'Role': [], 'Country': ['Japan']}, None),
+    "noma'lum qiymat": ({'Country': ['Atlantis']}, None),
+    'diapazon': (None, {'Salary': (60_000.0, 90_000.0)}),
+    'ikki diapazon': (None, {'Salary': (50_000.0, 150_000.0), 'Age': (25.0, 40.0)}),
+    'tanlov va diapazon': ({'RemoteWork': ['Hybrid'], 'Role': ['BI Developer']}, {'Age': (30.0, 50.0)}),
+}
+
+
+@pytest.fixture(scope='module')
+def frame():
+    return survey_frame()
+
+
+@pytest.mark.parametrize('case', CASES)
+def test_mask_matches_pandas(frame, case):
+    selections, ranges = CASES[case]
+    dataset = make_dataset(frame)
+    index = BitmapIndex(dataset.df)
+    bounds = {col: index.bounds(col) for col in index.sorted}
+    np.testing.assert_array_equal(index.mask(selections, ranges), expected_mask(dataset.df, selections, ranges, bounds))
+
+
+@pytest.mark.parametrize('case', CASES)
+def test_filtered_matches_pandas(frame, case):
+    selections, ranges = CASES[case]
+    dataset = make_dataset(frame)
+    subset = dataset.filtered(selections, ranges)
+    expected = dataset.df[expected_mask(dataset.df, selections, ranges)]
+    pd.testing.assert_frame_equal(subset.df, expected)
+    assert subset.version == f"{dataset.version}|{filter_key(selections, ranges)}"
+
+
+def test_no_active_filter_returns_dataset(frame):
+    dataset = make_dataset(frame)
+    index = dataset.bitmaps
+    assert index.mask() is None
+    assert index.mask({'Role': []}) is None
+    full = {col: index.bounds(col) for col in index.sorted}
+    assert index.mask(None, full) is None
+    assert dataset.filtered({'Role': []}, full) is dataset
+
+
+def test_nan_category_is_never_selected(frame):
+    dataset = make_dataset(frame)
+    index = dataset.bitmaps
+    assert dataset.df['Role'].isna().any()
+    assert all(value == value for value in index.values('Role'))
+    everything = index.mask({'Role': index.values('Role')})
+    np.testing.assert_array_equal(everything, dataset.df['Role'].notna().to_numpy())
+
+
+def test_range_excludes_missing_values(frame):
+    dataset = make_dataset(frame)
+    low, high = dataset.bitmaps.bounds('Salary')
+    mask = dataset.bitmaps.mask(None, {'Salary': (low, high - 1)})
+    assert not mask[dataset.df['Salary'].isna().to_numpy()].any()
+
+
+@pytest.mark.parametrize('case', CASES)
+def test_mask_after_append_matches_pandas(case):
+    selections, ranges = CASES[case]
+    base = make_dataset(survey_frame(2001, seed=1))
+    base.bitmaps
+    # Yangi qatorlarda bo'sh qiymatlar va asl jadvalda bo'lmagan kategoriya bor
+    batch = survey_frame(503, seed=2)
+    batch.loc[batch.index[:40], 'Country'] = 'Atlantis'
+    appended = base.append(batch)
+    index = appended.bitmaps
+    bounds = {col: index.bounds(col) for col in index.sorted}
+    np.testing.assert_array_equal(index.mask(selections, ranges),
+                                  expected_mask(appended.df, selections, ranges, bounds))
+    np.testing.assert_array_equal(index.mask({'Country': ['Atlantis']}),
+                                  (appended.df['Country'] == 'Atlantis').to_numpy())
+    rebuilt = BitmapIndex(appended.df)
+    assert rebuilt.bounds('Salary') == index.bounds('Salary')
+    np.testing.assert_array_equal(rebuilt.mask(selections, ranges), index.mask(selections, ranges))
+
+
+def test_view_size_counts_lazily_built_indexes(frame):
+    view = make_dataset(frame).filtered({'Role': ['Data Analyst', 'Data Scientist']})
+    base = view.nbytes
+    assert base == view.frame_bytes
+    view.bitmaps, view.summary, view.explorer.sort_order('Salary')
+    view.histogram('Salary', 30), view.binned_mean('Salary', [0.0, 1e5, 1e9], 'Age')
+    grown = view.nbytes
+    sort = view.explorer.sort_order('Salary')
+    assert grown >= base + view.bitmaps.nbytes + view.summary.nbytes + sort.nbytes
+
+
+def test_filter_cache_bound_follows_view_growth(frame):
+    dataset = make_dataset(frame)
+    first, second = [{'Role': [role]} for role in dataset.bitmaps.values('Role')[:2]]
+    small, grown = [dataset.filtered(selections, cache=LRUCache(10 ** 9)) for selections in (first, second)]
+    grown.bitmaps
+    # Ikkalasi dastlab sig'adi, ikkinchisi o'sgach esa faqat o'zi sig'adi
+    cache = LRUCache(small.nbytes + grown.nbytes - 1)
+    dataset.filtered(first, cache=cache)
+    view = dataset.filtered(second, cache=cache)
+    assert len(cache) == 2
+    # Bitmaplar qurilgach ikkala ko'rinish chegaraga sig'maydi - eng eskisi chiqariladi
+    view.bitmaps
+    assert dataset.filtered(second, cache=cache) is view
+    assert len(cache) == 1 and cache.bytes == view.nbytes <= cache.max_bytes
+
+
+def test_memoized_results_are_built_once_across_threads(frame):
+    dataset = make_dataset(frame)
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(lambda _: dataset.histogram('Salary', 30), range(32)))
+    assert all(result is results[0] for result in results)
+    assert len(dataset._histograms) == 1
@@ -0,0 +1,71 @@
+"""Server tomonidagi bin'lar ``np.histogram``/``np.histogram2d`` bilan o'sha chegaralarda bir xil"""
+import numpy as np
+import pytest
+
+from survey.histograms import compute_density, compute_histogram, histogram_frame, nice_bin_size
+
+
+def edges(start, size, count):
+    return start + size * np.arange(count + 1)
+
+
+def samples(kind, n=20_000, seed=41):
+    rng = np.random.default_rng(seed)
+    if kind == 'salary':
+        return np.round(rng.lognormal(11, 0.5, n), -2)
+    if kind == 'scores':
+        return rng.integers(1, 11, n).astype('float64')
+    if kind == 'age':
+        return rng.integers(21, 65, n).astype('float64')
+    if kind == 'negative':
+        return rng.normal(-3, 0.01, n)
+    return rng.normal(size=n)
+
+
+@pytest.mark.parametrize('kind', ['salary', 'scores', 'age', 'negative', 'normal'])
+@pytest.mark.parametrize('nbins', [10, 30, 50])
+def test_histogram_matches_numpy(kind, nbins):
+    values = samples(kind)
+    values[::97] = np.nan
+    histogram = compute_histogram(values, nbins, 'x')
+    clean = values[~np.isnan(values)]
+    expected, _ = np.histogram(clean, bins=edges(histogram.start, histogram.size, len(histogram.counts)))
+    np.testing.assert_array_equal(histogram.counts, expected)
+    assert histogram.counts.sum() == len(clean)
+    # Chegaralar qiymatlarni qamraydi va birinchi/oxirgi bin bo'sh emas
+    assert histogram.start <= clean.min() < histogram.start + histogram.size
+    assert histogram.counts[0] > 0 and histogram.counts[-1] > 0
+    assert histogram.size == nice_bin_size(histogram.size)
+
+
+def test_integer_values_sit_in_bin_centers():
+    values = samples('scores')
+    histogram = compute_histogram(values, 50, 'JobSatisfaction')
+    frame = histogram_frame(histogram)
+    assert histogram.size == 1.0
+    np.testing.assert_array_equal(frame['JobSatisfaction'], np.arange(1, 11))
+    np.testing.assert_array_equal(frame['count'], np.bincount(values.astype(int))[1:])
+
+
+def test_empty_and_constant_values():
+    assert len(compute_histogram([np.nan, np.nan], 10).counts) == 0
+    constant = compute_histogram(np.full(100, 7.0), 10)
+    assert constant.counts.tolist() == [100] and constant.start <= 7 < constant.start + constant.size
+
+
+@pytest.mark.parametrize('nbins', [(50, 50), (20, 10)])
+def test_density_matches_histogram2d(nbins):
+    x, y = samples('salary'), samples('scores', seed=42)
+    x[::53] = np.nan
+    y[::71] = np.nan
+    density = compute_density(x, y, nbins, ('Salary', 'JobSatisfaction'))
+    valid = ~(np.isnan(x) | np.isnan(y))
+    expected, _, _ = np.histogram2d(
+        x[valid], y[valid],
+        bins=[edges(density.x_start, density.x_size, density.counts.shape[0]),
+              edges(density.y_start, density.y_size, density.counts.shape[1])],
+    )
+    np.testing.assert_array_equal(density.counts, expected.astype(np.int64))
+    assert density.counts.sum() == valid.sum()
+    # Har bir o'q bin'lari bir o'lchovli gistogramma bilan bir xil
+    assert (density.x_start, density.x_size) == compute_histogram(x[valid], nbins[0])[1:3]
@@ -0,0 +1,218 @@
+"""To'lqinlarni yuklash: parallel yuklash, 5xx'da qayta urinish, ETag/304 va birlashtirish (mahalliy HTTP server)"""
+import hashlib
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from survey.cache import DiskCache, make_session
+from survey.ingest import combine_waves, fetch_survey, prepare_dataset
+
+WAVES = {
+    # Har bir to'lqinda ustun nomlari boshqacha - column_mapping bo'yicha moslashtiriladi
+    'wave_2022.csv': b"Job Title,Yearly Salary,Age,Country\nData Analyst,60000,29,USA\nData Engineer,90000,35,UK\n",
+    'wave_2023.csv': b"Role,Salary,Age,Gender\nData Scientist,110000,41,Female\nData Analyst,65000,,Male\n",
+    'wave_2024.csv': b"Position,Income,Country\nBI Developer,70000,India\n",
+}
+
+
+class WaveServer:
+    """GitHub contents ro'yxati va fayllarini beradigan mahalliy server.
+
+    Ro'yxat ETag bilan beriladi; fayllar ``delay`` soniya kechikib qaytadi
+    (bir vaqtdagi so'rovlar soni yoziladi), ``failures`` - fayl nomi bo'yicha
+    nechta so'rovga 503 qaytarish.
+    """
+
+    def __init__(self, files=WAVES, delay=0.2):
+        self.files = dict(files)
+        self.delay = delay
+        self.failures = {}
+        self.requests = []
+        self.active = self.max_active = 0
+        self.lock = threading.Lock()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                with server.lock:
+                    server.requests.append((self.path, dict(self.headers)))
+                if self.path == '/contents':
+                    return self.listing()
+                name = self.path.rsplit('/', 1)[-1]
+                with server.lock:
+                    server.active += 1
+                    server.max_active = max(server.max_active, server.active)
+                    failing = server.failures.get(name, 0) > 0
+                    if failing:
+                        server.failures[name] -= 1
+                try:
+                    time.sleep(server.delay)
+                    if failing:
+                        return self.reply(503, b"")
+                    self.reply(200, server.files[name])
+                finally:
+                    with server.lock:
+                        server.active -= 1
+
+            def listing(self):
+                body = json.dumps(server.listing()).encode()
+                etag = f'"{hashlib.sha1(body).hexdigest()}"'
+                if self.headers.get('If-None-Match') == etag:
+                    return self.reply(304, b"", etag)
+                self.reply(200, body, etag)
+
+            def reply(self, status, body, etag=None):
+                self.send_response(status)
+                if etag:
+                    self.send_header('ETag', etag)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+
+    def listing(self):
+        # Ro'yxat tartibsiz: to'lqinlar tartibini fetch_survey nom bo'yicha tiklaydi
+        return [{'name': name, 'sha': hashlib.sha1(body).hexdigest(), 'size': len(body),
+                 'download_url': f"{self.url}/files/{name}"} for name, body in reversed(self.files.items())] \
+            + [{'name': 'README.md', 'sha': 'readme', 'size': 10, 'download_url': f"{self.url}/files/README.md"}]
+
+    def hits(self, name):
+        return sum(path.endswith(f"/{name}") for path, _ in self.requests)
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+@pytest.fixture
+def server():
+    server = WaveServer()
+    yield server
+    server.stop()
+
+
+def fetch(server, tmp_path, **kwargs):
+    kwargs.setdefault('session', make_session(backoff=0))
+    return fetch_survey(DiskCache(str(tmp_path / 'downloads')), api_url=f"{server.url}/contents", **kwargs)
+
+
+def test_waves_are_downloaded_in_parallel(server, tmp_path):
+    df, file_name, version = fetch(server, tmp_path)
+    assert server.max_active == len(WAVES)
+    assert file_name == 'wave_2022.csv, wave_2023.csv, wave_2024.csv'
+    assert version == '+'.join(f"{name}@{hashlib.sha1(body).hexdigest()}" for name, body in WAVES.items())
+    assert server.hits('README.md') == 0
+
+
+def test_single_worker_downloads_one_at_a_time(server, tmp_path):
+    fetch(server, tmp_path, max_workers=1)
+    assert server.max_active == 1
+    assert all(server.hits(name) == 1 for name in WAVES)
+
+
+def test_waves_are_tagged_and_aligned(server, tmp_path):
+    df, _, _ = fetch(server, tmp_path)
+    assert list(df['SurveyWave'].cat.categories) == ['wave_2022', 'wave_2023', 'wave_2024']
+    assert df['SurveyWave'].astype(str).tolist() == ['wave_2022'] * 2 + ['wave_2023'] * 2 + ['wave_2024']
+    assert df['Role'].tolist() == ['Data Analyst', 'Data Engineer', 'Data Scientist', 'Data Analyst', 'BI Developer']
+    assert df['Salary'].tolist() == [60000, 90000, 110000, 65000, 70000]
+    # Faylda yo'q ustunlar bo'sh qiymat bilan to'ldiriladi
+    assert df['Gender'].isna().tolist() == [True, True, False, False, True]
+    assert df['Country'].isna().tolist() == [False, False, True, True, False]
+    assert np.isnan(df['Age'].iloc[3]) and np.isnan(df['Age'].iloc[4])
+
+
+def test_server_errors_are_retried(server, tmp_path):
+    server.failures = {'wave_2023.csv': 2}
+    df, _, _ = fetch(server, tmp_path, session=make_session(retries=3, backoff=0))
+    assert server.hits('wave_2023.csv') == 3
+    assert df['SurveyWave'].nunique() == len(WAVES)
+
+
+def test_failing_wave_is_skipped_with_warning(server, tmp_path):
+    server.failures = {'wave_2023.csv': 10}
+    warnings = []
+    df, file_name, _ = fetch(server, tmp_path, session=make_session(retries=1, backoff=0),
+                             on_warning=warnings.append)
+    assert server.hits('wave_2023.csv') == 2
+    assert file_name == 'wave_2022.csv, wave_2024.csv'
+    assert df['SurveyWave'].astype(str).unique().tolist() == ['wave_2022', 'wave_2024']
+    assert len(warnings) == 1 and 'wave_2023.csv' in warnings[0]
+
+
+def test_listing_is_revalidated_and_files_reused(server, tmp_path):
+    first, _, version = fetch(server, tmp_path)
+    requests_before = len(server.requests)
+    second, _, same_version = fetch(server, tmp_path)
+    # Ro'yxat If-None-Match bilan tekshiriladi (304), fayllar SHA bo'yicha keshdan olinadi
+    listing = [headers for path, headers in server.requests[requests_before:] if path == '/contents']
+    assert len(server.requests) - requests_before == len(listing) == 1
+    assert 'If-None-Match' in listing[0]
+    assert same_version == version
+    pd.testing.assert_frame_equal(first, second)
+
+
+def test_changed_wave_is_downloaded_again(server, tmp_path):
+    fetch(server, tmp_path)
+    server.files['wave_2024.csv'] += b"Data Engineer,95000,USA\n"
+    df, _, _ = fetch(server, tmp_path)
+    assert server.hits('wave_2024.csv') == 2
+    assert server.hits('wave_2022.csv') == server.hits('wave_2023.csv') == 1
+    assert (df['SurveyWave'] == 'wave_2024').sum() == 2
+
+
+def test_small_cache_does_not_drop_waves_being_read(tmp_path):
+    # Har bir fayl cheklovdan katta: parallel yozuvlar bir-birini hovuz tugaguncha o'chirmaydi
+    files = {f"wave_{year}.csv": b"Role,Salary\n" + f"Analyst {year},{year * 10}\n".encode() * 500
+             for year in range(2018, 2024)}
+    server = WaveServer(files, delay=0.05)
+    try:
+        cache = DiskCache(str(tmp_path / 'downloads'), max_bytes=1024)
+        warnings = []
+        df, _, _ = fetch_survey(cache, on_warning=warnings.append, session=make_session(backoff=0),
+                                api_url=f"{server.url}/contents")
+    finally:
+        server.stop()
+    assert warnings == []
+    assert df['SurveyWave'].nunique() == len(files) and len(df) == 500 * len(files)
+    # Hovuzdan keyin kesh chegaraga qaytariladi
+    assert sum(meta.get('size', 0) for _, meta in cache._entries()) <= cache.max_bytes
+
+
+def test_combine_waves_unifies_dtypes_and_categories():
+    first = pd.DataFrame({'Job Title': pd.Categorical(['Data Analyst', 'Data Engineer']), 'Age': [29, 35],
+                          'Gender': ['Male', 'Female']})
+    second = pd.DataFrame({'Role': pd.Categorical(['Data Scientist', 'Data Analyst']), 'Age': [41.5, None]})
+    third = pd.DataFrame({'Role': ['BI Developer'], 'Age': [50]})
+    df = combine_waves([first, second, third], ['2022', '2023', '2024'])
+
+    # Toifalar birlashtiriladi: category object'ga aylanmaydi, faylda yo'q qator - bo'sh
+    assert isinstance(df['Role'].dtype, pd.CategoricalDtype)
+    assert set(df['Role'].cat.categories) == {'Data Analyst', 'Data Engineer', 'Data Scientist', 'BI Developer'}
+    assert df['Role'].astype(object).tolist() == ['Data Analyst', 'Data Engineer', 'Data Scientist',
+                                                  'Data Analyst', 'BI Developer']
+    assert list(df['SurveyWave'].cat.categories) == ['2022', '2023', '2024']
+    # Butun va kasr sonlar float64 ga birlashadi, bo'sh qiymatlar saqlanadi
+    assert df['Age'].dtype == 'float64' and df['Age'].isna().tolist() == [False, False, False, True, False]
+    assert df['Gender'].isna().sum() == 3
+
+    dataset, _ = prepare_dataset(df, 'waves')
+    assert isinstance(dataset.df['SurveyWave'].dtype, pd.CategoricalDtype)
+    assert dataset.df.groupby('SurveyWave', observed=True).size().tolist() == [2, 2, 1]
+
+
+def test_single_wave_is_returned_unchanged():
+    frame = pd.DataFrame({'Job Title': ['Data Analyst'], 'Age': [30]})
+    assert combine_waves([frame], ['only']) is frame
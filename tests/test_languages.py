@@ -0,0 +1,79 @@
+"""Tillar matritsasi: soni, guruh x til va birgalikda uchrash jadvallari split/explode hisobi bilan bir xil"""
+import itertools
+
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip('scipy')
+
+from survey.languages import LanguageMatrix  # noqa: E402
+from survey.synthetic import sample_survey  # noqa: E402
+
+
+@pytest.fixture(scope='module')
+def frame():
+    df = sample_survey(5000, seed=31)[['Role', 'ProgrammingLanguages']].copy()
+    rng = np.random.default_rng(31)
+    # Bo'sh qiymatlar, ortiqcha bo'shliqlar, bo'sh elementlar va bir qatordagi takroriy til
+    languages = df['ProgrammingLanguages'].astype(object)
+    languages[rng.random(len(df)) < 0.05] = np.nan
+    languages.iloc[:3] = [' Python ,SQL', 'SQL,,R', 'Python, Python']
+    df['ProgrammingLanguages'] = languages
+    return df
+
+
+def exploded(series):
+    """Har bir qator uchun tillar to'plami (tekshiruv uchun oddiy hisob)"""
+    tokens = series.str.split(',').explode().str.strip()
+    tokens = tokens[tokens.notna() & (tokens != '')]
+    return tokens.groupby(level=0).unique()
+
+
+def test_counts_match_explode(frame):
+    matrix = LanguageMatrix.from_series(frame['ProgrammingLanguages'])
+    expected = exploded(frame['ProgrammingLanguages']).explode().value_counts()
+    counts = matrix.counts()
+    pd.testing.assert_series_equal(counts.sort_index(), expected.sort_index(), check_names=False,
+                                   check_index_type=False, check_dtype=False)
+    assert counts.is_monotonic_decreasing
+    assert len(matrix) == len(frame)
+    assert counts['Python'] == (exploded(frame['ProgrammingLanguages']).map(lambda langs: 'Python' in langs)).sum()
+
+
+def test_by_group_matches_crosstab(frame):
+    matrix = LanguageMatrix.from_series(frame['ProgrammingLanguages'])
+    rows = exploded(frame['ProgrammingLanguages']).explode()
+    expected = pd.crosstab(frame['Role'].loc[rows.index], rows.to_numpy())
+    result = matrix.by_group(frame['Role'])
+    pd.testing.assert_frame_equal(result.loc[expected.index, expected.columns], expected, check_names=False,
+                                  check_dtype=False, check_index_type=False, check_column_type=False)
+    # Tanlanmagan tillar ustunlari nol
+    assert (result.drop(columns=expected.columns).to_numpy() == 0).all()
+
+
+def test_cooccurrence_matches_pairs(frame):
+    matrix = LanguageMatrix.from_series(frame['ProgrammingLanguages'])
+    pairs = pd.Series([pair for langs in exploded(frame['ProgrammingLanguages'])
+                       for pair in itertools.product(langs, repeat=2)]).value_counts()
+    table = matrix.cooccurrence()
+    for (a, b), count in pairs.items():
+        assert table.loc[a, b] == count
+    assert table.to_numpy().sum() == pairs.sum()
+    assert (np.diag(table) == matrix.counts()[table.index]).all()
+
+
+def test_append_and_subset_match_rebuild(frame):
+    whole = LanguageMatrix.from_series(frame['ProgrammingLanguages'])
+    first = LanguageMatrix.from_series(frame['ProgrammingLanguages'].iloc[:2000])
+    first.counts(), first.cooccurrence()
+    extra = pd.Series(['Julia, Python', np.nan])
+    appended = first.append(LanguageMatrix.from_series(frame['ProgrammingLanguages'].iloc[2000:])) \
+        .append(LanguageMatrix.from_series(extra))
+    rebuilt = LanguageMatrix.from_series(pd.concat([frame['ProgrammingLanguages'], extra], ignore_index=True))
+    pd.testing.assert_series_equal(appended.counts().sort_index(), rebuilt.counts().sort_index())
+    pd.testing.assert_frame_equal(appended.cooccurrence(), rebuilt.cooccurrence())
+    mask = (frame['Role'] == 'Data Analyst').to_numpy()
+    subset = whole.subset(mask)
+    expected = LanguageMatrix.from_series(frame['ProgrammingLanguages'][mask]).counts()
+    pd.testing.assert_series_equal(subset.counts()[expected.index], expected)
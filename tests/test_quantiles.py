@@ -0,0 +1,91 @@
+"""KLL kvantil eskizi: rang xatosi hujjatdagi chegarada (``np.quantile`` bilan solishtiriladi)"""
+import numpy as np
+import pytest
+
+from survey.quantiles import DEFAULT_EXACT_LIMIT, DEFAULT_K, QuantileSketch
+
+# Hujjatdagi chegara: 1.65 * 200 / k foiz
+RANK_ERROR_BOUND = 1.65 * 200 / DEFAULT_K / 100
+
+QUANTILES = np.linspace(0.01, 0.99, 99)
+
+
+def rank_error(values, estimates, qs=QUANTILES):
+    """Taxminiy kvantillar rangining so'ralgan kvantildan eng katta chetlanishi (takroriy qiymatlar hisobga olinadi)"""
+    values = np.sort(values)
+    below = np.searchsorted(values, estimates, side='left') / len(values)
+    upto = np.searchsorted(values, estimates, side='right') / len(values)
+    return float(np.max(np.maximum(0, np.maximum(below - qs, qs - upto))))
+
+
+def sample(kind, n, seed):
+    rng = np.random.default_rng(seed)
+    if kind == 'lognormal':
+        return rng.lognormal(11, 0.5, n)
+    if kind == 'scores':
+        return rng.integers(1, 11, n).astype('float64')
+    return rng.normal(size=n)
+
+
+@pytest.mark.parametrize('seed', range(3))
+@pytest.mark.parametrize('kind', ['lognormal', 'scores', 'normal'])
+def test_single_sketch_within_bound(kind, seed):
+    values = sample(kind, 3 * DEFAULT_EXACT_LIMIT, seed)
+    sketch = QuantileSketch.from_values(values, seed=seed)
+    assert not sketch.exact
+    assert rank_error(values, sketch.quantile(QUANTILES)) <= RANK_ERROR_BOUND
+    assert sketch.quantile(0.0) == values.min() and sketch.quantile(1.0) == values.max()
+
+
+@pytest.mark.parametrize('seed', range(3))
+@pytest.mark.parametrize('parts', [2, 7])
+def test_merged_sketches_within_bound(parts, seed):
+    values = sample('lognormal', 4 * DEFAULT_EXACT_LIMIT, seed)
+    chunks = np.array_split(values, parts)
+    merged = QuantileSketch.from_values(chunks[0], seed=seed)
+    for i, chunk in enumerate(chunks[1:]):
+        merged = merged.merge(QuantileSketch.from_values(chunk, seed=seed * 100 + i))
+    assert merged.n == len(values)
+    assert rank_error(values, merged.quantile(QUANTILES)) <= RANK_ERROR_BOUND
+
+
+def test_exact_mode_matches_numpy():
+    values = sample('lognormal', DEFAULT_EXACT_LIMIT, 0)
+    sketch = QuantileSketch.from_values(values)
+    assert sketch.exact
+    np.testing.assert_array_equal(sketch.quantile(QUANTILES), np.quantile(values, QUANTILES))
+
+
+def test_merge_up_to_exact_limit_stays_exact():
+    values = sample('normal', DEFAULT_EXACT_LIMIT, 1)
+    half = len(values) // 2
+    merged = QuantileSketch.from_values(values[:half]).merge(QuantileSketch.from_values(values[half:]))
+    assert merged.exact
+    np.testing.assert_array_equal(merged.quantile(QUANTILES), np.quantile(values, QUANTILES))
+
+
+@pytest.mark.parametrize('sizes', [(60_000, 60_000), (DEFAULT_EXACT_LIMIT, 1), (1, DEFAULT_EXACT_LIMIT)])
+def test_merge_crossing_exact_limit_within_bound(sizes):
+    values = sample('lognormal', sum(sizes), 2)
+    left = QuantileSketch.from_values(values[:sizes[0]], seed=1)
+    right = QuantileSketch.from_values(values[sizes[0]:], seed=2)
+    assert left.exact and right.exact
+    merged = left.merge(right)
+    assert not merged.exact
+    assert rank_error(values, merged.quantile(QUANTILES)) <= RANK_ERROR_BOUND
+
+
+def test_merge_exact_with_compacted_sketch_within_bound():
+    values = sample('scores', 3 * DEFAULT_EXACT_LIMIT, 3)
+    big = QuantileSketch.from_values(values[:-1000], seed=1)
+    small = QuantileSketch.from_values(values[-1000:], seed=2)
+    assert small.exact and not big.exact
+    assert rank_error(values, small.merge(big).quantile(QUANTILES)) <= RANK_ERROR_BOUND
+
+
+def test_update_ignores_nan_and_copy_is_independent():
+    sketch = QuantileSketch.from_values([1.0, np.nan, 3.0])
+    copied = sketch.copy().update([100.0])
+    assert sketch.n == 2 and sketch.median() == 2.0
+    assert copied.n == 3 and copied.max == 100.0
+    assert np.isnan(QuantileSketch().median())
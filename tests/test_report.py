@@ -0,0 +1,65 @@
+"""Statik hisobot: jarayonlar hovuzidagi natija (fork va spawn/forkserver) ketma-ket qurilgani bilan bir xil"""
+import json
+import multiprocessing
+
+import pytest
+
+pytest.importorskip('plotly')
+
+import survey.report  # noqa: E402
+from survey.ingest import prepare_dataset  # noqa: E402
+from survey.report import build_report, main  # noqa: E402
+from survey.sections import SECTION_TITLES  # noqa: E402
+from survey.synthetic import sample_survey, write_survey  # noqa: E402
+
+
+@pytest.fixture(scope='module')
+def serial():
+    dataset, _ = prepare_dataset(sample_survey(3000, seed=51), 'report-test')
+    return dataset, build_report(dataset, workers=1)
+
+
+def assert_same(results, expected):
+    assert [section for section, *_ in results] == [section for section, *_ in expected]
+    for (section, aggregates, figures, tables), (_, expected_aggregates, expected_figures, expected_tables) \
+            in zip(results, expected):
+        assert json.dumps(aggregates, sort_keys=True) == json.dumps(expected_aggregates, sort_keys=True), section
+        assert figures == expected_figures, section
+        assert tables == expected_tables, section
+
+
+@pytest.mark.skipif('fork' not in multiprocessing.get_all_start_methods(), reason="fork yo'q")
+def test_fork_report_matches_serial(serial):
+    dataset, expected = serial
+    assert survey.report.pool_method(dataset) == 'fork'
+    results = build_report(dataset, workers=3)
+    assert [section for section, *_ in results] == list(SECTION_TITLES)
+    assert_same(results, expected)
+
+
+@pytest.mark.parametrize('method', sorted({'spawn', 'forkserver'} & set(multiprocessing.get_all_start_methods())))
+def test_payload_report_matches_serial(serial, monkeypatch, method):
+    # fork bo'lmasa ham hovuz ishlatiladi: jarayonlarga faqat bo'lim natijalari yuboriladi
+    dataset, expected = serial
+    monkeypatch.setattr(survey.report, 'pool_method', lambda dataset: method)
+    sections = ['demographics', 'salary', 'extra']
+    results = build_report(dataset, sections=sections, workers=2)
+    assert_same(results, [item for item in expected if item[0] in sections])
+
+
+def test_duckdb_backend_is_not_forked(serial, monkeypatch):
+    dataset, _ = serial
+    monkeypatch.setattr(dataset.backend, 'name', 'duckdb')
+    assert survey.report.pool_method(dataset) in ('forkserver', 'spawn')
+
+
+def test_main_writes_html_and_json(tmp_path):
+    source = tmp_path / 'survey.csv'
+    write_survey(str(source), 1000)
+    output, aggregates = tmp_path / 'report.html', tmp_path / 'aggregates.json'
+    main(['--source', str(source), '--output', str(output), '--json', str(aggregates), '--workers', '1',
+          '--sections', 'overview', 'salary'])
+    payload = json.loads(aggregates.read_text(encoding='utf-8'))
+    assert payload['rows'] == 1000 and list(payload['sections']) == ['overview', 'salary']
+    document = output.read_text(encoding='utf-8')
+    assert SECTION_TITLES['salary'] in document and 'salary-salary_hist' in document
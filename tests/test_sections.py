@@ -0,0 +1,30 @@
+"""Bo'lim hisob-kitoblari asl pandas amallari bilan bir xil natija beradi"""
+import pandas as pd
+import pytest
+
+from survey.ingest import prepare_dataset
+from survey.sections import _salary_bins, compute_performance
+from survey.synthetic import sample_survey
+
+
+@pytest.fixture(scope='module')
+def dataset():
+    dataset, _ = prepare_dataset(sample_survey(5_000, seed=3), 'sections@3')
+    return dataset
+
+
+@pytest.mark.parametrize('selections', [None, {'Role': ['Data Scientist', 'Data Engineer']}])
+def test_salary_wlb_matches_groupby(dataset, selections):
+    subset = dataset.filtered(selections)
+    expected = subset.df.groupby(_salary_bins(subset), observed=True)['WorkLifeBalance'].mean().reset_index()
+    pd.testing.assert_frame_equal(compute_performance(subset)['salary_wlb'], expected)
+
+
+def test_binned_mean_skips_missing_measure(dataset):
+    edges = [0.0, 60_000.0, 1e9]
+    df = dataset.df.assign(WorkLifeBalance=dataset.df['WorkLifeBalance'].where(dataset.df['Salary'] > 60_000))
+    subset, _ = prepare_dataset(df, 'sections@nan')
+    binned = subset.binned_mean('Salary', edges, 'WorkLifeBalance')
+    assert binned['n'].tolist() == [int((df['Salary'] <= 60_000).sum()), int((df['Salary'] > 60_000).sum())]
+    assert pd.isna(binned['mean'].iloc[0])
+    assert binned['mean'].iloc[1] == pytest.approx(df.loc[df['Salary'] > 60_000, 'WorkLifeBalance'].mean())
@@ -0,0 +1,73 @@
+"""Sessiyalar soni oshganda xotira: ma'lumotlar bitta, filtrlangan ko'rinishlar chegaralangan"""
+import gc
+import os
+
+import pytest
+
+st = pytest.importorskip('streamlit')
+from streamlit.testing.v1 import AppTest  # noqa: E402
+
+import survey.dataset  # noqa: E402
+import survey.ingest  # noqa: E402
+from survey.lru import LRUCache  # noqa: E402
+from survey.synthetic import write_survey  # noqa: E402
+
+APP_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'streamlit.py')
+
+ROWS = 100_000
+SESSIONS = 4
+# Keyingi har bir sessiya uchun ruxsat etilgan xotira o'sishi (ma'lumotlar o'zi ~10 MB)
+MAX_SESSION_GROWTH = 8 * 1024 ** 2
+# Filtrlangan ko'rinishlar keshi chegarasi: lavozim bo'yicha ko'rinishlar (10-35 ming qator) birgalikda sig'maydi
+FILTER_CACHE_BYTES = 3 * 1024 ** 2
+
+
+def rss_bytes():
+    with open('/proc/self/statm') as f:
+        return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+
+
+@pytest.fixture
+def app_source(tmp_path, monkeypatch):
+    path = tmp_path / 'survey.csv'
+    write_survey(str(path), ROWS)
+    monkeypatch.setattr(survey.ingest, 'LOCAL_SOURCE', str(path))
+    monkeypatch.setenv('SURVEY_CACHE_DIR', str(tmp_path / 'cache'))
+    st.cache_resource.clear()
+    yield path
+    st.cache_resource.clear()
+
+
+def open_session(role=None):
+    session = AppTest.from_file(APP_PATH, default_timeout=600)
+    session.run()
+    if role is not None:
+        session.sidebar.multiselect[0].set_value([role]).run()
+    for option in session.radio[0].options[:3]:
+        session.radio[0].set_value(option).run()
+    assert not session.exception, session.exception[0].value
+    return session
+
+
+@pytest.mark.skipif(not os.path.exists('/proc/self/statm'), reason="RSS faqat Linux'da o'lchanadi")
+def test_sessions_share_one_dataset(app_source):
+    alive = [open_session()]
+    gc.collect()
+    first = rss_bytes()
+    for _ in range(SESSIONS - 1):
+        alive.append(open_session())
+    gc.collect()
+    growth = (rss_bytes() - first) / (SESSIONS - 1)
+    assert growth < MAX_SESSION_GROWTH, f"har bir sessiya +{growth / 2**20:.1f} MB"
+
+
+def test_filtered_views_stay_within_byte_bound(app_source, monkeypatch):
+    cache = LRUCache(FILTER_CACHE_BYTES)
+    monkeypatch.setattr(survey.dataset, 'FILTERED', cache)
+    roles = open_session().sidebar.multiselect[0].options
+    # Har bir sessiya boshqa filtr holatini tanlaydi va tirik qoladi
+    alive = [open_session(role) for role in roles]
+    assert len(alive) == len(roles) > 2
+    assert cache.misses >= len(roles)
+    assert 0 < len(cache) < len(roles)
+    assert cache.bytes <= cache.max_bytes
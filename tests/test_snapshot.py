@@ -0,0 +1,119 @@
+"""Arrow nusxalari: ixcham turlar, barmoq izi bo'yicha nomlash, papka chegarasi, nusxasiz o'qish va bir xil turlar"""
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+pa = pytest.importorskip('pyarrow')
+
+from survey.ingest import prepare_dataset  # noqa: E402
+from survey.schema import compact_frame  # noqa: E402
+from survey.snapshot import load_snapshot, snapshot_file  # noqa: E402
+from survey.synthetic import sample_survey  # noqa: E402
+
+
+def snapshots(root):
+    return sorted(name for name in os.listdir(root) if name.endswith('.arrow'))
+
+
+def test_snapshot_is_reused_without_copying(tmp_path):
+    path = tmp_path / 'survey.csv'
+    sample_survey(5000, seed=1).to_csv(path, index=False)
+    first = load_snapshot(str(path), 'survey.csv', fingerprint='v1', root=str(tmp_path / 'snap'))
+    allocated = pa.total_allocated_bytes()
+    second = load_snapshot(str(path), 'survey.csv', fingerprint='v1', root=str(tmp_path / 'snap'))
+    pd.testing.assert_frame_equal(first, second)
+    # Raqamli ustunlar akslantirilgan fayl ustida: Arrow xotirasi ajratilmaydi, massivlar faqat o'qish uchun
+    assert pa.total_allocated_bytes() - allocated < 64 * 1024
+    salary = second['Salary'].to_numpy()
+    assert not salary.flags.writeable and not salary.flags.owndata
+
+
+def test_snapshot_stores_compact_types(tmp_path):
+    path = tmp_path / 'survey.csv'
+    raw = sample_survey(5000, seed=1).rename(columns={'Salary': 'Yearly Salary'})
+    raw.to_csv(path, index=False)
+    root = str(tmp_path / 'snap')
+    built = load_snapshot(str(path), 'survey.csv', fingerprint='v1', root=root)
+    schema = pa.ipc.open_file(snapshot_file('survey.csv', 'v1', root)).schema
+    # category - lug'at massivlari, ballar - kichraytirilgan butun sonlar; asl ustun nomlari saqlanadi
+    assert pa.types.is_dictionary(schema.field('Role').type) and schema.field('Age').type == pa.int8()
+    assert list(schema.names) == list(raw.columns) and 'Yearly Salary' in built.columns
+
+    reused = load_snapshot(str(path), 'survey.csv', fingerprint='v1', root=root)
+    pd.testing.assert_frame_equal(built, reused)
+    assert reused.attrs['source_bytes'] == built.attrs['source_bytes'] > 0
+
+
+def test_prepare_does_not_copy_snapshot_columns(tmp_path):
+    path = tmp_path / 'survey.csv'
+    sample_survey(5000, seed=1).to_csv(path, index=False)
+    root = str(tmp_path / 'snap')
+    load_snapshot(str(path), 'survey.csv', fingerprint='v1', root=root)
+    df = load_snapshot(str(path), 'survey.csv', fingerprint='v1', root=root)
+    # Ixcham jadval qayta o'zgartirilmaydi - o'sha obyekt, ustunlar akslantirilgan fayl ustida qoladi
+    assert compact_frame(df)[0] is df
+    dataset, report = prepare_dataset(df, 'v1')
+    salary = dataset.df['Salary'].to_numpy()
+    assert np.shares_memory(salary, df['Salary'].to_numpy()) and not salary.flags.owndata
+    assert isinstance(dataset.df['Role'].dtype, pd.CategoricalDtype)
+    # Xotira hisoboti asl fayl hajmidan boshlanadi
+    assert report['before'] == df.attrs['source_bytes'] > report['after']
+
+
+def test_mixed_columns_match_between_build_and_reuse(tmp_path):
+    path = tmp_path / 'mixed.xlsx'
+    pytest.importorskip('openpyxl')
+    pd.DataFrame({'Salary': [70000, 'unknown', 85000, None], 'Role': ['A', 'B', 'C', 'D']}).to_excel(path, index=False)
+    built = load_snapshot(str(path), 'mixed.xlsx', fingerprint='v1', root=str(tmp_path / 'snap'))
+    reused = load_snapshot(str(path), 'mixed.xlsx', fingerprint='v1', root=str(tmp_path / 'snap'))
+    assert len(snapshots(tmp_path / 'snap')) == 1
+    assert built['Salary'].tolist()[:3] == ['70000', 'unknown', '85000'] and pd.isna(built['Salary'].iloc[3])
+    pd.testing.assert_frame_equal(built, reused, check_dtype=False)
+    assert built['Salary'].isna().tolist() == reused['Salary'].isna().tolist()
+
+
+def test_snapshots_are_keyed_by_fingerprint(tmp_path):
+    root = str(tmp_path / 'snap')
+    path = tmp_path / 'survey.csv'
+    sample_survey(100, seed=1).to_csv(path, index=False)
+    load_snapshot(str(path), 'survey.csv', fingerprint='sha-1', root=root)
+    assert snapshots(root) == [os.path.basename(snapshot_file('survey.csv', 'sha-1', root))]
+
+    # Yangi SHA - yangi nusxa, shu nomning eskisi o'chiriladi
+    sample_survey(120, seed=2).to_csv(path, index=False)
+    df = load_snapshot(str(path), 'survey.csv', fingerprint='sha-2', root=root)
+    assert len(df) == 120
+    assert snapshots(root) == [os.path.basename(snapshot_file('survey.csv', 'sha-2', root))]
+
+
+def test_snapshot_dir_is_bounded(tmp_path):
+    root = str(tmp_path / 'snap')
+    for i in range(4):
+        path = tmp_path / f"wave_{i}.csv"
+        sample_survey(2000, seed=i).to_csv(path, index=False)
+        load_snapshot(str(path), path.name, fingerprint='v1', root=root)
+        os.utime(snapshot_file(path.name, 'v1', root), (1_000 + i, 1_000 + i))
+    size = os.path.getsize(snapshot_file('wave_0.csv', 'v1', root))
+
+    # wave_0 yaqinda o'qilgan - chegaradan oshganda eng uzoq o'qilmagan nusxalar o'chiriladi
+    load_snapshot(str(tmp_path / 'wave_0.csv'), 'wave_0.csv', fingerprint='v1', root=root)
+    path = tmp_path / 'wave_4.csv'
+    sample_survey(2000, seed=4).to_csv(path, index=False)
+    load_snapshot(str(path), path.name, fingerprint='v1', root=root, max_bytes=int(size * 3.5))
+    assert snapshots(root) == sorted(os.path.basename(snapshot_file(f"wave_{i}.csv", 'v1', root))
+                                     for i in [0, 3, 4])
+    assert sum(os.path.getsize(os.path.join(root, name)) for name in snapshots(root)) <= size * 3.5
+
+
+def test_stale_metadata_is_rebuilt(tmp_path):
+    root = str(tmp_path / 'snap')
+    path = tmp_path / 'survey.csv'
+    sample_survey(50, seed=1).to_csv(path, index=False)
+    load_snapshot(str(path), 'survey.csv', fingerprint='v1', root=root)
+    # Nusxa yo'li mos, lekin metadagi barmoq izi boshqa (masalan, yarim yozilgan eski fayl)
+    os.replace(snapshot_file('survey.csv', 'v1', root), snapshot_file('survey.csv', 'v2', root))
+    df = load_snapshot(str(path), 'survey.csv', fingerprint='v2', root=root)
+    assert len(df) == 50 and np.issubdtype(df['Salary'].dtype, np.integer)
+    assert snapshots(root) == [os.path.basename(snapshot_file('survey.csv', 'v2', root))]
@@ -0,0 +1,163 @@
+"""Jadvalsiz (DuckDB) rejim: bo'limlar, filtrlar va jadval ko'rgichi xotiradagi jadval bilan bir xil"""
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip('duckdb')
+
+import survey.ingest  # noqa: E402
+import survey.sql_dataset  # noqa: E402
+from survey.backends import PARQUET_DIR  # noqa: E402
+from survey.ingest import load_local, prepare_dataset  # noqa: E402
+from survey.lru import LRUCache  # noqa: E402
+from survey.sections import SECTION_COMPUTE, SCATTER_MAX_POINTS  # noqa: E402
+from survey.sql_dataset import SQLDataset  # noqa: E402
+from survey.synthetic import write_survey  # noqa: E402
+
+# Zichlik xaritasi yo'li ham tekshiriladi; kvantil eskizi shu hajmda hali aniq
+ROWS = SCATTER_MAX_POINTS + 5_000
+
+FILTERS = {
+    'barcha qatorlar': (None, None),
+    'lavozim va maosh': ({'Role': ['Data Scientist', 'Data Engineer']}, {'Salary': (60_000.0, 120_000.0)}),
+    'mamlakat': ({'Country': ['USA']}, None),
+}
+
+
+@pytest.fixture(scope='module', params=['parquet', 'csv'])
+def datasets(request, tmp_path_factory):
+    path = str(tmp_path_factory.mktemp(request.param) / f"survey.{request.param}")
+    write_survey(path, ROWS)
+    df, _, version = load_local(path)
+    dataset, _ = prepare_dataset(df, version)
+    return dataset, SQLDataset.from_file(path)
+
+
+def assert_same(expected, actual, key=''):
+    if isinstance(expected, pd.DataFrame):
+        pd.testing.assert_frame_equal(expected, actual, check_dtype=False, check_categorical=False,
+                                      check_index_type=False, check_column_type=False, check_names=False, obj=key)
+    elif isinstance(expected, pd.Series):
+        pd.testing.assert_series_equal(expected, actual, check_dtype=False, check_categorical=False,
+                                       check_index_type=False, obj=key)
+    elif isinstance(expected, tuple):
+        # Gistogramma va zichlik bin'lari
+        assert type(expected) is type(actual), key
+        for left, right in zip(expected, actual):
+            np.testing.assert_allclose(left, right, err_msg=key) if not isinstance(left, str) else None
+    elif isinstance(expected, dict):
+        assert list(expected) == list(actual), key
+        np.testing.assert_allclose(list(expected.values()), list(actual.values()), err_msg=key)
+    else:
+        assert expected == pytest.approx(actual, nan_ok=True), key
+
+
+def test_metadata_matches(datasets):
+    dataset, sql = datasets
+    assert sql.df is None
+    assert sql.version == dataset.version
+    assert sql.available == dataset.available
+    assert sql.columns == dataset.columns
+    assert sql.rows == dataset.rows == ROWS
+    assert sql.summary.columns == dataset.summary.columns
+
+
+@pytest.mark.parametrize('label', FILTERS)
+@pytest.mark.parametrize('section', SECTION_COMPUTE)
+def test_sections_match(datasets, section, label):
+    dataset, sql = datasets
+    selections, ranges = FILTERS[label]
+    expected = SECTION_COMPUTE[section](dataset.filtered(selections, ranges))
+    actual = SECTION_COMPUTE[section](sql.filtered(selections, ranges))
+    assert sorted(expected) == sorted(actual)
+    for key in expected:
+        assert_same(expected[key], actual[key], f"{section}.{key}")
+
+
+def test_filter_controls_match(datasets):
+    dataset, sql = datasets
+    for dim in ['SurveyWave', 'Role', 'Country', 'Education', 'Gender', 'RemoteWork', 'Salary']:
+        assert sql.filter_values(dim) == (None if dataset.filter_values(dim) is None
+                                          else [str(value) for value in dataset.filter_values(dim)])
+    for col in ['Age', 'Salary', 'Role']:
+        assert sql.filter_bounds(col) == dataset.filter_bounds(col)
+
+
+def test_filtered_views_are_cached(datasets):
+    _, sql = datasets
+    cache = LRUCache(1024 ** 2)
+    view = sql.filtered({'Role': ['Data Analyst']}, cache=cache)
+    assert sql.filtered({'Role': ['Data Analyst']}, cache=cache) is view
+    assert sql.filtered({'Role': []}, cache=cache) is sql
+    assert view.rows == sql.backend.counts('Role')['Data Analyst']
+
+
+@pytest.mark.parametrize('query', [
+    dict(number=0),
+    dict(number=3, sort='Salary', descending=True),
+    dict(number=1, sort=['Country', 'Age'], descending=[False, True]),
+    dict(number=0, search='python'),
+    dict(number=2, search='engineer india', sort='Age'),
+    dict(number=1, search='sql', filters={'Country': ['USA', 'UK']}, sort=['Role', 'Salary']),
+    dict(number=0, search='nothing-matches-this'),
+])
+def test_explorer_pages_match(datasets, query):
+    dataset, sql = datasets
+    expected, expected_total = dataset.explorer.page(size=25, **query)
+    actual, total = sql.explorer.page(size=25, **query)
+    assert total == expected_total == sql.explorer.count(query.get('search', ''), query.get('filters'))
+    assert list(actual.index) == list(expected.index)
+    assert list(actual.columns) == list(expected.columns)
+    pd.testing.assert_frame_equal(expected.astype(str), actual.astype(str), check_index_type=False)
+
+
+def test_csv_is_converted_to_parquet_once(tmp_path, monkeypatch):
+    root = tmp_path / 'parquet'
+    monkeypatch.setattr(survey.backends, 'PARQUET_DIR', str(root))
+    monkeypatch.setattr(survey.backends.parquet_copy, '__defaults__', (None, str(root)))
+    path = tmp_path / 'survey.csv'
+    write_survey(str(path), 500)
+    SQLDataset.from_file(str(path))
+    copies = os.listdir(root)
+    modified = os.path.getmtime(root / copies[0])
+    SQLDataset.from_file(str(path))
+    assert os.listdir(root) == copies and os.path.getmtime(root / copies[0]) == modified
+    # Fayl o'zgarsa eski nusxa yangisi bilan almashtiriladi
+    write_survey(str(path), 600)
+    assert SQLDataset.from_file(str(path)).rows == 600
+    assert len(os.listdir(root)) == 1 and os.listdir(root) != copies
+
+
+def test_app_runs_without_loading_the_frame(tmp_path, monkeypatch):
+    st = pytest.importorskip('streamlit')
+    from streamlit.testing.v1 import AppTest
+
+    path = tmp_path / 'survey.parquet'
+    write_survey(str(path), 2_000)
+    monkeypatch.setattr(survey.ingest, 'LOCAL_SOURCE', str(path))
+    monkeypatch.setattr(survey.sql_dataset, 'QUERY_BACKEND', 'duckdb')
+
+    def no_frame(*args, **kwargs):
+        raise AssertionError("jadval yuklanmasligi kerak")
+
+    monkeypatch.setattr(survey.ingest, 'load_local', no_frame)
+    st.cache_resource.clear()
+    try:
+        at = AppTest.from_file(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                            'streamlit.py'), default_timeout=600)
+        at.run()
+        at.sidebar.multiselect[0].set_value(['Data Scientist']).run()
+        for option in at.radio[0].options:
+            at.radio[0].set_value(option).run()
+            assert not at.exception, at.exception[0].value
+        assert not at.error
+        assert any("xotiraga yuklanmagan" in caption.value for caption in at.caption)
+        assert not [toggle for toggle in at.sidebar.toggle if toggle.key == 'confidence_intervals']
+    finally:
+        st.cache_resource.clear()
+
+
+def test_parquet_dir_is_under_the_cache_dir():
+    assert PARQUET_DIR.startswith(os.environ['SURVEY_CACHE_DIR'])
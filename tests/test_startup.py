@@ -0,0 +1,37 @@
+"""Ilova ishga tushishi: og'ir modullar kechiktiriladi, ilovaning o'z importlari byudjetdan oshmaydi"""
+import importlib.util
+import os
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+spec = importlib.util.spec_from_file_location('bench_startup', os.path.join(ROOT, 'benchmarks', 'bench_startup.py'))
+bench_startup = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(bench_startup)
+
+REPEAT = 3
+
+
+def test_lazy_modules_are_not_imported_at_startup():
+    rows, _, _, loaded = bench_startup.profile_imports(bench_startup.app_imports())
+    assert bench_startup.eager_modules(loaded) == []
+    # Asosiy modullar ajratuvchi qatordan oldin, ilova modullari undan keyin yuklanadi
+    app = {row['module'] for row in rows if row['app']}
+    assert 'survey.dataset' in app and 'streamlit' not in app and 'pandas' not in app
+
+
+@pytest.mark.slow
+def test_app_imports_within_budget():
+    statements = bench_startup.app_imports()
+    # Bir necha takrorning eng yaxshisi: bitta sekin ishga tushish (disk keshi sovuq) xato hisoblanmaydi
+    best_app = min(bench_startup.profile_imports(statements)[2] for _ in range(REPEAT))
+    failures = bench_startup.budget_failures(best_app / 1000, [], bench_startup.DEFAULT_BUDGET_MS)
+    assert not failures, '; '.join(failures)
+
+
+def test_budget_failures_reports_slow_and_eager_imports():
+    assert bench_startup.budget_failures(250, ['pandas'], 300) == []
+    failures = bench_startup.budget_failures(400, ['pandas', 'duckdb', 'scipy'], 300)
+    assert len(failures) == 2
+    assert '400 ms' in failures[0] and 'scipy, duckdb' in failures[1]
@@ -0,0 +1,58 @@
+"""Bo'laklab o'qish rejimi: statistika va korrelyatsiya ko'rsatiladi, fayllar topilmasa sahifa xato bilan to'xtamaydi"""
+import os
+
+import pytest
+import requests
+
+st = pytest.importorskip('streamlit')
+from streamlit.testing.v1 import AppTest  # noqa: E402
+
+import survey.ingest  # noqa: E402
+from survey.synthetic import write_survey  # noqa: E402
+
+APP_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'streamlit.py')
+
+
+def offline(*args, **kwargs):
+    raise requests.ConnectionError("tarmoq yo'q")
+
+
+@pytest.fixture
+def empty_listing(tmp_path, monkeypatch):
+    # SURVEY_STREAMING=1, repozitoriyada CSV/Excel fayl yo'q, zaxira manba ham yuklanmaydi
+    monkeypatch.setattr(survey.ingest, 'FORCE_STREAMING', True)
+    monkeypatch.setattr(survey.ingest, 'LOCAL_SOURCE', None)
+    monkeypatch.setattr(survey.ingest, 'list_data_files', lambda *args, **kwargs: [])
+    monkeypatch.setattr(survey.ingest, 'cached_get', offline)
+    monkeypatch.setenv('SURVEY_CACHE_DIR', str(tmp_path / 'cache'))
+    st.cache_resource.clear()
+    yield
+    st.cache_resource.clear()
+
+
+def test_missing_data_files_fall_back_to_in_memory_path(empty_listing):
+    at = AppTest.from_file(APP_PATH, default_timeout=600)
+    at.run()
+    assert not at.exception, at.exception[0].value
+    errors = [error.value for error in at.error]
+    assert any("bo'laklab o'qib bo'lmadi" in error and 'topilmadi' in error for error in errors)
+    # Odatdagi yo'l namunali ma'lumotlar bilan davom etadi - bo'limlar chiziladi
+    assert any('namuna' in subheader.value or 'sample' in subheader.value for subheader in at.subheader)
+
+
+def test_large_local_file_shows_correlations(tmp_path, monkeypatch):
+    path = str(tmp_path / 'survey.csv')
+    write_survey(path, 5000, seed=4)
+    monkeypatch.setattr(survey.ingest, 'FORCE_STREAMING', True)
+    monkeypatch.setattr(survey.ingest, 'LOCAL_SOURCE', path)
+    st.cache_resource.clear()
+    at = AppTest.from_file(APP_PATH, default_timeout=600)
+    at.run()
+    st.cache_resource.clear()
+    assert not at.exception, at.exception[0].value
+    assert any("bo'laklarda o'qildi" in info.value or "bo'lakda o'qildi" in info.value for info in at.info)
+    assert "Korrelyatsiya matritsasi" in [subheader.value for subheader in at.subheader]
+    texts = [markdown.value for markdown in at.markdown]
+    assert any(text.startswith("Tajriba va maosh o'rtasidagi korrelyatsiya") for text in texts)
+    # Jadval xotiraga yuklanmaydi - bo'limlar radiosi yo'q
+    assert not at.radio
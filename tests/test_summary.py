@@ -0,0 +1,110 @@
+"""Bir o'tishli statistika ``df.describe()`` bilan bir xil; bo'laklarni birlashtirish butun jadvalga teng"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from survey.quantiles import DEFAULT_EXACT_LIMIT
+from survey.schema import compact_frame, numeric_columns, standardize_columns
+from survey.streaming import StreamingSummary, stream_csv
+from survey.summary import NumericSummary
+from survey.synthetic import sample_survey
+
+
+@pytest.fixture(scope='module')
+def frame():
+    df = compact_frame(standardize_columns(sample_survey(20_000, seed=11)))[0]
+    rng = np.random.default_rng(11)
+    # Bo'sh qiymatlar va katta qiymatlar atrofidagi kichik dispersiya (aniqlik tekshiruvi)
+    df['Salary'] = df['Salary'].astype('float64').where(rng.random(len(df)) > 0.1)
+    df['Offset'] = 1e9 + rng.normal(size=len(df))
+    return df
+
+
+def assert_describe(summary, df):
+    expected = df[numeric_columns(df)].describe()
+    pd.testing.assert_frame_equal(summary.describe(), expected, check_dtype=False, rtol=1e-9)
+
+
+@pytest.mark.parametrize('block_rows', [1 << 16, 1000, 7])
+def test_describe_matches_pandas(frame, block_rows):
+    assert_describe(NumericSummary.from_frame(frame, block_rows=block_rows), frame)
+
+
+@pytest.mark.parametrize('split', [1, 4_321, 10_000, 19_999])
+def test_merged_partitions_match_whole(frame, split):
+    whole = NumericSummary.from_frame(frame)
+    merged = NumericSummary.from_frame(frame.iloc[:split]).merge(NumericSummary.from_frame(frame.iloc[split:]))
+    assert merged.rows == whole.rows == len(frame)
+    pd.testing.assert_frame_equal(merged.describe(), whole.describe(), rtol=1e-9)
+    assert_describe(merged, frame)
+    for column in merged.columns:
+        pd.testing.assert_series_equal(merged.column(column), whole.column(column), rtol=1e-9)
+
+
+def test_merge_leaves_partitions_unchanged(frame):
+    left, right = NumericSummary.from_frame(frame.iloc[:500]), NumericSummary.from_frame(frame.iloc[500:1000])
+    before = left.describe(), right.describe()
+    left.merge(right)
+    pd.testing.assert_frame_equal(left.describe(), before[0])
+    pd.testing.assert_frame_equal(right.describe(), before[1])
+
+
+def test_nan_only_column(frame):
+    df = frame[['Age', 'Salary']].assign(Empty=np.nan)
+    summary = NumericSummary.from_frame(df)
+    assert_describe(summary, df)
+    assert summary.metrics('Empty', [0.5]) is None
+    stats = summary.column('Empty')
+    assert stats['n'] == len(df) and stats['count'] == 0 and stats['sum'] == 0
+    assert np.isnan(stats[['min', 'max', 'mean', 'std']]).all()
+    # Bo'lakda faqat NaN bo'lsa ham birlashtirish boshqa bo'lak natijasini buzmaydi
+    nan_part = NumericSummary.from_frame(df.iloc[:100].assign(Salary=np.nan))
+    merged = nan_part.merge(NumericSummary.from_frame(df.iloc[100:]))
+    assert_describe(merged, pd.concat([df.iloc[:100].assign(Salary=np.nan), df.iloc[100:]]))
+
+
+def test_empty_frame(frame):
+    empty = frame.iloc[:0]
+    summary = NumericSummary.from_frame(empty)
+    assert summary.rows == 0
+    described = summary.describe()
+    assert described.loc['count'].tolist() == [0.0] * len(summary.columns)
+    assert described.drop('count').isna().all().all()
+    assert summary.metrics('Age', [0.5]) is None
+    # Bo'sh bo'lak bilan birlashtirish natijani o'zgartirmaydi
+    whole = NumericSummary.from_frame(frame)
+    pd.testing.assert_frame_equal(summary.merge(whole).describe(), whole.describe())
+
+
+def test_no_numeric_columns():
+    summary = NumericSummary.from_frame(pd.DataFrame({'Role': ['A', 'B']}))
+    assert summary.columns == [] and summary.describe() is None
+
+
+def test_large_merge_stays_within_sketch_error():
+    rng = np.random.default_rng(5)
+    values = rng.lognormal(11, 0.5, DEFAULT_EXACT_LIMIT + 50_000)
+    df = pd.DataFrame({'Salary': values})
+    half = len(df) // 2
+    merged = NumericSummary.from_frame(df.iloc[:half]).merge(NumericSummary.from_frame(df.iloc[half:]))
+    described, expected = merged.describe()['Salary'], df['Salary'].describe()
+    np.testing.assert_allclose(described[['count', 'mean', 'std', 'min', 'max']],
+                               expected[['count', 'mean', 'std', 'min', 'max']], rtol=1e-9)
+    # Kvartillar - eskiz xatoligi chegarasida (rang bo'yicha 2% dan kam)
+    ordered = np.sort(values)
+    for q, label in [(0.25, '25%'), (0.5, '50%'), (0.75, '75%')]:
+        rank = np.searchsorted(ordered, described[label]) / len(values)
+        assert abs(rank - q) < 0.02
+
+
+def test_streaming_correlation_matches_pandas(frame, tmp_path):
+    path = tmp_path / 'survey.csv'
+    frame.to_csv(path, index=False)
+    summary = stream_csv(str(path), chunksize=3000)
+    assert summary.chunks == 7 and summary.rows == len(frame)
+    expected = pd.read_csv(path)[summary.columns].corr()
+    pd.testing.assert_frame_equal(summary.correlation(), expected, rtol=1e-9, atol=1e-7)
+    assert summary.correlation_pair('Salary', 'YearsExperience') \
+        == pytest.approx(expected.loc['Salary', 'YearsExperience'], rel=1e-9)
+    assert summary.correlation_pair('Salary', 'Missing') is None
+    assert StreamingSummary().correlation() is None
@@ -0,0 +1,65 @@
+"""Namunali ma'lumotlar: sxema va turlar har qanday hajmda bir xil, bir xil seed - bir xil jadval"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from survey.ingest import load_local, prepare_dataset
+from survey.schema import compact_frame
+from survey.synthetic import (COUNTRIES, LANGUAGES, ROLES, SALARY_RANGE, SCHEMA, generate_survey, sample_survey,
+                              write_survey)
+
+
+@pytest.mark.parametrize('n', [0, 1, 7, 1000])
+def test_schema_is_the_same_for_any_size(n):
+    df = sample_survey(n, seed=3, chunk_size=4)
+    assert len(df) == n
+    assert df.dtypes.to_dict() == SCHEMA
+    assert df.index.equals(pd.RangeIndex(n))
+
+
+def test_empty_sample_flows_through_prepare():
+    dataset, _ = prepare_dataset(sample_survey(0), 'empty')
+    assert dataset.df.empty and list(dataset.df.columns) == list(SCHEMA)
+
+
+def test_same_seed_gives_same_frame():
+    pd.testing.assert_frame_equal(sample_survey(2000, seed=5), sample_survey(2000, seed=5))
+    assert not sample_survey(2000, seed=5).equals(sample_survey(2000, seed=6))
+    # Bo'laklar hajmi o'zgarmasa, generator ham o'sha bo'laklarni beradi
+    first, second = list(generate_survey(2500, seed=5, chunk_size=1000)), list(generate_survey(2500, 5, 1000))
+    assert [len(chunk) for chunk in first] == [1000, 1000, 500]
+    for left, right in zip(first, second):
+        pd.testing.assert_frame_equal(left, right)
+
+
+def test_values_stay_in_domain():
+    df = sample_survey(20_000, seed=8)
+    assert set(df['Role']) == set(ROLES) and set(df['Country']) <= set(COUNTRIES)
+    assert df['Salary'].between(*SALARY_RANGE).all() and (df['Salary'] % 500 == 0).all()
+    assert df['JobSatisfaction'].between(1, 10).all() and df['WorkLifeBalance'].between(1, 10).all()
+    assert df['Age'].between(20, 70).all() and (df['Age'] >= 22 + df['YearsExperience'] - 10).all()
+    languages = df['ProgrammingLanguages'].str.split(', ')
+    assert languages.map(len).min() >= 1 and set(languages.explode()) <= set(LANGUAGES)
+    # Maosh tajriba bilan o'sadi
+    assert np.corrcoef(df['YearsExperience'], np.log(df['Salary']))[0, 1] > 0.3
+
+
+@pytest.mark.parametrize('extension', ['csv', 'parquet', 'arrow'])
+@pytest.mark.parametrize('n', [0, 2500])
+def test_written_file_matches_sample(tmp_path, extension, n):
+    if extension != 'csv':
+        pytest.importorskip('pyarrow')
+    path = str(tmp_path / f"survey.{extension}")
+    write_survey(path, n, seed=9, chunk_size=1000)
+    df, _, _ = load_local(path) if extension != 'arrow' else (pd.read_feather(path), None, None)
+    expected = sample_survey(n, seed=9, chunk_size=1000)
+    if extension != 'arrow':
+        # load_local jadvalni ixcham turlarda qaytaradi (Arrow nusxasi bilan bir xil)
+        expected = compact_frame(expected)[0]
+    assert list(df.columns) == list(SCHEMA)
+    pd.testing.assert_frame_equal(df, expected, check_dtype=n > 0, check_categorical=n > 0)
+
+
+def test_unknown_format_is_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        write_survey(str(tmp_path / 'survey.json'), 10)